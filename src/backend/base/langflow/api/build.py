@@ -26,11 +26,12 @@ from langflow.api.utils import (
 from langflow.api.v1.schemas import FlowDataRequest, ResultDataResponse, VertexBuildResponse
 from langflow.events.event_manager import EventManager
 from langflow.exceptions.component import ComponentBuildError
+from langflow.memory import buffered_messages
 from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
 from langflow.services.database.models.flow.model import Flow
-from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
-from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+from langflow.services.deps import get_chat_service, get_state_service, get_telemetry_service, session_scope
+from langflow.services.job_queue.service import JobQueueFullError, JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentInputsPayload, ComponentPayload, PlaygroundPayload
 
 
@@ -92,6 +93,8 @@ async def start_flow_build(
             flow_name=flow_name,
         )
         queue_service.start_job(job_id, task_coro)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e)) from e
     except Exception as e:
         await logger.aexception("Failed to create queue and start task")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -476,6 +479,8 @@ async def generate_flow_events(
             msg = f"Error serializing vertex build response: {exc}"
             raise ValueError(msg) from exc
 
+        # Vertex results are the bulk of the events of a build, wait for the client when the job queue is full
+        await event_manager.wait_for_queue()
         event_manager.on_end_vertex(data={"build_data": build_data})
 
         if vertex_build_response.valid and vertex_build_response.next_vertices_ids:
@@ -504,11 +509,13 @@ async def generate_flow_events(
     event_manager.on_vertices_sorted(data={"ids": ids, "to_run": vertices_to_run})
 
     tasks = []
-    for vertex_id in ids:
-        task = asyncio.create_task(build_vertices(vertex_id, graph, event_manager))
-        tasks.append(task)
     try:
-        await asyncio.gather(*tasks)
+        # Messages stored by the vertices are written before the end event is sent
+        async with buffered_messages():
+            for vertex_id in ids:
+                task = asyncio.create_task(build_vertices(vertex_id, graph, event_manager))
+                tasks.append(task)
+            await asyncio.gather(*tasks)
     except asyncio.CancelledError:
         background_tasks.add_task(graph.end_all_traces_in_context())
         raise
@@ -524,6 +531,8 @@ async def generate_flow_events(
         )
         event_manager.on_error(data=error_message.data)
         raise
+    finally:
+        get_state_service().release_run(graph.run_id)
 
     event_manager.on_end(data={})
     await graph.end_all_traces()
@@ -24,6 +24,7 @@ from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
+from langflow.processing.prepared_graph import get_prepared_graph_cache
 from langflow.services.database.models.flow.model import (
     AccessTypeEnum,
     Flow,
@@ -360,6 +361,7 @@ async def update_flow(
         session.add(db_flow)
         await session.commit()
         await session.refresh(db_flow)
+        get_prepared_graph_cache().invalidate(db_flow.id)
 
         await _save_flow_to_fs(db_flow)
 
@@ -399,6 +401,7 @@ async def delete_flow(
         raise HTTPException(status_code=404, detail="Flow not found")
     await cascade_delete_flow(session, flow.id)
     await session.commit()
+    get_prepared_graph_cache().invalidate(flow.id)
     return {"message": "Flow deleted successfully"}
 
 
@@ -492,6 +495,9 @@ async def delete_multiple_flows(
             await cascade_delete_flow(db, flow.id)
 
         await db.commit()
+        prepared_graph_cache = get_prepared_graph_cache()
+        for flow in flows_to_delete:
+            prepared_graph_cache.invalidate(flow.id)
         return {"deleted": len(flows_to_delete)}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -5,7 +5,15 @@ from pathlib import Path
 
 import pandas as pd
 from fastapi import APIRouter, HTTPException
+from filelock import FileLock
 from langchain_chroma import Chroma
+from lfx.base.knowledge_bases.knowledge_base_utils import (
+    KB_STATS_FILENAME,
+    KB_STATS_LOCK_FILENAME,
+    get_directory_size,
+    read_kb_stats,
+    write_kb_stats,
+)
 from lfx.log import logger
 from pydantic import BaseModel
 
@@ -52,18 +60,6 @@ def get_kb_root_path() -> Path:
     return _get_knowledge_bases_dir()
 
 
-def get_directory_size(path: Path) -> int:
-    """Calculate the total size of all files in a directory."""
-    total_size = 0
-    try:
-        for file_path in path.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-    except (OSError, PermissionError):
-        pass
-    return total_size
-
-
 def detect_embedding_provider(kb_path: Path) -> str:
     """Detect the embedding provider from config files and directory structure."""
     # Provider patterns to check for
@@ -77,6 +73,8 @@ def detect_embedding_provider(kb_path: Path) -> str:
 
     # Check JSON config files for provider information
     for config_file in kb_path.glob("*.json"):
+        if config_file.name == KB_STATS_FILENAME:
+            continue
         try:
             with config_file.open("r", encoding="utf-8") as f:
                 config_data = json.load(f)
@@ -131,7 +129,7 @@ def detect_embedding_model(kb_path: Path) -> str:
     # Check other JSON config files for model information
     for config_file in kb_path.glob("*.json"):
         # Skip the embedding metadata file since we already checked it
-        if config_file.name == "embedding_metadata.json":
+        if config_file.name in {"embedding_metadata.json", KB_STATS_FILENAME}:
             continue
 
         try:
@@ -209,6 +207,84 @@ def calculate_text_metrics(df: pd.DataFrame, text_columns: list[str]) -> tuple[i
     return total_words, total_characters
 
 
+def compute_kb_stats(kb_path: Path) -> dict[str, int]:
+    """Compute the chunk, word and character counts of a knowledge base from its vector store.
+
+    This loads every chunk, so it is only used for knowledge bases that have no statistics file yet.
+    """
+    stats = {"chunks": 0, "words": 0, "characters": 0}
+
+    # Read schema for text column information
+    schema_data = None
+    schema_file = kb_path / "schema.json"
+    if schema_file.exists():
+        try:
+            with schema_file.open("r", encoding="utf-8") as f:
+                schema_data = json.load(f)
+                if not isinstance(schema_data, list):
+                    schema_data = None
+        except (ValueError, TypeError, OSError) as _:
+            logger.exception("Error reading schema file '%s'", schema_file)
+
+    # Create vector store
+    chroma = Chroma(
+        persist_directory=str(kb_path),
+        collection_name=kb_path.name,
+    )
+
+    # Access the raw collection
+    collection = chroma._collection  # noqa: SLF001
+
+    # Fetch all documents and metadata
+    results = collection.get(include=["documents", "metadatas"])
+
+    # Convert to pandas DataFrame
+    source_chunks = pd.DataFrame(
+        {
+            "document": results["documents"],
+            "metadata": results["metadatas"],
+        }
+    )
+
+    # Process the source data for metadata
+    try:
+        stats["chunks"] = len(source_chunks)
+
+        # Get text columns and calculate metrics
+        text_columns = get_text_columns(source_chunks, schema_data)
+        if text_columns:
+            stats["words"], stats["characters"] = calculate_text_metrics(source_chunks, text_columns)
+
+    except (OSError, ValueError, TypeError) as _:
+        logger.exception("Error processing Chroma DB '%s'", kb_path.name)
+
+    return stats
+
+
+def get_kb_stats(kb_path: Path) -> dict:
+    """Get the statistics of a knowledge base.
+
+    The statistics file maintained by the Knowledge Ingestion component is read when it exists. Otherwise the
+    statistics are computed from the vector store once, and saved so the next reads are cheap.
+    """
+    stats = read_kb_stats(kb_path)
+    if stats is not None:
+        return stats
+
+    stats = compute_kb_stats(kb_path)
+    size = get_directory_size(kb_path)
+    try:
+        # An ingestion may have written the statistics while they were computed: keep its counts
+        with FileLock(kb_path / KB_STATS_LOCK_FILENAME):
+            current_stats = read_kb_stats(kb_path)
+            if current_stats is not None:
+                return current_stats
+            return write_kb_stats(kb_path, size=size, **stats)
+    except OSError as _:
+        logger.exception("Error writing statistics of knowledge base '%s'", kb_path)
+    return {**stats, "bytes": size}
+
+
 def get_kb_metadata(kb_path: Path) -> dict:
     """Extract metadata from a knowledge base directory."""
     metadata: dict[str, float | int | str] = {
@@ -216,6 +292,7 @@ def get_kb_metadata(kb_path: Path) -> dict:
         "words": 0,
         "characters": 0,
         "avg_chunk_size": 0.0,
+        "size": 0,
         "embedding_provider": "Unknown",
         "embedding_model": "Unknown",
     }
@@ -241,55 +318,15 @@ def get_kb_metadata(kb_path: Path) -> dict:
         if metadata["embedding_model"] == "Unknown":
             metadata["embedding_model"] = detect_embedding_model(kb_path)
 
-        # Read schema for text column information
-        schema_data = None
-        schema_file = kb_path / "schema.json"
-        if schema_file.exists():
-            try:
-                with schema_file.open("r", encoding="utf-8") as f:
-                    schema_data = json.load(f)
-                    if not isinstance(schema_data, list):
-                        schema_data = None
-            except (ValueError, TypeError, OSError) as _:
-                logger.exception("Error reading schema file '%s'", schema_file)
-
-        # Create vector store
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=kb_path.name,
-        )
+        stats = get_kb_stats(kb_path)
+        metadata["chunks"] = stats["chunks"]
+        metadata["words"] = stats["words"]
+        metadata["characters"] = stats["characters"]
+        metadata["size"] = stats["bytes"]
 
-        # Access the raw collection
-        collection = chroma._collection  # noqa: SLF001
-
-        # Fetch all documents and metadata
-        results = collection.get(include=["documents", "metadatas"])
-
-        # Convert to pandas DataFrame
-        source_chunks = pd.DataFrame(
-            {
-                "document": results["documents"],
-                "metadata": results["metadatas"],
-            }
-        )
-
-        # Process the source data for metadata
-        try:
-            metadata["chunks"] = len(source_chunks)
-
-            # Get text columns and calculate metrics
-            text_columns = get_text_columns(source_chunks, schema_data)
-            if text_columns:
-                words, characters = calculate_text_metrics(source_chunks, text_columns)
-                metadata["words"] = words
-                metadata["characters"] = characters
-
-                # Calculate average chunk size
-                if int(metadata["chunks"]) > 0:
-                    metadata["avg_chunk_size"] = round(int(characters) / int(metadata["chunks"]), 1)
-
-        except (OSError, ValueError, TypeError) as _:
-            logger.exception("Error processing Chroma DB '%s'", kb_path.name)
+        # Calculate average chunk size
+        if stats["chunks"] > 0:
+            metadata["avg_chunk_size"] = round(stats["characters"] / stats["chunks"], 1)
 
     except (OSError, ValueError, TypeError) as _:
         logger.exception("Error processing knowledge base directory '%s'", kb_path)
@@ -316,10 +353,7 @@ async def list_knowledge_bases(current_user: CurrentActiveUser) -> list[Knowledg
                 continue
 
             try:
-                # Get size of the directory
-                size = get_directory_size(kb_dir)
-
-                # Get metadata from KB files
+                # Get metadata and statistics from KB files
                 metadata = get_kb_metadata(kb_dir)
 
                 kb_info = KnowledgeBaseInfo(
@@ -327,7 +361,7 @@ async def list_knowledge_bases(current_user: CurrentActiveUser) -> list[Knowledg
                     name=kb_dir.name.replace("_", " ").replace("-", " ").title(),
                     embedding_provider=metadata["embedding_provider"],
                     embedding_model=metadata["embedding_model"],
-                    size=size,
+                    size=metadata["size"],
                     words=metadata["words"],
                     characters=metadata["characters"],
                     chunks=metadata["chunks"],
@@ -361,10 +395,7 @@ async def get_knowledge_base(kb_name: str, current_user: CurrentActiveUser) -> K
         if not kb_path.exists() or not kb_path.is_dir():
             raise HTTPException(status_code=404, detail=f"Knowledge base '{kb_name}' not found")
 
-        # Get size of the directory
-        size = get_directory_size(kb_path)
-
-        # Get metadata from KB files
+        # Get metadata and statistics from KB files
         metadata = get_kb_metadata(kb_path)
 
         return KnowledgeBaseInfo(
@@ -372,7 +403,7 @@ async def get_knowledge_base(kb_name: str, current_user: CurrentActiveUser) -> K
             name=kb_name.replace("_", " ").replace("-", " ").title(),
             embedding_provider=metadata["embedding_provider"],
             embedding_model=metadata["embedding_model"],
-            size=size,
+            size=metadata["size"],
             words=metadata["words"],
             characters=metadata["characters"],
             chunks=metadata["chunks"],
@@ -9,7 +9,7 @@ from sqlmodel import col, select
 
 from langflow.api.utils import DbSession, custom_params
 from langflow.schema.message import MessageResponse
-from langflow.services.auth.utils import get_current_active_user
+from langflow.services.auth.utils import get_current_active_superuser, get_current_active_user
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
@@ -18,6 +18,7 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_log_buffer_service, get_queue_service
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -34,12 +35,20 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        # Buffered builds of the flow would be written after the delete
+        await get_log_buffer_service().discard_flow(flow_id, transactions=False)
         await delete_vertex_builds_by_flow_id(session, flow_id)
         await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/jobs", dependencies=[Depends(get_current_active_superuser)])
+async def get_job_queues() -> dict:
+    """Return the running flow build jobs and the events and bytes held by their queues."""
+    return get_queue_service().get_metrics()
+
+
 @router.get("/messages/sessions", dependencies=[Depends(get_current_active_user)])
 async def get_message_sessions(
     session: DbSession,
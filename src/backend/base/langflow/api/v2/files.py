@@ -70,18 +70,29 @@ async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser,
 
 
 async def save_file_routine(file, storage_service, current_user: CurrentActiveUser, file_content=None, file_name=None):
-    """Routine to save the file content to the storage service."""
+    """Routine to save the file content to the storage service.
+
+    Returns the id, stored name and size of the file.
+    """
     file_id = uuid.uuid4()
 
-    if not file_content:
-        file_content = await file.read()
     if not file_name:
         file_name = file.filename
 
     # Save the file using the storage service.
-    await storage_service.save_file(flow_id=str(current_user.id), file_name=file_name, data=file_content)
+    if file_content is not None:
+        await storage_service.save_file(flow_id=str(current_user.id), file_name=file_name, data=file_content)
+        file_size = len(file_content)
+    else:
+        # Stream the upload, so the file is never held in memory whole
+        saved_file = await storage_service.save_stream(
+            flow_id=str(current_user.id),
+            file_name=file_name,
+            chunks=byte_stream_generator(file, chunk_size=storage_service.chunk_size),
+        )
+        file_size = saved_file.size
 
-    return file_id, file_name
+    return file_id, file_name, file_size
 
 
 @router.post("", status_code=HTTPStatus.CREATED)
@@ -155,18 +166,12 @@ async def upload_user_file(
 
         # Read file content and save with unique filename
         try:
-            file_id, stored_file_name = await save_file_routine(
+            file_id, stored_file_name, file_size = await save_file_routine(
                 file, storage_service, current_user, file_name=unique_filename
             )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error saving file: {e}") from e
 
-        # Compute the file size based on the path
-        file_size = await storage_service.get_file_size(
-            flow_id=str(current_user.id),
-            file_name=stored_file_name,
-        )
-
         # Create a new file record
         new_file = UserFile(
             id=file_id,
@@ -219,17 +224,13 @@ async def load_sample_files(current_user: CurrentActiveUser, session: DbSession,
         binary_data = sample_file_path.read_bytes()
 
         # Write the sample file content to the storage service
-        file_id, _ = await save_file_routine(
+        file_id, _, file_size = await save_file_routine(
             sample_file_path,
             storage_service,
             current_user,
             file_content=binary_data,
             file_name=sample_file_name,
         )
-        file_size = await storage_service.get_file_size(
-            flow_id=str(current_user.id),
-            file_name=sample_file_name,
-        )
         # Create a UserFile object for the sample file
         sample_file = UserFile(
             id=file_id,
@@ -422,18 +423,15 @@ async def download_file(
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
-        if file_stream is None:
-            raise HTTPException(status_code=404, detail="File stream not available")
-
         # If return_content is True, read the file content and return it
         if return_content:
-            return await read_file_content(file_stream, decode=True)
+            file_content = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
+            if file_content is None:
+                raise HTTPException(status_code=404, detail="File stream not available")
+            return await read_file_content(file_content, decode=True)
 
-        # For streaming, ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
+        # Stream the file in chunks instead of reading it whole
+        byte_stream = await storage_service.open_stream(flow_id=str(current_user.id), file_name=file_name)
 
         # Create the filename with extension
         file_extension = Path(file.path).suffix
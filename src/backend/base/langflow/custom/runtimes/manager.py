@@ -3,11 +3,16 @@ Model Runtime Manager - Extensible architecture for local + remote model executi
 Supports multiple backends: transformers, llama-cpp, ollama, etc.
 """
 
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
-from enum import Enum
 import asyncio
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import nullcontext, suppress
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 
@@ -41,7 +46,8 @@ class ModelConfig:
     device_type: DeviceType = DeviceType.AUTO
     quantization: Optional[str] = None   # "int8", "int4", "fp16", etc.
     max_tokens: int = 512
-    batch_size: int = 1
+    batch_size: int = 1                  # Max concurrent prompts generated in one batch
+    batch_wait_ms: float = 5.0           # How long a batch waits for more prompts
     cache_size: int = 1024               # MB for KV cache
     parameters: Dict[str, Any] = None   # Runtime-specific parameters
     
@@ -98,6 +104,11 @@ class ModelRuntime(ABC):
         """Generate text based on prompt."""
         pass
 
+    async def generate_stream(self, gen_config: GenerationConfig) -> AsyncIterator[str]:
+        """Generate text, yielding the new text as it is generated. Yields the whole text by default."""
+        result = await self.generate(gen_config)
+        yield result.text
+
     @abstractmethod
     async def health_check(self) -> Dict[str, Any]:
         """Check runtime health."""
@@ -108,76 +119,345 @@ class ModelRuntime(ABC):
         return {"total_mb": 0, "used_mb": 0}
 
 
+# ============ INFERENCE WORKER ============
+
+@dataclass
+class InferenceRequest:
+    """A generation request waiting for, or being processed by, an inference worker."""
+    gen_config: GenerationConfig
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    chunks: asyncio.Queue | None = None   # Receives text chunks, then None, when streaming
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def batch_key(self) -> tuple[float, float, int]:
+        """Requests can share a batch only if they sample the same way."""
+        config = self.gen_config
+        return (config.temperature, config.top_p, config.top_k)
+
+    def resolve(self, result: GenerationResult | None = None, error: BaseException | None = None) -> None:
+        """Hand the result over to the event loop of the caller. Safe to call from any thread."""
+        def _resolve():
+            if self.chunks is not None:
+                self.chunks.put_nowait(None)
+            if self.future.done():
+                return
+            if error is not None:
+                self.future.set_exception(error)
+            else:
+                self.future.set_result(result)
+
+        # The event loop of the caller may be closed, then nobody is waiting anymore
+        with suppress(RuntimeError):
+            self.loop.call_soon_threadsafe(_resolve)
+
+    def emit(self, text: str) -> None:
+        if self.chunks is not None and text:
+            with suppress(RuntimeError):
+                self.loop.call_soon_threadsafe(self.chunks.put_nowait, text)
+
+
+class BatchStreamer:
+    """Streamer passed to `model.generate` for a batch of requests.
+
+    `generate` calls `put` with the prompt ids first, then with the ids generated for every row at each step.
+    Each row is decoded the same way as the non-streamed result, prompt included, and its new text is sent to
+    the request that owns it as soon as it decodes to complete characters.
+    """
+
+    def __init__(self, tokenizer, requests: list[InferenceRequest]):
+        self.tokenizer = tokenizer
+        self.requests = requests
+        self.eos_token_id = getattr(tokenizer, "eos_token_id", None)
+        self._prompt_seen = False
+        self._tokens: list[list[int]] = [[] for _ in requests]
+        self._generated: list[int] = [0 for _ in requests]
+        self._sent: list[str] = ["" for _ in requests]
+        self._finished: list[bool] = [False for _ in requests]
+
+    def put(self, value) -> None:
+        ids = value.tolist() if hasattr(value, "tolist") else list(value)
+        if not self._prompt_seen:
+            self._prompt_seen = True
+            for index, row in enumerate(ids):
+                self._tokens[index] = row.tolist() if hasattr(row, "tolist") else list(row)
+                self._flush(index, final=False)
+            return
+        for index, step_ids in enumerate(ids):
+            if self._finished[index]:
+                continue
+            token_id = step_ids[0] if isinstance(step_ids, list) else step_ids
+            request = self.requests[index]
+            self._tokens[index].append(token_id)
+            self._generated[index] += 1
+            if token_id == self.eos_token_id or self._generated[index] >= request.gen_config.max_tokens:
+                self._finished[index] = True
+            self._flush(index, final=self._finished[index])
+
+    def end(self) -> None:
+        for index in range(len(self.requests)):
+            self._flush(index, final=True)
+
+    def _flush(self, index: int, *, final: bool) -> None:
+        request = self.requests[index]
+        if request.chunks is None:
+            return
+        text = self.tokenizer.decode(self._tokens[index], skip_special_tokens=True)
+        # A multi-byte character split across tokens decodes to a replacement character until it is complete
+        if not final and text.endswith("\ufffd"):
+            return
+        request.emit(text[len(self._sent[index]) :])
+        self._sent[index] = text
+
+
+class InferenceWorker:
+    """Runs the generations of one loaded model on a dedicated thread.
+
+    Requests are queued from the event loop and awaited there, so a generation never blocks other
+    endpoints. The worker takes the first waiting request, waits up to `max_wait` seconds for more, and
+    generates up to `max_batch_size` prompts that sample the same way in one padded batch.
+    """
+
+    def __init__(self, runtime: "TransformersRuntime", max_batch_size: int = 1, max_wait: float = 0.005):
+        self.runtime = runtime
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait, 0.0)
+        self._requests: queue.Queue[InferenceRequest | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self.batches = 0
+        self.requests_processed = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pending(self) -> int:
+        return self._requests.qsize()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f"inference-{self.runtime.config.model_name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the worker once the requests already queued are processed. Blocks until it exits."""
+        if self._thread is None:
+            return
+        self._requests.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    async def submit(
+        self, gen_config: GenerationConfig, chunks: asyncio.Queue | None = None
+    ) -> GenerationResult:
+        """Queue a generation and wait for its result without blocking the event loop."""
+        if not self.is_running:
+            msg = f"Inference worker of {self.runtime.config.model_name} is not running"
+            raise RuntimeError(msg)
+        loop = asyncio.get_running_loop()
+        request = InferenceRequest(gen_config=gen_config, loop=loop, future=loop.create_future(), chunks=chunks)
+        self._requests.put(request)
+        return await request.future
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            request = self._requests.get()
+            if request is None:
+                break
+            batch = [request]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = self._requests.get(timeout=remaining) if remaining > 0 else self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            groups: dict[tuple[float, float, int], list[InferenceRequest]] = {}
+            for request in batch:
+                groups.setdefault(request.batch_key, []).append(request)
+            for requests in groups.values():
+                self._process(requests)
+
+    def _process(self, requests: list[InferenceRequest]) -> None:
+        try:
+            results = self.runtime.generate_batch(requests)
+        except Exception as e:  # noqa: BLE001
+            for request in requests:
+                request.resolve(error=e)
+        else:
+            for request, result in zip(requests, results, strict=True):
+                request.resolve(result=result)
+        self.batches += 1
+        self.requests_processed += len(requests)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "pending": self.pending,
+            "batches": self.batches,
+            "requests": self.requests_processed,
+            "avg_batch_size": self.requests_processed / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+        }
+
+
 # ============ TRANSFORMERS RUNTIME ============
 
 class TransformersRuntime(ModelRuntime):
-    """Runtime for HuggingFace transformers + PyTorch."""
+    """Runtime for HuggingFace transformers + PyTorch.
+
+    Generations run on an `InferenceWorker` thread, which batches concurrent prompts
+    (up to `config.batch_size`, waiting `config.batch_wait_ms` for more).
+    """
+
+    def __init__(self, config: ModelConfig):
+        super().__init__(config)
+        self.worker: InferenceWorker | None = None
 
     async def load(self) -> bool:
         """Load model using transformers."""
         try:
-            from transformers import AutoModelForCausalLM, AutoTokenizer
-            import torch
-
-            device = self._map_device()
-            self.tokenizer = AutoTokenizer.from_pretrained(self.config.model_id)
-            
-            torch_dtype = torch.float16 if self.config.quantization == "fp16" else torch.bfloat16
-            
-            self.model = AutoModelForCausalLM.from_pretrained(
-                self.config.model_id,
-                torch_dtype=torch_dtype,
-                device_map=device,
-                load_in_8bit=self.config.quantization == "int8",
-                load_in_4bit=self.config.quantization == "int4",
-            )
-            
+            # Loading reads the weights from disk or the network, keep it off the event loop
+            await asyncio.to_thread(self._load_model)
+            self._start_worker()
             self.is_loaded = True
             return True
         except Exception as e:
             print(f"Error loading transformers model: {e}")
             return False
 
+    def _load_model(self) -> None:
+        import torch
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+
+        device = self._map_device()
+        self.tokenizer = AutoTokenizer.from_pretrained(self.config.model_id)
+
+        torch_dtype = torch.float16 if self.config.quantization == "fp16" else torch.bfloat16
+
+        self.model = AutoModelForCausalLM.from_pretrained(
+            self.config.model_id,
+            torch_dtype=torch_dtype,
+            device_map=device,
+            load_in_8bit=self.config.quantization == "int8",
+            load_in_4bit=self.config.quantization == "int4",
+        )
+
+    def _start_worker(self) -> None:
+        # Batched prompts are padded on the left so that every row continues right after its prompt
+        if getattr(self.tokenizer, "pad_token", None) is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        self.tokenizer.padding_side = "left"
+        self.worker = InferenceWorker(
+            self,
+            max_batch_size=self.config.batch_size,
+            max_wait=self.config.batch_wait_ms / 1000,
+        )
+        self.worker.start()
+
     async def unload(self) -> None:
         """Unload model."""
+        if self.worker:
+            await asyncio.to_thread(self.worker.stop)
+            self.worker = None
         if self.model:
-            import torch
             del self.model
             del self.tokenizer
-            torch.cuda.empty_cache()
+            self.model = None
+            self.tokenizer = None
+            self._empty_cuda_cache()
             self.is_loaded = False
 
     async def generate(self, gen_config: GenerationConfig) -> GenerationResult:
         """Generate text."""
-        import time
-        import torch
-
-        if not self.is_loaded:
+        if not self.is_loaded or self.worker is None:
             raise RuntimeError("Model not loaded")
-
-        start_time = time.time()
-        inputs = self.tokenizer(gen_config.prompt, return_tensors="pt").to(self.model.device)
-
-        with torch.no_grad():
+        return await self.worker.submit(gen_config)
+
+    async def generate_stream(self, gen_config: GenerationConfig) -> AsyncIterator[str]:
+        """Generate text, yielding the prompt and then the new text as it is generated."""
+        if not self.is_loaded or self.worker is None:
+            msg = "Model not loaded"
+            raise RuntimeError(msg)
+        chunks: asyncio.Queue = asyncio.Queue()
+        result = asyncio.ensure_future(self.worker.submit(gen_config, chunks=chunks))
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is None:
+                    break
+                yield chunk
+            # Raises the generation error, if any
+            await result
+        finally:
+            if not result.done():
+                result.cancel()
+
+    def generate_batch(self, requests: list[InferenceRequest]) -> list[GenerationResult]:
+        """Generate the completions of a batch of requests. Runs on the inference worker thread."""
+        configs = [request.gen_config for request in requests]
+        inputs = self.tokenizer(
+            [config.prompt for config in configs], return_tensors="pt", padding=True
+        ).to(self.model.device)
+        prompt_length = len(inputs["input_ids"][0])
+        streamer = BatchStreamer(self.tokenizer, requests) if any(r.chunks is not None for r in requests) else None
+
+        with self._no_grad():
             output = self.model.generate(
                 **inputs,
-                max_new_tokens=gen_config.max_tokens,
-                temperature=gen_config.temperature,
-                top_p=gen_config.top_p,
-                top_k=gen_config.top_k,
+                max_new_tokens=max(config.max_tokens for config in configs),
+                temperature=configs[0].temperature,
+                top_p=configs[0].top_p,
+                top_k=configs[0].top_k,
                 do_sample=True,
-                pad_token_id=self.tokenizer.eos_token_id,
+                pad_token_id=self.tokenizer.pad_token_id,
+                streamer=streamer,
             )
 
-        result_text = self.tokenizer.decode(output[0], skip_special_tokens=True)
-        elapsed = time.time() - start_time
+        finished_at = time.perf_counter()
+        results = []
+        for index, (request, config) in enumerate(zip(requests, configs, strict=True)):
+            row = output[index]
+            row = row.tolist() if hasattr(row, "tolist") else list(row)
+            # Rows run until the longest request of the batch is done, cut each at its own limit
+            generated = row[prompt_length:][:config.max_tokens]
+            if self.tokenizer.eos_token_id in generated:
+                generated = generated[:generated.index(self.tokenizer.eos_token_id) + 1]
+            results.append(GenerationResult(
+                text=self.tokenizer.decode(row[:prompt_length] + generated, skip_special_tokens=True),
+                model_name=self.config.model_name,
+                tokens_generated=len(generated),
+                execution_time=finished_at - request.submitted_at,
+                metadata={"batch_size": len(requests)},
+            ))
+        return results
+
+    @staticmethod
+    def _no_grad():
+        try:
+            import torch
+        except ImportError:
+            return nullcontext()
+        return torch.no_grad()
 
-        return GenerationResult(
-            text=result_text,
-            model_name=self.config.model_name,
-            tokens_generated=len(output[0]) - len(inputs["input_ids"][0]),
-            execution_time=elapsed,
-        )
+    @staticmethod
+    def _empty_cuda_cache() -> None:
+        try:
+            import torch
+        except ImportError:
+            return
+        torch.cuda.empty_cache()
 
     async def health_check(self) -> Dict[str, Any]:
         """Check health."""
@@ -186,6 +466,7 @@ class TransformersRuntime(ModelRuntime):
             "status": "healthy" if self.is_loaded else "not_loaded",
             "device": torch.cuda.get_device_name(0) if torch.cuda.is_available() else "cpu",
             "cuda_available": torch.cuda.is_available(),
+            "worker": self.worker.stats() if self.worker else None,
         }
 
     def _map_device(self) -> str:
@@ -290,6 +571,7 @@ class RuntimeManager:
         self.runtimes: Dict[str, ModelRuntime] = {}
         self.model_configs: Dict[str, ModelConfig] = {}
         self.loaded_models: Dict[str, ModelRuntime] = {}
+        self._load_locks: dict[str, asyncio.Lock] = {}
 
     def register_model(self, config: ModelConfig) -> bool:
         """Register a model configuration."""
@@ -319,13 +601,19 @@ class RuntimeManager:
         if model_name not in self.runtimes:
             raise ValueError(f"Model {model_name} not registered")
 
-        runtime = self.runtimes[model_name]
-        success = await runtime.load()
-        
-        if success:
-            self.loaded_models[model_name] = runtime
-        
-        return success
+        # Concurrent requests for a model that is not loaded yet wait for a single load
+        lock = self._load_locks.setdefault(model_name, asyncio.Lock())
+        async with lock:
+            if model_name in self.loaded_models:
+                return True
+
+            runtime = self.runtimes[model_name]
+            success = await runtime.load()
+
+            if success:
+                self.loaded_models[model_name] = runtime
+
+            return success
 
     async def unload_model(self, model_name: str) -> None:
         """Unload a model from memory."""
@@ -346,6 +634,19 @@ class RuntimeManager:
         runtime = self.loaded_models[model_name]
         return await runtime.generate(gen_config)
 
+    async def generate_stream(
+        self,
+        model_name: str,
+        gen_config: GenerationConfig,
+    ) -> AsyncIterator[str]:
+        """Generate text using specified model, yielding the new text as it is generated."""
+        if model_name not in self.loaded_models:
+            await self.load_model(model_name)
+
+        runtime = self.loaded_models[model_name]
+        async for chunk in runtime.generate_stream(gen_config):
+            yield chunk
+
     async def health_check(self) -> Dict[str, Any]:
         """Check health of all loaded models."""
         health = {
@@ -5,6 +5,7 @@ Endpoints for loading, unloading, and generating with local models.
 
 from typing import Optional, List
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import logging
 
@@ -38,6 +39,7 @@ class ModelRegistrationRequest(BaseModel):
     quantization: Optional[str] = None
     max_tokens: Optional[int] = 512
     cache_size: Optional[int] = 1024
+    batch_size: int | None = 1  # Max concurrent prompts generated in one batch
 
 
 class GenerationRequest(BaseModel):
@@ -114,6 +116,7 @@ async def register_model(request: ModelRegistrationRequest):
     - runtime_type: "transformers", "llama_cpp", "ollama"
     - device_type: "cpu", "gpu", "mps", "auto"
     - quantization: "int8", "int4", "fp16", or None
+    - batch_size: Max concurrent prompts generated in one batch
     """
     try:
         manager = get_runtime_manager()
@@ -127,6 +130,7 @@ async def register_model(request: ModelRegistrationRequest):
             quantization=request.quantization,
             max_tokens=request.max_tokens or 512,
             cache_size=request.cache_size or 1024,
+            batch_size=request.batch_size or 1,
         )
         
         success = manager.register_model(config)
@@ -211,16 +215,7 @@ async def generate_text(request: GenerationRequest):
     try:
         manager = get_runtime_manager()
         
-        gen_config = GenerationConfig(
-            prompt=request.prompt,
-            max_tokens=request.max_tokens or 512,
-            temperature=request.temperature or 0.7,
-            top_p=request.top_p or 0.95,
-            top_k=request.top_k or 50,
-            repetition_penalty=request.repetition_penalty or 1.0,
-        )
-        
-        result = await manager.generate(request.model_name, gen_config)
+        result = await manager.generate(request.model_name, _to_generation_config(request))
         
         return GenerationResponse(
             text=result.text,
@@ -239,6 +234,41 @@ async def generate_text(request: GenerationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/generate/stream")
+async def generate_text_stream(request: GenerationRequest):
+    """Generate text using a local model, streaming the text as plain text chunks while it is generated.
+
+    Takes the same parameters as `/generate`.
+    """
+    manager = get_runtime_manager()
+    try:
+        # Load before streaming so that loading errors are reported with a status code
+        if not await manager.load_model(request.model_name):
+            raise HTTPException(status_code=400, detail=f"Failed to load model {request.model_name}")
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    async def stream():
+        try:
+            async for chunk in manager.generate_stream(request.model_name, _to_generation_config(request)):
+                yield chunk
+        except Exception:
+            logger.exception("Error during streaming generation")
+
+    return StreamingResponse(stream(), media_type="text/plain")
+
+
+def _to_generation_config(request: GenerationRequest) -> GenerationConfig:
+    return GenerationConfig(
+        prompt=request.prompt,
+        max_tokens=request.max_tokens or 512,
+        temperature=request.temperature or 0.7,
+        top_p=request.top_p or 0.95,
+        top_k=request.top_k or 50,
+        repetition_penalty=request.repetition_penalty or 1.0,
+    )
+
+
 @router.get("/models", response_model=List[dict])
 async def list_models():
     """
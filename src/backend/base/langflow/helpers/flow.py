@@ -8,6 +8,7 @@ from lfx.log.logger import logger
 from pydantic.v1 import BaseModel, Field, create_model
 from sqlmodel import select
 
+from langflow.schema.data import Data
 from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.database.models.flow.model import Flow, FlowRead
 from langflow.services.deps import get_settings_service, session_scope
@@ -19,8 +20,6 @@ if TYPE_CHECKING:
     from lfx.graph.schema import RunOutputs
     from lfx.graph.vertex.base import Vertex
 
-    from langflow.schema.data import Data
-
 INPUT_TYPE_MAP = {
     "ChatInput": {"type_hint": "Optional[str]", "default": '""'},
     "TextInput": {"type_hint": "Optional[str]", "default": '""'},
@@ -44,12 +43,48 @@ async def list_flows(*, user_id: str | None = None) -> list[Data]:
         raise ValueError(msg) from e
 
 
+async def list_flow_catalog(*, user_id: str | None = None, flow_name: str | None = None) -> list[Data]:
+    """Lists the flows of a user without their data.
+
+    Only the id, name, description and updated_at columns are selected, so listing flows to pick one
+    doesn't load and parse the JSON of every flow. With `flow_name`, only the flow with that name is
+    looked up, through the (user_id, name) unique index.
+    """
+    if not user_id:
+        msg = "Session is invalid"
+        raise ValueError(msg)
+    try:
+        async with session_scope() as session:
+            uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+            stmt = (
+                select(Flow.id, Flow.name, Flow.description, Flow.updated_at)
+                .where(Flow.user_id == uuid_user_id)
+                .where(Flow.is_component == False)  # noqa: E712
+            )
+            if flow_name is not None:
+                stmt = stmt.where(Flow.name == flow_name)
+            rows = (await session.exec(stmt)).all()
+
+            return [
+                Data(
+                    data={"id": row.id, "name": row.name, "description": row.description, "updated_at": row.updated_at}
+                )
+                for row in rows
+            ]
+    except Exception as e:
+        msg = f"Error listing flows: {e}"
+        raise ValueError(msg) from e
+
+
 async def load_flow(
     user_id: str, flow_id: str | None = None, flow_name: str | None = None, tweaks: dict | None = None
 ) -> Graph:
-    from lfx.graph.graph.base import Graph
+    """Loads the graph of a flow, by id or by name.
 
-    from langflow.processing.process import process_tweaks
+    Graphs are served from the prepared graph cache, keyed by the flow's `updated_at`, so the flow
+    data is only loaded and built again when the flow changed.
+    """
+    from langflow.processing.prepared_graph import get_prepared_graph_cache
 
     if not flow_id and not flow_name:
         msg = "Flow ID or Flow Name is required"
@@ -60,22 +95,29 @@ async def load_flow(
             msg = f"Flow {flow_name} not found"
             raise ValueError(msg)
 
+    uuid_flow_id = UUID(flow_id) if isinstance(flow_id, str) else flow_id
+    async with session_scope() as session:
+        stmt = select(Flow.updated_at).where(Flow.id == uuid_flow_id)
+        updated_at = (await session.exec(stmt)).first()
+    prepared_graph_cache = get_prepared_graph_cache()
+    graph = prepared_graph_cache.get_cached_graph(flow_id, updated_at, tweaks, user_id=user_id)
+    if graph is not None:
+        return graph
+
     async with session_scope() as session:
-        graph_data = flow.data if (flow := await session.get(Flow, flow_id)) else None
-    if not graph_data:
+        flow = await session.get(Flow, uuid_flow_id)
+    if not flow or not flow.data:
         msg = f"Flow {flow_id} not found"
         raise ValueError(msg)
-    if tweaks:
-        graph_data = process_tweaks(graph_data=graph_data, tweaks=tweaks)
-    return Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id)
+    return prepared_graph_cache.get_graph(flow, tweaks, user_id=user_id)
 
 
 async def find_flow(flow_name: str, user_id: str) -> str | None:
+    """Returns the id of the flow named `flow_name`, looked up with the (user_id, name) unique index."""
     async with session_scope() as session:
         uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
-        stmt = select(Flow).where(Flow.name == flow_name).where(Flow.user_id == uuid_user_id)
-        flow = (await session.exec(stmt)).first()
-        return flow.id if flow else None
+        stmt = select(Flow.id).where(Flow.user_id == uuid_user_id).where(Flow.name == flow_name)
+        return (await session.exec(stmt)).first()
 
 
 async def run_flow(
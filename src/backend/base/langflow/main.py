@@ -34,6 +34,7 @@ from langflow.initial_setup.setup import (
     sync_flows_from_fs,
 )
 from langflow.middleware import ContentSizeLimitMiddleware
+from langflow.services.database.models.api_key.cache import get_api_key_usage_aggregator
 from langflow.services.deps import get_queue_service, get_service, get_settings_service, get_telemetry_service
 from langflow.services.schema import ServiceType
 from langflow.services.utils import initialize_services, initialize_settings_service, teardown_services
@@ -316,6 +317,10 @@ def get_lifespan(*, fix_migration=False, version=None):
 
                 # Step 2: Cleaning Up Services
                 with shutdown_progress.step(2):
+                    try:
+                        await asyncio.wait_for(get_api_key_usage_aggregator().stop(), timeout=10)
+                    except Exception as e:  # noqa: BLE001
+                        await logger.awarning(f"Failed to write API key usage: {e}")
                     try:
                         await asyncio.wait_for(teardown_services(), timeout=30)
                     except asyncio.TimeoutError:
@@ -1,6 +1,8 @@
 import asyncio
 import json
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from uuid import UUID
 
 from langchain_core.chat_history import BaseChatMessageHistory
@@ -13,7 +15,101 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
 from langflow.services.database.models.message.model import MessageRead, MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_settings_service, session_scope
+
+
+class MessageBuffer:
+    """Messages stored during a run, written to the database together.
+
+    Storing a message costs a session and a commit, and a streamed message is written a second time when
+    complete. Within `buffered_messages`, stored messages are kept in memory instead, updates of a buffered
+    message are applied in memory, and the buffer is written with a single commit when it holds `max_size`
+    messages, before messages are read or deleted, and at the end of the run.
+
+    Args:
+        max_size: Number of buffered messages that triggers a write.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.loop = asyncio.get_running_loop()
+        self._pending: dict[UUID, MessageTable] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def add(self, messages: list[MessageTable]) -> None:
+        async with self._lock:
+            for message in messages:
+                self._pending[message.id] = message
+        if len(self._pending) >= self.max_size:
+            await self.flush()
+
+    async def update(self, message: Message) -> MessageTable | None:
+        """Applies `message` to the buffered message with the same id. None if it isn't buffered."""
+        message_id = UUID(str(message.id))
+        async with self._lock:
+            buffered = self._pending.get(message_id)
+            if buffered is None:
+                return None
+            updated = buffered.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
+            if updated.flow_id and isinstance(updated.flow_id, str):
+                updated.flow_id = UUID(updated.flow_id)
+            self._pending[message_id] = updated
+            return updated
+
+    async def discard(self, id_: str | UUID) -> bool:
+        """Drops a buffered message. False if it isn't buffered."""
+        async with self._lock:
+            return self._pending.pop(UUID(str(id_)), None) is not None
+
+    async def flush(self) -> None:
+        """Writes the buffered messages with a single commit.
+
+        The messages stay buffered if the write fails, so the next flush writes them again.
+        """
+        async with self._lock:
+            if not self._pending:
+                return
+            messages = list(self._pending.values())
+            async with session_scope() as session:
+                await aadd_messagetables(messages, session)
+            self._pending.clear()
+
+
+_message_buffer: ContextVar[MessageBuffer | None] = ContextVar("message_buffer", default=None)
+
+
+def _get_message_buffer() -> MessageBuffer | None:
+    buffer = _message_buffer.get()
+    # A synchronous caller running its own event loop (run_until_complete) can't share the buffer lock
+    if buffer is not None and buffer.loop is asyncio.get_running_loop():
+        return buffer
+    return None
+
+
+@asynccontextmanager
+async def buffered_messages(max_size: int | None = None) -> AsyncIterator[MessageBuffer | None]:
+    """Buffers the messages stored within the context, including by the tasks it starts.
+
+    Yields None when buffering is disabled, that is when `max_size` (by default the `message_buffer_size`
+    setting) is 0, or the buffer of the enclosing context when there is one.
+    """
+    if max_size is None:
+        max_size = get_settings_service().settings.message_buffer_size
+    current = _get_message_buffer()
+    if current is not None or max_size <= 0:
+        yield current
+        return
+    buffer = MessageBuffer(max_size)
+    token = _message_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _message_buffer.reset(token)
+        await buffer.flush()
 
 
 def _get_variable_query(
@@ -111,6 +207,8 @@ async def aget_messages(
     Returns:
         List[Data]: A list of Data objects representing the retrieved messages.
     """
+    if buffer := _get_message_buffer():
+        await buffer.flush()
     async with session_scope() as session:
         stmt = _get_variable_query(sender, sender_name, session_id, context_id, order_by, order, flow_id, limit)
         messages = await session.exec(stmt)
@@ -143,8 +241,11 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
 
     try:
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
-        async with session_scope() as session:
-            messages_models = await aadd_messagetables(messages_models, session)
+        if buffer := _get_message_buffer():
+            await buffer.add(messages_models)
+        else:
+            async with session_scope() as session:
+                messages_models = await aadd_messagetables(messages_models, session)
         return [await Message.create(**message.model_dump()) for message in messages_models]
     except Exception as e:
         await logger.aexception(e)
@@ -155,8 +256,21 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
     if not isinstance(messages, list):
         messages = [messages]
 
+    buffered_updates: list[MessageTable] = []
+    if buffer := _get_message_buffer():
+        remaining_messages = []
+        for message in messages:
+            buffered = await buffer.update(message)
+            if buffered is None:
+                remaining_messages.append(message)
+            else:
+                buffered_updates.append(buffered)
+        if not remaining_messages:
+            return [MessageRead.model_validate(message, from_attributes=True) for message in buffered_updates]
+        messages = remaining_messages
+
     async with session_scope() as session:
-        updated_messages: list[MessageTable] = []
+        updated_messages: list[MessageTable] = list(buffered_updates)
         for message in messages:
             msg = await session.get(MessageTable, message.id)
             if msg:
@@ -184,8 +298,9 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
     try:
         try:
-            for message in messages:
-                session.add(message)
+            # Inserted together, and not refreshed after the commit: the ids and timestamps are set
+            # in memory and the sessions don't expire objects on commit
+            session.add_all(messages)
             await session.commit()
             # This is a hack.
             # We are doing this because build_public_tmp causes the CancelledError to be raised
@@ -193,8 +308,6 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         except asyncio.CancelledError:
             await session.rollback()
             return await aadd_messagetables(messages, session)
-        for message in messages:
-            await session.refresh(message)
     except asyncio.CancelledError as e:
         await logger.aexception(e)
         error_msg = "Operation cancelled"
@@ -232,6 +345,8 @@ async def adelete_messages(session_id: str | None = None, context_id: str | None
         session_id (str): The session ID associated with the messages to delete.
         context_id (str): The context ID associated with the messages to delete.
     """
+    if buffer := _get_message_buffer():
+        await buffer.flush()
     async with session_scope() as session:
         if not session_id and not context_id:
             msg = "Either session_id or context_id must be provided to delete messages."
@@ -255,6 +370,8 @@ async def delete_message(id_: str) -> None:
     Args:
         id_ (str): The ID of the message to delete.
     """
+    if (buffer := _get_message_buffer()) and await buffer.discard(id_):
+        return
     async with session_scope() as session:
         message = await session.get(MessageTable, id_)
         if message:
@@ -0,0 +1,168 @@
+"""Cache of prepared graphs used to serve repeated runs of the same flow."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from lfx.graph.graph.base import Graph
+
+from langflow.processing.process import process_tweaks
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.schema.graph import Tweaks
+    from langflow.services.database.models.flow.model import Flow
+
+DEFAULT_MAX_SIZE = 128
+
+PreparedGraphKey = tuple[str, str, str]
+
+
+def hash_tweaks(tweaks: Tweaks | dict[str, Any] | None, *, stream: bool) -> str:
+    """Returns a stable hash of the tweaks and stream flag applied to a flow."""
+    tweaks_dict = tweaks.model_dump() if tweaks is not None and not isinstance(tweaks, dict) else tweaks or {}
+    payload = orjson.dumps({"tweaks": tweaks_dict, "stream": stream}, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class PreparedGraphCache:
+    """An LRU cache of graphs built from a flow, used as templates for per-run clones.
+
+    Entries are keyed by flow id, the flow's `updated_at` and a hash of the tweaks, so a saved flow
+    never reuses a graph built from its previous version. `invalidate` drops every entry of a flow
+    when it is saved or deleted, so stale templates don't hold memory until they are evicted.
+
+    Attributes:
+        max_size (int): Maximum number of prepared graphs kept. 0 disables caching.
+        hits (int): Number of runs served from a cached template.
+        misses (int): Number of runs that had to build the graph from the flow data.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._cache: OrderedDict[PreparedGraphKey, Graph] = OrderedDict()
+        self._lock = threading.RLock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get_graph(
+        self,
+        flow: Flow,
+        tweaks: Tweaks | dict[str, Any] | None,
+        *,
+        stream: bool = False,
+        user_id: str | None = None,
+        context: dict | None = None,
+    ) -> Graph:
+        """Returns a graph ready to be run for `flow` with `tweaks` applied.
+
+        On a miss the flow data is tweaked and built into a template graph once; every call then
+        returns a fresh clone of that template, so runs never share state.
+        """
+        flow_id = str(flow.id)
+        if flow.data is None:
+            msg = f"Flow {flow_id} has no data"
+            raise ValueError(msg)
+        if self.max_size <= 0:
+            return self._build_template(flow, tweaks, stream=stream, user_id=user_id, context=context)
+
+        key = (flow_id, str(flow.updated_at), hash_tweaks(tweaks, stream=stream))
+        with self._lock:
+            template = self._cache.get(key)
+            if template is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if template is None:
+            template = self._build_template(flow, tweaks, stream=stream, user_id=user_id)
+            with self._lock:
+                self._cache[key] = template
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+        return template.clone_for_run(user_id=user_id, context=context)
+
+    def get_cached_graph(
+        self,
+        flow_id: str | UUID,
+        updated_at: Any,
+        tweaks: Tweaks | dict[str, Any] | None,
+        *,
+        stream: bool = False,
+        user_id: str | None = None,
+        context: dict | None = None,
+    ) -> Graph | None:
+        """Returns a clone of the cached template of a flow version, or None if it isn't cached.
+
+        This lets callers check the cache with the flow's `updated_at` alone, before loading its data.
+        """
+        key = (str(flow_id), str(updated_at), hash_tweaks(tweaks, stream=stream))
+        with self._lock:
+            template = self._cache.get(key)
+            if template is None:
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+        return template.clone_for_run(user_id=user_id, context=context)
+
+    @staticmethod
+    def _build_template(
+        flow: Flow,
+        tweaks: Tweaks | dict[str, Any] | None,
+        *,
+        stream: bool,
+        user_id: str | None,
+        context: dict | None = None,
+    ) -> Graph:
+        graph_data = flow.data.copy()  # type: ignore[union-attr]
+        graph_data = process_tweaks(graph_data, tweaks or {}, stream=stream)
+        return Graph.from_payload(
+            graph_data, flow_id=str(flow.id), user_id=user_id, flow_name=flow.name, context=context
+        )
+
+    def invalidate(self, flow_id: str | UUID) -> int:
+        """Removes every prepared graph of a flow. Returns the number of entries removed."""
+        flow_id = str(flow_id)
+        with self._lock:
+            keys = [key for key in self._cache if key[0] == flow_id]
+            for key in keys:
+                del self._cache[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Removes every prepared graph and resets the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Returns the cache size and hit/miss counters."""
+        with self._lock:
+            return {"size": len(self._cache), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_prepared_graph_cache: PreparedGraphCache | None = None
+_prepared_graph_cache_lock = threading.Lock()
+
+
+def get_prepared_graph_cache() -> PreparedGraphCache:
+    """Returns the process-wide prepared graph cache, sized from the `prepared_graph_cache_size` setting."""
+    global _prepared_graph_cache  # noqa: PLW0603
+    if _prepared_graph_cache is None:
+        with _prepared_graph_cache_lock:
+            if _prepared_graph_cache is None:
+                _prepared_graph_cache = PreparedGraphCache(
+                    max_size=get_settings_service().settings.prepared_graph_cache_size
+                )
+    return _prepared_graph_cache
@@ -7,6 +7,7 @@ from lfx.log.logger import logger
 from lfx.processing.utils import validate_and_repair_json
 from pydantic import BaseModel
 
+from langflow.memory import buffered_messages
 from langflow.schema.graph import InputValue, Tweaks
 from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.deps import get_settings_service
@@ -49,16 +50,17 @@ async def run_graph_internal(
 
     fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
     graph.session_id = effective_session_id
-    run_outputs = await graph.arun(
-        inputs=inputs_list,
-        inputs_components=components,
-        types=types,
-        outputs=outputs or [],
-        stream=stream,
-        session_id=effective_session_id or "",
-        fallback_to_env_vars=fallback_to_env_vars,
-        event_manager=event_manager,
-    )
+    async with buffered_messages():
+        run_outputs = await graph.arun(
+            inputs=inputs_list,
+            inputs_components=components,
+            types=types,
+            outputs=outputs or [],
+            stream=stream,
+            session_id=effective_session_id or "",
+            fallback_to_env_vars=fallback_to_env_vars,
+            event_manager=event_manager,
+        )
     return run_outputs, effective_session_id
 
 
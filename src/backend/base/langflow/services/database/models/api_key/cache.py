@@ -0,0 +1,227 @@
+"""In-process cache of verified API keys and aggregator of their usage counters."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from lfx.log.logger import logger
+from sqlmodel import col, update
+
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.models.user.model import User
+from langflow.services.deps import get_settings_service, session_scope
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+DEFAULT_TTL = 30.0
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+
+class _VerifiedApiKey(NamedTuple):
+    api_key_id: UUID
+    user_id: UUID
+    user: dict[str, Any]
+    expires_at: float
+
+
+def hash_api_key(api_key: str) -> str:
+    """Returns the hash an API key is cached under, so the cache never holds the keys themselves."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class ApiKeyCache:
+    """An LRU cache of verified API keys and the users they belong to.
+
+    Entries expire after `ttl` seconds. `invalidate` drops a key when it is deleted and `invalidate_user`
+    drops the keys of a user when the user is updated or deleted, so revocations apply right away.
+
+    Attributes:
+        ttl (float): Seconds a verified key is kept. 0 disables caching.
+        max_size (int): Maximum number of verified keys kept.
+        hits (int): Number of keys served from the cache.
+        misses (int): Number of keys that had to be checked in the database.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._cache: OrderedDict[str, _VerifiedApiKey] = OrderedDict()
+        self._lock = threading.Lock()
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, api_key: str) -> tuple[UUID, User] | None:
+        """Returns the id of a verified key and a copy of its user, or None if the key must be checked."""
+        if not self.enabled:
+            return None
+        key = hash_api_key(api_key)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._cache[key]
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+        # Each caller gets its own detached copy, so changes made to it never reach the cache
+        return entry.api_key_id, User.model_validate(entry.user)
+
+    def set(self, api_key: str, api_key_id: UUID, user: User) -> None:
+        if not self.enabled:
+            return
+        entry = _VerifiedApiKey(api_key_id, user.id, user.model_dump(), time.monotonic() + self.ttl)
+        key = hash_api_key(api_key)
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, api_key_id: UUID | str) -> int:
+        """Drops a key from the cache, returning the number of entries removed."""
+        return self._invalidate_where(lambda entry: str(entry.api_key_id) == str(api_key_id))
+
+    def invalidate_user(self, user_id: UUID | str) -> int:
+        """Drops the keys of a user from the cache, returning the number of entries removed."""
+        return self._invalidate_where(lambda entry: str(entry.user_id) == str(user_id))
+
+    def _invalidate_where(self, predicate) -> int:
+        with self._lock:
+            keys = [key for key, entry in self._cache.items() if predicate(entry)]
+            for key in keys:
+                del self._cache[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class ApiKeyUsageAggregator:
+    """Counts the uses of API keys in memory and writes them to the database in batches.
+
+    Instead of a commit per authenticated request, `flush` issues one
+    `UPDATE apikey SET total_uses = total_uses + n, last_used_at = ...` per key used since the previous flush.
+    Flushes run every `flush_interval` seconds on the event loop that recorded the uses, and on shutdown with
+    `stop`.
+    """
+
+    def __init__(self, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._counts: dict[UUID, int] = {}
+        self._last_used: dict[UUID, datetime] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of uses not written to the database yet."""
+        with self._lock:
+            return sum(self._counts.values())
+
+    def record(self, api_key_id: UUID) -> None:
+        """Counts a use of a key and makes sure a flush is scheduled."""
+        with self._lock:
+            self._counts[api_key_id] = self._counts.get(api_key_id, 0) + 1
+            self._last_used[api_key_id] = datetime.now(timezone.utc)
+        self._ensure_flush_task()
+
+    def _ensure_flush_task(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as exc:  # noqa: BLE001
+                await logger.awarning(f"Error writing API key usage: {exc}")
+
+    async def flush(self) -> int:
+        """Writes the pending counters to the database, returning the number of keys updated.
+
+        Counters that fail to be written are merged back, so they are retried on the next flush.
+        """
+        with self._lock:
+            counts, self._counts = self._counts, {}
+            last_used, self._last_used = self._last_used, {}
+        if not counts:
+            return 0
+        try:
+            async with session_scope() as session:
+                for api_key_id, uses in counts.items():
+                    stmt = (
+                        update(ApiKey)
+                        .where(col(ApiKey.id) == api_key_id)
+                        .values(total_uses=col(ApiKey.total_uses) + uses, last_used_at=last_used[api_key_id])
+                    )
+                    await session.exec(stmt)
+        except Exception:
+            with self._lock:
+                for api_key_id, uses in counts.items():
+                    self._counts[api_key_id] = self._counts.get(api_key_id, 0) + uses
+                    self._last_used.setdefault(api_key_id, last_used[api_key_id])
+            raise
+        return len(counts)
+
+    async def stop(self) -> None:
+        """Cancels the scheduled flushes and writes the pending counters."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            if task.get_loop() is asyncio.get_running_loop():
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        await self.flush()
+
+
+_api_key_cache: ApiKeyCache | None = None
+_api_key_usage_aggregator: ApiKeyUsageAggregator | None = None
+_lock = threading.Lock()
+
+
+def get_api_key_cache() -> ApiKeyCache:
+    """Returns the process-wide cache of verified API keys, configured from the `api_key_cache_*` settings."""
+    global _api_key_cache  # noqa: PLW0603
+    if _api_key_cache is None:
+        with _lock:
+            if _api_key_cache is None:
+                settings = get_settings_service().settings
+                _api_key_cache = ApiKeyCache(ttl=settings.api_key_cache_ttl, max_size=settings.api_key_cache_size)
+    return _api_key_cache
+
+
+def get_api_key_usage_aggregator() -> ApiKeyUsageAggregator:
+    """Returns the process-wide aggregator of API key usage, flushed every `api_key_usage_flush_interval`."""
+    global _api_key_usage_aggregator  # noqa: PLW0603
+    if _api_key_usage_aggregator is None:
+        with _lock:
+            if _api_key_usage_aggregator is None:
+                _api_key_usage_aggregator = ApiKeyUsageAggregator(
+                    flush_interval=get_settings_service().settings.api_key_usage_flush_interval
+                )
+    return _api_key_usage_aggregator
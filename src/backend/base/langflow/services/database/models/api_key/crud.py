@@ -7,6 +7,7 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.services.database.models.api_key.cache import get_api_key_cache, get_api_key_usage_aggregator
 from langflow.services.database.models.api_key.model import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
 from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_settings_service, session_scope
@@ -47,18 +48,29 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
+    get_api_key_cache().invalidate(api_key_id)
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
-    """Check if the API key is valid."""
-    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
-    api_key_object: ApiKey | None = (await session.exec(query)).first()
-    if api_key_object is not None:
-        settings_service = get_settings_service()
-        if settings_service.settings.disable_track_apikey_usage is not True:
-            await update_total_uses(api_key_object.id)
-        return api_key_object.user
-    return None
+    """Check if the API key is valid.
+
+    Verified keys are served from the API key cache for a few seconds, and their uses are counted in memory
+    and written to the database in batches.
+    """
+    api_key_cache = get_api_key_cache()
+    if (cached := api_key_cache.get(api_key)) is not None:
+        api_key_id, user = cached
+    else:
+        query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
+        api_key_object: ApiKey | None = (await session.exec(query)).first()
+        if api_key_object is None:
+            return None
+        api_key_id, user = api_key_object.id, api_key_object.user
+        api_key_cache.set(api_key, api_key_id, user)
+    settings_service = get_settings_service()
+    if settings_service.settings.disable_track_apikey_usage is not True:
+        get_api_key_usage_aggregator().record(api_key_id)
+    return user
 
 
 async def update_total_uses(api_key_id: UUID):
@@ -1,7 +1,7 @@
 from uuid import UUID
 
 from lfx.log.logger import logger
-from sqlmodel import col, delete, select
+from sqlmodel import col, delete, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.transactions.model import (
@@ -74,6 +74,58 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+async def log_transactions(db: AsyncSession, transactions: list[TransactionBase]) -> list[TransactionTable]:
+    """Insert many transactions in a single transaction, without enforcing the per-flow limit.
+
+    Used by the log buffer service, which prunes old transactions periodically with `prune_transactions`
+    instead of after every insert. Transactions without a flow_id are skipped.
+
+    Args:
+        db: Database session
+        transactions: Transaction data to log
+
+    Returns:
+        The created TransactionTable entries
+    """
+    tables = [TransactionTable(**transaction.model_dump()) for transaction in transactions if transaction.flow_id]
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def prune_transactions(db: AsyncSession, *, max_entries: int, flow_ids: set[UUID] | None = None) -> None:
+    """Delete the oldest transactions of each flow beyond `max_entries`.
+
+    Args:
+        db: Database session
+        max_entries: Maximum number of transactions to keep per flow
+        flow_ids: Only prune these flows. If None, every flow is pruned.
+    """
+    try:
+        ranked = select(
+            TransactionTable.id,
+            func.row_number()
+            .over(partition_by=TransactionTable.flow_id, order_by=col(TransactionTable.timestamp).desc())
+            .label("position"),
+        )
+        if flow_ids is not None:
+            ranked = ranked.where(col(TransactionTable.flow_id).in_(flow_ids))
+        ranked_subq = ranked.subquery()
+        await db.exec(
+            delete(TransactionTable).where(
+                col(TransactionTable.id).in_(select(ranked_subq.c.id).where(ranked_subq.c.position > max_entries))
+            )
+        )
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse]:
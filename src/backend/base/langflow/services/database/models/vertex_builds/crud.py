@@ -130,6 +130,78 @@ async def log_vertex_build(
     return table
 
 
+async def log_vertex_builds(db: AsyncSession, vertex_builds: list[VertexBuildBase]) -> list[VertexBuildTable]:
+    """Insert many vertex builds in a single transaction, without enforcing the build history limits.
+
+    Used by the log buffer service, which prunes the history periodically with `prune_vertex_builds`
+    instead of after every insert.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertex_builds (list[VertexBuildBase]): The vertex builds to insert.
+
+    Returns:
+        list[VertexBuildTable]: The inserted vertex build records.
+    """
+    tables = [VertexBuildTable(**vertex_build.model_dump()) for vertex_build in vertex_builds]
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def prune_vertex_builds(
+    db: AsyncSession,
+    *,
+    max_builds_to_keep: int,
+    max_builds_per_vertex: int,
+    flow_ids: set[UUID] | None = None,
+) -> None:
+    """Delete the vertex builds exceeding the per-vertex and global history limits.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        max_builds_to_keep (int): Maximum number of builds to keep globally.
+        max_builds_per_vertex (int): Maximum number of builds to keep per vertex.
+        flow_ids (set[UUID] | None, optional): Only enforce the per-vertex limit on these flows.
+            If None, it is enforced on every flow.
+    """
+    try:
+        ranked = select(
+            VertexBuildTable.build_id,
+            func.row_number()
+            .over(
+                partition_by=(VertexBuildTable.flow_id, VertexBuildTable.id),
+                order_by=(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc()),
+            )
+            .label("position"),
+        )
+        if flow_ids is not None:
+            ranked = ranked.where(col(VertexBuildTable.flow_id).in_(flow_ids))
+        ranked_subq = ranked.subquery()
+        await db.exec(
+            delete(VertexBuildTable).where(
+                col(VertexBuildTable.build_id).in_(
+                    select(ranked_subq.c.build_id).where(ranked_subq.c.position > max_builds_per_vertex)
+                )
+            )
+        )
+
+        keep_global_subq = (
+            select(VertexBuildTable.build_id)
+            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+            .limit(max_builds_to_keep)
+        )
+        await db.exec(delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq)))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
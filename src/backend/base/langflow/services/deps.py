@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
     from langflow.services.job_queue.service import JobQueueService
+    from langflow.services.log_buffer.service import LogBufferService
     from langflow.services.session.service import SessionService
     from langflow.services.state.service import StateService
     from langflow.services.storage.service import StorageService
@@ -266,3 +267,10 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_log_buffer_service() -> LogBufferService:
+    """Retrieves the LogBufferService instance from the service manager."""
+    from langflow.services.log_buffer.factory import LogBufferServiceFactory
+
+    return get_service(ServiceType.LOG_BUFFER_SERVICE, LogBufferServiceFactory())
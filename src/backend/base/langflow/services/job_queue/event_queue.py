@@ -0,0 +1,162 @@
+"""Bounded event queue of a build job."""
+
+from __future__ import annotations
+
+import asyncio
+import pickle
+import tempfile
+from typing import IO, Any, Literal
+
+FullQueuePolicy = Literal["block", "drop_tokens", "spill"]
+
+# Events are (event_id, encoded event, put time) tuples; the end of the stream has no encoded event
+Event = tuple[Any, bytes | None, float]
+
+
+def _event_size(item: Event) -> int:
+    value = item[1]
+    return len(value) if isinstance(value, bytes) else 0
+
+
+def _is_token(item: Event) -> bool:
+    event_id = item[0]
+    return isinstance(event_id, str) and event_id.startswith("token-")
+
+
+class JobEventQueue(asyncio.Queue):
+    """An asyncio queue of job events that keeps at most `maxsize` events in memory.
+
+    When the queue is full, `policy` decides what happens to a new event:
+      * ``block``: `put` waits for the consumer. Events put without waiting with `put_nowait`, such as the ones
+        sent by an `EventManager`, are still queued, so no event is ever lost. Their producers bound the queue
+        by waiting with `EventManager.wait_for_queue` before sending, woken by the consumer like `put`: the
+        build waits before each vertex result, components before each message and `TokenStream` before each
+        token. The queue then only goes over `maxsize` by the events of producers that can't wait (the sorted
+        vertices, logs, tool build start and end events, errors and the end of the build), by one event per
+        message sent while another producer was woken, and by the last frame of each token stream, sent by its
+        timer or when it is closed.
+      * ``drop_tokens``: token events are dropped. Other events, which include the end of the build, are
+        always queued, dropping the oldest queued token event to make room when there is one.
+      * ``spill``: events are written to a temporary file in `spill_dir` and read back in order.
+
+    A `maxsize` of 0 never bounds the queue. The queue counts the events and bytes it holds, see `get_metrics`.
+    """
+
+    def __init__(self, maxsize: int = 0, policy: FullQueuePolicy = "block", spill_dir: str | None = None) -> None:
+        super().__init__(maxsize)
+        self.policy = policy
+        self.spill_dir = spill_dir
+        self._spill_file: IO[bytes] | None = None
+        self._spill_read_offset = 0
+        self._spilled_pending = 0
+        self.queued_bytes = 0
+        self.peak_bytes = 0
+        self.events_put = 0
+        self.events_dropped = 0
+        self.events_spilled = 0
+
+    @property
+    def blocks_producers(self) -> bool:
+        """Whether producers that can wait should wait while the queue is full."""
+        return self.policy == "block"
+
+    def full(self) -> bool:
+        return self.blocks_producers and super().full()
+
+    def qsize(self) -> int:
+        return super().qsize() + self._spilled_pending
+
+    def put_nowait(self, item: Event) -> None:
+        if self.policy == "drop_tokens" and self._bounded() and not self._make_room(item):
+            # Dropped before asyncio.Queue counts it as an unfinished task, so `join` doesn't wait for it
+            self.events_dropped += 1
+            return
+        if self.policy == "block" and super().full():
+            # Callers that can't wait must not lose events: queue over the bound
+            self._put(item)
+            self._unfinished_tasks += 1
+            self._finished.clear()
+            self._wakeup_next(self._getters)
+            return
+        super().put_nowait(item)
+
+    def _bounded(self) -> bool:
+        return self.maxsize > 0 and len(self._queue) >= self.maxsize
+
+    def _put(self, item: Event) -> None:
+        if self.policy == "spill" and (self._bounded() or self._spilled_pending):
+            self._spill(item)
+        else:
+            self._queue.append(item)
+        self.events_put += 1
+        self.queued_bytes += _event_size(item)
+        self.peak_bytes = max(self.peak_bytes, self.queued_bytes)
+
+    def _make_room(self, item: Event) -> bool:
+        """Drops the oldest queued token event for a non-token event, returning whether `item` can be queued."""
+        if _is_token(item):
+            return False
+        queue = self._queue
+        for index, queued in enumerate(queue):
+            if _is_token(queued):
+                del queue[index]
+                self.events_dropped += 1
+                self.queued_bytes -= _event_size(queued)
+                # The dropped event will never be got, so it is done
+                self.task_done()
+                break
+        return True
+
+    def _get(self) -> Event:
+        item = self._queue.popleft()
+        self.queued_bytes -= _event_size(item)
+        if self._spilled_pending:
+            # Keep the queue non-empty in memory while events wait on disk, so getters are woken up
+            self._queue.append(self._unspill())
+        return item
+
+    def _spill(self, item: Event) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="langflow-job-", dir=self.spill_dir)  # noqa: SIM115
+        self._spill_file.seek(0, 2)
+        pickle.dump(item, self._spill_file)
+        self._spilled_pending += 1
+        self.events_spilled += 1
+
+    def _unspill(self) -> Event:
+        spill_file = self._spill_file
+        if spill_file is None:
+            msg = "No spilled events to read"
+            raise RuntimeError(msg)
+        spill_file.seek(self._spill_read_offset)
+        item = pickle.load(spill_file)  # noqa: S301
+        self._spill_read_offset = spill_file.tell()
+        self._spilled_pending -= 1
+        if not self._spilled_pending:
+            spill_file.seek(0)
+            spill_file.truncate()
+            self._spill_read_offset = 0
+        return item
+
+    def close(self) -> None:
+        """Drops the queued events, wakes the waiting producers and removes the spill file."""
+        self._queue.clear()
+        for putter in self._putters:
+            if not putter.done():
+                putter.set_result(None)
+        self.queued_bytes = 0
+        self._spilled_pending = 0
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+            self._spill_read_offset = 0
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {
+            "queued_events": self.qsize(),
+            "queued_bytes": self.queued_bytes,
+            "peak_bytes": self.peak_bytes,
+            "events_put": self.events_put,
+            "events_dropped": self.events_dropped,
+            "events_spilled": self.events_spilled,
+        }
@@ -1,3 +1,6 @@
+from lfx.services.settings.service import SettingsService
+from typing_extensions import override
+
 from langflow.services.base import Service
 from langflow.services.factory import ServiceFactory
 from langflow.services.job_queue.service import JobQueueService
@@ -7,5 +10,12 @@ class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
-        return JobQueueService()
+    @override
+    def create(self, settings_service: SettingsService) -> Service:
+        settings = settings_service.settings
+        return JobQueueService(
+            max_queue_size=settings.job_queue_max_size,
+            full_queue_policy=settings.job_queue_full_policy,
+            spill_dir=settings.job_queue_spill_dir,
+            max_jobs=settings.job_queue_max_jobs,
+        )
@@ -6,6 +6,7 @@ from lfx.log.logger import logger
 
 from langflow.events.event_manager import EventManager
 from langflow.services.base import Service
+from langflow.services.job_queue.event_queue import FullQueuePolicy, JobEventQueue
 
 
 class JobQueueNotFoundError(Exception):
@@ -16,6 +17,14 @@ class JobQueueNotFoundError(Exception):
         super().__init__(f"Job queue not found for job_id: {job_id}")
 
 
+class JobQueueFullError(Exception):
+    """Exception raised when a job is created while the maximum number of jobs are running."""
+
+    def __init__(self, max_jobs: int) -> None:
+        self.max_jobs = max_jobs
+        super().__init__(f"Too many jobs running, the limit is {max_jobs}")
+
+
 class JobQueueService(Service):
     """Asynchronous service for managing job-specific queues and their associated tasks.
 
@@ -26,6 +35,9 @@ class JobQueueService(Service):
       - Safely clean up resources by cancelling active tasks and emptying queues.
       - Automatically perform periodic cleanup of inactive or completed job queues.
 
+    Each job queue keeps at most `max_queue_size` events in memory, applying `full_queue_policy` when it is full
+    (see `JobEventQueue`), and at most `max_jobs` jobs run at the same time.
+
     The cleanup process follows a two-phase approach:
       1. When a task is cancelled or fails, it is marked for cleanup by setting a timestamp
       2. The actual cleanup only occurs after CLEANUP_GRACE_PERIOD seconds have elapsed
@@ -41,6 +53,10 @@ class JobQueueService(Service):
               * The cleanup timestamp (if any).
         _cleanup_task (asyncio.Task | None): Background task for periodic cleanup.
         _closed (bool): Flag indicating whether the service is currently active.
+        max_queue_size (int): Maximum number of events kept in memory by each job queue. 0 means unbounded.
+        full_queue_policy (str): What a full job queue does with new events: "block", "drop_tokens" or "spill".
+        spill_dir (str | None): Directory of the files events are spilled to. None uses the temporary directory.
+        max_jobs (int): Maximum number of jobs running at the same time. 0 means unlimited.
         CLEANUP_GRACE_PERIOD (int): Number of seconds to wait after a task is marked for cleanup
             before actually removing it. This grace period allows for:
               * Pending operations to complete
@@ -61,12 +77,22 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_queue_size: int = 0,
+        full_queue_policy: FullQueuePolicy = "block",
+        spill_dir: str | None = None,
+        max_jobs: int = 0,
+    ) -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
         """
+        self.max_queue_size = max_queue_size
+        self.full_queue_policy = full_queue_policy
+        self.spill_dir = spill_dir
+        self.max_jobs = max_jobs
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
@@ -132,6 +158,9 @@ class JobQueueService(Service):
             tuple[asyncio.Queue, EventManager]: A tuple containing:
                 - The asyncio.Queue instance for handling the job's tasks or messages.
                 - The EventManager instance for event handling tied to the queue.
+
+        Raises:
+            JobQueueFullError: If `max_jobs` jobs are already running.
         """
         if self._closed:
             msg = "Queue service is closed"
@@ -142,7 +171,12 @@ class JobQueueService(Service):
             msg = f"Queue for job_id {job_id} already exists"
             raise ValueError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
+        if self.max_jobs and self.count_running_jobs() >= self.max_jobs:
+            raise JobQueueFullError(self.max_jobs)
+
+        main_queue: asyncio.Queue = JobEventQueue(
+            self.max_queue_size, policy=self.full_queue_policy, spill_dir=self.spill_dir
+        )
         event_manager: EventManager = self._create_default_event_manager(main_queue)
 
         # Register the queue without an active task.
@@ -184,6 +218,28 @@ class JobQueueService(Service):
         self._queues[job_id] = (main_queue, event_manager, task, None)
         logger.debug(f"New task started for job_id {job_id}")
 
+    def count_running_jobs(self) -> int:
+        """Count the jobs that are waiting to start or running."""
+        return sum(1 for _, _, task, _ in self._queues.values() if task is None or not task.done())
+
+    def get_metrics(self) -> dict:
+        """Return the number of jobs and, for each job, its state and the events and bytes held by its queue."""
+        jobs = {}
+        for job_id, (main_queue, _event_manager, task, _) in self._queues.items():
+            metrics = (
+                main_queue.get_metrics()
+                if isinstance(main_queue, JobEventQueue)
+                else {"queued_events": main_queue.qsize()}
+            )
+            jobs[job_id] = {"running": task is None or not task.done(), **metrics}
+        return {
+            "jobs": len(jobs),
+            "running_jobs": sum(1 for job in jobs.values() if job["running"]),
+            "max_jobs": self.max_jobs,
+            "queued_bytes": sum(job.get("queued_bytes", 0) for job in jobs.values()),
+            "job_queues": jobs,
+        }
+
     def get_queue_data(self, job_id: str) -> tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
         """Retrieve the complete data structure associated with a job's queue.
 
@@ -245,6 +301,8 @@ class JobQueueService(Service):
                 items_cleared += 1
             except asyncio.QueueEmpty:
                 break
+        if isinstance(main_queue, JobEventQueue):
+            main_queue.close()
 
         await logger.adebug(f"Removed {items_cleared} items from queue for job_id {job_id}")
         # Remove the job entry from the registry
@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.log_buffer.service import LogBufferService
+
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
+
+class LogBufferServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(LogBufferService)
+
+    @override
+    def create(self, settings_service: "SettingsService"):
+        return LogBufferService(settings_service)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from lfx.log.logger import logger
+from pydantic import BaseModel
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import log_transactions, prune_transactions
+from langflow.services.database.models.transactions.model import TransactionBase
+from langflow.services.database.models.vertex_builds.crud import log_vertex_builds, prune_vertex_builds
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+from langflow.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
+
+class LogBufferService(Service):
+    """Write-behind buffer for vertex build and transaction logs.
+
+    Logging a vertex build or a transaction used to cost an insert, one or two retention deletes and a
+    commit per record, which made the database the main contention point under concurrent runs. This
+    service keeps the records in memory and writes them with one bulk insert per table when
+    `log_buffer_batch_size` records are pending or `log_buffer_flush_interval` seconds have passed.
+
+    The history limits (`max_vertex_builds_to_keep`, `max_vertex_builds_per_vertex` and
+    `max_transactions_to_keep`) are enforced by a sweep that runs every `log_retention_interval` seconds,
+    only on the flows that were written to since the previous sweep.
+
+    The buffer is bounded by `log_buffer_max_size`: when it is full, adding a record waits for the pending
+    records to be written. When a batch fails to be written, its records are retried one by one and only
+    those the database still rejects are dropped. If none of them can be written, the database is assumed to
+    be unavailable and the batch is kept in the buffer to be written with the next one, only the records that
+    don't fit in the buffer are dropped. Pending records are written when the service is torn down.
+    """
+
+    name = "log_buffer_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        self.settings_service = settings_service
+        settings = settings_service.settings
+        self.batch_size = settings.log_buffer_batch_size
+        self.flush_interval = settings.log_buffer_flush_interval
+        self.max_size = settings.log_buffer_max_size
+        self.retention_interval = settings.log_retention_interval
+        self._vertex_builds: list[VertexBuildBase] = []
+        self._transactions: list[TransactionBase] = []
+        self._vertex_build_flows: set[UUID] = set()
+        self._transaction_flows: set[UUID] = set()
+        self._flush_lock: asyncio.Lock | None = None
+        self._flush_requested: asyncio.Event | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._retention_task: asyncio.Task | None = None
+        self._closed = False
+        self.written = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be written."""
+        return len(self._vertex_builds) + len(self._transactions)
+
+    def is_started(self) -> bool:
+        return self._flush_task is not None
+
+    def start(self) -> None:
+        """Start the background flush and retention tasks. Must be called from a running event loop."""
+        self._closed = False
+        self._flush_lock = asyncio.Lock()
+        self._flush_requested = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+        self._retention_task = asyncio.create_task(self._prune_periodically())
+        logger.debug("LogBufferService started")
+
+    async def add_vertex_build(
+        self,
+        *,
+        flow_id: str | UUID,
+        vertex_id: str,
+        valid: bool,
+        params: Any,
+        data: dict | BaseModel | None,
+        artifacts: dict | None = None,
+    ) -> None:
+        """Buffer a vertex build to be written with the next batch."""
+        vertex_build = VertexBuildBase(
+            flow_id=flow_id,
+            id=vertex_id,
+            valid=valid,
+            params=str(params) if params else None,
+            data=data.model_dump() if isinstance(data, BaseModel) else data,
+            artifacts=artifacts,
+        )
+        await self._make_room()
+        self._vertex_builds.append(vertex_build)
+        self._vertex_build_flows.add(vertex_build.flow_id)
+        self._request_flush_if_full()
+
+    async def add_transaction(
+        self,
+        *,
+        flow_id: str | UUID | None,
+        vertex_id: str,
+        status: str,
+        target_id: str | None = None,
+        inputs: dict | None = None,
+        outputs: dict | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Buffer a transaction to be written with the next batch. Transactions without a flow_id are ignored."""
+        if not flow_id:
+            await logger.adebug("Transaction flow_id is None")
+            return
+        transaction = TransactionBase(
+            flow_id=flow_id,
+            vertex_id=vertex_id,
+            target_id=target_id,
+            inputs=inputs,
+            outputs=outputs,
+            status=status,
+            error=error,
+        )
+        await self._make_room()
+        self._transactions.append(transaction)
+        self._transaction_flows.add(transaction.flow_id)
+        self._request_flush_if_full()
+
+    async def _make_room(self) -> None:
+        if not self.is_started():
+            self.start()
+        if self.pending >= self.max_size:
+            await self.flush()
+
+    def _request_flush_if_full(self) -> None:
+        if self.pending >= self.batch_size and self._flush_requested is not None:
+            self._flush_requested.set()
+
+    async def flush(self) -> None:
+        """Write every pending record with one bulk insert per table."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            vertex_builds, self._vertex_builds = self._vertex_builds, []
+            transactions, self._transactions = self._transactions, []
+            if not vertex_builds and not transactions:
+                return
+            try:
+                await self._write(vertex_builds, transactions)
+            except Exception as exc:  # noqa: BLE001
+                await logger.aerror(f"Error writing {len(vertex_builds) + len(transactions)} buffered logs: {exc}")
+                await self._write_one_by_one(vertex_builds, transactions)
+            else:
+                self.written += len(vertex_builds) + len(transactions)
+
+    @staticmethod
+    async def _write(vertex_builds: list[VertexBuildBase], transactions: list[TransactionBase]) -> None:
+        async with session_scope() as session:
+            if vertex_builds:
+                await log_vertex_builds(session, vertex_builds)
+            if transactions:
+                await log_transactions(session, transactions)
+
+    async def _write_one_by_one(
+        self, vertex_builds: list[VertexBuildBase], transactions: list[TransactionBase]
+    ) -> None:
+        """Retry a batch that couldn't be written record by record, so one bad record doesn't hold back the rest.
+
+        The records that still fail are dropped, unless none could be written.
+        """
+        failed_builds: list[VertexBuildBase] = []
+        failed_transactions: list[TransactionBase] = []
+        written = 0
+        for vertex_build in vertex_builds:
+            try:
+                await self._write([vertex_build], [])
+            except Exception:  # noqa: BLE001
+                failed_builds.append(vertex_build)
+            else:
+                written += 1
+        for transaction in transactions:
+            try:
+                await self._write([], [transaction])
+            except Exception:  # noqa: BLE001
+                failed_transactions.append(transaction)
+            else:
+                written += 1
+        self.written += written
+        if not written:
+            self._requeue(failed_builds, failed_transactions)
+            return
+        failed = len(failed_builds) + len(failed_transactions)
+        if failed:
+            self.dropped += failed
+            await logger.aerror(f"Dropped {failed} buffered logs the database rejected")
+
+    async def discard_flow(self, flow_id: str | UUID, *, transactions: bool = True) -> None:
+        """Forget the pending records of a flow whose logs are being deleted, so they aren't written afterwards.
+
+        Waits for a write in progress, which may hold records of the flow, to finish first.
+
+        Args:
+            flow_id: The flow whose records are discarded.
+            transactions: Whether to discard the transactions of the flow too, not only its vertex builds.
+        """
+        flow_id = flow_id if isinstance(flow_id, UUID) else UUID(str(flow_id))
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            self._vertex_builds = [build for build in self._vertex_builds if build.flow_id != flow_id]
+            self._vertex_build_flows.discard(flow_id)
+            if transactions:
+                self._transactions = [
+                    transaction for transaction in self._transactions if transaction.flow_id != flow_id
+                ]
+                self._transaction_flows.discard(flow_id)
+
+    def _requeue(self, vertex_builds: list[VertexBuildBase], transactions: list[TransactionBase]) -> None:
+        """Put a batch that couldn't be written back in front of the buffer, to be written with the next batch.
+
+        Only the oldest records that don't fit in `log_buffer_max_size` are dropped.
+        """
+        self._vertex_builds = vertex_builds + self._vertex_builds
+        self._transactions = transactions + self._transactions
+        overflow = self.pending - self.max_size
+        if overflow <= 0:
+            return
+        dropped_builds = min(overflow, len(vertex_builds))
+        dropped_transactions = min(overflow - dropped_builds, len(transactions))
+        del self._vertex_builds[:dropped_builds]
+        del self._transactions[:dropped_transactions]
+        self.dropped += dropped_builds + dropped_transactions
+        logger.warning(f"Log buffer is full, dropped {dropped_builds + dropped_transactions} unwritten logs")
+
+    async def prune(self) -> None:
+        """Delete vertex builds and transactions exceeding the history limits on the flows written to."""
+        settings = self.settings_service.settings
+        vertex_build_flows, self._vertex_build_flows = self._vertex_build_flows, set()
+        transaction_flows, self._transaction_flows = self._transaction_flows, set()
+        try:
+            async with session_scope() as session:
+                if vertex_build_flows:
+                    await prune_vertex_builds(
+                        session,
+                        max_builds_to_keep=settings.max_vertex_builds_to_keep,
+                        max_builds_per_vertex=settings.max_vertex_builds_per_vertex,
+                        flow_ids=vertex_build_flows,
+                    )
+                if transaction_flows:
+                    await prune_transactions(
+                        session, max_entries=settings.max_transactions_to_keep, flow_ids=transaction_flows
+                    )
+        except Exception as exc:  # noqa: BLE001
+            # Try again on the next sweep
+            self._vertex_build_flows |= vertex_build_flows
+            self._transaction_flows |= transaction_flows
+            await logger.aerror(f"Error pruning vertex builds and transactions: {exc}")
+
+    async def _flush_periodically(self) -> None:
+        while not self._closed:
+            if self._flush_requested is not None:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+                self._flush_requested.clear()
+            await self.flush()
+
+    async def _prune_periodically(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.retention_interval)
+            # Records still in the buffer would escape this sweep
+            await self.flush()
+            await self.prune()
+
+    async def stop(self) -> None:
+        """Stop the background tasks, then write the pending records and enforce the history limits."""
+        self._closed = True
+        for task in (self._flush_task, self._retention_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._flush_task = None
+        self._retention_task = None
+        await self.flush()
+        if self.pending:
+            # The last write failed and nothing will retry it
+            self.dropped += self.pending
+            await logger.aerror(f"Dropped {self.pending} buffered logs that couldn't be written")
+            self._vertex_builds, self._transactions = [], []
+        await self.prune()
+        await logger.adebug("LogBufferService stopped")
+
+    async def teardown(self) -> None:
+        await self.stop()
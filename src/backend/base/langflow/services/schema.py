@@ -20,3 +20,5 @@ class ServiceType(str, Enum):
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
     MCP_COMPOSER_SERVICE = "mcp_composer_service"
+    LOG_BUFFER_SERVICE = "log_buffer_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
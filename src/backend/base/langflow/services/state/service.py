@@ -1,3 +1,6 @@
+import heapq
+import sys
+import time
 from collections import defaultdict
 from collections.abc import Callable
 from threading import Lock
@@ -7,6 +10,9 @@ from lfx.services.settings.service import SettingsService
 
 from langflow.services.base import Service
 
+# Number of locks the runs are spread over, so writes to different runs rarely wait for each other
+LOCK_SHARDS = 64
+
 
 class StateService(Service):
     name = "state_service"
@@ -20,6 +26,9 @@ class StateService(Service):
     def get_state(self, key, run_id: str):
         raise NotImplementedError
 
+    def release_run(self, run_id: str) -> None:
+        raise NotImplementedError
+
     def subscribe(self, key, observer: Callable) -> None:
         raise NotImplementedError
 
@@ -30,34 +39,127 @@ class StateService(Service):
         raise NotImplementedError
 
 
+class _RunState:
+    __slots__ = ("last_used", "size", "values")
+
+    def __init__(self) -> None:
+        self.values: dict = {}
+        self.size = 0
+        self.last_used = time.monotonic()
+
+
 class InMemoryStateService(StateService):
+    """Keeps the state of each graph run in memory until the run is released.
+
+    The state of a run is dropped by `release_run` when the run ends. Runs that are never released are dropped
+    after `state_service_run_ttl` seconds without use, and the least recently used runs are dropped when more
+    than `state_service_max_runs` are held. Reads and writes of an existing run lock only the shard of the run,
+    which is also where its last use is recorded; the global lock is only taken to create, evict or release runs.
+    """
+
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
-        self.states: dict[str, dict] = {}
+        self.ttl = settings_service.settings.state_service_run_ttl
+        self.max_runs = settings_service.settings.state_service_max_runs
+        self.states: dict[str, _RunState] = {}
         self.observers: dict[str, list[Callable]] = defaultdict(list)
+        # Guards the set of runs and the observers; the values of a run are guarded by the lock of its shard
         self.lock = Lock()
+        self._shard_locks = [Lock() for _ in range(LOCK_SHARDS)]
+        self._next_sweep = time.monotonic() + self.ttl / 10
+        self.evicted_runs = 0
+        self.expired_runs = 0
+
+    def _shard_lock(self, run_id: str) -> Lock:
+        return self._shard_locks[hash(run_id) % LOCK_SHARDS]
+
+    def _get_run(self, run_id: str) -> _RunState:
+        """Returns the state of a run, creating it if needed.
+
+        Callers record the use of the run under the lock of its shard.
+        """
+        run_state = self.states.get(run_id)
+        if run_state is not None:
+            return run_state
+        with self.lock:
+            run_state = self.states.get(run_id)
+            if run_state is None:
+                run_state = self.states[run_id] = _RunState()
+                self._evict()
+        return run_state
+
+    def _evict(self) -> None:
+        """Drops expired runs, at most every tenth of the TTL, and the least recently used runs over the limit.
+
+        Must be called with the lock held. Finding the least recently used runs walks every run, so a tenth of
+        the limit more is dropped at once to only do it again after as many new runs.
+        """
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._next_sweep = now + self.ttl / 10
+            expired = [run_id for run_id, run_state in self.states.items() if now - run_state.last_used > self.ttl]
+            for run_id in expired:
+                del self.states[run_id]
+            self.expired_runs += len(expired)
+        excess = len(self.states) - self.max_runs
+        if excess <= 0:
+            return
+        least_recently_used = heapq.nsmallest(
+            excess + self.max_runs // 10, self.states.items(), key=lambda item: item[1].last_used
+        )
+        for run_id, _ in least_recently_used:
+            del self.states[run_id]
+        self.evicted_runs += len(least_recently_used)
 
     def append_state(self, key, new_state, run_id: str) -> None:
-        with self.lock:
-            if run_id not in self.states:
-                self.states[run_id] = {}
-            if key not in self.states[run_id]:
-                self.states[run_id][key] = []
-            elif not isinstance(self.states[run_id][key], list):
-                self.states[run_id][key] = [self.states[run_id][key]]
-            self.states[run_id][key].append(new_state)
-            self.notify_append_observers(key, new_state)
+        run_state = self._get_run(run_id)
+        with self._shard_lock(run_id):
+            run_state.last_used = time.monotonic()
+            values = run_state.values
+            if key not in values:
+                values[key] = []
+            elif not isinstance(values[key], list):
+                values[key] = [values[key]]
+            values[key].append(new_state)
+            run_state.size += sys.getsizeof(new_state)
+        self.notify_append_observers(key, new_state)
 
     def update_state(self, key, new_state, run_id: str) -> None:
-        with self.lock:
-            if run_id not in self.states:
-                self.states[run_id] = {}
-            self.states[run_id][key] = new_state
-            self.notify_observers(key, new_state)
+        run_state = self._get_run(run_id)
+        with self._shard_lock(run_id):
+            run_state.last_used = time.monotonic()
+            values = run_state.values
+            if key in values:
+                old_state = values[key]
+                old_items = old_state if isinstance(old_state, list) else [old_state]
+                run_state.size -= sum(sys.getsizeof(item) for item in old_items)
+            values[key] = new_state
+            run_state.size += sys.getsizeof(new_state)
+        self.notify_observers(key, new_state)
 
     def get_state(self, key, run_id: str):
+        run_state = self.states.get(run_id)
+        if run_state is None:
+            return ""
+        with self._shard_lock(run_id):
+            run_state.last_used = time.monotonic()
+            return run_state.values.get(key, "")
+
+    def release_run(self, run_id: str) -> None:
+        """Drops the state of a run that ended."""
         with self.lock:
-            return self.states.get(run_id, {}).get(key, "")
+            self.states.pop(run_id, None)
+
+    def get_metrics(self) -> dict[str, int]:
+        """Returns the number of runs held, the approximate bytes of their state and the runs dropped unreleased."""
+        with self.lock:
+            run_states = list(self.states.values())
+        return {
+            "runs": len(run_states),
+            "bytes": sum(run_state.size for run_state in run_states),
+            "evicted_runs": self.evicted_runs,
+            "expired_runs": self.expired_runs,
+        }
 
     def subscribe(self, key, observer: Callable) -> None:
         with self.lock:
@@ -65,11 +167,11 @@ class InMemoryStateService(StateService):
                 self.observers[key].append(observer)
 
     def notify_observers(self, key, new_state) -> None:
-        for callback in self.observers[key]:
+        for callback in list(self.observers.get(key, ())):
             callback(key, new_state, append=False)
 
     def notify_append_observers(self, key, new_state) -> None:
-        for callback in self.observers[key]:
+        for callback in list(self.observers.get(key, ())):
             try:
                 callback(key, new_state, append=True)
             except Exception:  # noqa: BLE001
@@ -78,6 +180,14 @@ class InMemoryStateService(StateService):
 
     def unsubscribe(self, key, observer: Callable) -> None:
         with self.lock:
-            if observer in self.observers[key]:
+            observers = self.observers.get(key)
+            if observers and observer in observers:
                 # Use list.remove() since observers[key] is a list
-                self.observers[key].remove(observer)
+                observers.remove(observer)
+            if not observers:
+                self.observers.pop(key, None)
+
+    async def teardown(self) -> None:
+        with self.lock:
+            self.states.clear()
+            self.observers.clear()
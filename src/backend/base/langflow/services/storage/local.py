@@ -1,8 +1,24 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
 import anyio
 from aiofile import async_open
 from lfx.log.logger import logger
 
-from .service import StorageService
+from .service import ByteRange, SavedFile, StorageService, check_byte_range, iter_chunks
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+# Directories of the data directory holding the files being saved and, with dedup, the content of the files
+UPLOADS_DIR = ".uploads"
+BLOBS_DIR = ".blobs"
 
 
 class LocalStorageService(StorageService):
@@ -11,6 +27,7 @@ class LocalStorageService(StorageService):
     def __init__(self, session_service, settings_service) -> None:
         """Initialize the local storage service with session and settings services."""
         super().__init__(session_service, settings_service)
+        self.dedup_enabled: bool = settings_service.settings.storage_dedup_enabled
         self.set_ready()
 
     def build_full_path(self, flow_id: str, file_name: str) -> str:
@@ -30,17 +47,117 @@ class LocalStorageService(StorageService):
             IsADirectoryError: If the file name is a directory.
             PermissionError: If there is no permission to write the file.
         """
+        await self.save_stream(flow_id, file_name, iter_chunks(data, max(len(data), 1)))
+
+    async def save_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> SavedFile:
+        """Save a file in the local storage from an async iterable of byte chunks.
+
+        The chunks are written to a temporary file as they come, which is synced to disk and then renamed to the
+        file, so readers never see a partial file. With `storage_dedup_enabled`, files with the same SHA-256 are
+        hard links to a single copy kept in the blobs directory.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file.
+
+        Returns:
+            The size and SHA-256 digest of the file.
+        """
         folder_path = self.data_dir / flow_id
         await folder_path.mkdir(parents=True, exist_ok=True)
+        uploads_path = self.data_dir / UPLOADS_DIR
+        await uploads_path.mkdir(parents=True, exist_ok=True)
         file_path = folder_path / file_name
+        tmp_path = uploads_path / uuid4().hex
 
+        digest = hashlib.sha256()
+        size = 0
         try:
-            async with async_open(str(file_path), "wb") as f:
-                await f.write(data)
+            async with async_open(str(tmp_path), "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+                await f.flush(sync_metadata=True)
+            sha256 = digest.hexdigest()
+            if self.dedup_enabled:
+                await anyio.to_thread.run_sync(self._link_to_blob, Path(tmp_path), Path(file_path), sha256)
+            else:
+                await tmp_path.replace(file_path)
             await logger.ainfo(f"File {file_name} saved successfully in flow {flow_id}.")
         except Exception:
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            with contextlib.suppress(OSError):
+                await tmp_path.unlink(missing_ok=True)
             raise
+        return SavedFile(size, sha256)
+
+    def _blob_path(self, sha256: str) -> Path:
+        return Path(self.data_dir) / BLOBS_DIR / sha256[:2] / sha256
+
+    def _link_to_blob(self, tmp_path: Path, file_path: Path, sha256: str) -> None:
+        """Replace `file_path` with a hard link to the blob of its content, keeping `tmp_path` as the blob if new.
+
+        The blob of the replaced file is removed when the file was the last link to it.
+        """
+        replaced_blob = self._last_linked_blob(file_path)
+        self._replace_with_blob_link(tmp_path, file_path, sha256)
+        if replaced_blob is not None:
+            self._prune_blob(*replaced_blob)
+
+    def _replace_with_blob_link(self, tmp_path: Path, file_path: Path, sha256: str) -> None:
+        blob_path = self._blob_path(sha256)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(tmp_path, blob_path)
+        except FileExistsError:
+            link_path = tmp_path.with_suffix(".link")
+            try:
+                os.link(blob_path, link_path)
+            except FileNotFoundError:
+                # The blob was pruned in the meantime, keep the new copy
+                tmp_path.replace(file_path)
+                return
+            tmp_path.unlink()
+            tmp_path = link_path
+        except OSError:
+            # The file system has no hard links, keep a full copy
+            tmp_path.replace(file_path)
+            return
+        tmp_path.replace(file_path)
+        # Renaming a link over a link to the same file does nothing
+        tmp_path.unlink(missing_ok=True)
+
+    def _unlink_deduplicated(self, file_path: Path) -> None:
+        """Remove a file, and the blob of its content when the file was the last link to it."""
+        blob = self._last_linked_blob(file_path)
+        file_path.unlink()
+        if blob is not None:
+            self._prune_blob(*blob)
+
+    def _last_linked_blob(self, file_path: Path) -> tuple[Path, os.stat_result] | None:
+        """Return the blob path and the stat of `file_path` when it may be the last link to a blob, else None."""
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+        if stat.st_nlink != 2:  # noqa: PLR2004
+            return None
+        # The other link may be the blob, which is named after the digest of the content
+        digest = hashlib.sha256()
+        with file_path.open("rb") as f:
+            while chunk := f.read(self.chunk_size):
+                digest.update(chunk)
+        return self._blob_path(digest.hexdigest()), stat
+
+    @staticmethod
+    def _prune_blob(blob_path: Path, stat: os.stat_result) -> None:
+        """Remove the blob of a file that was unlinked or replaced, if nothing else links to it anymore."""
+        with contextlib.suppress(FileNotFoundError):
+            blob_stat = blob_path.stat()
+            if (blob_stat.st_dev, blob_stat.st_ino) == (stat.st_dev, stat.st_ino) and blob_stat.st_nlink == 1:
+                blob_path.unlink()
 
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the local storage.
@@ -67,6 +184,42 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def open_stream(
+        self, flow_id: str, file_name: str, byte_range: ByteRange | None = None
+    ) -> AsyncIterator[bytes]:
+        """Open a file of the local storage for reading in chunks of `storage_chunk_size` bytes.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be read.
+            byte_range: The `(start, stop)` offsets of the bytes to read, `stop` excluded. None reads the whole file.
+
+        Returns:
+            An async iterator over the chunks of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        start, stop = check_byte_range(byte_range)
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            await logger.awarning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+        return self._read_chunks(str(file_path), start, stop)
+
+    async def _read_chunks(self, file_path: str, start: int, stop: int | None) -> AsyncIterator[bytes]:
+        async with async_open(file_path, "rb") as f:
+            f.seek(start)
+            remaining = None if stop is None else stop - start
+            while remaining is None or remaining > 0:
+                chunk = await f.read(self.chunk_size if remaining is None else min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -104,7 +257,10 @@ class LocalStorageService(StorageService):
         """
         file_path = self.data_dir / flow_id / file_name
         if await file_path.exists():
-            await file_path.unlink()
+            if self.dedup_enabled:
+                await anyio.to_thread.run_sync(self._unlink_deduplicated, Path(file_path))
+            else:
+                await file_path.unlink()
             await logger.ainfo(f"File {file_name} deleted successfully from flow {flow_id}.")
         else:
             await logger.awarning(f"Attempted to delete non-existent file {file_name} in flow {flow_id}.")
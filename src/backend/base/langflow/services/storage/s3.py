@@ -1,8 +1,18 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+from typing import TYPE_CHECKING
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from lfx.log.logger import logger
 
-from .service import StorageService
+from .service import ByteRange, SavedFile, StorageService, check_byte_range, iter_chunks
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
 
 
 class S3StorageService(StorageService):
@@ -13,6 +23,7 @@ class S3StorageService(StorageService):
         super().__init__(session_service, settings_service)
         self.bucket = "langflow"
         self.s3_client = boto3.client("s3")
+        self.part_size: int = settings_service.settings.storage_s3_part_size
         self.set_ready()
 
     async def save_file(self, folder: str, file_name: str, data) -> None:
@@ -57,6 +68,118 @@ class S3StorageService(StorageService):
             await logger.aexception(f"Error retrieving file {file_name} from folder {folder}")
             raise
 
+    async def save_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> SavedFile:
+        """Save a file to the S3 bucket from an async iterable of byte chunks.
+
+        Files larger than `storage_s3_part_size` are sent with a multipart upload, one part at a time, so at most
+        one part is held in memory. The upload is aborted if the chunks or a part fail.
+
+        Args:
+            flow_id: The folder in the bucket to save the file.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file.
+
+        Returns:
+            The size and SHA-256 digest of the file.
+        """
+        key = f"{flow_id}/{file_name}"
+        digest = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        upload_id = None
+        parts: list[dict] = []
+        try:
+            async for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                buffer += chunk
+                if len(buffer) >= self.part_size:
+                    if upload_id is None:
+                        response = await asyncio.to_thread(
+                            self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key
+                        )
+                        upload_id = response["UploadId"]
+                    parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                    buffer.clear()
+            if upload_id is None:
+                await asyncio.to_thread(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer))
+            else:
+                if buffer:
+                    parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+            await logger.ainfo(f"File {file_name} saved successfully in folder {flow_id}.")
+        except Exception as exc:
+            if upload_id is not None:
+                # Don't leave the uploaded parts billed in the bucket, nor hide the error with a failed abort
+                with contextlib.suppress(ClientError):
+                    await asyncio.to_thread(
+                        self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                    )
+            if isinstance(exc, NoCredentialsError):
+                await logger.aexception("Credentials not available for AWS S3.")
+            else:
+                await logger.aexception(f"Error saving file {file_name} in folder {flow_id}")
+            raise
+        return SavedFile(size, digest.hexdigest())
+
+    async def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> dict:
+        response = await asyncio.to_thread(
+            self.s3_client.upload_part,
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    async def open_stream(
+        self, flow_id: str, file_name: str, byte_range: ByteRange | None = None
+    ) -> AsyncIterator[bytes]:
+        """Open a file of the S3 bucket for reading in chunks of `storage_chunk_size` bytes.
+
+        Args:
+            flow_id: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be read.
+            byte_range: The `(start, stop)` offsets of the bytes to read, `stop` excluded, fetched with a ranged
+                GET. None reads the whole file.
+
+        Returns:
+            An async iterator over the chunks of the file.
+
+        Raises:
+            Exception: If an error occurs during file retrieval.
+        """
+        start, stop = check_byte_range(byte_range)
+        if stop == start:
+            # S3 can't serve an empty range
+            return iter_chunks(b"", self.chunk_size)
+        kwargs = {}
+        if start or stop is not None:
+            # HTTP ranges include their last byte
+            kwargs["Range"] = f"bytes={start}-{'' if stop is None else stop - 1}"
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.get_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}", **kwargs
+            )
+        except ClientError:
+            await logger.aexception(f"Error retrieving file {file_name} from folder {flow_id}")
+            raise
+        return self._read_chunks(response["Body"])
+
+    async def _read_chunks(self, body) -> AsyncIterator[bytes]:
+        try:
+            while chunk := await asyncio.to_thread(body.read, self.chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
 
@@ -1,17 +1,47 @@
 from __future__ import annotations
 
+import hashlib
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import anyio
 
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from lfx.services.settings.service import SettingsService
 
     from langflow.services.session.service import SessionService
 
+# Offsets of the first byte to read and of the byte to stop at, excluded; a stop of None reads to the end
+ByteRange = tuple[int, int | None]
+
+
+class SavedFile(NamedTuple):
+    """Size and SHA-256 digest of a file saved from a stream."""
+
+    size: int
+    sha256: str
+
+
+def check_byte_range(byte_range: ByteRange | None) -> ByteRange:
+    """Returns the `(start, stop)` offsets of a byte range, reading the whole file when it is None."""
+    if byte_range is None:
+        return 0, None
+    start, stop = byte_range
+    if start < 0 or (stop is not None and stop < start):
+        msg = f"Invalid byte range {byte_range}"
+        raise ValueError(msg)
+    return start, stop
+
+
+async def iter_chunks(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yields `data` in chunks of at most `chunk_size` bytes."""
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
 
 class StorageService(Service):
     name = "storage_service"
@@ -20,6 +50,7 @@ class StorageService(Service):
         self.settings_service = settings_service
         self.session_service = session_service
         self.data_dir: anyio.Path = anyio.Path(settings_service.settings.config_dir)
+        self.chunk_size: int = settings_service.settings.storage_chunk_size
         self.set_ready()
 
     def build_full_path(self, flow_id: str, file_name: str) -> str:
@@ -48,5 +79,29 @@ class StorageService(Service):
     async def delete_file(self, flow_id: str, file_name: str) -> None:
         raise NotImplementedError
 
+    async def save_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> SavedFile:
+        """Save a file from an async iterable of byte chunks.
+
+        Storages that can't write a file chunk by chunk buffer it and save it with `save_file`.
+        """
+        digest = hashlib.sha256()
+        data = bytearray()
+        async for chunk in chunks:
+            digest.update(chunk)
+            data += chunk
+        await self.save_file(flow_id, file_name, bytes(data))
+        return SavedFile(len(data), digest.hexdigest())
+
+    async def open_stream(
+        self, flow_id: str, file_name: str, byte_range: ByteRange | None = None
+    ) -> AsyncIterator[bytes]:
+        """Return an async iterator over the chunks of a file, or of the `(start, stop)` byte range of it.
+
+        Storages that can't read a file chunk by chunk read it whole with `get_file`.
+        """
+        start, stop = check_byte_range(byte_range)
+        data = await self.get_file(flow_id, file_name)
+        return iter_chunks(data[start:stop], self.chunk_size)
+
     async def teardown(self) -> None:
         raise NotImplementedError
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,27 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def get_variables(self, user_id: UUID | str, names: Iterable[str], session: AsyncSession) -> dict[str, str]:
+        """Get the values of several variables.
+
+        Services that can fetch several variables at once should override this method.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+
+        Returns:
+            The values of the variables that were found, by name.
+        """
+        values = {}
+        for name in names:
+            try:
+                values[name] = await self.get_variable(user_id, name, "", session)
+            except ValueError:
+                continue
+        return values
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+from cachetools import TTLCache
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+DEFAULT_MAX_SIZE = 4096
+
+
+class CachedVariable(NamedTuple):
+    type: str | None
+    value: str
+
+
+class VariableValueCache:
+    """In-memory cache of decrypted variable values, per user, with a short time to live.
+
+    Values are never persisted. The entries of a user are dropped with `invalidate` whenever one of
+    their variables is created, updated or deleted; the time to live bounds how long a change made
+    by another process can go unnoticed.
+
+    Args:
+        ttl: Time in seconds an entry is kept. 0 disables the cache.
+        max_size: Maximum number of entries kept.
+    """
+
+    def __init__(self, ttl: float, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._cache: TTLCache | None = TTLCache(maxsize=max_size, ttl=ttl) if ttl > 0 else None
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID | str, name: str) -> CachedVariable | None:
+        if self._cache is None:
+            return None
+        with self._lock:
+            return self._cache.get((str(user_id), name))
+
+    def set(self, user_id: UUID | str, name: str, variable: CachedVariable) -> None:
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache[str(user_id), name] = variable
+
+    def invalidate(self, user_id: UUID | str) -> None:
+        """Drops every cached variable of `user_id`."""
+        if self._cache is None:
+            return
+        user_key = str(user_id)
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == user_key]:
+                self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache.clear()
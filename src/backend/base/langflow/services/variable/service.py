@@ -5,17 +5,18 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from lfx.log.logger import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
 from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableCreate, VariableRead, VariableUpdate
 from langflow.services.variable.base import VariableService
+from langflow.services.variable.cache import CachedVariable, VariableValueCache
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
     from lfx.services.settings.service import SettingsService
@@ -25,6 +26,8 @@ if TYPE_CHECKING:
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        # Decrypted values, so that resolving the same variable again doesn't cost a query and a decryption
+        self.value_cache = VariableValueCache(ttl=settings_service.settings.variable_cache_ttl)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -59,24 +62,51 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
-
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
-
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+        cached = self.value_cache.get(user_id, name)
+        if cached is None:
+            # we get the credential from the database
+            stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
+            variable = (await session.exec(stmt)).first()
+
+            if not variable or not variable.value:
+                msg = f"{name} variable not found."
+                raise ValueError(msg)
+            cached = self._cache_variable(user_id, variable)
+
+        if cached.type == CREDENTIAL_TYPE and field == "session_id":
             msg = (
                 f"variable {name} of type 'Credential' cannot be used in a Session ID field "
                 "because its purpose is to prevent the exposure of values."
             )
             raise TypeError(msg)
 
+        return cached.value
+
+    async def get_variables(self, user_id: UUID | str, names: Iterable[str], session: AsyncSession) -> dict[str, str]:
+        values: dict[str, str] = {}
+        missing: list[str] = []
+        for name in set(names):
+            cached = self.value_cache.get(user_id, name)
+            if cached is None:
+                missing.append(name)
+            else:
+                values[name] = cached.value
+        if missing:
+            # One query for every variable that isn't cached yet
+            stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+            for variable in (await session.exec(stmt)).all():
+                if variable.value:
+                    values[variable.name] = self._cache_variable(user_id, variable).value
+        return values
+
+    def _cache_variable(self, user_id: UUID | str, variable: Variable) -> CachedVariable:
         # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        cached = CachedVariable(
+            type=variable.type,
+            value=auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service),
+        )
+        self.value_cache.set(user_id, variable.name, cached)
+        return cached
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -119,6 +149,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self.value_cache.invalidate(user_id)
         await session.refresh(variable)
         return variable
 
@@ -143,6 +174,7 @@ class DatabaseVariableService(VariableService, Service):
 
         session.add(db_variable)
         await session.commit()
+        self.value_cache.invalidate(user_id)
         await session.refresh(db_variable)
         return db_variable
 
@@ -160,6 +192,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.value_cache.invalidate(user_id)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -170,6 +203,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.value_cache.invalidate(user_id)
 
     async def create_variable(
         self,
@@ -190,5 +224,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self.value_cache.invalidate(user_id)
         await session.refresh(variable)
         return variable
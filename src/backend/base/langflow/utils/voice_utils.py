@@ -1,10 +1,11 @@
 import asyncio
 import base64
+import math
 from pathlib import Path
 
 import numpy as np
 from lfx.log import logger
-from scipy.signal import resample
+from scipy.signal import firwin, resample, upfirdn
 
 SAMPLE_RATE_24K = 24000
 VAD_SAMPLE_RATE_16K = 16000
@@ -13,6 +14,14 @@ BYTES_PER_SAMPLE = 2
 
 BYTES_PER_24K_FRAME = int(SAMPLE_RATE_24K * FRAME_DURATION_MS / 1000) * BYTES_PER_SAMPLE
 BYTES_PER_16K_FRAME = int(VAD_SAMPLE_RATE_16K * FRAME_DURATION_MS / 1000) * BYTES_PER_SAMPLE
+SAMPLES_PER_16K_FRAME = BYTES_PER_16K_FRAME // BYTES_PER_SAMPLE
+
+# 24kHz -> 16kHz is an upsampling by 2 followed by a downsampling by 3
+_UP, _DOWN = 2, 3
+# Same anti-aliasing filter as scipy.signal.resample_poly
+_RESAMPLE_FILTER = firwin(2 * 10 * _DOWN + 1, 1 / _DOWN, window=("kaiser", 5.0)) * _UP
+# Input samples kept between chunks to compute the first outputs of the next chunk, a multiple of _DOWN
+_HISTORY = math.ceil(len(_RESAMPLE_FILTER) / _UP / _DOWN) * _DOWN
 
 
 def resample_24k_to_16k(frame_24k_bytes):
@@ -43,6 +52,81 @@ def resample_24k_to_16k(frame_24k_bytes):
     return frame_16k.tobytes()
 
 
+class StreamingResampler:
+    """Resamples a stream of 24kHz 16-bit PCM chunks to 16kHz with a polyphase filter.
+
+    Unlike `resample_24k_to_16k`, which resamples each 20ms frame on its own with an FFT, chunks of any size are
+    resampled at once and the filter state is carried over between chunks, so there are no artifacts at the frame
+    boundaries. The output lags the input by the delay of the filter, about 0.6ms.
+    """
+
+    def __init__(self) -> None:
+        # Input samples not consumed yet, starting at the absolute input index `_start`
+        self._samples = np.zeros(_HISTORY, dtype=np.float64)
+        self._start = -_HISTORY
+        self._next_output = 0
+        self._odd_byte = b""
+
+    def process(self, chunk_24k: bytes) -> np.ndarray:
+        """Returns the 16kHz samples, as int16, that can be computed once `chunk_24k` is received."""
+        if self._odd_byte:
+            chunk_24k = self._odd_byte + chunk_24k
+        usable = len(chunk_24k) - len(chunk_24k) % BYTES_PER_SAMPLE
+        self._odd_byte = chunk_24k[usable:]
+        samples = np.concatenate((self._samples, np.frombuffer(chunk_24k[:usable], dtype=np.int16)))
+        end = self._start + len(samples)
+
+        # Output m uses the upsampled inputs up to 3m, that is the inputs up to floor(3m / 2)
+        output_end = (_UP * end - 1) // _DOWN + 1
+        first = self._next_output - self._start * _UP // _DOWN
+        resampled = upfirdn(_RESAMPLE_FILTER, samples, _UP, _DOWN)[first : first + output_end - self._next_output]
+        self._next_output = output_end
+
+        # Keep the inputs the next outputs still need
+        needed = (_DOWN * output_end - len(_RESAMPLE_FILTER) + 1) // _UP
+        keep_from = max(self._start, needed // _DOWN * _DOWN)
+        self._samples = samples[keep_from - self._start :]
+        self._start = keep_from
+        return np.clip(np.rint(resampled), -32768, 32767).astype(np.int16)
+
+
+class VADFrameStream:
+    """Turns a stream of 24kHz 16-bit PCM chunks into 20ms frames of 16kHz audio for webrtcvad.
+
+    The samples of an incomplete frame are carried over to the next chunk, so no buffer is ever shifted.
+    """
+
+    def __init__(self) -> None:
+        self._resampler = StreamingResampler()
+        self._pending = np.empty(0, dtype=np.int16)
+
+    def feed(self, chunk_24k: bytes) -> np.ndarray:
+        """Returns the complete 16kHz frames available after `chunk_24k`, as rows of a 2D int16 array."""
+        samples = self._resampler.process(chunk_24k)
+        if len(self._pending):
+            samples = np.concatenate((self._pending, samples))
+        frame_count = len(samples) // SAMPLES_PER_16K_FRAME
+        split = frame_count * SAMPLES_PER_16K_FRAME
+        self._pending = samples[split:].copy()
+        return samples[:split].reshape(frame_count, SAMPLES_PER_16K_FRAME)
+
+
+def detect_speech(vad, frames_16k: np.ndarray) -> np.ndarray:
+    """Runs webrtcvad on a batch of 20ms 16kHz frames, returning whether each frame holds speech.
+
+    Every frame is passed to the VAD, in order, since it smooths its decisions over consecutive frames.
+    """
+    data = memoryview(np.ascontiguousarray(frames_16k)).cast("B")
+    return np.fromiter(
+        (
+            vad.is_speech(data[offset : offset + BYTES_PER_16K_FRAME], VAD_SAMPLE_RATE_16K)
+            for offset in range(0, len(data), BYTES_PER_16K_FRAME)
+        ),
+        dtype=bool,
+        count=len(frames_16k),
+    )
+
+
 # def resample_24k_to_16k(frame_24k_bytes: bytes) -> bytes:
 #    """
 #    Convert one 20ms chunk (960 bytes @ 24kHz) to 20ms @ 16kHz (640 bytes).
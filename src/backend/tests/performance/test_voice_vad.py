@@ -0,0 +1,86 @@
+import time
+
+import numpy as np
+import pytest
+from langflow.utils.voice_utils import (
+    BYTES_PER_24K_FRAME,
+    SAMPLE_RATE_24K,
+    VAD_SAMPLE_RATE_16K,
+    VADFrameStream,
+    detect_speech,
+    resample_24k_to_16k,
+)
+
+# 10 seconds of audio, sent as the 100ms chunks of a realtime voice session
+AUDIO_SECONDS = 10
+CHUNK_BYTES = BYTES_PER_24K_FRAME * 5
+# A session produces 50 frames per second
+FRAME_COUNT = AUDIO_SECONDS * 50
+
+
+def _audio_24k() -> bytes:
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(SAMPLE_RATE_24K * AUDIO_SECONDS) * 3000).astype(np.int16).tobytes()
+
+
+def _chunks(audio: bytes) -> list[bytes]:
+    return [audio[i : i + CHUNK_BYTES] for i in range(0, len(audio), CHUNK_BYTES)]
+
+
+def _frames_24k(audio: bytes) -> list[bytes]:
+    return [audio[i : i + BYTES_PER_24K_FRAME] for i in range(0, len(audio), BYTES_PER_24K_FRAME)]
+
+
+def _frames_per_second(run) -> tuple[int, float]:
+    start = time.perf_counter()
+    frames = run()
+    return frames, frames / (time.perf_counter() - start)
+
+
+def _record_throughput(record_property, streaming_fps: float, per_frame_fps: float) -> None:
+    # Timings vary too much between machines to be asserted, they are reported in the JUnit XML report
+    record_property("streaming_frames_per_second", round(streaming_fps))
+    record_property("per_frame_frames_per_second", round(per_frame_fps))
+
+
+@pytest.mark.benchmark
+def test_vad_frame_stream_throughput(record_property):
+    """Benchmark the 20ms frames per second per core prepared for the VAD, against per-frame resampling."""
+    audio = _audio_24k()
+    chunks = _chunks(audio)
+
+    def streaming() -> int:
+        stream = VADFrameStream()
+        return sum(len(stream.feed(chunk)) for chunk in chunks)
+
+    def per_frame() -> int:
+        return len([resample_24k_to_16k(frame) for frame in _frames_24k(audio)])
+
+    streaming_frames, streaming_fps = _frames_per_second(streaming)
+    per_frame_frames, per_frame_fps = _frames_per_second(per_frame)
+
+    assert streaming_frames == per_frame_frames == FRAME_COUNT
+    _record_throughput(record_property, streaming_fps, per_frame_fps)
+
+
+@pytest.mark.benchmark
+def test_webrtcvad_throughput(record_property):
+    """Benchmark the 20ms frames per second per core run through webrtcvad, against per-frame resampling."""
+    webrtcvad = pytest.importorskip("webrtcvad")
+    audio = _audio_24k()
+    chunks = _chunks(audio)
+
+    def streaming() -> int:
+        vad = webrtcvad.Vad(3)
+        stream = VADFrameStream()
+        return sum(len(detect_speech(vad, stream.feed(chunk))) for chunk in chunks)
+
+    def per_frame() -> int:
+        vad = webrtcvad.Vad(3)
+        return len([vad.is_speech(resample_24k_to_16k(frame), VAD_SAMPLE_RATE_16K) for frame in _frames_24k(audio)])
+
+    streaming_frames, streaming_fps = _frames_per_second(streaming)
+    per_frame_frames, per_frame_fps = _frames_per_second(per_frame)
+
+    assert streaming_frames == per_frame_frames == FRAME_COUNT
+    _record_throughput(record_property, streaming_fps, per_frame_fps)
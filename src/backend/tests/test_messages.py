@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from unittest.mock import patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -10,6 +11,8 @@ from langflow.memory import (
     aget_messages,
     astore_message,
     aupdate_messages,
+    buffered_messages,
+    delete_message,
     delete_messages,
     get_messages,
 )
@@ -23,6 +26,7 @@ from langflow.services.database.models.message import MessageCreate, MessageRead
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.deps import session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
+from sqlmodel import select
 
 
 @pytest.fixture
@@ -362,3 +366,86 @@ async def test_aupdate_message_with_nested_properties(created_message):
     assert updated[0].properties.allow_markdown is True
     assert updated[0].properties.state == "complete"
     assert updated[0].properties.targets == []
+
+
+async def count_stored_messages(session_id: str) -> int:
+    async with session_scope() as session:
+        messages = await session.exec(select(MessageTable).where(MessageTable.session_id == session_id))
+        return len(messages.all())
+
+
+@pytest.mark.usefixtures("client")
+async def test_buffered_messages_are_written_at_the_end():
+    session_id = "buffered_session_id"
+    async with buffered_messages(max_size=10) as buffer:
+        stored = await aadd_messages(
+            [
+                Message(text="First", sender="User", sender_name="User", session_id=session_id),
+                Message(text="", sender="AI", sender_name="AI", session_id=session_id),
+            ]
+        )
+        stored[1].text = "Streamed answer"
+        updated = await aupdate_messages(stored[1])
+
+        assert updated[0].text == "Streamed answer"
+        assert buffer.pending == 2
+        assert await count_stored_messages(session_id) == 0
+
+    messages = await aget_messages(session_id=session_id, order="ASC")
+    assert [message.text for message in messages] == ["First", "Streamed answer"]
+
+
+@pytest.mark.usefixtures("client")
+async def test_buffered_messages_are_written_before_reads():
+    session_id = "buffered_read_session_id"
+    async with buffered_messages(max_size=10) as buffer:
+        await aadd_messages(Message(text="First", sender="User", sender_name="User", session_id=session_id))
+
+        messages = await aget_messages(session_id=session_id)
+
+        assert [message.text for message in messages] == ["First"]
+        assert buffer.pending == 0
+
+
+@pytest.mark.usefixtures("client")
+async def test_buffered_messages_are_written_when_full():
+    session_id = "buffered_full_session_id"
+    async with buffered_messages(max_size=2) as buffer:
+        for text in ["First", "Second", "Third"]:
+            await aadd_messages(Message(text=text, sender="User", sender_name="User", session_id=session_id))
+
+        assert buffer.pending == 1
+        assert await count_stored_messages(session_id) == 2
+
+
+@pytest.mark.usefixtures("client")
+async def test_buffered_messages_are_kept_when_the_write_fails():
+    session_id = "buffered_failed_session_id"
+    async with buffered_messages(max_size=10) as buffer:
+        await aadd_messages(Message(text="First", sender="User", sender_name="User", session_id=session_id))
+
+        with (
+            patch("langflow.memory.aadd_messagetables", side_effect=RuntimeError("database is locked")),
+            pytest.raises(RuntimeError, match="database is locked"),
+        ):
+            await buffer.flush()
+
+        assert buffer.pending == 1
+
+    assert await count_stored_messages(session_id) == 1
+
+
+@pytest.mark.usefixtures("client")
+async def test_deleted_buffered_message_is_never_written():
+    session_id = "buffered_deleted_session_id"
+    async with buffered_messages(max_size=10):
+        stored = await aadd_messages(Message(text="Oops", sender="AI", sender_name="AI", session_id=session_id))
+        await delete_message(stored[0].id)
+
+    assert await count_stored_messages(session_id) == 0
+
+
+@pytest.mark.usefixtures("client")
+async def test_buffering_disabled_by_default():
+    async with buffered_messages() as buffer:
+        assert buffer is None
@@ -7,14 +7,17 @@ import pytest
 from fastapi import UploadFile
 
 # Module under test
-from langflow.api.v2.files import upload_user_file
+from langflow.api.v2.files import save_file_routine, upload_user_file
 from langflow.api.v2.mcp import get_mcp_file
+from langflow.services.storage.service import SavedFile
 
 if TYPE_CHECKING:
     from langflow.services.database.models.file.model import File as UserFile
 
 
 class FakeStorageService:  # Minimal stub for storage interactions
+    chunk_size = 8192
+
     def __init__(self):
         # key -> bytes
         self._store: dict[str, bytes] = {}
@@ -22,6 +25,11 @@ class FakeStorageService:  # Minimal stub for storage interactions
     async def save_file(self, flow_id: str, file_name: str, data: bytes):
         self._store[f"{flow_id}/{file_name}"] = data
 
+    async def save_stream(self, flow_id: str, file_name: str, chunks):
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save_file(flow_id, file_name, data)
+        return SavedFile(len(data), "")
+
     async def get_file_size(self, flow_id: str, file_name: str):
         return len(self._store.get(f"{flow_id}/{file_name}", b""))
 
@@ -124,6 +132,7 @@ async def test_mcp_servers_upload_replace(session, storage_service, settings_ser
 
     # DB should contain single entry named _mcp_servers
     assert list(session._db.keys()) == [mcp_file]
+    assert session._db[mcp_file].size == len(content1)
 
     # Upload again with different content
     content2 = b'{"mcpServers": {"everything": {}}}'
@@ -167,3 +176,13 @@ async def test_mcp_servers_upload_replace(session, storage_service, settings_ser
 
     stored_bytes = storage_service._store[expected_path]
     assert stored_bytes == content3
+
+
+@pytest.mark.asyncio
+async def test_empty_file_content_is_saved(storage_service, current_user):
+    _, file_name, file_size = await save_file_routine(
+        None, storage_service, current_user, file_content=b"", file_name="empty.txt"
+    )
+
+    assert (file_name, file_size) == ("empty.txt", 0)
+    assert storage_service._store[f"{current_user.id}/empty.txt"] == b""
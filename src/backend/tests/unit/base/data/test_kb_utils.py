@@ -1,5 +1,15 @@
+import threading
+
 import pytest
-from langflow.base.knowledge_bases.knowledge_base_utils import compute_bm25, compute_tfidf
+from langflow.base.knowledge_bases.knowledge_base_utils import (
+    KB_STATS_FILENAME,
+    compute_bm25,
+    compute_tfidf,
+    count_words_and_characters,
+    read_kb_stats,
+    update_kb_stats,
+    write_kb_stats,
+)
 
 
 class TestKBUtils:
@@ -456,3 +466,60 @@ class TestKBUtils:
         assert scores[1] > 0.0
         # Third document only contains "bird", so should have zero score
         assert scores[2] == 0.0
+
+
+class TestKBStats:
+    """Test suite for the knowledge base statistics file."""
+
+    def test_count_words_and_characters(self):
+        """Test that words are split on whitespace and every character is counted."""
+        assert count_words_and_characters(["hello world", " a  b ", ""]) == (4, 17)
+
+    def test_read_kb_stats_missing_or_invalid(self, tmp_path):
+        """Test that a missing or invalid statistics file reads as None."""
+        assert read_kb_stats(tmp_path) is None
+
+        (tmp_path / KB_STATS_FILENAME).write_text("not json")
+        assert read_kb_stats(tmp_path) is None
+
+        (tmp_path / KB_STATS_FILENAME).write_text('{"chunks": 1}')
+        assert read_kb_stats(tmp_path) is None
+
+    def test_write_kb_stats_measures_size(self, tmp_path):
+        """Test that the directory size is measured when not given."""
+        (tmp_path / "data.bin").write_bytes(b"x" * 100)
+
+        stats = write_kb_stats(tmp_path, chunks=2, words=10, characters=50)
+
+        assert stats["bytes"] == 100
+        assert read_kb_stats(tmp_path) == stats
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_update_kb_stats_is_incremental(self, tmp_path):
+        """Test that counts are added to the existing statistics and never go below zero."""
+        update_kb_stats(tmp_path, chunks=2, words=10, characters=50)
+        stats = update_kb_stats(tmp_path, chunks=1, words=5, characters=20)
+
+        assert (stats["chunks"], stats["words"], stats["characters"]) == (3, 15, 70)
+        assert "updated_at" in stats
+
+        stats = update_kb_stats(tmp_path, chunks=-5, words=-5, characters=-5)
+        assert (stats["chunks"], stats["words"], stats["characters"]) == (0, 10, 65)
+
+    def test_concurrent_update_kb_stats_keeps_every_update(self, tmp_path):
+        """Test that concurrent updates of the same knowledge base don't lose counts."""
+        write_kb_stats(tmp_path, chunks=0, words=0, characters=0)
+
+        def update():
+            for _ in range(10):
+                update_kb_stats(tmp_path, chunks=1, words=2, characters=3)
+
+        threads = [threading.Thread(target=update) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = read_kb_stats(tmp_path)
+        assert (stats["chunks"], stats["words"], stats["characters"]) == (80, 160, 240)
+        assert not list(tmp_path.glob("*.tmp"))
@@ -1,5 +1,4 @@
-import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from langflow.io import Output
 from lfx.components.files_and_knowledge.file import FileComponent
@@ -114,13 +113,14 @@ class TestFileComponentDynamicOutputs:
         assert result["advanced_mode"]["show"] is False
         assert result["advanced_mode"]["value"] is False
 
-    @patch("subprocess.run")
-    def test_process_docling_subprocess_success(self, mock_subprocess):
-        """Test successful Docling subprocess execution."""
+    @patch("lfx.components.files_and_knowledge.file.get_docling_parse_cache", return_value=None)
+    @patch("lfx.components.files_and_knowledge.file.get_docling_worker_pool")
+    def test_process_docling_subprocess_success(self, mock_pool, mock_cache):  # noqa: ARG002
+        """Test successful Docling worker execution."""
         component = FileComponent()
         component.markdown = False
 
-        # Mock successful subprocess response
+        # Mock successful worker response
         mock_result = {
             "ok": True,
             "mode": "structured",
@@ -130,13 +130,39 @@ class TestFileComponentDynamicOutputs:
             ],
             "meta": {"file_path": "test.pdf"},
         }
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
-            stderr=b"",
-        )
+        mock_pool.return_value.convert.return_value = mock_result
 
         result = component._process_docling_in_subprocess("test.pdf")
 
         assert result is not None
         assert result.data["doc"] == mock_result["doc"]
         assert result.data["file_path"] == "test.pdf"
+
+    @patch("lfx.components.files_and_knowledge.file.get_docling_worker_pool")
+    def test_process_docling_uses_parse_cache(self, mock_pool, tmp_path):
+        """Test that a file with already converted content is served from the parse cache."""
+        from lfx.base.data.docling_pool import DoclingParseCache
+
+        component = FileComponent()
+        component.markdown = True
+        first = tmp_path / "first.pdf"
+        copy = tmp_path / "copy.pdf"
+        first.write_bytes(b"%PDF-1.4 content")
+        copy.write_bytes(b"%PDF-1.4 content")
+        mock_pool.return_value.convert.return_value = {
+            "ok": True,
+            "mode": "markdown",
+            "text": "# Title",
+            "meta": {"file_path": str(first)},
+        }
+
+        with patch(
+            "lfx.components.files_and_knowledge.file.get_docling_parse_cache",
+            return_value=DoclingParseCache(tmp_path / "cache"),
+        ):
+            first_result = component._process_docling_in_subprocess(str(first))
+            copy_result = component._process_docling_in_subprocess(str(copy))
+
+        mock_pool.return_value.convert.assert_called_once()
+        assert first_result.data["exported_content"] == copy_result.data["exported_content"] == "# Title"
+        assert copy_result.data["file_path"] == str(copy)
@@ -1,3 +1,4 @@
+import hashlib
 import json
 from unittest.mock import MagicMock, patch
 
@@ -263,6 +264,39 @@ class TestKnowledgeIngestionComponent(ComponentTestBaseWithClient):
         # Should only return one object (second row) since first is duplicate
         assert len(data_objects) == 1
 
+    def test_build_row_payloads(self, component_class, default_kwargs):
+        """Test that payloads skip missing values and hash the identifier columns."""
+        component = component_class(**default_kwargs)
+        data_df = DataFrame({"text": ["Sample", None], "title": ["Title 1", None], "category": ["cat1", "cat2"]})
+
+        payloads = component._build_row_payloads(data_df, ["text"], ["category"])
+
+        assert payloads[0] == {
+            "text": "Sample",
+            "title": "Title 1",
+            "category": "cat1",
+            "_id": hashlib.sha256(b"cat1").hexdigest(),
+        }
+        assert payloads[1] == {"text": "", "category": "cat2", "_id": hashlib.sha256(b"cat2").hexdigest()}
+
+    async def test_iter_data_batches_only_looks_up_batch_hashes(self, component_class, default_kwargs):
+        """Test that rows are converted in batches and only the hashes of a batch are looked up."""
+        default_kwargs["chunk_size"] = 2
+        component = component_class(**default_kwargs)
+        data_df = DataFrame({"text": ["a", "b", "a", "c", "d"]})
+        config_list = [{"column_name": "text", "vectorize": True, "identifier": False}]
+        existing_hash = hashlib.sha256(b"c").hexdigest()
+        chroma = MagicMock()
+        chroma.get.side_effect = lambda where, **_: {
+            "metadatas": [{"_id": _id} for _id in where["_id"]["$in"] if _id == existing_hash]
+        }
+
+        batches = [batch async for batch in component._iter_data_batches(data_df, config_list, chroma)]
+
+        assert [[obj.data["text"] for obj in batch] for batch in batches] == [["a", "b"], [], ["d"]]
+        assert chroma.get.call_count == 3
+        assert all(len(call.kwargs["where"]["_id"]["$in"]) <= 2 for call in chroma.get.call_args_list)
+
     def test_is_valid_collection_name(self, component_class, default_kwargs):
         """Test collection name validation."""
         component = component_class(**default_kwargs)
@@ -16,6 +16,8 @@ from lfx.components.processing import (
     ParserComponent,
     SplitTextComponent,
 )
+from lfx.components.processing.create_list import CreateListComponent
+from lfx.components.processing.message_to_data import MessageToDataComponent
 from lfx.graph import Graph
 from lfx.schema.data import Data
 
@@ -248,3 +250,27 @@ async def test_loop_flow():
     results = [result async for result in flow.async_start()]
     result_order = [result.vertex.id.split("-")[0] for result in results if hasattr(result, "vertex")]
     assert result_order == expected_execution_order
+
+
+@pytest.mark.parametrize(
+    ("execution_mode", "expected_order"),
+    [
+        ("Sequential", ["items", "loop", *(["parser", "to_data", "loop"] * 5), "done_parser"]),
+        ("Parallel Map", ["items", "loop", "done_parser"]),
+    ],
+)
+async def test_loop_execution_modes(execution_mode, expected_order):
+    """Both modes aggregate the loop body results in input order, Parallel Map runs the body outside the graph."""
+    items = CreateListComponent(_id="items").set(texts=[f"item {i}" for i in range(5)])
+    loop = LoopComponent(_id="loop").set(data=items.as_dataframe, execution_mode=execution_mode, max_concurrency=2)
+    parser = ParserComponent(_id="parser").set(input_data=loop.item_output, pattern="#{text}")
+    to_data = MessageToDataComponent(_id="to_data").set(message=parser.parse_combined_text)
+    loop.set(item=to_data.convert_message_to_data)
+    done_parser = ParserComponent(_id="done_parser").set(input_data=loop.done_output, pattern="{text}", sep="|")
+    graph = Graph(items, done_parser)
+
+    results = [result async for result in graph.async_start()]
+
+    assert [result.vertex.id for result in results if hasattr(result, "vertex")] == expected_order
+    parsed_text = graph.get_vertex("done_parser").results["parsed_text"]
+    assert parsed_text.text == "#item 0|#item 1|#item 2|#item 3|#item 4"
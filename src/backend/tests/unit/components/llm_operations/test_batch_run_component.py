@@ -1,4 +1,6 @@
+import asyncio
 import re
+from uuid import uuid4
 
 import pytest
 from lfx.components.llm_operations.batch_run import BatchRunComponent
@@ -8,6 +10,16 @@ from tests.base import ComponentTestBaseWithoutClient
 from tests.unit.mock_language_model import MockLanguageModel
 
 
+class ParamsLanguageModel(MockLanguageModel):
+    """A mock language model with identifying parameters, so its responses can be cached."""
+
+    max_tokens: int = 100
+
+    @property
+    def _identifying_params(self):
+        return {"model_name": "mock", "max_tokens": self.max_tokens}
+
+
 class TestBatchRunComponent(ComponentTestBaseWithoutClient):
     @pytest.fixture
     def component_class(self):
@@ -256,3 +268,182 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
         )
         result_dicts = result.to_dict("records")
         assert all(row["metadata"]["processing_status"] == "success" for row in result_dicts)
+
+    async def test_failed_rows_are_retried_without_failing_the_batch(self, monkeypatch):
+        monkeypatch.setattr("lfx.components.llm_operations.batch_run.RETRY_BASE_DELAY", 0)
+        attempts: dict[str, int] = {}
+
+        def flaky_response(content):
+            attempts[content] = attempts.get(content, 0) + 1
+            if content == "always" or (content == "flaky" and attempts[content] == 1):
+                msg = "Rate limit exceeded"
+                raise RuntimeError(msg)
+            return f"Response for {content}"
+
+        component = BatchRunComponent(
+            model=MockLanguageModel(response_generator=flaky_response),
+            df=DataFrame({"text": ["ok", "flaky", "always"]}),
+            column_name="text",
+            enable_metadata=True,
+            max_retries=2,
+            cache_responses=False,
+        )
+
+        result = await component.run_batch()
+
+        assert list(result["model_response"]) == ["Response for ok", "Response for flaky", ""]
+        statuses = [row["metadata"]["processing_status"] for row in result.to_dict("records")]
+        assert statuses == ["success", "success", "failed"]
+        assert "Rate limit exceeded" in result.iloc[2]["metadata"]["error"]
+        assert result["error"].isna().tolist() == [True, True, False]
+        assert attempts == {"ok": 1, "flaky": 2, "always": 3}
+
+    async def test_failed_rows_are_reported_without_metadata(self, monkeypatch):
+        monkeypatch.setattr("lfx.components.llm_operations.batch_run.RETRY_BASE_DELAY", 0)
+
+        def failing_response(content):
+            if content == "bad":
+                msg = "Rate limit exceeded"
+                raise RuntimeError(msg)
+            return f"Response for {content}"
+
+        component = BatchRunComponent(
+            model=MockLanguageModel(response_generator=failing_response),
+            df=DataFrame({"text": ["good", "bad"]}),
+            column_name="text",
+            max_retries=0,
+        )
+
+        result = await component.run_batch()
+
+        assert "metadata" not in result.columns
+        assert list(result["model_response"]) == ["Response for good", ""]
+        assert result.iloc[1]["error"] == "Rate limit exceeded"
+        assert component._logs[-1].message == "Processed 2/2 rows (0 cached, 1 failed)"
+
+    async def test_batch_fails_when_every_row_fails(self, monkeypatch):
+        monkeypatch.setattr("lfx.components.llm_operations.batch_run.RETRY_BASE_DELAY", 0)
+
+        def failing_response(_content):
+            msg = "Invalid API key"
+            raise RuntimeError(msg)
+
+        component = BatchRunComponent(
+            model=MockLanguageModel(response_generator=failing_response),
+            df=DataFrame({"text": ["a", "b"]}),
+            column_name="text",
+            max_retries=0,
+        )
+
+        with pytest.raises(ValueError, match=re.escape("All 2 rows failed. First error: Invalid API key")):
+            await component.run_batch()
+
+    async def test_concurrency_is_bounded(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        class SlowModel(MockLanguageModel):
+            async def abatch(self, messages, *args, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return await super().abatch(messages, *args, **kwargs)
+
+        component = BatchRunComponent(
+            model=SlowModel(),
+            df=DataFrame({"text": [f"row {i}" for i in range(10)]}),
+            column_name="text",
+            max_concurrency=3,
+            chunk_size=4,
+            cache_responses=False,
+        )
+
+        result = await component.run_batch()
+
+        assert list(result["batch_index"]) == list(range(10))
+        assert list(result["model_response"]) == [f"Response for row {i}" for i in range(10)]
+        assert max_in_flight == 3
+        assert [log.message for log in component._logs] == [
+            "Processed 4/10 rows (0 cached, 0 failed)",
+            "Processed 8/10 rows (0 cached, 0 failed)",
+            "Processed 10/10 rows (0 cached, 0 failed)",
+        ]
+
+    async def test_rows_waiting_to_retry_do_not_hold_a_concurrency_slot(self, monkeypatch):
+        monkeypatch.setattr("lfx.components.llm_operations.batch_run.RETRY_BASE_DELAY", 0.1)
+        calls: list[str] = []
+
+        def flaky_response(content):
+            calls.append(content)
+            if calls.count(content) == 1 and content == "flaky":
+                msg = "Rate limit exceeded"
+                raise RuntimeError(msg)
+            return f"Response for {content}"
+
+        component = BatchRunComponent(
+            model=MockLanguageModel(response_generator=flaky_response),
+            df=DataFrame({"text": ["flaky", "ok"]}),
+            column_name="text",
+            max_concurrency=1,
+            max_retries=1,
+            cache_responses=False,
+        )
+
+        result = await component.run_batch()
+
+        assert list(result["model_response"]) == ["Response for flaky", "Response for ok"]
+        assert calls == ["flaky", "ok", "flaky"]
+
+    async def test_rerun_skips_cached_rows(self):
+        calls: list[str] = []
+
+        def counting_response(content):
+            calls.append(content)
+            return f"Response for {content}"
+
+        df = DataFrame({"text": [f"cached row {uuid4()}", f"cached row {uuid4()}"]})
+        kwargs = {"df": df, "column_name": "text", "system_message": "Be brief", "cache_responses": True}
+
+        first = await BatchRunComponent(
+            model=ParamsLanguageModel(response_generator=counting_response), **kwargs
+        ).run_batch()
+        component = BatchRunComponent(model=ParamsLanguageModel(response_generator=counting_response), **kwargs)
+        second = await component.run_batch()
+
+        assert len(calls) == 2
+        assert list(second["model_response"]) == list(first["model_response"])
+        assert component._logs[-1].message == "Processed 2/2 rows (2 cached, 0 failed)"
+
+    async def test_cache_is_keyed_by_model_parameters(self):
+        calls: list[str] = []
+
+        def counting_response(content):
+            calls.append(content)
+            return f"Response for {content}"
+
+        kwargs = {"df": DataFrame({"text": [f"row {uuid4()}"]}), "column_name": "text", "cache_responses": True}
+
+        await BatchRunComponent(model=ParamsLanguageModel(response_generator=counting_response), **kwargs).run_batch()
+        await BatchRunComponent(
+            model=ParamsLanguageModel(response_generator=counting_response, max_tokens=10), **kwargs
+        ).run_batch()
+
+        assert len(calls) == 2
+
+    async def test_responses_are_not_cached_by_default(self):
+        calls: list[str] = []
+
+        def counting_response(content):
+            calls.append(content)
+            return f"Response for {content}"
+
+        kwargs = {"df": DataFrame({"text": [f"row {uuid4()}"]}), "column_name": "text"}
+
+        for _ in range(2):
+            await BatchRunComponent(
+                model=ParamsLanguageModel(response_generator=counting_response), **kwargs
+            ).run_batch()
+
+        assert len(calls) == 2
@@ -66,6 +66,16 @@ class TestDynamicImport:
         # Helper module should be the langflow implementation
         assert is_helper_module(list_flows, _LANGFLOW_HELPER_MODULE_FLOW)
 
+    def test_helpers_import_list_flow_catalog(self):
+        """Test the lfx.helpers.list_flow_catalog import."""
+        try:
+            from lfx.helpers import list_flow_catalog
+        except (ImportError, ModuleNotFoundError) as e:
+            pytest.fail(f"Failed to dynamically import lfx.helpers.list_flow_catalog: {e}")
+
+        # Helper module should be the langflow implementation
+        assert is_helper_module(list_flow_catalog, _LANGFLOW_HELPER_MODULE_FLOW)
+
     def test_helpers_import_load_flow(self):
         """Test the lfx.helpers.load_flow import."""
         try:
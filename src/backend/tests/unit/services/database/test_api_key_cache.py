@@ -0,0 +1,113 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langflow.services.database.models.api_key.cache import ApiKeyCache, ApiKeyUsageAggregator
+from langflow.services.database.models.api_key.crud import check_key, create_api_key, delete_api_key
+from langflow.services.database.models.api_key.model import ApiKey, ApiKeyCreate
+from langflow.services.database.models.user.crud import update_user
+from langflow.services.database.models.user.model import User, UserUpdate
+from langflow.services.deps import session_scope
+
+CRUD_MODULE = "langflow.services.database.models.api_key.crud"
+
+
+@pytest.fixture
+def api_key_cache():
+    cache = ApiKeyCache(ttl=60)
+    with (
+        patch(f"{CRUD_MODULE}.get_api_key_cache", return_value=cache),
+        patch("langflow.services.database.models.user.crud.get_api_key_cache", return_value=cache),
+    ):
+        yield cache
+
+
+@pytest.fixture
+def usage_aggregator():
+    aggregator = ApiKeyUsageAggregator(flush_interval=3600)
+    with patch(f"{CRUD_MODULE}.get_api_key_usage_aggregator", return_value=aggregator):
+        yield aggregator
+
+
+@pytest.fixture
+async def api_key(active_user):
+    async with session_scope() as session:
+        return await create_api_key(session, ApiKeyCreate(name="cached"), active_user.id)
+
+
+@pytest.mark.usefixtures("usage_aggregator")
+async def test_verified_key_is_served_from_cache(api_key_cache, api_key, active_user):
+    async with session_scope() as session:
+        user = await check_key(session, api_key.api_key)
+    failing_session = AsyncMock()
+    failing_session.exec.side_effect = AssertionError("The database should not be queried")
+
+    cached_user = await check_key(failing_session, api_key.api_key)
+
+    assert user.id == cached_user.id == active_user.id
+    assert isinstance(cached_user, User)
+    assert (api_key_cache.hits, api_key_cache.misses) == (1, 1)
+    assert api_key.api_key not in str(api_key_cache._cache)
+
+
+@pytest.mark.usefixtures("usage_aggregator")
+async def test_deleted_key_is_revoked_right_away(api_key_cache, api_key):
+    async with session_scope() as session:
+        assert await check_key(session, api_key.api_key) is not None
+        await delete_api_key(session, api_key.id)
+
+        assert await check_key(session, api_key.api_key) is None
+    assert len(api_key_cache) == 0
+
+
+@pytest.mark.usefixtures("usage_aggregator")
+async def test_updated_user_is_not_served_stale(api_key_cache, api_key, active_user):
+    async with session_scope() as session:
+        await check_key(session, api_key.api_key)
+        user_db = await session.get(User, active_user.id)
+        await update_user(user_db, UserUpdate(is_active=False), session)
+
+        user = await check_key(session, api_key.api_key)
+
+    assert user.is_active is False
+    assert api_key_cache.misses == 2
+
+
+def test_expired_key_is_checked_again():
+    cache = ApiKeyCache(ttl=60)
+    user = User(username="user", password="password")  # noqa: S106
+    cache.set("sk-key", user.id, user)
+
+    with patch("langflow.services.database.models.api_key.cache.time.monotonic", return_value=float("inf")):
+        assert cache.get("sk-key") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.usefixtures("api_key_cache")
+async def test_usage_is_written_in_one_update_per_key(usage_aggregator, api_key):
+    async with session_scope() as session:
+        for _ in range(3):
+            await check_key(session, api_key.api_key)
+
+    assert usage_aggregator.pending == 3
+    assert await usage_aggregator.flush() == 1
+    assert usage_aggregator.pending == 0
+    async with session_scope() as session:
+        api_key_db = await session.get(ApiKey, api_key.id)
+        assert api_key_db.total_uses == 3
+        assert api_key_db.last_used_at is not None
+
+
+async def test_failed_flush_keeps_the_counters(usage_aggregator, api_key):
+    usage_aggregator.record(api_key.id)
+
+    with (
+        patch(
+            "langflow.services.database.models.api_key.cache.session_scope", side_effect=RuntimeError("database down")
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        await usage_aggregator.flush()
+
+    assert usage_aggregator.pending == 1
+    await usage_aggregator.stop()
+    assert usage_aggregator.pending == 0
@@ -3,7 +3,11 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build
+from langflow.services.database.models.vertex_builds.crud import (
+    log_vertex_build,
+    log_vertex_builds,
+    prune_vertex_builds,
+)
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
 from lfx.services.settings.base import Settings
 from sqlalchemy import delete, func, select
@@ -314,3 +318,51 @@ async def test_concurrent_log_vertex_build(vertex_build_data, mock_settings):
         async with AsyncSession(engine) as session:
             count = await session.scalar(select(func.count()).select_from(VertexBuildTable))
             assert count <= mock_settings.max_vertex_builds_to_keep
+
+
+@pytest.mark.asyncio
+async def test_log_vertex_builds_bulk_insert(async_session: AsyncSession, timestamp_generator):
+    """Test that many builds are inserted at once without enforcing the history limits."""
+    flow_id = uuid4()
+    builds = [
+        VertexBuildBase(id="vertex", flow_id=flow_id, timestamp=timestamp_generator(i), artifacts={}, valid=True)
+        for i in range(10)
+    ]
+
+    tables = await log_vertex_builds(async_session, builds)
+
+    assert len(tables) == 10
+    count = await async_session.scalar(select(func.count()).select_from(VertexBuildTable))
+    assert count == 10
+
+
+@pytest.mark.asyncio
+async def test_prune_vertex_builds_per_vertex_and_global(async_session: AsyncSession, timestamp_generator):
+    """Test that pruning keeps the newest builds of each vertex and enforces the global limit."""
+    pruned_flow, other_flow = uuid4(), uuid4()
+    builds = [
+        VertexBuildBase(id=vertex_id, flow_id=flow_id, timestamp=timestamp_generator(i), artifacts={}, valid=True)
+        for i in range(4)
+        for vertex_id in ("a", "b")
+        for flow_id in (pruned_flow, other_flow)
+    ]
+    await log_vertex_builds(async_session, builds)
+
+    await prune_vertex_builds(async_session, max_builds_to_keep=100, max_builds_per_vertex=2, flow_ids={pruned_flow})
+
+    pruned_stmt = select(VertexBuildTable).where(VertexBuildTable.flow_id == pruned_flow)
+    pruned = (await async_session.scalars(pruned_stmt)).all()
+    other_count = await async_session.scalar(
+        select(func.count()).select_from(VertexBuildTable).where(VertexBuildTable.flow_id == other_flow)
+    )
+    assert len(pruned) == 4
+    assert {build.timestamp.replace(tzinfo=timezone.utc) for build in pruned} == {
+        timestamp_generator(2),
+        timestamp_generator(3),
+    }
+    assert other_count == 8
+
+    await prune_vertex_builds(async_session, max_builds_to_keep=3, max_builds_per_vertex=2)
+
+    count = await async_session.scalar(select(func.count()).select_from(VertexBuildTable))
+    assert count == 3
@@ -0,0 +1,169 @@
+import asyncio
+
+import pytest
+from langflow.events.event_manager import create_default_event_manager
+from langflow.services.job_queue.event_queue import JobEventQueue
+from langflow.services.job_queue.service import JobQueueFullError, JobQueueService
+
+END_EVENT = (None, None, 0.0)
+
+
+def event(event_id: str, size: int = 10):
+    return (event_id, b"x" * size, 0.0)
+
+
+def drain(queue: asyncio.Queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+async def test_block_policy_waits_for_the_consumer():
+    queue = JobEventQueue(2, policy="block")
+    await queue.put(event("token-1"))
+    await queue.put(event("token-2"))
+
+    producer = asyncio.create_task(queue.put(event("token-3")))
+    await asyncio.sleep(0.01)
+    assert not producer.done()
+
+    await queue.get()
+    await asyncio.wait_for(producer, timeout=1)
+    assert queue.qsize() == 2
+
+
+async def test_block_policy_never_loses_events_put_without_waiting():
+    queue = JobEventQueue(1, policy="block")
+    queue.put_nowait(event("token-1"))
+    queue.put_nowait(END_EVENT)
+
+    assert drain(queue) == [event("token-1"), END_EVENT]
+
+
+async def test_drop_tokens_policy_keeps_terminal_events():
+    queue = JobEventQueue(2, policy="drop_tokens")
+    for i in range(5):
+        await queue.put(event(f"token-{i}"))
+    await queue.put(event("end-1"))
+    queue.put_nowait(END_EVENT)
+
+    assert drain(queue) == [event("end-1"), END_EVENT]
+    assert queue.events_dropped == 5
+    assert queue.queued_bytes == 0
+
+
+async def test_drop_tokens_policy_join_returns_after_drops():
+    queue = JobEventQueue(2, policy="drop_tokens")
+    for i in range(5):
+        await queue.put(event(f"token-{i}"))
+    queue.put_nowait(event("end-1"))
+    queue.put_nowait(END_EVENT)
+
+    for _ in drain(queue):
+        queue.task_done()
+    await asyncio.wait_for(queue.join(), timeout=1)
+
+
+async def test_block_policy_event_manager_waits_for_the_consumer():
+    queue = JobEventQueue(1, policy="block")
+    event_manager = create_default_event_manager(queue)
+    event_manager.on_end_vertex(data={"build_data": {}})
+
+    producer = asyncio.create_task(event_manager.wait_for_queue())
+    await asyncio.sleep(0.05)
+    assert not producer.done()
+
+    await queue.get()
+    await asyncio.wait_for(producer, timeout=1)
+
+
+async def test_block_policy_stays_bounded_with_waiting_producers():
+    queue = JobEventQueue(2, policy="block")
+    event_manager = create_default_event_manager(queue)
+    sizes = []
+
+    async def produce():
+        for _ in range(5):
+            await event_manager.wait_for_queue()
+            event_manager.on_end_vertex(data={"build_data": {}})
+            sizes.append(queue.qsize())
+
+    producers = [asyncio.create_task(produce()) for _ in range(3)]
+    for _ in range(15):
+        await queue.get()
+        await asyncio.sleep(0)
+    await asyncio.wait_for(asyncio.gather(*producers), timeout=1)
+
+    assert len(sizes) == 15
+    assert max(sizes) == 2
+
+
+async def test_block_policy_only_grows_past_the_bound_by_events_that_cant_wait():
+    queue = JobEventQueue(2, policy="block")
+    event_manager = create_default_event_manager(queue)
+    for _ in range(2):
+        await event_manager.wait_for_queue()
+        event_manager.on_end_vertex(data={"build_data": {}})
+
+    waiting = asyncio.create_task(event_manager.wait_for_queue())
+    event_manager.on_error(data={"error": "boom"})
+    event_manager.on_end(data={})
+    await asyncio.sleep(0.01)
+
+    assert queue.qsize() == 4
+    assert not waiting.done()
+
+    # The producer waits until the queue is below its bound again
+    drain(queue)
+    await asyncio.wait_for(waiting, timeout=1)
+
+
+async def test_close_wakes_waiting_producers():
+    queue = JobEventQueue(1, policy="block")
+    event_manager = create_default_event_manager(queue)
+    event_manager.on_end_vertex(data={"build_data": {}})
+    producer = asyncio.create_task(event_manager.wait_for_queue())
+    await asyncio.sleep(0.01)
+
+    queue.close()
+
+    await asyncio.wait_for(producer, timeout=1)
+
+
+async def test_spill_policy_keeps_events_in_order(tmp_path):
+    queue = JobEventQueue(2, policy="spill", spill_dir=str(tmp_path))
+    events = [event(f"token-{i}") for i in range(6)]
+    for item in events:
+        await queue.put(item)
+
+    assert queue.qsize() == 6
+    assert queue.get_metrics()["events_spilled"] == 4
+    assert queue.queued_bytes == 60
+    assert [await queue.get() for _ in range(3)] == events[:3]
+    await queue.put(event("token-6"))
+    assert drain(queue) == [*events[3:], event("token-6")]
+    assert queue.queued_bytes == 0
+
+
+async def test_running_jobs_are_limited():
+    service = JobQueueService(max_jobs=1)
+    service.create_queue("job-1")
+
+    with pytest.raises(JobQueueFullError):
+        service.create_queue("job-2")
+
+    await service.cleanup_job("job-1")
+    service.create_queue("job-2")
+
+
+async def test_metrics_report_queued_events_and_bytes():
+    service = JobQueueService(max_queue_size=10)
+    _, event_manager = service.create_queue("job-1")
+    event_manager.on_token(data={"chunk": "hello", "id": "message"})
+
+    metrics = service.get_metrics()
+
+    assert metrics["running_jobs"] == 1
+    assert metrics["job_queues"]["job-1"]["queued_events"] == 1
+    assert metrics["queued_bytes"] == metrics["job_queues"]["job-1"]["queued_bytes"] > 0
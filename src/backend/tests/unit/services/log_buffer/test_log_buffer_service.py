@@ -0,0 +1,211 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from langflow.services.log_buffer.service import LogBufferService
+
+SERVICE_MODULE = "langflow.services.log_buffer.service"
+
+
+@pytest.fixture
+def settings_service():
+    settings_service = MagicMock()
+    settings = settings_service.settings
+    settings.log_buffer_batch_size = 3
+    settings.log_buffer_flush_interval = 60
+    settings.log_buffer_max_size = 5
+    settings.log_retention_interval = 3600
+    settings.max_vertex_builds_to_keep = 100
+    settings.max_vertex_builds_per_vertex = 2
+    settings.max_transactions_to_keep = 50
+    return settings_service
+
+
+@pytest.fixture
+def crud():
+    session = MagicMock()
+
+    @asynccontextmanager
+    async def session_scope():
+        yield session
+
+    with (
+        patch(f"{SERVICE_MODULE}.session_scope", session_scope),
+        patch(f"{SERVICE_MODULE}.log_vertex_builds", new_callable=AsyncMock) as log_vertex_builds,
+        patch(f"{SERVICE_MODULE}.log_transactions", new_callable=AsyncMock) as log_transactions,
+        patch(f"{SERVICE_MODULE}.prune_vertex_builds", new_callable=AsyncMock) as prune_vertex_builds,
+        patch(f"{SERVICE_MODULE}.prune_transactions", new_callable=AsyncMock) as prune_transactions,
+    ):
+        yield MagicMock(
+            log_vertex_builds=log_vertex_builds,
+            log_transactions=log_transactions,
+            prune_vertex_builds=prune_vertex_builds,
+            prune_transactions=prune_transactions,
+        )
+
+
+@pytest.fixture
+async def service(settings_service):
+    service = LogBufferService(settings_service)
+    yield service
+    await service.stop()
+
+
+async def add_builds(service: LogBufferService, count: int, flow_id=None):
+    for i in range(count):
+        await service.add_vertex_build(
+            flow_id=flow_id or uuid4(), vertex_id=f"vertex-{i}", valid=True, params=None, data={"results": {}}
+        )
+
+
+async def test_records_are_buffered_until_flush(service, crud):
+    flow_id = uuid4()
+    await add_builds(service, 2, flow_id)
+    await service.add_transaction(flow_id=flow_id, vertex_id="vertex-0", status="success")
+
+    assert service.pending == 3
+    crud.log_vertex_builds.assert_not_called()
+
+    await service.flush()
+
+    assert service.pending == 0
+    assert service.written == 3
+    (_, vertex_builds), _ = crud.log_vertex_builds.call_args
+    (_, transactions), _ = crud.log_transactions.call_args
+    assert [build.id for build in vertex_builds] == ["vertex-0", "vertex-1"]
+    assert transactions[0].flow_id == flow_id
+
+
+async def test_full_buffer_is_written_before_accepting_more(service, crud):
+    await add_builds(service, 6)
+
+    crud.log_vertex_builds.assert_awaited_once()
+    (_, vertex_builds), _ = crud.log_vertex_builds.call_args
+    assert len(vertex_builds) == 5
+    assert service.pending == 1
+
+
+async def test_transactions_without_flow_id_are_ignored(service, crud):  # noqa: ARG001
+    await service.add_transaction(flow_id=None, vertex_id="vertex", status="success")
+
+    assert service.pending == 0
+
+
+async def test_prune_only_sweeps_flows_written_to(service, crud, settings_service):
+    flow_id = uuid4()
+    await add_builds(service, 1, flow_id)
+    await service.flush()
+
+    await service.prune()
+    await service.prune()
+
+    crud.prune_vertex_builds.assert_awaited_once()
+    _, kwargs = crud.prune_vertex_builds.call_args
+    assert kwargs["flow_ids"] == {flow_id}
+    assert kwargs["max_builds_per_vertex"] == settings_service.settings.max_vertex_builds_per_vertex
+    crud.prune_transactions.assert_not_called()
+
+
+async def test_failed_batch_is_written_with_the_next_flush(service, crud):
+    crud.log_vertex_builds.side_effect = RuntimeError("database is locked")
+    await add_builds(service, 2)
+
+    await service.flush()
+
+    assert service.pending == 2
+    assert service.dropped == 0
+    assert service.written == 0
+
+    crud.log_vertex_builds.side_effect = None
+    await service.add_transaction(flow_id=uuid4(), vertex_id="vertex-2", status="success")
+    await service.flush()
+
+    assert service.pending == 0
+    assert service.written == 3
+    (_, vertex_builds), _ = crud.log_vertex_builds.call_args
+    assert [build.id for build in vertex_builds] == ["vertex-0", "vertex-1"]
+    crud.log_transactions.assert_awaited_once()
+
+
+async def test_failed_batch_overflow_is_dropped(service, crud):
+    crud.log_vertex_builds.side_effect = RuntimeError("database is locked")
+    await add_builds(service, 4)
+    await service.flush()
+    await add_builds(service, 2)
+    await service.flush()
+
+    # Only the oldest record that didn't fit in the buffer was dropped
+    assert service.dropped == 1
+    assert service.pending == 5
+
+    crud.log_vertex_builds.side_effect = None
+    await service.flush()
+
+    assert service.written == 5
+    (_, vertex_builds), _ = crud.log_vertex_builds.call_args
+    assert [build.id for build in vertex_builds] == ["vertex-1", "vertex-2", "vertex-3", "vertex-0", "vertex-1"]
+
+
+async def test_rejected_record_is_dropped_alone(service, crud):
+    async def log_vertex_builds(_session, vertex_builds):
+        if any(build.id == "vertex-1" for build in vertex_builds):
+            msg = "can't encode data"
+            raise TypeError(msg)
+
+    crud.log_vertex_builds.side_effect = log_vertex_builds
+    await add_builds(service, 3)
+
+    await service.flush()
+
+    assert service.pending == 0
+    assert service.written == 2
+    assert service.dropped == 1
+
+    await add_builds(service, 1)
+    await service.flush()
+
+    assert service.written == 3
+    assert service.dropped == 1
+
+
+async def test_discard_flow_forgets_its_pending_records(service, crud):
+    flow_id, other_flow_id = uuid4(), uuid4()
+    await add_builds(service, 2, flow_id)
+    await add_builds(service, 1, other_flow_id)
+    await service.add_transaction(flow_id=flow_id, vertex_id="vertex-0", status="success")
+
+    await service.discard_flow(str(flow_id))
+    await service.flush()
+    await service.prune()
+
+    (_, vertex_builds), _ = crud.log_vertex_builds.call_args
+    assert [build.flow_id for build in vertex_builds] == [other_flow_id]
+    crud.log_transactions.assert_not_called()
+    _, kwargs = crud.prune_vertex_builds.call_args
+    assert kwargs["flow_ids"] == {other_flow_id}
+    crud.prune_transactions.assert_not_called()
+
+
+async def test_discard_flow_can_keep_its_transactions(service, crud):
+    flow_id = uuid4()
+    await add_builds(service, 1, flow_id)
+    await service.add_transaction(flow_id=flow_id, vertex_id="vertex-0", status="success")
+
+    await service.discard_flow(flow_id, transactions=False)
+    await service.flush()
+
+    crud.log_vertex_builds.assert_not_called()
+    (_, transactions), _ = crud.log_transactions.call_args
+    assert [transaction.flow_id for transaction in transactions] == [flow_id]
+
+
+async def test_teardown_writes_pending_records(settings_service, crud):
+    service = LogBufferService(settings_service)
+    await add_builds(service, 2)
+
+    await service.teardown()
+
+    crud.log_vertex_builds.assert_awaited_once()
+    crud.prune_vertex_builds.assert_awaited_once()
+    assert not service.is_started()
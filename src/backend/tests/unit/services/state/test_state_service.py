@@ -0,0 +1,124 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langflow.services.state.service import InMemoryStateService
+from lfx.services.settings.base import Settings
+
+
+def make_state_service(**overrides) -> InMemoryStateService:
+    settings = Settings()
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    return InMemoryStateService(MagicMock(settings=settings))
+
+
+@pytest.fixture
+def state_service():
+    return make_state_service()
+
+
+def test_state_is_scoped_to_runs(state_service):
+    state_service.update_state("answer", "first", run_id="run-1")
+    state_service.append_state("history", "a", run_id="run-2")
+    state_service.append_state("history", "b", run_id="run-2")
+
+    assert state_service.get_state("answer", run_id="run-1") == "first"
+    assert state_service.get_state("answer", run_id="run-2") == ""
+    assert state_service.get_state("history", run_id="run-2") == ["a", "b"]
+
+
+def test_released_run_frees_its_state(state_service):
+    state_service.update_state("answer", "x" * 1000, run_id="run-1")
+    assert state_service.get_metrics()["bytes"] > 1000
+
+    state_service.release_run("run-1")
+
+    assert state_service.get_state("answer", run_id="run-1") == ""
+    assert state_service.get_metrics() == {"runs": 0, "bytes": 0, "evicted_runs": 0, "expired_runs": 0}
+
+
+def test_oldest_runs_are_evicted_over_the_limit():
+    state_service = make_state_service(state_service_max_runs=2)
+
+    for i in range(3):
+        state_service.update_state("answer", i, run_id=f"run-{i}")
+
+    assert state_service.get_state("answer", run_id="run-0") == ""
+    assert state_service.get_state("answer", run_id="run-2") == 2
+    assert state_service.get_metrics()["evicted_runs"] == 1
+
+
+def test_least_recently_used_run_is_evicted():
+    state_service = make_state_service(state_service_max_runs=2)
+    state_service.update_state("answer", "long", run_id="run-long")
+    state_service.update_state("answer", "short", run_id="run-short")
+
+    state_service.append_state("history", "step", run_id="run-long")
+    state_service.update_state("answer", "new", run_id="run-new")
+
+    assert state_service.get_state("answer", run_id="run-long") == "long"
+    assert state_service.get_state("answer", run_id="run-short") == ""
+
+
+def test_eviction_drops_a_tenth_of_the_limit_more():
+    state_service = make_state_service(state_service_max_runs=20)
+
+    for i in range(21):
+        state_service.update_state("answer", i, run_id=f"run-{i}")
+
+    assert state_service.get_metrics()["runs"] == 18
+    assert state_service.get_state("answer", run_id="run-2") == ""
+    assert state_service.get_state("answer", run_id="run-3") == 3
+
+
+def test_existing_runs_are_used_without_the_global_lock(state_service):
+    state_service.update_state("answer", "first", run_id="run-1")
+
+    def use_run():
+        state_service.append_state("history", "a", run_id="run-1")
+        state_service.update_state("answer", "second", run_id="run-1")
+        return state_service.get_state("answer", run_id="run-1")
+
+    with ThreadPoolExecutor(max_workers=1) as executor, state_service.lock:
+        assert executor.submit(use_run).result(timeout=5) == "second"
+
+
+def test_unreleased_runs_expire():
+    state_service = make_state_service(state_service_run_ttl=10)
+    state_service.update_state("answer", "stale", run_id="run-1")
+
+    now = state_service.states["run-1"].last_used + 11
+    with patch("langflow.services.state.service.time.monotonic", return_value=now):
+        state_service.update_state("answer", "fresh", run_id="run-2")
+
+    assert state_service.get_state("answer", run_id="run-1") == ""
+    assert state_service.get_metrics()["expired_runs"] == 1
+
+
+def test_replacing_state_updates_bytes_held(state_service):
+    state_service.append_state("history", "x" * 1000, run_id="run-1")
+    state_service.update_state("history", "", run_id="run-1")
+
+    assert state_service.get_metrics()["bytes"] < 100
+
+
+def test_concurrent_appends_to_different_runs(state_service):
+    def append(run: int) -> None:
+        for i in range(100):
+            state_service.append_state("history", i, run_id=f"run-{run}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(append, range(8)))
+
+    assert all(state_service.get_state("history", run_id=f"run-{run}") == list(range(100)) for run in range(8))
+
+
+def test_observers_are_dropped_on_unsubscribe(state_service):
+    observer = MagicMock()
+    state_service.subscribe("answer", observer)
+    state_service.update_state("answer", "value", run_id="run-1")
+    state_service.unsubscribe("answer", observer)
+
+    observer.assert_called_once_with("answer", "value", append=False)
+    assert "answer" not in state_service.observers
@@ -0,0 +1,129 @@
+import hashlib
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.services.storage.local import BLOBS_DIR, UPLOADS_DIR, LocalStorageService
+from lfx.services.settings.base import Settings
+
+
+def make_storage_service(tmp_path, **overrides) -> LocalStorageService:
+    settings = Settings()
+    settings.config_dir = str(tmp_path)
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    return LocalStorageService(MagicMock(), MagicMock(settings=settings))
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def read_all(chunks) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+async def test_stream_is_saved_and_read_in_chunks(tmp_path):
+    storage_service = make_storage_service(tmp_path, storage_chunk_size=4)
+
+    saved = await storage_service.save_stream("flow", "file.txt", stream(b"hello ", b"streamed ", b"world"))
+
+    assert saved.size == len(b"hello streamed world")
+    assert saved.sha256 == hashlib.sha256(b"hello streamed world").hexdigest()
+    chunks = await read_all(await storage_service.open_stream("flow", "file.txt"))
+    assert b"".join(chunks) == b"hello streamed world"
+    assert max(len(chunk) for chunk in chunks) == 4
+    assert not list((tmp_path / UPLOADS_DIR).iterdir())
+
+
+async def test_byte_ranges_are_read(tmp_path):
+    storage_service = make_storage_service(tmp_path, storage_chunk_size=3)
+    await storage_service.save_file("flow", "file.txt", b"0123456789")
+
+    async def read_range(byte_range):
+        return b"".join(await read_all(await storage_service.open_stream("flow", "file.txt", byte_range)))
+
+    assert await read_range((2, 7)) == b"23456"
+    assert await read_range((5, None)) == b"56789"
+    assert await read_range((3, 3)) == b""
+    with pytest.raises(ValueError, match="Invalid byte range"):
+        await storage_service.open_stream("flow", "file.txt", (5, 2))
+    with pytest.raises(FileNotFoundError):
+        await storage_service.open_stream("flow", "missing.txt")
+
+
+async def test_failed_stream_leaves_no_partial_file(tmp_path):
+    storage_service = make_storage_service(tmp_path)
+    await storage_service.save_file("flow", "file.txt", b"previous")
+
+    async def failing_stream():
+        yield b"partial"
+        msg = "client disconnected"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        await storage_service.save_stream("flow", "file.txt", failing_stream())
+
+    assert await storage_service.get_file("flow", "file.txt") == b"previous"
+    assert not list((tmp_path / UPLOADS_DIR).iterdir())
+
+
+async def test_identical_files_are_stored_once(tmp_path):
+    storage_service = make_storage_service(tmp_path, storage_dedup_enabled=True)
+
+    first = await storage_service.save_stream("flow", "first.txt", stream(b"same ", b"content"))
+    second = await storage_service.save_stream("other", "second.txt", stream(b"same content"))
+    await storage_service.save_stream("other", "second.txt", stream(b"same content"))
+
+    assert first.sha256 == second.sha256
+    blob = tmp_path / BLOBS_DIR / first.sha256[:2] / first.sha256
+    assert (tmp_path / "flow" / "first.txt").stat().st_ino == blob.stat().st_ino
+    assert (tmp_path / "other" / "second.txt").stat().st_ino == blob.stat().st_ino
+    assert blob.stat().st_nlink == 3
+
+    await storage_service.delete_file("flow", "first.txt")
+    assert blob.exists()
+    await storage_service.delete_file("other", "second.txt")
+    assert not blob.exists()
+
+
+async def test_deleting_a_file_only_prunes_its_own_blob(tmp_path):
+    storage_service = make_storage_service(tmp_path, storage_dedup_enabled=True)
+    saved = await storage_service.save_stream("flow", "file.txt", stream(b"content"))
+    unrelated_blob = tmp_path / BLOBS_DIR / "ab" / ("ab" * 32)
+    unrelated_blob.parent.mkdir(parents=True, exist_ok=True)
+    unrelated_blob.write_bytes(b"orphan")
+
+    await storage_service.delete_file("flow", "file.txt")
+
+    assert not (tmp_path / "flow" / "file.txt").exists()
+    assert not (tmp_path / BLOBS_DIR / saved.sha256[:2] / saved.sha256).exists()
+    assert unrelated_blob.exists()
+
+
+async def test_overwriting_a_deduplicated_file_keeps_its_copies(tmp_path):
+    storage_service = make_storage_service(tmp_path, storage_dedup_enabled=True)
+    await storage_service.save_file("flow", "first.txt", b"same content")
+    await storage_service.save_file("flow", "second.txt", b"same content")
+
+    await storage_service.save_file("flow", "first.txt", b"new content")
+
+    assert await storage_service.get_file("flow", "first.txt") == b"new content"
+    assert await storage_service.get_file("flow", "second.txt") == b"same content"
+
+
+async def test_overwriting_the_last_link_prunes_the_replaced_blob(tmp_path):
+    storage_service = make_storage_service(tmp_path, storage_dedup_enabled=True)
+    old = await storage_service.save_stream("flow", "file.txt", stream(b"old content"))
+    old_blob = tmp_path / BLOBS_DIR / old.sha256[:2] / old.sha256
+
+    new = await storage_service.save_stream("flow", "file.txt", stream(b"new content"))
+    new_blob = tmp_path / BLOBS_DIR / new.sha256[:2] / new.sha256
+
+    assert not old_blob.exists()
+    assert new_blob.stat().st_nlink == 2
+
+    # Saving the same content again keeps its blob
+    await storage_service.save_stream("flow", "file.txt", stream(b"new content"))
+    assert new_blob.stat().st_nlink == 2
+    assert await storage_service.get_file("flow", "file.txt") == b"new content"
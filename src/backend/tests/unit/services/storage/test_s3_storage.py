@@ -0,0 +1,74 @@
+import hashlib
+from unittest.mock import MagicMock
+
+import pytest
+from lfx.services.settings.base import Settings
+
+moto = pytest.importorskip("moto")
+boto3 = pytest.importorskip("boto3")
+
+from langflow.services.storage.s3 import S3StorageService  # noqa: E402
+
+PART_SIZE = 5 * 1024 * 1024
+
+
+@pytest.fixture
+def storage_service(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    settings = Settings()
+    settings.storage_chunk_size = 1024 * 1024
+    settings.storage_s3_part_size = PART_SIZE
+    with moto.mock_aws():
+        service = S3StorageService(MagicMock(), MagicMock(settings=settings))
+        service.s3_client.create_bucket(Bucket=service.bucket)
+        yield service
+
+
+async def stream(data: bytes, chunk_size: int = 1024 * 1024):
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
+
+async def test_large_file_is_uploaded_in_parts(storage_service):
+    data = bytes(range(256)) * (PART_SIZE * 2 // 256 + 1000)
+
+    saved = await storage_service.save_stream("flow", "large.bin", stream(data))
+
+    assert saved.size == len(data)
+    assert saved.sha256 == hashlib.sha256(data).hexdigest()
+    head = storage_service.s3_client.head_object(Bucket=storage_service.bucket, Key="flow/large.bin")
+    assert head["ETag"].strip('"').endswith("-3")
+    chunks = [chunk async for chunk in await storage_service.open_stream("flow", "large.bin")]
+    assert b"".join(chunks) == data
+
+
+async def test_small_file_is_uploaded_whole(storage_service):
+    await storage_service.save_stream("flow", "small.txt", stream(b"small content", chunk_size=4))
+
+    assert await storage_service.get_file("flow", "small.txt") == b"small content"
+
+
+async def test_byte_ranges_are_fetched(storage_service):
+    await storage_service.save_file("flow", "file.txt", b"0123456789")
+
+    async def read_range(byte_range):
+        return b"".join([chunk async for chunk in await storage_service.open_stream("flow", "file.txt", byte_range)])
+
+    assert await read_range((2, 7)) == b"23456"
+    assert await read_range((5, None)) == b"56789"
+    assert await read_range((3, 3)) == b""
+
+
+async def test_failed_upload_is_aborted(storage_service):
+    async def failing_stream():
+        yield b"x" * PART_SIZE
+        msg = "client disconnected"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        await storage_service.save_stream("flow", "file.bin", failing_stream())
+
+    uploads = storage_service.s3_client.list_multipart_uploads(Bucket=storage_service.bucket)
+    assert not uploads.get("Uploads")
@@ -240,3 +240,47 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_get_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name1", "value1", session=session)
+    await service.create_variable(user_id, "name2", "value2", session=session)
+
+    result = await service.get_variables(user_id, ["name1", "name2", "missing"], session=session)
+
+    assert result == {"name1": "value1", "name2": "value2"}
+
+
+async def test_get_variables__decrypts_once(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+
+    with patch("langflow.services.variable.service.auth_utils.decrypt_api_key", return_value="value") as decrypt:
+        await service.get_variables(user_id, ["name"], session=session)
+        await service.get_variables(user_id, ["name"], session=session)
+        await service.get_variable(user_id, "name", "", session=session)
+
+    decrypt.assert_called_once()
+
+
+async def test_get_variable__cache_invalidated_on_update(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "old_value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "old_value"
+
+    await service.update_variable(user_id, "name", "new_value", session=session)
+
+    assert await service.get_variable(user_id, "name", "", session=session) == "new_value"
+
+
+async def test_get_variable__cache_invalidated_on_delete(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+    assert await service.get_variables(user_id, ["name"], session=session) == {"name": "value"}
+
+    await service.delete_variable(user_id, "name", session=session)
+
+    assert await service.get_variables(user_id, ["name"], session=session) == {}
+    with pytest.raises(ValueError, match=r"name variable not found\."):
+        await service.get_variable(user_id, "name", "", session=session)
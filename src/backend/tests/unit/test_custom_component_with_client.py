@@ -30,3 +30,33 @@ async def test_list_flows_flow_objects(component):
 async def test_list_flows_return_type(component):
     flows = await component.alist_flows()
     assert isinstance(flows, list)
+
+
+async def test_list_flow_catalog_excludes_flow_data(component, flow):
+    flows = await component.alist_flow_catalog()
+
+    entry = next(entry for entry in flows if entry.data["name"] == flow.name)
+    assert set(entry.data) == {"id", "name", "description", "updated_at"}
+    assert entry.data["id"] == flow.id
+
+
+async def test_list_flow_catalog_by_name(component, flow):
+    flows = await component.alist_flow_catalog(flow_name=flow.name)
+
+    assert [entry.data["id"] for entry in flows] == [flow.id]
+    assert await component.alist_flow_catalog(flow_name=f"{flow.name} (missing)") == []
+
+
+async def test_load_flow_by_name_is_cached_until_the_flow_changes(component, flow):
+    from langflow.processing.prepared_graph import get_prepared_graph_cache
+
+    prepared_graph_cache = get_prepared_graph_cache()
+    prepared_graph_cache.invalidate(flow.id)
+
+    first = await component.load_flow(flow_name=flow.name)
+    hits = prepared_graph_cache.hits
+    second = await component.load_flow(str(flow.id))
+
+    assert first is not second
+    assert [vertex.id for vertex in second.vertices] == [vertex.id for vertex in first.vertices]
+    assert prepared_graph_cache.hits == hits + 1
@@ -537,7 +537,7 @@ class TestLogProcessors:
 
         with (
             patch.object(log_buffer, "enabled", return_value=False),
-            patch.object(log_buffer, "write") as mock_write,
+            patch.object(log_buffer, "write_record") as mock_write,
         ):
             result = buffer_writer(None, "info", event_dict)
 
@@ -551,15 +551,12 @@ class TestLogProcessors:
 
         with (
             patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write") as mock_write,
+            patch.object(log_buffer, "write_record") as mock_write,
         ):
             result = buffer_writer(None, "info", event_dict)
 
-        # Should write to buffer when enabled
-        mock_write.assert_called_once()
-        call_args = mock_write.call_args[0]
-        written_data = json.loads(call_args[0])
-        assert written_data["event"] == "Test message"
+        # Should write the event dict to buffer when enabled, without serializing it
+        mock_write.assert_called_once_with(event_dict)
         assert result == event_dict
 
 
@@ -949,3 +946,69 @@ def test_max_size(sized_log_buffer):
     assert sized_log_buffer.max_size() == 0
     sized_log_buffer.max = 100
     assert sized_log_buffer.max_size() == 100
+
+
+def test_write_record(sized_log_buffer):
+    sized_log_buffer.max = 2
+    sized_log_buffer.write_record({"event": "Test log", "timestamp": "2021-07-01T00:00:00.124Z"})
+    assert sized_log_buffer.buffer == [(1625097600124, "Test log")]
+
+
+def test_wraparound_keeps_time_order(sized_log_buffer):
+    sized_log_buffer.max = 3
+    for i in range(7):
+        sized_log_buffer.append(1000 * i, f"Log {i}")
+
+    assert sized_log_buffer.buffer == [(4000, "Log 4"), (5000, "Log 5"), (6000, "Log 6")]
+    assert sized_log_buffer.get_after_timestamp(4500, lines=5) == {5000: "Log 5", 6000: "Log 6"}
+    assert sized_log_buffer.get_before_timestamp(6000, lines=5) == {4000: "Log 4", 5000: "Log 5"}
+    # Nothing at or after the timestamp returns the last entries
+    assert sized_log_buffer.get_before_timestamp(9000, lines=1) == {6000: "Log 6"}
+    assert sized_log_buffer.get_last_n(0) == {4000: "Log 4", 5000: "Log 5", 6000: "Log 6"}
+
+
+def test_resize_keeps_most_recent_entries(sized_log_buffer):
+    sized_log_buffer.max = 4
+    for i in range(4):
+        sized_log_buffer.append(i, f"Log {i}")
+
+    sized_log_buffer.max = 2
+    sized_log_buffer.append(4, "Log 4")
+
+    assert sized_log_buffer.buffer == [(3, "Log 3"), (4, "Log 4")]
+
+
+def test_resize_grow_skips_unwritten_slots(sized_log_buffer):
+    sized_log_buffer.max = 2
+    for i in range(1, 4):
+        sized_log_buffer.append(i, f"Log {i}")
+
+    sized_log_buffer.max = 5
+    sized_log_buffer.append(4, "Log 4")
+
+    assert sized_log_buffer.buffer == [(2, "Log 2"), (3, "Log 3"), (4, "Log 4")]
+    assert len(sized_log_buffer) == 3
+    assert sized_log_buffer.get_last_n(10) == {2: "Log 2", 3: "Log 3", 4: "Log 4"}
+    assert sized_log_buffer.get_after_timestamp(0, lines=10) == {2: "Log 2", 3: "Log 3", 4: "Log 4"}
+
+    for i in range(5, 8):
+        sized_log_buffer.append(i, f"Log {i}")
+    assert sized_log_buffer.buffer == [(i, f"Log {i}") for i in range(3, 8)]
+
+
+def test_read_since(sized_log_buffer):
+    sized_log_buffer.max = 3
+    sized_log_buffer.append(0, "Log 0")
+    entries, sequence = sized_log_buffer.read_since(sized_log_buffer.sequence)
+    assert entries == []
+
+    sized_log_buffer.append(1, "Log 1")
+    entries, sequence = sized_log_buffer.read_since(sequence)
+    assert entries == [(1, "Log 1")]
+
+    # Entries overwritten before being read are skipped
+    for i in range(2, 7):
+        sized_log_buffer.append(i, f"Log {i}")
+    entries, sequence = sized_log_buffer.read_since(sequence)
+    assert entries == [(4, "Log 4"), (5, "Log 5"), (6, "Log 6")]
+    assert sized_log_buffer.read_since(sequence) == ([], sequence)
@@ -0,0 +1,82 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.processing.prepared_graph import PreparedGraphCache, hash_tweaks
+
+
+@pytest.fixture
+def flow():
+    flow_data = json.loads(pytest.SIMPLE_API_TEST.read_text(encoding="utf-8"))
+    return SimpleNamespace(
+        id=uuid4(),
+        name="Simple API Test",
+        data=flow_data["data"],
+        updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_hash_tweaks_is_order_independent():
+    assert hash_tweaks({"a": {"x": 1}, "b": {"y": 2}}, stream=False) == hash_tweaks(
+        {"b": {"y": 2}, "a": {"x": 1}}, stream=False
+    )
+    assert hash_tweaks({}, stream=False) != hash_tweaks({}, stream=True)
+    assert hash_tweaks(None, stream=False) == hash_tweaks({}, stream=False)
+
+
+def test_repeated_runs_reuse_the_template(flow):
+    cache = PreparedGraphCache(max_size=4)
+
+    first = cache.get_graph(flow, {}, user_id="user")
+    second = cache.get_graph(flow, {}, user_id="user")
+
+    assert first is not second
+    assert first._vertices is second._vertices
+    assert first.flow_id == str(flow.id)
+    assert cache.stats() == {"size": 1, "max_size": 4, "hits": 1, "misses": 1}
+
+
+def test_updated_flow_gets_a_new_template(flow):
+    cache = PreparedGraphCache(max_size=4)
+    first = cache.get_graph(flow, {})
+
+    flow.updated_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    second = cache.get_graph(flow, {})
+
+    assert first._vertices is not second._vertices
+    assert cache.misses == 2
+
+
+def test_invalidate_removes_every_entry_of_a_flow(flow):
+    cache = PreparedGraphCache(max_size=4)
+    cache.get_graph(flow, {})
+    cache.get_graph(flow, {}, stream=True)
+
+    assert cache.invalidate(flow.id) == 2
+    assert len(cache) == 0
+
+
+def test_least_recently_used_template_is_evicted(flow):
+    cache = PreparedGraphCache(max_size=1)
+    cache.get_graph(flow, {})
+    cache.get_graph(flow, {}, stream=True)
+
+    assert len(cache) == 1
+    cache.get_graph(flow, {}, stream=True)
+    assert cache.hits == 1
+
+
+def test_zero_max_size_disables_caching(flow):
+    cache = PreparedGraphCache(max_size=0)
+    cache.get_graph(flow, {})
+    cache.get_graph(flow, {})
+
+    assert len(cache) == 0
+
+
+def test_flow_without_data_raises(flow):
+    flow.data = None
+    with pytest.raises(ValueError, match="has no data"):
+        PreparedGraphCache().get_graph(flow, {})
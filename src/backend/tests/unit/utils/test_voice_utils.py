@@ -10,10 +10,14 @@ from langflow.utils.voice_utils import (
     FRAME_DURATION_MS,
     SAMPLE_RATE_24K,
     VAD_SAMPLE_RATE_16K,
+    StreamingResampler,
+    VADFrameStream,
     _write_bytes_to_file,
+    detect_speech,
     resample_24k_to_16k,
     write_audio_to_file,
 )
+from scipy.signal import resample_poly
 
 
 class TestConstants:
@@ -172,6 +176,67 @@ class TestResample24kTo16k:
         assert target_samples == 320  # int(480 * 2 / 3)
 
 
+def _tone_24k(seconds: float = 1.0) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE_24K * seconds)) / SAMPLE_RATE_24K
+    return (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+
+class TestStreamingResampler:
+    """Test cases for the StreamingResampler class."""
+
+    def test_matches_polyphase_resampling_of_the_whole_stream(self):
+        """Test that resampling chunk by chunk gives the same audio as resampling the whole stream at once."""
+        samples_24k = _tone_24k()
+        audio = samples_24k.tobytes()
+        resampler = StreamingResampler()
+
+        # Chunks of uneven sizes, some splitting a sample in two
+        chunks = [audio[i : i + 1001] for i in range(0, len(audio), 1001)]
+        result = np.concatenate([resampler.process(chunk) for chunk in chunks])
+
+        expected = resample_poly(samples_24k.astype(np.float64), 2, 3)
+        assert len(result) == len(expected)
+        # The stream is delayed by the filter, 10 samples at 16kHz
+        assert np.max(np.abs(result[10:].astype(np.float64) - expected[:-10])) <= 1
+
+    def test_output_is_clipped_to_int16(self):
+        """Test that overshooting samples are clipped instead of wrapping around."""
+        samples_24k = np.array([32767, -32768] * 2400, dtype=np.int16)
+
+        result = StreamingResampler().process(samples_24k.tobytes())
+
+        assert result.dtype == np.int16
+        assert np.all(np.abs(result.astype(np.int32)) <= 32768)
+
+
+class TestVADFrameStream:
+    """Test cases for the VADFrameStream class and detect_speech."""
+
+    def test_frames_carry_over_incomplete_audio(self):
+        """Test that chunks are cut into complete 20ms frames at 16kHz, keeping the remainder for later."""
+        stream = VADFrameStream()
+
+        first = stream.feed(b"\x00" * (BYTES_PER_24K_FRAME + BYTES_PER_24K_FRAME // 2))
+        second = stream.feed(b"\x00" * (BYTES_PER_24K_FRAME // 2))
+
+        assert first.shape == (1, BYTES_PER_16K_FRAME // BYTES_PER_SAMPLE)
+        assert len(first) + len(second) == 2
+
+    def test_detect_speech_checks_every_frame_in_order(self):
+        """Test that every frame of a batch is passed to the VAD as a 20ms frame."""
+        frames = VADFrameStream().feed(_tone_24k(0.1).tobytes())
+        vad = MagicMock()
+        vad.is_speech.side_effect = [False, True, False, False, True]
+
+        result = detect_speech(vad, frames)
+
+        assert result.tolist() == [False, True, False, False, True]
+        for call, frame in zip(vad.is_speech.call_args_list, frames, strict=True):
+            data, sample_rate = call.args
+            assert bytes(data) == frame.tobytes()
+            assert sample_rate == VAD_SAMPLE_RATE_16K
+
+
 class TestWriteAudioToFile:
     """Test cases for write_audio_to_file function."""
 
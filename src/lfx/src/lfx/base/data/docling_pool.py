@@ -0,0 +1,504 @@
+"""Pool of warm Docling worker processes, and a parse cache keyed by file content.
+
+Starting a Python interpreter, importing Docling and loading its layout and OCR models costs far more than
+converting a typical document. The workers of the pool are long-lived `python -c` processes that keep their
+converters loaded for each (pipeline, OCR engine) configuration and take jobs as JSON lines over their stdin,
+answering each with a JSON line on stdout. Workers are recycled after a number of jobs to bound the memory held
+by native libraries, and killed when a job exceeds its timeout.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import queue
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from collections import deque
+from contextlib import suppress
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from lfx.log.logger import logger
+from lfx.services.deps import get_settings_service
+
+_STDERR_TAIL_LINES = 50
+
+WORKER_SCRIPT = textwrap.dedent(
+    r"""
+    import json, os, sys
+
+    _modules = None
+
+    def try_imports():
+        global _modules
+        if _modules is None:
+            from docling.datamodel.base_models import ConversionStatus, InputFormat  # type: ignore
+            from docling.document_converter import DocumentConverter  # type: ignore
+            from docling_core.types.doc import ImageRefMode  # type: ignore
+            _modules = ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, "latest"
+        return _modules
+
+    def create_converter(strategy, input_format, DocumentConverter, pipeline, ocr_engine):
+        # --- Standard PDF/IMAGE pipeline, with optional OCR ---
+        if pipeline == "standard":
+            try:
+                from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
+                from docling.document_converter import PdfFormatOption  # type: ignore
+
+                pipe = PdfPipelineOptions()
+                pipe.do_ocr = False
+
+                if ocr_engine:
+                    try:
+                        from docling.models.factories import get_ocr_factory  # type: ignore
+                        pipe.do_ocr = True
+                        fac = get_ocr_factory(allow_external_plugins=False)
+                        pipe.ocr_options = fac.create_options(kind=ocr_engine)
+                    except Exception:
+                        # If OCR setup fails, disable it
+                        pipe.do_ocr = False
+
+                fmt = {}
+                if hasattr(input_format, "PDF"):
+                    fmt[getattr(input_format, "PDF")] = PdfFormatOption(pipeline_options=pipe)
+                if hasattr(input_format, "IMAGE"):
+                    fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(pipeline_options=pipe)
+
+                return DocumentConverter(format_options=fmt)
+            except Exception:
+                return DocumentConverter()
+
+        # --- Vision-Language Model (VLM) pipeline ---
+        if pipeline == "vlm":
+            from docling.datamodel.pipeline_options import VlmPipelineOptions
+            from docling.datamodel.vlm_model_specs import GRANITEDOCLING_MLX, GRANITEDOCLING_TRANSFORMERS
+            from docling.document_converter import PdfFormatOption
+            from docling.pipeline.vlm_pipeline import VlmPipeline
+
+            vl_pipe = VlmPipelineOptions(
+                vlm_options=GRANITEDOCLING_TRANSFORMERS,
+            )
+
+            if sys.platform == "darwin":
+                import mlx_vlm
+                vl_pipe.vlm_options = GRANITEDOCLING_MLX
+
+            # VLM paths generally don't need OCR; keep OCR off by default here.
+            fmt = {}
+            if hasattr(input_format, "PDF"):
+                fmt[getattr(input_format, "PDF")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+            if hasattr(input_format, "IMAGE"):
+                fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+
+            return DocumentConverter(format_options=fmt)
+
+        # --- Fallback: default converter with no special options ---
+        return DocumentConverter()
+
+    def export_markdown(document, ImageRefMode, image_mode, img_ph, pg_ph):
+        try:
+            mode = getattr(ImageRefMode, image_mode.upper(), image_mode)
+            return document.export_to_markdown(
+                image_mode=mode,
+                image_placeholder=img_ph,
+                page_break_placeholder=pg_ph,
+            )
+        except Exception:
+            try:
+                return document.export_to_text()
+            except Exception:
+                return str(document)
+
+    def to_rows(doc_dict):
+        rows = []
+        for t in doc_dict.get("texts", []):
+            prov = t.get("prov") or []
+            page_no = None
+            if prov and isinstance(prov, list) and isinstance(prov[0], dict):
+                page_no = prov[0].get("page_no")
+            rows.append({
+                "page_no": page_no,
+                "label": t.get("label"),
+                "text": t.get("text"),
+                "level": t.get("level"),
+            })
+        return rows
+
+    def convert(cfg, converters):
+        file_path = cfg["file_path"]
+        markdown = cfg["markdown"]
+        image_mode = cfg["image_mode"]
+        img_ph = cfg["md_image_placeholder"]
+        pg_ph = cfg["md_page_break_placeholder"]
+        pipeline = cfg["pipeline"]
+        ocr_engine = cfg.get("ocr_engine")
+        meta = {"file_path": file_path}
+
+        try:
+            ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
+            # Converters keep their models loaded, so they are built once per configuration
+            converter = converters.get((pipeline, ocr_engine))
+            if converter is None:
+                converter = create_converter(strategy, InputFormat, DocumentConverter, pipeline, ocr_engine)
+                converters[pipeline, ocr_engine] = converter
+            try:
+                res = converter.convert(file_path)
+            except Exception as e:
+                return {"ok": False, "error": f"Docling conversion error: {e}", "meta": meta}
+
+            ok = False
+            if hasattr(res, "status"):
+                try:
+                    ok = (res.status == ConversionStatus.SUCCESS) or (str(res.status).lower() == "success")
+                except Exception:
+                    ok = (str(res.status).lower() == "success")
+            if not ok and hasattr(res, "document"):
+                ok = getattr(res, "document", None) is not None
+            if not ok:
+                return {"ok": False, "error": "Docling conversion failed", "meta": meta}
+
+            doc = getattr(res, "document", None)
+            if doc is None:
+                return {"ok": False, "error": "Docling produced no document", "meta": meta}
+
+            if markdown:
+                text = export_markdown(doc, ImageRefMode, image_mode, img_ph, pg_ph)
+                return {"ok": True, "mode": "markdown", "text": text, "meta": meta}
+
+            # structured
+            try:
+                doc_dict = doc.export_to_dict()
+            except Exception as e:
+                return {"ok": False, "error": f"Docling export_to_dict failed: {e}", "meta": meta}
+
+            return {"ok": True, "mode": "structured", "doc": to_rows(doc_dict), "meta": meta}
+        except Exception as e:
+            return {"ok": False, "error": f"Docling processing error: {e}", "meta": meta}
+
+    def main():
+        # Results are written to a private copy of stdout, and fd 1 points to stderr before Docling is imported, so
+        # anything Python code or native libraries print goes to stderr and stdout only carries results
+        results = os.fdopen(os.dup(1), "w", encoding="utf-8")
+        os.dup2(2, 1)
+        sys.stdout = sys.stderr
+        converters = {}
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            result = convert(json.loads(line), converters)
+            results.write(json.dumps(result) + "\n")
+            results.flush()
+
+    if __name__ == "__main__":
+        main()
+    """
+)
+
+
+class DoclingWorker:
+    """A warm Docling worker process, running one job at a time."""
+
+    def __init__(self) -> None:
+        self.process = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-u", "-c", WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        self.jobs = 0
+        self.configs: set[tuple[str, str | None]] = set()
+        self._results: queue.Queue[str | None] = queue.Queue()
+        self._stderr: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        threading.Thread(target=self._read_results, daemon=True).start()
+        # stderr is drained continuously so a chatty worker never blocks on a full pipe
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+    def _read_results(self) -> None:
+        for line in self.process.stdout:
+            self._results.put(line)
+        self._results.put(None)
+
+    def _read_stderr(self) -> None:
+        for line in self.process.stderr:
+            self._stderr.append(line)
+
+    @property
+    def stderr_tail(self) -> str:
+        return "".join(self._stderr).strip()
+
+    def run(self, job: dict[str, Any], timeout: float | None) -> dict[str, Any]:
+        """Run a job and return its result.
+
+        Raises:
+            TimeoutError: If the job didn't finish within `timeout` seconds.
+            RuntimeError: If the worker exited before answering.
+        """
+        self.jobs += 1
+        try:
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+        except OSError as e:
+            msg = f"{e}. stderr={self.stderr_tail}"
+            raise RuntimeError(msg) from e
+        try:
+            line = self._results.get(timeout=timeout)
+        except queue.Empty as e:
+            msg = f"Docling conversion timed out after {timeout} seconds"
+            raise TimeoutError(msg) from e
+        if line is None:
+            msg = self.stderr_tail or "no output from child process"
+            raise RuntimeError(msg)
+        return json.loads(line)
+
+    def stop(self) -> None:
+        """Stop the worker, killing it if it doesn't exit promptly."""
+        with suppress(OSError):
+            self.process.stdin.close()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class DoclingWorkerPool:
+    """Pool of warm Docling worker processes.
+
+    Workers are started on demand, up to `size`. A job goes to an idle worker that already has a converter for
+    its configuration when there is one.
+
+    Args:
+        size: Maximum number of worker processes.
+        max_jobs_per_worker: Number of jobs after which a worker is replaced by a fresh process. 0 never recycles.
+        job_timeout: Time in seconds a job can run before its worker is killed. None waits indefinitely.
+    """
+
+    def __init__(self, size: int, max_jobs_per_worker: int = 0, job_timeout: float | None = None) -> None:
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.job_timeout = job_timeout
+        self._idle: list[DoclingWorker] = []
+        self._started = 0
+        self._condition = threading.Condition()
+
+    def _acquire(self, config: tuple[str, str | None]) -> DoclingWorker:
+        with self._condition:
+            while True:
+                worker = next((w for w in self._idle if config in w.configs), None)
+                if worker is None and self._idle:
+                    worker = self._idle[0]
+                if worker is not None:
+                    self._idle.remove(worker)
+                    return worker
+                if self._started < self.size:
+                    self._started += 1
+                    break
+                self._condition.wait()
+        try:
+            return DoclingWorker()
+        except Exception:
+            self._forget_worker()
+            raise
+
+    def _release(self, worker: DoclingWorker, *, healthy: bool) -> None:
+        recycle = self.max_jobs_per_worker and worker.jobs >= self.max_jobs_per_worker
+        if healthy and not recycle and worker.process.poll() is None:
+            with self._condition:
+                self._idle.append(worker)
+                self._condition.notify()
+            return
+        if not healthy:
+            worker.process.kill()
+        worker.stop()
+        self._forget_worker()
+
+    def _forget_worker(self) -> None:
+        with self._condition:
+            self._started -= 1
+            self._condition.notify()
+
+    def convert(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Convert a file with a warm worker.
+
+        Returns:
+            The result of the worker, with `ok` False and an `error` when the conversion failed.
+        """
+        config = (job["pipeline"], job.get("ocr_engine"))
+        meta = {"file_path": job["file_path"]}
+        worker = self._acquire(config)
+        healthy = False
+        try:
+            result = worker.run(job, self.job_timeout)
+            worker.configs.add(config)
+            healthy = True
+        except TimeoutError as e:
+            return {"ok": False, "error": str(e), "meta": meta}
+        except (RuntimeError, ValueError) as e:
+            return {"ok": False, "error": f"Docling subprocess error: {e}", "meta": meta}
+        finally:
+            self._release(worker, healthy=healthy)
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the idle workers."""
+        with self._condition:
+            workers, self._idle = self._idle, []
+            self._started -= len(workers)
+        for worker in workers:
+            worker.stop()
+
+
+@cache
+def _docling_version() -> str:
+    try:
+        return version("docling")
+    except PackageNotFoundError:
+        return ""
+
+
+class DoclingParseCache:
+    """Disk cache of Docling results, keyed by the file content, the conversion options and the Docling version.
+
+    Results expire `ttl` seconds after they are written, and the oldest ones are removed once the cache holds more
+    than `max_size` bytes. Both are enforced each time a result is written.
+
+    Args:
+        directory: Directory of the cache.
+        ttl: Seconds a result is kept. 0 keeps results until they are evicted by size.
+        max_size: Maximum total size of the cache in bytes. 0 disables the limit.
+    """
+
+    def __init__(self, directory: str | Path, ttl: float = 0, max_size: int = 0) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_size = max_size
+
+    @staticmethod
+    def key(file_path: str, options: dict[str, Any]) -> str:
+        """Return the cache key of a file converted with `options` by the installed Docling version.
+
+        Raises:
+            OSError: If the file can't be read.
+        """
+        digest = hashlib.sha256()
+        with Path(file_path).open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        digest.update(json.dumps(options, sort_keys=True).encode())
+        digest.update(_docling_version().encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _is_expired(self, modified_at: float, now: float) -> bool:
+        return bool(self.ttl) and modified_at + self.ttl <= now
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            if self._is_expired(path.stat().st_mtime, time.time()):
+                path.unlink(missing_ok=True)
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read cached Docling result {key}: {e}")
+            return None
+
+    def set(self, key: str, result: dict[str, Any]) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written under a temporary name first so readers never see a partial file
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(result), encoding="utf-8")
+            tmp_path.replace(path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not cache Docling result {key}: {e}")
+        self.prune()
+
+    def prune(self) -> int:
+        """Remove the expired results, then the oldest ones until the cache fits in `max_size`.
+
+        Returns:
+            The number of results removed.
+        """
+        now = time.time()
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            with suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        removed = 0
+        for modified_at, size, path in entries:
+            if not self._is_expired(modified_at, now) and (not self.max_size or total_size <= self.max_size):
+                break
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Could not remove cached Docling result {path}: {e}")
+                continue
+            total_size -= size
+            removed += 1
+        return removed
+
+
+_pool: DoclingWorkerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_docling_worker_pool() -> DoclingWorkerPool:
+    """Return the Docling worker pool of the process, configured from the settings."""
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None:
+            settings_service = get_settings_service()
+            if settings_service is None:
+                _pool = DoclingWorkerPool(size=1)
+            else:
+                settings = settings_service.settings
+                _pool = DoclingWorkerPool(
+                    size=settings.docling_worker_pool_size,
+                    max_jobs_per_worker=settings.docling_worker_max_jobs,
+                    job_timeout=settings.docling_job_timeout or None,
+                )
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def get_docling_parse_cache() -> DoclingParseCache | None:
+    """Return the Docling parse cache configured in the settings, or None if it is disabled."""
+    settings_service = get_settings_service()
+    if settings_service is None:
+        return None
+    settings = settings_service.settings
+    if not settings.docling_parse_cache:
+        return None
+    directory = settings.docling_parse_cache_dir
+    if directory is None:
+        if not settings.config_dir:
+            return None
+        directory = Path(settings.config_dir) / "docling_cache"
+    return DoclingParseCache(
+        directory, ttl=settings.docling_parse_cache_ttl, max_size=settings.docling_parse_cache_max_size
+    )
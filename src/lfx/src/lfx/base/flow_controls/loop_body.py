@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lfx.graph.edge.base import CycleEdge
+    from lfx.graph.graph.base import Graph
+
+LOOP_ITEM = "item"
+
+
+def _source_output(edge: CycleEdge) -> str | None:
+    return getattr(edge.source_handle, "name", None)
+
+
+class LoopBody:
+    """The vertices a Loop sends each item through, extracted into a graph of their own.
+
+    The body is every vertex downstream of the loop's `item` output. Each call to `run` builds an isolated
+    copy of it, so items can go through the body at the same time without sharing vertex or component state.
+
+    Inputs the body receives from outside are resolved when it is extracted: the item is set on the fields
+    connected to the `item` output, and the results of vertices already built are copied into the fields they
+    feed. Upstream vertices that aren't built yet are added to the body, so they run once per item.
+
+    Args:
+        graph: The graph the loop belongs to.
+        loop_id: The ID of the loop vertex.
+
+    Raises:
+        ValueError: If the body doesn't connect back to the loop's `item` input.
+    """
+
+    def __init__(self, graph: Graph, loop_id: str) -> None:
+        self.graph = graph
+        self.loop_id = loop_id
+        edges = list(graph.edges)
+
+        return_edge = next(
+            (edge for edge in edges if edge.target_id == loop_id and edge.target_param == LOOP_ITEM), None
+        )
+        if return_edge is None or _source_output(return_edge) is None:
+            msg = "The loop body must be connected back to the Loop 'Item' input to run items in parallel"
+            raise ValueError(msg)
+        self.result_vertex_id = return_edge.source_id
+        self.result_output = _source_output(return_edge)
+
+        self.item_fields = [
+            (edge.target_id, edge.target_param)
+            for edge in edges
+            if edge.source_id == loop_id and _source_output(edge) == LOOP_ITEM
+        ]
+        self.vertex_ids = self._collect_vertices(edges)
+        if self.result_vertex_id not in self.vertex_ids:
+            msg = "The vertex connected to the Loop 'Item' input must be downstream of the Loop 'Item' output"
+            raise ValueError(msg)
+        self.external_values = self._collect_external_values(edges)
+
+        nodes = [graph.get_vertex(vertex_id).full_data for vertex_id in self.vertex_ids]
+        body_edges = [
+            edge.to_data() for edge in edges if edge.source_id in self.vertex_ids and edge.target_id in self.vertex_ids
+        ]
+        self._template = type(graph).from_payload(
+            copy.deepcopy({"nodes": nodes, "edges": body_edges}),
+            flow_id=graph.flow_id,
+            flow_name=graph.flow_name,
+            user_id=graph.user_id,
+        )
+
+    def _collect_vertices(self, edges: list[CycleEdge]) -> set[str]:
+        successors: dict[str, list[str]] = defaultdict(list)
+        predecessors: dict[str, list[str]] = defaultdict(list)
+        for edge in edges:
+            successors[edge.source_id].append(edge.target_id)
+            predecessors[edge.target_id].append(edge.source_id)
+
+        vertex_ids: set[str] = set()
+        to_visit = [vertex_id for vertex_id, _ in self.item_fields]
+        while to_visit:
+            vertex_id = to_visit.pop()
+            if vertex_id == self.loop_id or vertex_id in vertex_ids:
+                continue
+            vertex_ids.add(vertex_id)
+            to_visit.extend(successors[vertex_id])
+
+        # Upstream vertices that haven't run can't provide their results, so they run with the body
+        to_visit = [source_id for vertex_id in vertex_ids for source_id in predecessors[vertex_id]]
+        while to_visit:
+            vertex_id = to_visit.pop()
+            if vertex_id == self.loop_id or vertex_id in vertex_ids or self.graph.get_vertex(vertex_id).built:
+                continue
+            vertex_ids.add(vertex_id)
+            to_visit.extend(predecessors[vertex_id])
+        return vertex_ids
+
+    def _collect_external_values(self, edges: list[CycleEdge]) -> dict[tuple[str, str], list[Any]]:
+        external_values: dict[tuple[str, str], list[Any]] = defaultdict(list)
+        for edge in edges:
+            if edge.target_id not in self.vertex_ids or edge.source_id in self.vertex_ids:
+                continue
+            if edge.source_id == self.loop_id:
+                continue
+            source = self.graph.get_vertex(edge.source_id)
+            external_values[edge.target_id, edge.target_param].append(source.results.get(_source_output(edge)))
+        return external_values
+
+    async def run(self, item: Any, *, fallback_to_env_vars: bool = False) -> Any:
+        """Run `item` through a copy of the body and return the value sent back to the loop."""
+        graph = self._template.clone_for_run(context=dict(self.graph.context))
+        graph.session_id = self.graph.session_id
+
+        params: dict[tuple[str, str], Any] = {
+            key: values[0] if len(values) == 1 else values for key, values in self.external_values.items()
+        }
+        params.update(dict.fromkeys(self.item_fields, item))
+        for (vertex_id, field), value in params.items():
+            graph.get_vertex(vertex_id).update_raw_params({field: value}, overwrite=True)
+
+        await graph.process(fallback_to_env_vars=fallback_to_env_vars)
+        return graph.get_vertex(self.result_vertex_id).results.get(self.result_output)
+
+    async def map(self, items: list[Any], *, max_concurrency: int, fallback_to_env_vars: bool = False) -> list[Any]:
+        """Run every item through its own copy of the body, at most `max_concurrency` at a time.
+
+        The results are returned in the order of the items. If an item fails, the others are cancelled.
+        """
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def run_item(item: Any) -> Any:
+            async with semaphore:
+                return await self.run(item, fallback_to_env_vars=fallback_to_env_vars)
+
+        tasks = [asyncio.ensure_future(run_item(item)) for item in items]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
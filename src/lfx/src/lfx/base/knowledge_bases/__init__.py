@@ -1,3 +1,17 @@
-from .knowledge_base_utils import compute_bm25, compute_tfidf, get_knowledge_bases
+from .knowledge_base_utils import (
+    compute_bm25,
+    compute_tfidf,
+    get_knowledge_bases,
+    read_kb_stats,
+    update_kb_stats,
+    write_kb_stats,
+)
 
-__all__ = ["compute_bm25", "compute_tfidf", "get_knowledge_bases"]
+__all__ = [
+    "compute_bm25",
+    "compute_tfidf",
+    "get_knowledge_bases",
+    "read_kb_stats",
+    "update_kb_stats",
+    "write_kb_stats",
+]
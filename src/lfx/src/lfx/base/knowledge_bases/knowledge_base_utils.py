@@ -1,11 +1,24 @@
+import json
 import math
+import tempfile
 from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
+from filelock import FileLock
 from langflow.services.database.models.user.crud import get_user_by_id
 from langflow.services.deps import session_scope
 
+# Statistics of a knowledge base, kept next to its vector store so listing knowledge bases doesn't read the store
+KB_STATS_FILENAME = "kb_stats.json"
+# Serializes the updates of the statistics file between threads and worker processes
+KB_STATS_LOCK_FILENAME = "kb_stats.json.lock"
+
+KB_STATS_FIELDS = ("chunks", "words", "characters", "bytes")
+
 
 def compute_tfidf(documents: list[str], query_terms: list[str]) -> list[float]:
     """Compute TF-IDF scores for query terms across a collection of documents.
@@ -135,3 +148,97 @@ async def get_knowledge_bases(kb_root: Path, user_id: UUID | str) -> list[str]:
         return []
 
     return [str(d.name) for d in kb_path.iterdir() if not d.name.startswith(".") and d.is_dir()]
+
+
+def count_words_and_characters(texts: Iterable[str]) -> tuple[int, int]:
+    """Count the whitespace separated words and the characters of `texts`."""
+    words = 0
+    characters = 0
+    for text in texts:
+        words += len(text.split())
+        characters += len(text)
+    return words, characters
+
+
+def get_directory_size(path: Path) -> int:
+    """Calculate the total size of all files in a directory."""
+    total_size = 0
+    try:
+        for file_path in path.rglob("*"):
+            if file_path.is_file():
+                total_size += file_path.stat().st_size
+    except OSError:
+        pass
+    return total_size
+
+
+def read_kb_stats(kb_path: Path) -> dict[str, Any] | None:
+    """Read the statistics file of a knowledge base.
+
+    Returns:
+        The statistics, or None if the knowledge base has no valid statistics file.
+    """
+    stats_path = kb_path / KB_STATS_FILENAME
+    try:
+        stats = json.loads(stats_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(stats, dict) or not all(isinstance(stats.get(key), int) for key in KB_STATS_FIELDS):
+        return None
+    return stats
+
+
+def write_kb_stats(kb_path: Path, *, chunks: int, words: int, characters: int, size: int | None = None) -> dict:
+    """Write the statistics file of a knowledge base, replacing the previous one atomically.
+
+    Args:
+        kb_path: The knowledge base directory.
+        chunks: The number of chunks in the vector store.
+        words: The number of words in the chunks.
+        characters: The number of characters in the chunks.
+        size: The size of the knowledge base directory in bytes. Computed when not given.
+
+    Returns:
+        The statistics written.
+    """
+    stats = {
+        "chunks": max(chunks, 0),
+        "words": max(words, 0),
+        "characters": max(characters, 0),
+        "bytes": get_directory_size(kb_path) if size is None else size,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    stats_path = kb_path / KB_STATS_FILENAME
+    # A temporary file per writer, so concurrent writers never replace the statistics with a partial file
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=kb_path, prefix=f"{KB_STATS_FILENAME}.", suffix=".tmp", delete=False
+    ) as tmp_file:
+        tmp_file.write(json.dumps(stats))
+    Path(tmp_file.name).replace(stats_path)
+    return stats
+
+
+def update_kb_stats(kb_path: Path, *, chunks: int = 0, words: int = 0, characters: int = 0) -> dict:
+    """Add the given counts to the statistics of a knowledge base. Use negative counts for removed chunks.
+
+    The counts start from zero when the knowledge base has no statistics file yet, so this must only be
+    called for knowledge bases whose statistics were tracked since they were created. The size is measured
+    again, as the vector store doesn't grow by a predictable amount.
+
+    The statistics are read and written back under a file lock, so concurrent ingestions into the same
+    knowledge base, from threads or worker processes, don't lose each other's counts.
+
+    Returns:
+        The updated statistics.
+    """
+    # Measured before taking the lock, walking the directory can be slow
+    size = get_directory_size(kb_path)
+    with FileLock(kb_path / KB_STATS_LOCK_FILENAME):
+        stats = read_kb_stats(kb_path) or dict.fromkeys(KB_STATS_FIELDS, 0)
+        return write_kb_stats(
+            kb_path,
+            chunks=stats["chunks"] + chunks,
+            words=stats["words"] + words,
+            characters=stats["characters"] + characters,
+            size=size,
+        )
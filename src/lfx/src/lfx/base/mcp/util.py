@@ -22,7 +22,7 @@ from pydantic import BaseModel
 
 from lfx.log.logger import logger
 from lfx.schema.json_schema import create_input_schema_from_json_schema
-from lfx.services.deps import get_settings_service
+from lfx.services.deps import get_http_client_service, get_settings_service
 
 HTTP_ERROR_STATUS_CODE = httpx_codes.BAD_REQUEST  # HTTP status code for client errors
 
@@ -754,7 +754,10 @@ class MCPSessionManager:
         # Get verify_ssl option from connection params, default to True
         verify_ssl = connection_params.get("verify_ssl", True)
 
-        # Create custom httpx client factory with SSL verification option
+        # Create custom httpx client factory with SSL verification option.
+        # The transports don't borrow a client of the HTTP client service: the MCP SDK closes the client it is
+        # given, sets the headers, auth and timeouts of the session on the client itself, and keeps a stream open
+        # for the whole session, which would hold one of the in-flight request slots of the pool until it ends.
         def custom_httpx_factory(
             headers: dict[str, str] | None = None,
             timeout: httpx.Timeout | None = None,
@@ -1368,8 +1371,13 @@ class MCPStreamableHttpClient:
             headers["Mcp-Session-Id"] = str(session_id)
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                await client.delete(url, headers=headers)
+            http_client_service = get_http_client_service()
+            if http_client_service is None:
+                async with httpx.AsyncClient(timeout=5.0) as client:
+                    await client.delete(url, headers=headers)
+            else:
+                client = http_client_service.get_client(url, verify=self._connection_params.get("verify_ssl", True))
+                await client.delete(url, headers=headers, timeout=5.0)
         except Exception as e:  # noqa: BLE001
             # DELETE is advisory—log and continue
             logger.debug(f"Unable to send session DELETE to '{url}': {e}")
@@ -5,10 +5,24 @@ from abc import abstractmethod
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.language_models.llms import LLM
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    message_to_dict,
+    messages_from_dict,
+)
 from langchain_core.output_parsers import BaseOutputParser
 
 from lfx.base.constants import STREAM_INFO_TEXT
+from lfx.base.models.response_cache import (
+    get_llm_response_cache,
+    model_cache_params,
+    response_cache_key,
+    split_into_tokens,
+)
 from lfx.custom.custom_component.component import Component
 from lfx.field_typing import LanguageModel
 from lfx.inputs.inputs import BoolInput, InputTypes, MessageInput, MultilineInput
@@ -215,6 +229,8 @@ class LCModelComponent(Component):
             raise ValueError(msg)
         system_message_added = False
         message = None
+        model = runnable
+        prompt = None
         if input_value:
             if isinstance(input_value, Message):
                 with warnings.catch_warnings():
@@ -249,7 +265,10 @@ class LCModelComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
-            if stream:
+            cache_key = self._response_cache_key(model, messages, prompt)
+            if cache_key is not None:
+                lf_message, result, message = await self._get_cached_result(cache_key, runnable, inputs, stream=stream)
+            elif stream:
                 lf_message, result = await self._handle_stream(runnable, inputs)
             else:
                 message = await runnable.ainvoke(inputs)
@@ -268,6 +287,97 @@ class LCModelComponent(Component):
             raise
         return lf_message or Message(text=result)
 
+    def _response_cache_key(self, model: LanguageModel, messages: list[BaseMessage], prompt=None) -> str | None:
+        """Return the key of the request in the response cache, or None if it can't be cached."""
+        if get_llm_response_cache() is None or getattr(self, "output_parser", None) is not None:
+            return None
+        model_params = model_cache_params(model)
+        if model_params is None:
+            return None
+        if prompt is not None:
+            try:
+                messages = prompt.format_messages()
+            except (KeyError, ValueError):
+                return None
+        return response_cache_key(type(self).__name__, model_params, messages)
+
+    async def _get_cached_result(self, cache_key: str, runnable, inputs, *, stream: bool):
+        """Answer the request from the response cache, or call the model and cache its response.
+
+        Identical requests in flight share one call to the model. Cached responses are replayed as a token
+        stream when streaming.
+
+        Returns:
+            tuple: (Message object if streamed to a chat output, model result, model message)
+        """
+        cache = get_llm_response_cache()
+        live: dict = {}
+
+        async def call_model() -> dict | None:
+            if stream:
+                live["lf_message"], live["result"] = await self._handle_stream(runnable, inputs)
+            else:
+                live["message"] = await runnable.ainvoke(inputs)
+                message = live["message"]
+                live["result"] = message.content if hasattr(message, "content") else message
+            if not isinstance(live["result"], str):
+                return None
+            message = live.get("message")
+            return {
+                "text": live["result"],
+                "message": message_to_dict(message) if isinstance(message, AIMessage) else None,
+            }
+
+        payload, cached = await cache.get_or_compute(cache_key, call_model) if cache else (None, False)
+        if not cached or payload is None:
+            if not live:
+                await call_model()
+            return live.get("lf_message"), live["result"], live.get("message")
+
+        message = messages_from_dict([payload["message"]])[0] if payload["message"] else None
+        if stream:
+            lf_message, result = await self._replay_stream(payload["text"])
+            return lf_message, result, message
+        return None, payload["text"], message
+
+    async def _replay_stream(self, text: str):
+        """Send a cached response to the chat output as a token stream.
+
+        Returns:
+            tuple: (Message object if connected to chat output, model result)
+        """
+        if not self.is_connected_to_chat_output():
+            return None, text
+
+        async def tokens():
+            for token in split_into_tokens(text):
+                yield AIMessageChunk(content=token)
+
+        return await self._send_stream_message(tokens())
+
+    async def _send_stream_message(self, stream):
+        """Send a streamed response to the chat output.
+
+        Returns:
+            tuple: (Message object sent to the chat output, model result)
+        """
+        if hasattr(self, "graph"):
+            session_id = self.graph.session_id
+        elif hasattr(self, "_session_id"):
+            session_id = self._session_id
+        else:
+            session_id = None
+        model_message = Message(
+            text=stream,
+            sender=MESSAGE_SENDER_AI,
+            sender_name="AI",
+            properties={"icon": self.icon, "state": "partial"},
+            session_id=session_id,
+        )
+        model_message.properties.source = self._build_source(self._id, self.display_name, self)
+        lf_message = await self.send_message(model_message)
+        return lf_message, lf_message.text or ""
+
     async def _handle_stream(self, runnable, inputs):
         """Handle streaming responses from the language model.
 
@@ -281,22 +391,7 @@ class LCModelComponent(Component):
         lf_message = None
         if self.is_connected_to_chat_output():
             # Add a Message
-            if hasattr(self, "graph"):
-                session_id = self.graph.session_id
-            elif hasattr(self, "_session_id"):
-                session_id = self._session_id
-            else:
-                session_id = None
-            model_message = Message(
-                text=runnable.astream(inputs),
-                sender=MESSAGE_SENDER_AI,
-                sender_name="AI",
-                properties={"icon": self.icon, "state": "partial"},
-                session_id=session_id,
-            )
-            model_message.properties.source = self._build_source(self._id, self.display_name, self)
-            lf_message = await self.send_message(model_message)
-            result = lf_message.text or ""
+            lf_message, result = await self._send_stream_message(runnable.astream(inputs))
         else:
             message = await runnable.ainvoke(inputs)
             result = message.content if hasattr(message, "content") else message
@@ -0,0 +1,253 @@
+"""Exact-match cache of language model responses."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.runnables import RunnableBinding
+
+from lfx.log.logger import logger
+from lfx.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+
+_TOKEN_PATTERN = re.compile(r"\S+\s*|\s+")
+# Seconds between two sweeps of the expired responses of the disk tier
+DISK_SWEEP_INTERVAL = 600.0
+
+
+def model_cache_params(model: Any) -> dict[str, Any] | None:
+    """Return the parameters identifying a model's responses, or None if they can't be determined.
+
+    Arguments bound to the model, like tools, are part of the parameters.
+    """
+    bound_kwargs: dict[str, Any] = {}
+    while isinstance(model, RunnableBinding):
+        bound_kwargs = {**model.kwargs, **bound_kwargs}
+        model = model.bound
+    params = getattr(model, "_identifying_params", None)
+    if not isinstance(params, Mapping) or not params:
+        return None
+    return {"type": type(model).__name__, "params": dict(params), "bound": bound_kwargs}
+
+
+def response_cache_key(provider: str, model_params: Mapping[str, Any], messages: list[BaseMessage]) -> str:
+    """Return the cache key of a request, from the provider, model parameters and normalized messages."""
+    normalized = [{"type": message.type, "content": message.content} for message in messages]
+    request = [provider, model_params, normalized]
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def split_into_tokens(text: str) -> list[str]:
+    """Split a cached response into word-sized chunks, to be replayed as a token stream."""
+    return _TOKEN_PATTERN.findall(text)
+
+
+class LLMResponseCache:
+    """Exact-match cache of language model responses, with an in-memory LRU tier and an optional disk tier.
+
+    Responses are JSON serializable payloads kept for `ttl` seconds. The memory tier keeps the `max_size` most
+    recently used ones; the disk tier, when a directory is given, keeps every response until it expires and
+    survives restarts. Expired responses are removed from disk by a sweep that runs, at most every
+    `sweep_interval` seconds, when a response is written.
+
+    Identical requests are coalesced: while a response is being computed, `get_or_compute` callers for the same
+    key on the same event loop wait for it instead of calling the model again.
+
+    Args:
+        ttl: Time in seconds a response is kept.
+        max_size: Maximum number of responses kept in memory.
+        directory: Directory of the disk tier. None keeps the responses in memory only.
+        sweep_interval: Minimum time in seconds between two sweeps of the disk tier.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int,
+        directory: str | Path | None = None,
+        sweep_interval: float = DISK_SWEEP_INTERVAL,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.directory = Path(directory) if directory else None
+        self.sweep_interval = sweep_interval
+        # The first write sweeps the responses left expired by previous processes
+        self._next_sweep = 0.0
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        if self.directory is None:
+            msg = "The response cache has no directory"
+            raise ValueError(msg)
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _get_from_memory(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _set_in_memory(self, key: str, payload: dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _read_disk(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug(f"Could not read cached response {path}: {exc}")
+            return None
+        if entry["expires_at"] <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return entry["expires_at"], entry["payload"]
+
+    def _write_disk(self, key: str, payload: dict[str, Any], expires_at: float) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written under a temporary name first so readers never see a partial file
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps({"expires_at": expires_at, "payload": payload}), encoding="utf-8")
+            tmp_path.replace(path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug(f"Could not write cached response {path}: {exc}")
+
+    def _sweep_disk(self) -> int:
+        """Remove the expired responses of the disk tier, and temporary files left by failed writes.
+
+        Returns:
+            The number of files removed.
+        """
+        if self.directory is None:
+            return 0
+        now = time.time()
+        removed = 0
+        for path in self.directory.glob("*/*"):
+            try:
+                if path.suffix == ".tmp":
+                    expired = path.stat().st_mtime + self.sweep_interval <= now
+                else:
+                    expired = json.loads(path.read_text(encoding="utf-8"))["expires_at"] <= now
+                if expired:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+            except (OSError, ValueError, KeyError, TypeError) as exc:
+                logger.debug(f"Could not sweep cached response {path}: {exc}")
+        return removed
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached response for `key`, looking in memory first and then on disk."""
+        payload = self._get_from_memory(key)
+        if payload is None and self.directory is not None:
+            entry = await asyncio.to_thread(self._read_disk, key)
+            if entry is not None:
+                expires_at, payload = entry
+                self._set_in_memory(key, payload, expires_at)
+        return payload
+
+    async def set(self, key: str, payload: dict[str, Any]) -> None:
+        """Cache the response `payload` for `key` for `ttl` seconds."""
+        expires_at = time.time() + self.ttl
+        self._set_in_memory(key, payload, expires_at)
+        if self.directory is not None:
+            await asyncio.to_thread(self._write_disk, key, payload, expires_at)
+            now = time.time()
+            if now >= self._next_sweep:
+                self._next_sweep = now + self.sweep_interval
+                await asyncio.to_thread(self._sweep_disk)
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[dict[str, Any] | None]]
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """Return the cached response for `key`, or compute it, sharing the computation with identical requests.
+
+        `compute` returns the payload to cache, or None if the response can't be cached; the waiting requests
+        then compute their own response.
+
+        Returns:
+            The payload and whether it came from the cache or from another request.
+        """
+        payload = await self.get(key)
+        if payload is not None:
+            self.hits += 1
+            return payload, True
+
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None and in_flight.get_loop() is loop:
+            payload = await asyncio.shield(in_flight)
+            if payload is not None:
+                self.hits += 1
+                return payload, True
+
+        self.misses += 1
+        future: asyncio.Future = loop.create_future()
+        self._in_flight[key] = future
+        try:
+            payload = await compute()
+            if payload is not None:
+                await self.set(key, payload)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+            if not future.done():
+                future.set_result(payload)
+        return payload, False
+
+    def clear(self) -> None:
+        """Drop every response kept in memory."""
+        with self._lock:
+            self._entries.clear()
+
+
+_response_cache: LLMResponseCache | None = None
+_response_cache_config: tuple | None = None
+
+
+def get_llm_response_cache() -> LLMResponseCache | None:
+    """Return the language model response cache configured in the settings, or None if it is disabled."""
+    global _response_cache, _response_cache_config  # noqa: PLW0603
+    settings_service = get_settings_service()
+    if settings_service is None:
+        return None
+    settings = settings_service.settings
+    config = (
+        getattr(settings, "llm_response_cache_ttl", 0),
+        getattr(settings, "llm_response_cache_max_size", 0),
+        getattr(settings, "llm_response_cache_dir", None),
+    )
+    ttl, max_size, directory = config
+    if not ttl or ttl <= 0 or not max_size:
+        return None
+    if _response_cache is None or config != _response_cache_config:
+        _response_cache = LLMResponseCache(ttl=ttl, max_size=max_size, directory=directory)
+        _response_cache_config = config
+    return _response_cache
@@ -108,25 +108,13 @@ class RunFlowBaseComponent(Component):
         return Message(text=message_result.data["text"])
 
     async def get_flow_names(self) -> list[str]:
-        # TODO: get flfow ID with flow name
-        flow_data = await self.alist_flows()
-        return [flow_data.data["name"] for flow_data in flow_data]
-
-    async def get_flow(self, flow_name_selected: str) -> Data | None:
-        # get flow from flow id
-        flow_datas = await self.alist_flows()
-        for flow_data in flow_datas:
-            if flow_data.data["name"] == flow_name_selected:
-                return flow_data
-        return None
+        flow_catalog = await self.alist_flow_catalog()
+        return [flow_entry.data["name"] for flow_entry in flow_catalog]
 
     async def get_graph(self, flow_name_selected: str | None = None) -> Graph:
         if flow_name_selected:
-            flow_data = await self.get_flow(flow_name_selected)
-            if flow_data:
-                return Graph.from_payload(flow_data.data["data"])
-            msg = "Flow not found"
-            raise ValueError(msg)
+            # Looked up by name without listing the user's flows, and cached until the flow changes
+            return await self.load_flow(flow_name=flow_name_selected)
         # Ensure a Graph is always returned or an exception is raised
         msg = "No valid flow JSON or flow name selected."
         raise ValueError(msg)
@@ -192,15 +180,15 @@ class RunFlowBaseComponent(Component):
         ]
 
     async def get_required_data(self, flow_name_selected):
-        self.flow_data = await self.alist_flows()
-        for flow_data in self.flow_data:
-            if flow_data.data["name"] == flow_name_selected:
-                graph = Graph.from_payload(flow_data.data["data"])
-                new_fields = self.get_new_fields_from_graph(graph)
-                new_fields = self.update_input_types(new_fields)
-
-                return flow_data.data["description"], [field for field in new_fields if field.get("tool_mode") is True]
-        return None
+        flow_catalog = await self.alist_flow_catalog(flow_name=flow_name_selected)
+        if not flow_catalog:
+            return None
+        flow_entry = flow_catalog[0]
+        graph = await self.load_flow(str(flow_entry.data["id"]))
+        new_fields = self.get_new_fields_from_graph(graph)
+        new_fields = self.update_input_types(new_fields)
+
+        return flow_entry.data["description"], [field for field in new_fields if field.get("tool_mode") is True]
 
     def update_input_types(self, fields: list[dotdict]) -> list[dotdict]:
         for field in fields:
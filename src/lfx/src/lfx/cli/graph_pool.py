@@ -0,0 +1,148 @@
+"""Pools of pre-built graph instances used by ``lfx serve`` to run flows."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+from lfx.graph import Graph
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_ACQUIRE_TIMEOUT = 30.0
+
+
+class GraphPoolExhaustedError(Exception):
+    """Raised when no graph instance becomes available within the pool's acquire timeout."""
+
+
+class GraphPool:
+    """A fixed-size pool of graph instances built from a single served graph.
+
+    Instances are built once when the pool is created. A request checks one out, runs it and returns it;
+    the returned instance only has its run state reset, so requests no longer pay for a full copy of the
+    graph. An instance whose run raised or was cancelled is replaced by a freshly built one instead.
+
+    The pool size bounds the number of concurrent runs of the flow. When every instance is in use,
+    `acquire` waits up to `acquire_timeout` seconds and then raises `GraphPoolExhaustedError`.
+
+    Args:
+        graph: The graph used as a template. It is never run by the pool.
+        size: Number of instances kept in the pool.
+        acquire_timeout: Seconds to wait for a free instance. None waits forever, 0 never waits.
+    """
+
+    def __init__(self, graph: Graph, size: int = DEFAULT_POOL_SIZE, *, acquire_timeout: float | None = None) -> None:
+        if size < 1:
+            msg = f"size must be a positive integer, got {size}"
+            raise ValueError(msg)
+        self.template = graph
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self._idle: deque[Graph] = deque(self._build_instance() for _ in range(size))
+        self._semaphore = asyncio.Semaphore(size)
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.waits = 0
+        """Number of checkouts that found every instance in use and had to wait."""
+        self.rejected = 0
+        self.replaced = 0
+        self.total_wait_time = 0.0
+
+    def _build_instance(self) -> Graph:
+        template = self.template
+        if isinstance(template, Graph) and template._start is None and template._end is None:  # noqa: SLF001
+            return template.clone_for_run(context=dict(template.context))
+        return deepcopy(template)
+
+    async def acquire(self) -> Graph:
+        """Checks an instance out of the pool, waiting for one to be released if all are in use."""
+        started = time.perf_counter()
+        if self._semaphore.locked():
+            self.waits += 1
+            if self.acquire_timeout == 0:
+                self._reject()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.acquire_timeout)
+            except asyncio.TimeoutError:
+                self._reject()
+        else:
+            await self._semaphore.acquire()
+        self.total_wait_time += time.perf_counter() - started
+        self.checkouts += 1
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        return self._idle.popleft()
+
+    def _reject(self) -> None:
+        self.rejected += 1
+        msg = f"All {self.size} instances of flow {self.template.flow_id} are in use"
+        raise GraphPoolExhaustedError(msg)
+
+    def release(self, graph: Graph, *, discard: bool = False) -> None:
+        """Returns an instance to the pool.
+
+        Args:
+            graph: The instance returned by `acquire`.
+            discard: Replace the instance with a new one instead of resetting it, e.g. after a failed run.
+        """
+        if not isinstance(graph, Graph):
+            # Run state can only be reset on a Graph, anything else is copied again
+            discard = True
+        elif not discard:
+            try:
+                graph.reset_run_state()
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Error resetting graph of flow {self.template.flow_id}, replacing it")
+                discard = True
+        if discard:
+            graph = self._build_instance()
+            self.replaced += 1
+        self._idle.append(graph)
+        self.in_use -= 1
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[Graph]:
+        """Checks an instance out for the duration of the block and returns it to the pool afterwards."""
+        graph = await self.acquire()
+        try:
+            yield graph
+        except BaseException:
+            self.release(graph, discard=True)
+            raise
+        self.release(graph)
+
+    def stats(self) -> dict[str, int | float]:
+        """Returns the pool size and utilization counters."""
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "utilization": self.in_use / self.size,
+            "checkouts": self.checkouts,
+            "waits": self.waits,
+            "rejected": self.rejected,
+            "replaced": self.replaced,
+            "total_wait_time": self.total_wait_time,
+        }
+
+
+def create_graph_pool(graph: Graph) -> GraphPool:
+    """Creates a pool for `graph` sized from the `serve_graph_pool_size` and `serve_graph_pool_timeout` settings."""
+    from lfx.services.deps import get_settings_service
+
+    settings_service = get_settings_service()
+    if settings_service is None:
+        return GraphPool(graph, DEFAULT_POOL_SIZE, acquire_timeout=DEFAULT_ACQUIRE_TIMEOUT)
+    settings = settings_service.settings
+    return GraphPool(graph, settings.serve_graph_pool_size, acquire_timeout=settings.serve_graph_pool_timeout)
@@ -6,6 +6,7 @@ its own router prefix::
 
     /flows/{flow_id}/run  - POST - execute the flow
     /flows/{flow_id}/info - GET  - metadata
+    /flows/{flow_id}/pool - GET  - graph pool metrics
 
 A global ``/flows`` endpoint lists all available flows and returns a JSON array
 of metadata objects, allowing API consumers to discover IDs without guessing.
@@ -19,7 +20,6 @@ from __future__ import annotations
 
 import asyncio
 import time
-from copy import deepcopy
 from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Security
@@ -28,6 +28,7 @@ from fastapi.security import APIKeyHeader, APIKeyQuery
 from pydantic import BaseModel, Field
 
 from lfx.cli.common import execute_graph_with_capture, extract_result_data, get_api_key
+from lfx.cli.graph_pool import GraphPool, GraphPoolExhaustedError, create_graph_pool
 from lfx.log.logger import logger
 
 if TYPE_CHECKING:
@@ -299,7 +300,7 @@ async def run_flow_generator_for_serve(
     flow_id: str,
     event_manager,
     client_consumed_queue: asyncio.Queue,
-) -> None:
+) -> bool:
     """Executes a flow asynchronously and manages event streaming to the client.
 
     This coroutine runs a flow with streaming enabled and handles the event lifecycle,
@@ -312,6 +313,9 @@ async def run_flow_generator_for_serve(
         event_manager: Manages the streaming of events to the client
         client_consumed_queue (asyncio.Queue): Tracks client consumption of events
 
+    Returns:
+        bool: True if the graph run failed, in which case the graph instance must not be reused
+
     Events Generated:
         - "add_message": Sent when new messages are added during flow execution
         - "token": Sent for each token generated during streaming
@@ -324,11 +328,13 @@ async def run_flow_generator_for_serve(
         - On error, logs the error and sends it via event_manager.on_error()
         - Always sends a final None event to signal completion
     """
+    failed = True
     try:
         # For the serve app, we'll use execute_graph_with_capture with streaming
         # Note: This is a simplified version. In a full implementation, you might want
         # to integrate with the full LFX streaming pipeline from endpoints.py
         results, logs = await execute_graph_with_capture(graph, input_request.input_value)
+        failed = False
         result_data = extract_result_data(results, logs)
 
         # Send the final result
@@ -339,6 +345,16 @@ async def run_flow_generator_for_serve(
         event_manager.on_error(data={"error": str(e)})
     finally:
         await event_manager.queue.put((None, None, time.time()))
+    return failed
+
+
+async def _acquire_graph(pool: GraphPool) -> Graph:
+    """Checks a graph instance out of `pool`, rejecting the request with a 503 when the pool is exhausted."""
+    try:
+        return await pool.acquire()
+    except GraphPoolExhaustedError as exc:
+        logger.warning(str(exc))
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"}) from exc
 
 
 # -----------------------------------------------------------------------------
@@ -380,6 +396,9 @@ def create_multi_serve_app(
         version="1.0.0",
     )
 
+    pools: dict[str, GraphPool] = {}
+    app.state.graph_pools = pools
+
     # ------------------------------------------------------------------
     # Global endpoints
     # ------------------------------------------------------------------
@@ -401,6 +420,8 @@ def create_multi_serve_app(
         """Create a router for a specific flow to avoid loop variable binding issues."""
         analysis = _analyze_graph_structure(graph)
         run_description = _generate_dynamic_run_description(graph)
+        pool = create_graph_pool(graph)
+        pools[flow_id] = pool
 
         router = APIRouter(
             prefix=f"/flows/{flow_id}",
@@ -418,9 +439,11 @@ def create_multi_serve_app(
         async def run_flow(
             request: RunRequest,
         ) -> RunResponse:
+            graph_instance = await _acquire_graph(pool)
+            discard = True
             try:
-                graph_copy = deepcopy(graph)
-                results, logs = await execute_graph_with_capture(graph_copy, request.input_value)
+                results, logs = await execute_graph_with_capture(graph_instance, request.input_value)
+                discard = False
                 result_data = extract_result_data(results, logs)
 
                 # Debug logging
@@ -473,6 +496,8 @@ def create_multi_serve_app(
                     type="error",
                     component="",
                 )
+            finally:
+                pool.release(graph_instance, discard=discard)
 
         @router.post(
             "/stream",
@@ -484,6 +509,8 @@ def create_multi_serve_app(
             request: StreamRequest,
         ) -> StreamingResponse:
             """Stream the execution of the flow with real-time events."""
+            graph_instance = await _acquire_graph(pool)
+            main_task: asyncio.Task | None = None
             try:
                 # Import here to avoid potential circular imports
                 from lfx.events.event_manager import create_stream_tokens_event_manager
@@ -494,13 +521,21 @@ def create_multi_serve_app(
 
                 main_task = asyncio.create_task(
                     run_flow_generator_for_serve(
-                        graph=graph,
+                        graph=graph_instance,
                         input_request=request,
                         flow_id=flow_id,
                         event_manager=event_manager,
                         client_consumed_queue=asyncio_queue_client_consumed,
                     )
                 )
+                # The instance goes back to the pool once the run ends, not when the response is returned,
+                # and is replaced instead of reset when the run failed, was cancelled or raised
+                main_task.add_done_callback(
+                    lambda task: pool.release(
+                        graph_instance,
+                        discard=task.cancelled() or task.exception() is not None or bool(task.result()),
+                    )
+                )
 
                 async def on_disconnect() -> None:
                     logger.debug(f"Client disconnected from flow {flow_id}, closing tasks")
@@ -513,6 +548,8 @@ def create_multi_serve_app(
                 )
             except Exception as exc:  # noqa: BLE001
                 logger.error(f"Error setting up streaming for flow {flow_id}: {exc}")
+                if main_task is None:
+                    pool.release(graph_instance)
                 # Return a simple error stream
                 error_message = f"Failed to start streaming: {exc!s}"
 
@@ -524,6 +561,11 @@ def create_multi_serve_app(
                     media_type="text/event-stream",
                 )
 
+        @router.get("/pool", summary="Graph pool metrics")
+        async def flow_pool():
+            """Return the size and utilization of the pool of graph instances serving this flow."""
+            return pool.stats()
+
         @router.get("/info", summary="Flow metadata", response_model=FlowMeta)
         async def flow_info():
             """Return metadata and basic analysis for this flow."""
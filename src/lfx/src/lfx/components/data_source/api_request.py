@@ -1,6 +1,8 @@
 import json
 import re
 import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -26,6 +28,7 @@ from lfx.io import (
 )
 from lfx.schema.data import Data
 from lfx.schema.dotdict import dotdict
+from lfx.services.deps import get_http_client_service
 from lfx.utils.component_utils import set_current_fields, set_field_advanced, set_field_display
 from lfx.utils.ssrf_protection import SSRFProtectionError, validate_url_for_ssrf
 
@@ -471,7 +474,7 @@ class APIRequestComponent(Component):
         body = self._process_body(body)
         url = self.add_query_params(url, query_params)
 
-        async with httpx.AsyncClient() as client:
+        async with self._borrow_client(url) as client:
             result = await self.make_request(
                 client,
                 method,
@@ -486,6 +489,16 @@ class APIRequestComponent(Component):
         self.status = result
         return result
 
+    @asynccontextmanager
+    async def _borrow_client(self, url: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow the pooled client of the URL's host, which keeps its connections alive across runs."""
+        http_client_service = get_http_client_service()
+        if http_client_service is None:
+            async with httpx.AsyncClient() as client:
+                yield client
+            return
+        yield http_client_service.get_client(url)
+
     def update_build_config(self, build_config: dotdict, field_value: Any, field_name: str | None = None) -> dotdict:
         """Update the build config based on the selected mode."""
         if field_name != "mode":
@@ -6,6 +6,7 @@ import hashlib
 import json
 import re
 import uuid
+from collections.abc import AsyncIterator  # noqa: TC003
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,7 +18,12 @@ from langchain_chroma import Chroma
 from langflow.services.auth.utils import decrypt_api_key, encrypt_api_key
 from langflow.services.database.models.user.crud import get_user_by_id
 
-from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
+from lfx.base.knowledge_bases.knowledge_base_utils import (
+    count_words_and_characters,
+    get_knowledge_bases,
+    read_kb_stats,
+    update_kb_stats,
+)
 from lfx.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
 from lfx.components.processing.converter import convert_to_dataframe
 from lfx.custom import Component
@@ -203,6 +209,13 @@ class KnowledgeIngestionComponent(Component):
             advanced=True,
             value=False,
         ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrent Batches",
+            info="Maximum number of batches of Chunk Size rows embedded and added to the knowledge base at a time",
+            advanced=True,
+            value=2,
+        ),
     ]
 
     # ------ Outputs -------------------------------------------------------
@@ -374,7 +387,11 @@ class KnowledgeIngestionComponent(Component):
         embedding_model: str,
         api_key: str,
     ) -> None:
-        """Create vector store following Local DB component pattern."""
+        """Create vector store following Local DB component pattern.
+
+        Rows are converted, deduplicated, embedded and added in batches of `chunk_size` rows, with up to
+        `max_concurrency` batches being embedded at a time, so the whole table is never held as documents.
+        """
         try:
             # Set up vector store directory
             vector_store_dir = await self._kb_path()
@@ -386,9 +403,6 @@ class KnowledgeIngestionComponent(Component):
             # Create embeddings model
             embedding_function = self._build_embeddings(embedding_model, api_key)
 
-            # Convert DataFrame to Data objects (following Local DB pattern)
-            data_objects = await self._convert_df_to_data_objects(df_source, config_list)
-
             # Create vector store
             chroma = Chroma(
                 persist_directory=str(vector_store_dir),
@@ -396,42 +410,53 @@ class KnowledgeIngestionComponent(Component):
                 collection_name=self.knowledge_base,
             )
 
-            # Convert Data objects to LangChain Documents
-            documents = []
-            for data_obj in data_objects:
-                doc = data_obj.to_lc_document()
-                documents.append(doc)
+            # Stats can only be kept up to date from here if they were tracked since the KB was created.
+            # Otherwise they are computed from the vector store the next time the KB is listed.
+            track_stats = (
+                read_kb_stats(vector_store_dir) is not None or chroma._collection.count() == 0  # noqa: SLF001
+            )
+            totals = {"chunks": 0, "words": 0, "characters": 0}
+            semaphore = asyncio.Semaphore(max(int(self.max_concurrency or 1), 1))
 
-            # Add documents to vector store
-            if documents:
-                chroma.add_documents(documents)
-                self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
+            async def add_batch(documents: list) -> None:
+                try:
+                    await asyncio.to_thread(chroma.add_documents, documents)
+                    words, characters = count_words_and_characters(doc.page_content for doc in documents)
+                    totals["chunks"] += len(documents)
+                    totals["words"] += words
+                    totals["characters"] += characters
+                finally:
+                    semaphore.release()
+
+            tasks: list[asyncio.Task] = []
+            try:
+                async for data_objects in self._iter_data_batches(df_source, config_list, chroma):
+                    if not data_objects:
+                        continue
+                    # Convert Data objects to LangChain Documents
+                    documents = [data_obj.to_lc_document() for data_obj in data_objects]
+                    # Wait for a free slot before converting the next batch, which bounds the rows held in memory
+                    await semaphore.acquire()
+                    tasks.append(asyncio.create_task(add_batch(documents)))
+                    # Surface the errors of finished batches early instead of converting the whole table first
+                    for task in [task for task in tasks if task.done()]:
+                        tasks.remove(task)
+                        task.result()
+                await asyncio.gather(*tasks)
+            finally:
+                # Batches already being added can't be stopped, so wait for them to keep the stats accurate
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if totals["chunks"]:
+                    self.log(f"Added {totals['chunks']} documents to vector store '{self.knowledge_base}'")
+                    if track_stats:
+                        update_kb_stats(vector_store_dir, **totals)
 
         except (OSError, ValueError, RuntimeError) as e:
             self.log(f"Error creating vector store: {e}")
 
-    async def _convert_df_to_data_objects(
-        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
-    ) -> list[Data]:
-        """Convert DataFrame to Data objects for vector store."""
-        data_objects: list[Data] = []
-
-        # Set up vector store directory
-        kb_path = await self._kb_path()
-
-        # If we don't allow duplicates, we need to get the existing hashes
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=self.knowledge_base,
-        )
-
-        # Get all documents and their metadata
-        all_docs = chroma.get()
-
-        # Extract all _id values from metadata
-        id_list = [metadata.get("_id") for metadata in all_docs["metadatas"] if metadata.get("_id")]
-
-        # Get column roles
+    @staticmethod
+    def _get_column_roles(config_list: list[dict[str, Any]]) -> tuple[list[str], list[str]]:
+        """Return the vectorized (content) columns and the identifier columns of the column configuration."""
         content_cols = []
         identifier_cols = []
 
@@ -445,45 +470,103 @@ class KnowledgeIngestionComponent(Component):
             elif identifier:
                 identifier_cols.append(col_name)
 
-        # Convert each row to a Data object
-        for _, row in df_source.iterrows():
-            # Build content text from identifier columns using list comprehension
-            identifier_parts = [str(row[col]) for col in content_cols if col in row and pd.notna(row[col])]
-
-            # Join all parts into a single string
-            page_content = " ".join(identifier_parts)
-
-            # Build metadata from NON-vectorized columns only (simple key-value pairs)
-            data_dict = {
-                "text": page_content,  # Main content for vectorization
-            }
+        return content_cols, identifier_cols
 
-            # Add identifier columns if they exist
-            if identifier_cols:
-                identifier_parts = [str(row[col]) for col in identifier_cols if col in row and pd.notna(row[col])]
-                page_content = " ".join(identifier_parts)
-
-            # Add metadata columns as simple key-value pairs
-            for col in df_source.columns:
-                if col not in content_cols and col in row and pd.notna(row[col]):
-                    # Convert to simple types for Chroma metadata
-                    value = row[col]
-                    data_dict[col] = str(value)  # Convert complex types to string
-
-            # Hash the page_content for unique ID
-            page_content_hash = hashlib.sha256(page_content.encode()).hexdigest()
-            data_dict["_id"] = page_content_hash
-
-            # If duplicates are disallowed, and hash exists, prevent adding this row
-            if not self.allow_duplicates and page_content_hash in id_list:
-                self.log(f"Skipping duplicate row with hash {page_content_hash}")
+    @staticmethod
+    def _join_columns(df_source: pd.DataFrame, columns: list[str]) -> pd.Series:
+        """Join the non-null values of `columns` of each row with spaces, using column operations."""
+        joined = pd.Series("", index=df_source.index, dtype=object)
+        has_value = pd.Series(data=False, index=df_source.index)
+        for col in columns:
+            if col not in df_source.columns:
                 continue
+            present = df_source[col].notna()
+            values = df_source[col].astype(str)
+            values = values.where(~has_value, joined + " " + values)
+            joined = values.where(present, joined)
+            has_value |= present
+        return joined
+
+    def _build_row_payloads(
+        self, df_source: pd.DataFrame, content_cols: list[str], identifier_cols: list[str]
+    ) -> list[dict[str, Any]]:
+        """Build the Data payload of each row of `df_source`."""
+        # Main content for vectorization
+        texts = self._join_columns(df_source, content_cols)
+        # The unique ID is the hash of the identifier columns if there are any, of the content otherwise
+        hashed = self._join_columns(df_source, identifier_cols) if identifier_cols else texts
+
+        # Metadata from NON-vectorized columns only, as strings for Chroma
+        metadata_df = df_source[[col for col in df_source.columns if col not in content_cols]]
+        if metadata_df.columns.empty:
+            metadata_records: list[dict] = [{}] * len(df_source)
+        else:
+            metadata_records = metadata_df.astype(str).where(metadata_df.notna()).to_dict("records")
+
+        payloads = []
+        for text, hashed_text, metadata in zip(texts, hashed, metadata_records, strict=True):
+            data_dict = {"text": text}
+            data_dict.update({key: value for key, value in metadata.items() if isinstance(value, str)})
+            data_dict["_id"] = hashlib.sha256(hashed_text.encode()).hexdigest()
+            payloads.append(data_dict)
+        return payloads
+
+    @staticmethod
+    def _get_existing_ids(chroma: Chroma, ids: list[str]) -> set[str]:
+        """Return which of `ids` are already in the vector store, without loading the other documents."""
+        if not ids:
+            return set()
+        results = chroma.get(where={"_id": {"$in": ids}}, include=["metadatas"])
+        return {metadata.get("_id") for metadata in results["metadatas"] if metadata}
+
+    async def _iter_data_batches(
+        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]], chroma: Chroma
+    ) -> AsyncIterator[list[Data]]:
+        """Convert the rows of `df_source` to Data objects, `chunk_size` rows at a time."""
+        content_cols, identifier_cols = self._get_column_roles(config_list)
+        batch_size = max(int(self.chunk_size or 0), 1)
+        # Hashes added by this run, which the vector store may not have yet when batches are added concurrently
+        seen_ids: set[str] = set()
+
+        for start in range(0, len(df_source), batch_size):
+            payloads = self._build_row_payloads(
+                df_source.iloc[start : start + batch_size], content_cols, identifier_cols
+            )
+
+            # If duplicates are disallowed, skip the rows whose hash is already in the vector store
+            if not self.allow_duplicates:
+                existing_ids = await asyncio.to_thread(
+                    self._get_existing_ids, chroma, list({payload["_id"] for payload in payloads})
+                )
+                unique_payloads = []
+                for payload in payloads:
+                    if payload["_id"] in existing_ids or payload["_id"] in seen_ids:
+                        continue
+                    seen_ids.add(payload["_id"])
+                    unique_payloads.append(payload)
+                if len(unique_payloads) < len(payloads):
+                    self.log(f"Skipping {len(payloads) - len(unique_payloads)} duplicate rows")
+                payloads = unique_payloads
 
             # Create Data object - everything except "text" becomes metadata
-            data_obj = Data(data=data_dict)
-            data_objects.append(data_obj)
+            yield [Data(data=payload) for payload in payloads]
+
+    async def _convert_df_to_data_objects(
+        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
+    ) -> list[Data]:
+        """Convert DataFrame to Data objects for vector store."""
+        # Set up vector store directory
+        kb_path = await self._kb_path()
+
+        # Used to look up the hashes of the rows if we don't allow duplicates
+        chroma = Chroma(
+            persist_directory=str(kb_path),
+            collection_name=self.knowledge_base,
+        )
 
-        return data_objects
+        return [
+            data_obj async for batch in self._iter_data_batches(df_source, config_list, chroma) for data_obj in batch
+        ]
 
     def is_valid_collection_name(self, name, min_length: int = 3, max_length: int = 63) -> bool:
         """Validates collection name against conditions 1-3.
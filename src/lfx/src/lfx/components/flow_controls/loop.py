@@ -1,9 +1,14 @@
+from lfx.base.flow_controls.loop_body import LoopBody
 from lfx.custom.custom_component.component import Component
-from lfx.inputs.inputs import HandleInput
+from lfx.inputs.inputs import DropdownInput, HandleInput, IntInput
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
+from lfx.services.deps import get_settings_service
 from lfx.template.field.base import Output
 
+SEQUENTIAL_MODE = "Sequential"
+PARALLEL_MAP_MODE = "Parallel Map"
+
 
 class LoopComponent(Component):
     display_name = "Loop"
@@ -20,6 +25,24 @@ class LoopComponent(Component):
             info="The initial list of Data objects or DataFrame to iterate over.",
             input_types=["DataFrame"],
         ),
+        DropdownInput(
+            name="execution_mode",
+            display_name="Execution Mode",
+            info=(
+                "Sequential sends the items through the loop one at a time. Parallel Map sends each item through "
+                "its own copy of the loop, several at a time, for loops whose items are independent."
+            ),
+            options=[SEQUENTIAL_MODE, PARALLEL_MAP_MODE],
+            value=SEQUENTIAL_MODE,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of items going through the loop at the same time in Parallel Map mode.",
+            value=4,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -62,11 +85,20 @@ class LoopComponent(Component):
         data_length = len(self.ctx.get(f"{self._id}_data", []))
         return current_index > data_length
 
+    def is_parallel_map(self) -> bool:
+        """Check if the items go through copies of the loop body instead of the loop itself."""
+        return getattr(self, "execution_mode", SEQUENTIAL_MODE) == PARALLEL_MAP_MODE and self._vertex is not None
+
     def item_output(self) -> Data:
         """Output the next item in the list or stop if done."""
         self.initialize_data()
         current_item = Data(text="")
 
+        if self.is_parallel_map():
+            # The items are sent through copies of the loop body by done_output
+            self.stop("item")
+            return current_item
+
         if self.evaluate_stop_loop():
             self.stop("item")
         else:
@@ -94,10 +126,13 @@ class LoopComponent(Component):
             if self._id not in self.graph.run_manager.run_map[item_dependency_id]:
                 self.graph.run_manager.run_map[item_dependency_id].append(self._id)
 
-    def done_output(self) -> DataFrame:
+    async def done_output(self) -> DataFrame:
         """Trigger the done output when iteration is complete."""
         self.initialize_data()
 
+        if self.is_parallel_map() and not self.evaluate_stop_loop():
+            await self.map_items()
+
         if self.evaluate_stop_loop():
             self.stop("item")
             self.start("done")
@@ -108,6 +143,19 @@ class LoopComponent(Component):
         self.stop("done")
         return DataFrame([])
 
+    async def map_items(self) -> None:
+        """Send every item through its own copy of the loop body and aggregate the results in input order."""
+        data_list = self.ctx.get(f"{self._id}_data", [])
+        settings_service = get_settings_service()
+        fallback_to_env_vars = settings_service.settings.fallback_to_env_var if settings_service else False
+
+        loop_body = LoopBody(self.graph, self._id)
+        results = await loop_body.map(
+            data_list, max_concurrency=self.max_concurrency or 1, fallback_to_env_vars=fallback_to_env_vars
+        )
+        aggregated = [result for result in results if result is not None and not isinstance(result, str)]
+        self.update_ctx({f"{self._id}_aggregated": aggregated, f"{self._id}_index": len(data_list) + 1})
+
     def loop_variables(self):
         """Retrieve loop variables from context."""
         return (
@@ -2,7 +2,6 @@ from typing import Any
 
 from lfx.base.flow_processing.utils import build_data_from_result_data
 from lfx.custom.custom_component.component import Component
-from lfx.graph.graph.base import Graph
 from lfx.graph.vertex.base import Vertex
 from lfx.helpers import get_flow_inputs
 from lfx.io import DropdownInput, Output
@@ -20,15 +19,8 @@ class SubFlowComponent(Component):
     icon = "Workflow"
 
     async def get_flow_names(self) -> list[str]:
-        flow_data = await self.alist_flows()
-        return [flow_data.data["name"] for flow_data in flow_data]
-
-    async def get_flow(self, flow_name: str) -> Data | None:
-        flow_datas = await self.alist_flows()
-        for flow_data in flow_datas:
-            if flow_data.data["name"] == flow_name:
-                return flow_data
-        return None
+        flow_catalog = await self.alist_flow_catalog()
+        return [flow_entry.data["name"] for flow_entry in flow_catalog]
 
     async def update_build_config(self, build_config: dotdict, field_value: Any, field_name: str | None = None):
         if field_name == "flow_name":
@@ -39,22 +31,17 @@ class SubFlowComponent(Component):
                 del build_config[key]
         if field_value is not None and field_name == "flow_name":
             try:
-                flow_data = await self.get_flow(field_value)
+                graph = await self.load_flow(flow_name=field_value)
             except Exception:  # noqa: BLE001
                 await logger.aexception(f"Error getting flow {field_value}")
             else:
-                if not flow_data:
-                    msg = f"Flow {field_value} not found."
-                    await logger.aerror(msg)
-                else:
-                    try:
-                        graph = Graph.from_payload(flow_data.data["data"])
-                        # Get all inputs from the graph
-                        inputs = get_flow_inputs(graph)
-                        # Add inputs to the build config
-                        build_config = self.add_inputs_to_build_config(inputs, build_config)
-                    except Exception:  # noqa: BLE001
-                        await logger.aexception(f"Error building graph for flow {field_value}")
+                try:
+                    # Get all inputs from the graph
+                    inputs = get_flow_inputs(graph)
+                    # Add inputs to the build config
+                    build_config = self.add_inputs_to_build_config(inputs, build_config)
+                except Exception:  # noqa: BLE001
+                    await logger.aexception(f"Error building graph for flow {field_value}")
 
         return build_config
 
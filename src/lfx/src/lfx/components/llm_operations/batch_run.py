@@ -1,19 +1,58 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, cast
 
 import toml  # type: ignore[import-untyped]
+from langchain_core.runnables import Runnable  # noqa: TC002
 
-from lfx.custom.custom_component.component import Component
-from lfx.io import BoolInput, DataFrameInput, HandleInput, MessageTextInput, MultilineInput, Output
+from lfx.base.models.response_cache import model_cache_params
+from lfx.custom.custom_component.component_with_cache import ComponentWithCache
+from lfx.io import BoolInput, DataFrameInput, HandleInput, IntInput, MessageTextInput, MultilineInput, Output
 from lfx.log.logger import logger
 from lfx.schema.dataframe import DataFrame
 
-if TYPE_CHECKING:
-    from langchain_core.runnables import Runnable
+# Delay before the first retry of a row, doubled on each following retry
+RETRY_BASE_DELAY = 1.0
+CACHE_KEY_PREFIX = "batch_run:"
+# Column holding the error of the rows that failed, added to the output when any row failed
+ERROR_COLUMN = "error"
 
 
-class BatchRunComponent(Component):
+class RequestRateLimiter:
+    """Spaces requests evenly so that at most `requests_per_minute` start in any minute. 0 means unlimited."""
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class RowResult:
+    """The outcome of one row: the response text, or the error it failed with after its retries."""
+
+    __slots__ = ("cached", "error", "text")
+
+    def __init__(self, text: str = "", *, error: str | None = None, cached: bool = False) -> None:
+        self.text = text
+        self.error = error
+        self.cached = cached
+
+
+class BatchRunComponent(ComponentWithCache):
     display_name = "Batch Run"
     description = "Runs an LLM on each row of a DataFrame column. If no column is specified, all columns are used."
     documentation: str = "https://docs.langflow.org/components-processing#batch-run"
@@ -65,6 +104,52 @@ class BatchRunComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of rows sent to the model at the same time.",
+            value=8,
+            advanced=True,
+        ),
+        IntInput(
+            name="requests_per_minute",
+            display_name="Requests per Minute",
+            info="Maximum number of model requests started per minute. 0 means unlimited.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="Number of times a failed row is retried, with exponential backoff, before it is marked as failed.",
+            value=2,
+            advanced=True,
+        ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info="Number of rows processed before progress is reported.",
+            value=100,
+            advanced=True,
+        ),
+        BoolInput(
+            name="cache_responses",
+            display_name="Cache Responses",
+            info=(
+                "If True, responses are cached by model parameters, instructions and row content, "
+                "so re-running the batch skips the rows already answered. Models whose parameters "
+                "can't be determined are never cached."
+            ),
+            value=False,
+            advanced=True,
+        ),
+        BoolInput(
+            name="stream_partial_results",
+            display_name="Stream Partial Results",
+            info="If True, the rows of each chunk are logged as soon as the chunk is processed.",
+            value=False,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -110,18 +195,94 @@ class BatchRunComponent(Component):
                 "processing_status": "failed",
             }
 
+    def _model_identity(self, model: Any) -> str | None:
+        """Describe the model for the response cache, or return None if its responses can't be cached.
+
+        All the identifying parameters of the model are part of it, along with the arguments bound to it.
+        """
+        params = model_cache_params(model)
+        if params is None:
+            return None
+        return json.dumps(params, sort_keys=True, default=str)
+
+    def _cache_key(self, model_identity: str | None, conversation: list[dict[str, str]]) -> str | None:
+        if model_identity is None:
+            return None
+        digest = hashlib.sha256(json.dumps([model_identity, conversation]).encode()).hexdigest()
+        return f"{CACHE_KEY_PREFIX}{digest}"
+
+    def _response_cache(self) -> Any:
+        return self._shared_component_cache if self.cache_responses else None
+
+    async def _process_row(
+        self,
+        model: Runnable,
+        conversation: list[dict[str, str]],
+        cache_key: str | None,
+        semaphore: asyncio.Semaphore,
+        rate_limiter: RequestRateLimiter,
+    ) -> RowResult:
+        """Send one row to the model, retrying with exponential backoff until `max_retries` is reached."""
+        cache = self._response_cache() if cache_key is not None else None
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if isinstance(cached, str):
+                return RowResult(cached, cached=True)
+
+        max_retries = max(self.max_retries or 0, 0)
+        error = ""
+        for attempt in range(max_retries + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BASE_DELAY * 2 ** (attempt - 1))
+            await rate_limiter.acquire()
+            try:
+                # Only the request holds a concurrency slot, so rows waiting to retry don't block the others
+                async with semaphore:
+                    (response,) = await model.abatch([conversation])
+            except (KeyError, AttributeError):
+                # Data structure and attribute access errors fail the whole batch
+                raise
+            except Exception as e:  # noqa: BLE001
+                error = str(e)
+            else:
+                response_text = response.content if hasattr(response, "content") else str(response)
+                if cache is not None and isinstance(response_text, str):
+                    cache.set(cache_key, response_text)
+                return RowResult(response_text)
+        await logger.awarning(f"Row failed after {max_retries + 1} attempts: {error}")
+        return RowResult(error=error)
+
+    @staticmethod
+    async def _gather_rows(coroutines: list) -> list[RowResult]:
+        """Run the rows of a chunk concurrently, cancelling the others if one fails the batch."""
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def run_batch(self) -> DataFrame:
         """Process each row in df[column_name] with the language model asynchronously.
 
+        Rows are processed in chunks of `chunk_size`, with at most `max_concurrency` rows sent to the model at
+        once and at most `requests_per_minute` requests started per minute. A row that fails is retried up to
+        `max_retries` times and then marked as failed without failing the others, with its error in the
+        'error' column. With `cache_responses`, responses are cached by model parameters and content, so
+        re-running the same batch only sends the rows that weren't answered.
+
         Returns:
             DataFrame: A new DataFrame containing:
                 - All original columns
                 - The model's response column (customizable name)
                 - 'batch_index' column for processing order
                 - 'metadata' (optional)
+                - 'error', when any row failed, with the error of each failed row
 
         Raises:
-            ValueError: If the specified column is not found in the DataFrame
+            ValueError: If the specified column is not found in the DataFrame, or if every row failed
             TypeError: If the model is not compatible or input types are wrong
         """
         model: Runnable = self.model
@@ -139,13 +300,12 @@ class BatchRunComponent(Component):
             raise ValueError(msg)
 
         try:
+            original_rows = df.to_dict(orient="records")
             # Determine text input for each row
             if col_name:
                 user_texts = df[col_name].astype(str).tolist()
             else:
-                user_texts = [
-                    self._format_row_as_toml(cast("dict[str, Any]", row)) for row in df.to_dict(orient="records")
-                ]
+                user_texts = [self._format_row_as_toml(cast("dict[str, Any]", row)) for row in original_rows]
 
             total_rows = len(user_texts)
             await logger.ainfo(f"Processing {total_rows} rows with batch run")
@@ -157,6 +317,7 @@ class BatchRunComponent(Component):
                 else [{"role": "user", "content": text}]
                 for text in user_texts
             ]
+            model_identity = self._model_identity(model)
 
             # Configure the model with project info and callbacks
             model = model.with_config(
@@ -166,35 +327,60 @@ class BatchRunComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
-            # Process batches and track progress
-            responses_with_idx = list(
-                zip(
-                    range(len(conversations)),
-                    await model.abatch(list(conversations)),
-                    strict=True,
-                )
-            )
-
-            # Sort by index to maintain order
-            responses_with_idx.sort(key=lambda x: x[0])
+            semaphore = asyncio.Semaphore(max(self.max_concurrency or 1, 1))
+            rate_limiter = RequestRateLimiter(self.requests_per_minute or 0)
+            chunk_size = self.chunk_size if self.chunk_size and self.chunk_size > 0 else max(total_rows, 1)
 
-            # Build the final data with enhanced metadata
+            # Build the final data with enhanced metadata, one chunk at a time
             rows: list[dict[str, Any]] = []
-            for idx, (original_row, response) in enumerate(
-                zip(df.to_dict(orient="records"), responses_with_idx, strict=False)
-            ):
-                response_text = response[1].content if hasattr(response[1], "content") else str(response[1])
-                row = self._create_base_row(
-                    cast("dict[str, Any]", original_row), model_response=response_text, batch_index=idx
+            row_errors: list[str | None] = []
+            cached_rows = failed_rows = 0
+            for chunk_start in range(0, total_rows, chunk_size):
+                chunk_end = min(chunk_start + chunk_size, total_rows)
+                results = await self._gather_rows(
+                    [
+                        self._process_row(
+                            model,
+                            conversations[idx],
+                            self._cache_key(model_identity, conversations[idx]),
+                            semaphore,
+                            rate_limiter,
+                        )
+                        for idx in range(chunk_start, chunk_end)
+                    ]
                 )
-                self._add_metadata(row, success=True, system_msg=system_msg)
-                rows.append(row)
 
-                # Log progress
-                if (idx + 1) % max(1, total_rows // 10) == 0:
-                    await logger.ainfo(f"Processed {idx + 1}/{total_rows} rows")
+                chunk_rows: list[dict[str, Any]] = []
+                for idx, result in enumerate(results, chunk_start):
+                    row = self._create_base_row(
+                        cast("dict[str, Any]", original_rows[idx]), model_response=result.text, batch_index=idx
+                    )
+                    if result.error is None:
+                        self._add_metadata(row, success=True, system_msg=system_msg)
+                    else:
+                        self._add_metadata(row, success=False, error=result.error)
+                        failed_rows += 1
+                    cached_rows += result.cached
+                    row_errors.append(result.error)
+                    chunk_rows.append(row)
+                rows.extend(chunk_rows)
 
-            await logger.ainfo("Batch processing completed successfully")
+                # Report progress
+                progress = f"Processed {chunk_end}/{total_rows} rows ({cached_rows} cached, {failed_rows} failed)"
+                await logger.ainfo(progress)
+                self.log(progress, name="Progress")
+                if self.stream_partial_results:
+                    self.log(chunk_rows, name=f"Rows {chunk_start + 1}-{chunk_end}")
+
+            if failed_rows:
+                if failed_rows == total_rows:
+                    msg = f"All {total_rows} rows failed. First error: {row_errors[0]}"
+                    raise ValueError(msg)
+                for row, error in zip(rows, row_errors, strict=True):
+                    row[ERROR_COLUMN] = error
+                await logger.awarning(f"Batch processing completed with {failed_rows} failed rows")
+            else:
+                await logger.ainfo("Batch processing completed successfully")
             return DataFrame(rows)
 
         except (KeyError, AttributeError) as e:
@@ -0,0 +1,108 @@
+"""Process-wide cache of component classes built from source code."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_MAX_SIZE = 512
+
+
+def hash_code(code: str) -> str:
+    """Returns the content hash used as the cache key for a piece of component code."""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+class ComponentClassCache:
+    """An LRU cache of component classes keyed by the SHA-256 of their source code.
+
+    Building a component class parses the code, imports every module it uses and executes the class
+    body. The result only depends on the code string, so it can be shared by every vertex and every
+    run that uses the same code. Because entries are content-addressed, editing a component produces
+    a new key and can never return a class built from the old code; `invalidate` is available to drop
+    the old entry right away instead of waiting for it to be evicted.
+
+    Attributes:
+        max_size (int): Maximum number of classes kept. 0 disables caching.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that had to build the class.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._cache: OrderedDict[str, type] = OrderedDict()
+        self._lock = threading.RLock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, code: str, build: Callable[[str], type]) -> type:
+        """Returns the class for `code`, calling `build(code)` only if it is not cached.
+
+        Errors raised by `build` are propagated and nothing is cached for that code.
+        """
+        if self.max_size <= 0:
+            return build(code)
+        key = hash_code(code)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        # Build outside the lock: it runs imports and user code, which can be slow.
+        class_object = build(code)
+        with self._lock:
+            self._cache[key] = class_object
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return class_object
+
+    def invalidate(self, code: str) -> bool:
+        """Removes the class built from `code`. Returns True if it was cached."""
+        with self._lock:
+            return self._cache.pop(hash_code(code), None) is not None
+
+    def clear(self) -> None:
+        """Removes every cached class and resets the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Returns the cache size and hit/miss counters."""
+        with self._lock:
+            return {"size": len(self._cache), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, code: object) -> bool:
+        return isinstance(code, str) and hash_code(code) in self._cache
+
+
+_component_class_cache: ComponentClassCache | None = None
+_component_class_cache_lock = threading.Lock()
+
+
+def get_component_class_cache() -> ComponentClassCache:
+    """Returns the process-wide component class cache, sized from the `component_class_cache_size` setting."""
+    global _component_class_cache  # noqa: PLW0603
+    if _component_class_cache is None:
+        with _component_class_cache_lock:
+            if _component_class_cache is None:
+                from lfx.services.deps import get_settings_service
+
+                settings_service = get_settings_service()
+                max_size = (
+                    settings_service.settings.component_class_cache_size if settings_service else DEFAULT_MAX_SIZE
+                )
+                _component_class_cache = ComponentClassCache(max_size=max_size)
+    return _component_class_cache
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import contextlib
 import inspect
 from collections.abc import AsyncIterator, Iterator
 from copy import deepcopy
@@ -22,6 +23,7 @@ from lfx.base.tools.constants import (
     TOOLS_METADATA_INPUT_NAME,
 )
 from lfx.custom.tree_visitor import RequiredInputsVisitor
+from lfx.events.event_manager import TokenStream
 from lfx.exceptions.component import StreamingError
 from lfx.field_typing import Tool  # noqa: TC001
 
@@ -30,6 +32,7 @@ from lfx.field_typing import Tool  # noqa: TC001
 # Lazy import to avoid circular dependency
 # from lfx.graph.utils import has_chat_output
 from lfx.helpers.custom import format_type
+from lfx.log.logger import logger
 from lfx.memory import astore_message, aupdate_messages, delete_message
 from lfx.schema.artifact import get_artifact_type, post_process_raw
 from lfx.schema.data import Data
@@ -37,9 +40,11 @@ from lfx.schema.log import Log
 from lfx.schema.message import ErrorMessage, Message
 from lfx.schema.properties import Source
 from lfx.serialization.serialization import serialize
+from lfx.services.deps import get_settings_service
 from lfx.template.field.base import UNDEFINED, Input, Output
 from lfx.template.frontend_node.custom_components import ComponentFrontendNode
 from lfx.utils.async_helpers import run_until_complete
+from lfx.utils.stream_accumulator import StreamAccumulator
 from lfx.utils.util import find_closest_match
 
 from .custom_component import CustomComponent
@@ -837,7 +842,8 @@ class Component(CustomComponent):
         except KeyError:
             input_ = self._get_fallback_input(name=key, display_name=key)
             self._inputs[key] = input_
-            self.inputs.append(input_)
+            # Rebind instead of appending: `inputs` is usually a class attribute shared by every instance.
+            self.inputs = [*self.inputs, input_]
             return input_
 
     def _connect_to_component(self, key, value, input_) -> None:
@@ -1524,14 +1530,16 @@ class Component(CustomComponent):
 
     def _append_tool_output(self) -> None:
         if next((output for output in self.outputs if output.name == TOOL_OUTPUT_NAME), None) is None:
-            self.outputs.append(
+            # Rebind instead of appending: `outputs` is a class attribute shared by every instance of a cached class
+            self.outputs = [
+                *self.outputs,
                 Output(
                     name=TOOL_OUTPUT_NAME,
                     display_name=TOOL_OUTPUT_DISPLAY_NAME,
                     method="to_toolkit",
                     types=["Tool"],
-                )
-            )
+                ),
+            ]
 
     def is_connected_to_chat_output(self) -> bool:
         # Lazy import to avoid circular dependency
@@ -1643,6 +1651,9 @@ class Component(CustomComponent):
             msg = "Only one message can be stored at a time."
             raise ValueError(msg)
         stored_message = stored_messages[0]
+        # Stores returning a new Message (langflow's) don't need another copy, the caller keeps its own
+        if isinstance(stored_message, Message) and stored_message is not message:
+            return stored_message
         return await Message.create(**stored_message.model_dump())
 
     async def _send_message_event(self, message: Message, id_: str | None = None, category: str | None = None) -> None:
@@ -1668,6 +1679,8 @@ class Component(CustomComponent):
                     case _:
                         self._event_manager.on_message(data=data_dict)
 
+            # Messages can be sent in a loop: wait for the client when the queue is full
+            await self._event_manager.wait_for_queue()
             await asyncio.to_thread(_send_event)
 
     def _should_stream_message(self, stored_message: Message, original_message: Message) -> bool:
@@ -1701,49 +1714,135 @@ class Component(CustomComponent):
             msg = "The message must be an iterator or an async iterator."
             raise TypeError(msg)
 
-        if isinstance(iterator, AsyncIterator):
-            return await self._handle_async_iterator(iterator, message.id, message)
+        streamed_text = StreamAccumulator()
+        token_stream = self._create_token_stream(message.id)
+        checkpoints = self._start_message_checkpoints(message, streamed_text)
         try:
-            complete_message = ""
-            first_chunk = True
-            for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
+            if isinstance(iterator, AsyncIterator):
+                return await self._handle_async_iterator(
+                    iterator, message.id, message, streamed_text=streamed_text, token_stream=token_stream
                 )
-                first_chunk = False
-        except Exception as e:
-            raise StreamingError(cause=e, source=message.properties.source) from e
-        else:
-            return complete_message
+            try:
+                first_chunk = True
+                for chunk in iterator:
+                    await self._process_chunk(
+                        chunk.content,
+                        streamed_text,
+                        message.id,
+                        message,
+                        first_chunk=first_chunk,
+                        token_stream=token_stream,
+                    )
+                    first_chunk = False
+            except Exception as e:
+                raise StreamingError(cause=e, source=message.properties.source) from e
+            else:
+                return streamed_text.text
+        finally:
+            if checkpoints is not None:
+                checkpoints.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await checkpoints
+            if token_stream is not None:
+                token_stream.close()
+
+    def _create_token_stream(self, message_id: str) -> TokenStream | None:
+        """Returns the stream sending the tokens of the message from the event loop.
+
+        None if the token events have a custom callback, which could block and is called from a thread instead.
+        """
+        if not self._event_manager or not self._event_manager.sends_directly("on_token"):
+            return None
+        settings_service = get_settings_service()
+        if settings_service is None:
+            return TokenStream(self._event_manager, str(message_id))
+        settings = settings_service.settings
+        return TokenStream(
+            self._event_manager,
+            str(message_id),
+            interval=settings.token_stream_interval,
+            max_size=settings.token_stream_max_size,
+            max_pending=settings.token_stream_max_pending,
+        )
+
+    def _start_message_checkpoints(self, message: Message, streamed_text: StreamAccumulator) -> asyncio.Task | None:
+        """Starts writing the text streamed so far to the stored message every `message_checkpoint_interval`.
+
+        Clients reconnecting during the stream then get the partial text instead of an empty message.
+        """
+        settings_service = get_settings_service()
+        interval = settings_service.settings.message_checkpoint_interval if settings_service else 0
+        if not interval:
+            return None
+        return asyncio.create_task(self._checkpoint_message_periodically(message, streamed_text, interval))
+
+    async def _checkpoint_message_periodically(
+        self, message: Message, streamed_text: StreamAccumulator, interval: float
+    ) -> None:
+        checkpointed_length = 0
+        while True:
+            await asyncio.sleep(interval)
+            if len(streamed_text) == checkpointed_length:
+                continue
+            checkpointed_length = len(streamed_text)
+            partial_message = message.model_copy(
+                update={
+                    "text": streamed_text.text,
+                    "properties": message.properties.model_copy(update={"state": "partial"}),
+                }
+            )
+            try:
+                await self._update_stored_message(partial_message)
+            except Exception as e:  # noqa: BLE001
+                # The complete text is still written at the end of the stream
+                await logger.adebug(f"Error writing the partial text of message {message.id}: {e}")
 
-    async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
+    async def _handle_async_iterator(
+        self,
+        iterator: AsyncIterator,
+        message_id: str,
+        message: Message,
+        *,
+        streamed_text: StreamAccumulator | None = None,
+        token_stream: TokenStream | None = None,
+    ) -> str:
+        if streamed_text is None:
+            streamed_text = StreamAccumulator()
         first_chunk = True
         async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
+            await self._process_chunk(
+                chunk.content, streamed_text, message_id, message, first_chunk=first_chunk, token_stream=token_stream
             )
             first_chunk = False
-        return complete_message
+        return streamed_text.text
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
+        self,
+        chunk: str,
+        streamed_text: StreamAccumulator,
+        message_id: str,
+        message: Message,
+        *,
+        first_chunk: bool = False,
+        token_stream: TokenStream | None = None,
+    ) -> None:
+        streamed_text.append(chunk)
         if self._event_manager:
             if first_chunk:
                 # Send the initial message only on the first chunk
                 msg_copy = message.model_copy()
-                msg_copy.text = complete_message
+                msg_copy.text = streamed_text.text
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+            if token_stream is not None:
+                await token_stream.send(chunk)
+            else:
+                await asyncio.to_thread(
+                    self._event_manager.on_token,
+                    data={
+                        "chunk": chunk,
+                        "id": str(message_id),
+                    },
+                )
 
     async def send_error(
         self,
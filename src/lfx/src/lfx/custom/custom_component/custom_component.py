@@ -12,7 +12,7 @@ from pydantic import BaseModel
 
 from lfx.custom import validate
 from lfx.custom.custom_component.base_component import BaseComponent
-from lfx.helpers import list_flows, load_flow, run_flow
+from lfx.helpers import list_flow_catalog, list_flows, load_flow, run_flow
 from lfx.log.logger import logger
 from lfx.schema.data import Data
 from lfx.services.deps import get_storage_service, get_variable_service, session_scope
@@ -519,11 +519,13 @@ class CustomComponent(BaseComponent):
         """
         return validate.create_function(self._code, self._function_entrypoint_name)
 
-    async def load_flow(self, flow_id: str, tweaks: dict | None = None) -> Graph:
+    async def load_flow(
+        self, flow_id: str | None = None, tweaks: dict | None = None, *, flow_name: str | None = None
+    ) -> Graph:
         if not self.user_id:
             msg = "Session is invalid"
             raise ValueError(msg)
-        return await load_flow(user_id=str(self.user_id), flow_id=flow_id, tweaks=tweaks)
+        return await load_flow(user_id=str(self.user_id), flow_id=flow_id, flow_name=flow_name, tweaks=tweaks)
 
     async def run_flow(
         self,
@@ -557,6 +559,20 @@ class CustomComponent(BaseComponent):
             msg = f"Error listing flows: {e}"
             raise ValueError(msg) from e
 
+    async def alist_flow_catalog(self, flow_name: str | None = None) -> list[Data]:
+        """Lists the id, name, description and updated_at of the user's flows, without loading their data.
+
+        With `flow_name`, only the flow with that name is listed.
+        """
+        if not self.user_id:
+            msg = "Session is invalid"
+            raise ValueError(msg)
+        try:
+            return await list_flow_catalog(user_id=str(self.user_id), flow_name=flow_name)
+        except Exception as e:
+            msg = f"Error listing flows: {e}"
+            raise ValueError(msg) from e
+
     def build(self, *args: Any, **kwargs: Any) -> Any:
         """Builds the custom component.
 
@@ -1,12 +1,20 @@
 from typing import TYPE_CHECKING
 
 from lfx.custom import validate
+from lfx.custom.class_cache import get_component_class_cache
 
 if TYPE_CHECKING:
     from lfx.custom.custom_component.custom_component import CustomComponent
 
 
-def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
+def _build_custom_component_class(code: str) -> type["CustomComponent"]:
     class_name = validate.extract_class_name(code)
     return validate.create_class(code, class_name)
+
+
+def eval_custom_component_code(code: str) -> type["CustomComponent"]:
+    """Evaluate custom component code.
+
+    Classes are cached by the hash of their code, so the same code is only parsed and executed once per process.
+    """
+    return get_component_class_cache().get_or_build(code, _build_custom_component_class)
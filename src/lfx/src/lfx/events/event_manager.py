@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import inspect
+import itertools
 import json
 import time
 import uuid
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from fastapi.encoders import jsonable_encoder
 from typing_extensions import Protocol
@@ -16,6 +19,32 @@ if TYPE_CHECKING:
     # Lightweight type stub for log types
     LoggableType = dict | str | int | float | bool | list | None
 
+# Same output as json.dumps without arguments, without building an encoder per call
+_encode_json = json.JSONEncoder().encode
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+_MAX_PLAIN_DEPTH = 4
+
+
+def _is_plain(data: Any, depth: int = 0) -> bool:
+    """Whether `data` only holds builtin JSON types, so it can be encoded without `jsonable_encoder`."""
+    data_type = type(data)
+    if data_type in _JSON_SCALAR_TYPES:
+        return True
+    if depth >= _MAX_PLAIN_DEPTH:
+        return False
+    if data_type is dict:
+        return all(type(key) is str and _is_plain(value, depth + 1) for key, value in data.items())
+    if data_type is list:
+        return all(_is_plain(value, depth + 1) for value in data)
+    return False
+
+
+def encode_event(event_type: str, data: LoggableType) -> bytes:
+    """Encodes an event as sent to the client. Plain str, dict and list payloads skip `jsonable_encoder`."""
+    if not _is_plain(data):
+        data = jsonable_encoder(data)
+    return (_encode_json({"event": event_type, "data": data}) + "\n\n").encode("utf-8")
+
 
 class EventCallback(Protocol):
     def __call__(self, *, manager: EventManager, event_type: str, data: LoggableType): ...
@@ -29,6 +58,11 @@ class EventManager:
     def __init__(self, queue):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self._direct_events: set[str] = set()
+        # Event ids only need to be unique: a random uuid per manager whose last 12 hex digits are replaced
+        # by a counter is much cheaper than a uuid4 per event, and still reads as a uuid
+        self._event_id_prefix = str(uuid.uuid4())[:24]
+        self._event_ids = itertools.count()
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -59,10 +93,19 @@ class EventManager:
             raise ValueError(msg)
         if callback is None:
             callback_ = partial(self.send_event, event_type=event_type)
+            self._direct_events.add(name)
         else:
             callback_ = partial(callback, manager=self, event_type=event_type)
+            self._direct_events.discard(name)
         self.events[name] = callback_
 
+    def sends_directly(self, name: str) -> bool:
+        """Whether the event `name` is put on the queue by `send_event`, which never blocks.
+
+        Such events can be sent from the event loop, events with a custom callback are sent from a thread.
+        """
+        return name in self._direct_events
+
     def send_event(self, *, event_type: str, data: LoggableType):
         try:
             # Simple event creation without heavy dependencies
@@ -71,16 +114,51 @@ class EventManager:
                 pass
         except Exception:  # noqa: BLE001
             logger.debug(f"Error processing event: {event_type}")
-        jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
-        event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
+        event_id = f"{event_type}-{self._event_id_prefix}{next(self._event_ids):012x}"
         if self.queue:
             try:
-                self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+                self.queue.put_nowait((event_id, encode_event(event_type, data), time.time()))
             except Exception:  # noqa: BLE001
                 logger.debug("Queue not available for event")
 
+    async def wait_for_queue(self, max_pending: int = 0) -> None:
+        """Waits until the queue has room for more events.
+
+        Events are put on the queue without waiting, so producers that can wait call this before sending
+        to apply the backpressure of a bounded queue that blocks its producers. Waiting producers are woken
+        by the consumer like the ones waiting in `asyncio.Queue.put`: each event got from the queue wakes the
+        producer that has waited the longest.
+
+        Args:
+            max_pending: Number of events waiting in the queue above which this waits for the queue to be
+                consumed. 0 only waits while a bounded queue is full.
+        """
+        queue = self.queue
+        if not isinstance(queue, asyncio.Queue):
+            return
+        bounded = queue.maxsize > 0 and getattr(queue, "blocks_producers", True)
+        if not max_pending and not bounded:
+            return
+
+        def is_full() -> bool:
+            return bool((max_pending and queue.qsize() >= max_pending) or (bounded and queue.full()))
+
+        while is_full():
+            # Same as asyncio.Queue.put, whose waiters are woken by `get`
+            putters = queue._putters  # noqa: SLF001
+            waiter = asyncio.get_running_loop().create_future()
+            putters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                waiter.cancel()
+                with contextlib.suppress(ValueError):
+                    putters.remove(waiter)
+                if not is_full() and not waiter.cancelled():
+                    # This waiter was woken before being cancelled: wake the next one instead
+                    queue._wakeup_next(putters)  # noqa: SLF001
+                raise
+
     def noop(self, *, data: LoggableType) -> None:
         pass
 
@@ -88,6 +166,73 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
+class TokenStream:
+    """Sends the token events of a streamed message from the event loop, coalesced into frames.
+
+    Sending each token from a thread costs a thread hop and an encoding per token, which dominates the CPU
+    time of the server with many concurrent streams. Tokens are instead buffered and sent as a single token
+    event, with the buffered chunks joined, once `interval` seconds have passed since the first buffered
+    token or `max_size` characters are buffered. An interval of 0 sends every token on its own.
+
+    The stream must only be used when the `on_token` event of `event_manager` is sent directly (see
+    `EventManager.sends_directly`), and must be closed to send the last buffered tokens.
+
+    Args:
+        event_manager: The event manager sending the token events.
+        message_id: The id of the streamed message.
+        interval: Seconds during which tokens are coalesced.
+        max_size: Number of characters sent without waiting for the interval.
+        max_pending: Number of events waiting in the queue above which `send` waits for the queue to be
+            consumed. 0 only waits while a bounded queue is full. Waiting streams are woken by the consumer,
+            see `EventManager.wait_for_queue`.
+    """
+
+    def __init__(
+        self,
+        event_manager: EventManager,
+        message_id: str,
+        *,
+        interval: float = 0.0,
+        max_size: int = 1024,
+        max_pending: int = 0,
+    ) -> None:
+        self.event_manager = event_manager
+        self.message_id = message_id
+        self.interval = interval
+        self.max_size = max_size
+        self.max_pending = max_pending
+        self._chunks: list[str] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self.frames = 0
+
+    async def send(self, chunk: str) -> None:
+        """Buffers a token, sending the buffered tokens if the frame is full."""
+        await self.event_manager.wait_for_queue(self.max_pending)
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        if self.interval <= 0 or self._size >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.interval, self.flush)
+
+    def flush(self) -> None:
+        """Sends the buffered tokens as one token event."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._chunks:
+            return
+        chunk = self._chunks[0] if len(self._chunks) == 1 else "".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        self.frames += 1
+        self.event_manager.on_token(data={"chunk": chunk, "id": self.message_id})
+
+    def close(self) -> None:
+        self.flush()
+
+
 def create_default_event_manager(queue=None):
     manager = EventManager(queue)
     manager.register_event("on_token", "token")
@@ -19,7 +19,10 @@ from lfx.exceptions.component import ComponentBuildError
 from lfx.graph.edge.base import CycleEdge, Edge
 from lfx.graph.graph.constants import Finish, lazy_load_vertex_dict
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
+from lfx.graph.graph.scheduler import DependencyScheduler
 from lfx.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from lfx.graph.graph.snapshots import DEFAULT_MAX_SIZE as DEFAULT_SNAPSHOT_MAX_SIZE
+from lfx.graph.graph.snapshots import SnapshotHistory
 from lfx.graph.graph.state_model import create_state_model_from_graph
 from lfx.graph.graph.utils import (
     find_all_cycle_edges,
@@ -29,6 +32,7 @@ from lfx.graph.graph.utils import (
     process_flow,
     should_continue,
 )
+from lfx.graph.graph.variables import RunVariableResolver
 from lfx.graph.schema import InterfaceComponentTypes, RunOutputs
 from lfx.graph.utils import log_vertex_build
 from lfx.graph.vertex.base import Vertex, VertexStates
@@ -38,7 +42,7 @@ from lfx.log.logger import LogConfig, configure, logger
 from lfx.schema.dotdict import dotdict
 from lfx.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from lfx.services.cache.utils import CacheMiss
-from lfx.services.deps import get_chat_service, get_tracing_service
+from lfx.services.deps import get_chat_service, get_settings_service, get_tracing_service
 from lfx.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -48,6 +52,8 @@ if TYPE_CHECKING:
     from lfx.custom.custom_component.component import Component
     from lfx.events.event_manager import EventManager
     from lfx.graph.edge.schema import EdgeData
+    from lfx.graph.graph.scheduler import GraphScheduler
+    from lfx.graph.graph.snapshots import SnapshotMode
     from lfx.graph.schema import ResultData
     from lfx.schema.schema import InputValueRequest
     from lfx.services.chat.schema import GetCache, SetCache
@@ -125,7 +131,15 @@ class Graph:
         self._cycles: list[tuple[str, str]] | None = None
         self._cycle_vertices: set[str] | None = None
         self._call_order: list[str] = []
-        self._snapshots: list[dict[str, Any]] = []
+        # Resolved from the `graph_snapshot_mode` setting on the first step, see `enable_snapshots`
+        self._snapshots: SnapshotHistory | None = None
+        self._snapshots_configured = False
+        self.vertex_queue_wait_times: dict[str, float] = {}
+        self._variable_resolver: RunVariableResolver | None = None
+        # Shared between a prepared graph and its clones, see `clone_for_run`
+        self._sorted_vertices_cache: dict[tuple[str | None, str | None], tuple[list[str], list[list[str]]]] | None = (
+            None
+        )
         self._end_trace_tasks: set[asyncio.Task] = set()
 
         if context and not isinstance(context, dict):
@@ -639,6 +653,13 @@ class Graph:
 
         self._run_id = str(run_id)
 
+    @property
+    def variable_resolver(self) -> RunVariableResolver:
+        """The resolver of the `load_from_db` variables of the current run, see `RunVariableResolver`."""
+        if self._variable_resolver is None or self._variable_resolver.run_id != self._run_id:
+            self._variable_resolver = RunVariableResolver(self, self._run_id)
+        return self._variable_resolver
+
     async def initialize_run(self) -> None:
         if not self._run_id:
             self.set_run_id()
@@ -1115,6 +1136,10 @@ class Graph:
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
         self.__dict__.update(state)
+        self._sorted_vertices_cache = None
+        self._snapshots = None
+        self._snapshots_configured = False
+        self._variable_resolver = None
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         # Tracing service will be lazily initialized via property when needed
         self.set_run_id(self._run_id)
@@ -1158,6 +1183,82 @@ class Graph:
         else:
             return graph
 
+    def clone_for_run(self, *, user_id: str | None = None, context: dict | None = None) -> Graph:
+        """Creates a graph with fresh run state from a graph built with `from_payload`.
+
+        The clone shares this graph's processed nodes and edges data, cycle information and sorted
+        layers, so none of those are recomputed. Vertices, edges and components are rebuilt, so nothing
+        built during one run leaks into another. This graph is used as a template and must not be run.
+
+        Args:
+            user_id: The user ID of the clone. Defaults to this graph's user ID.
+            context: Optional context dictionary for request-specific data.
+
+        Returns:
+            Graph: A new graph ready to be run.
+        """
+        if self._start is not None or self._end is not None:
+            msg = "Only graphs created from a payload can be cloned for a run"
+            raise ValueError(msg)
+        graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=user_id if user_id is not None else self.user_id,
+            context=context,
+        )
+        graph.raw_graph_data = self.raw_graph_data
+        graph._graph_data = self._graph_data  # noqa: SLF001
+        graph._vertices = self._vertices  # noqa: SLF001
+        graph._edges = self._edges  # noqa: SLF001
+        graph.top_level_vertices = list(self.top_level_vertices)
+        graph._cycle_vertices = self.cycle_vertices  # noqa: SLF001
+        graph._is_cyclic = self.is_cyclic  # noqa: SLF001
+        graph._cycles = self._cycles  # noqa: SLF001
+        if self._sorted_vertices_cache is None:
+            self._sorted_vertices_cache = {}
+        graph._sorted_vertices_cache = self._sorted_vertices_cache  # noqa: SLF001
+
+        graph._build_graph()  # noqa: SLF001
+        # The adjacency lists are consumed by the run manager during a run, so each clone gets its own copy
+        graph.predecessor_map = defaultdict(list, {key: list(value) for key, value in self.predecessor_map.items()})
+        graph.successor_map = defaultdict(list, {key: list(value) for key, value in self.successor_map.items()})
+        graph.in_degree_map = defaultdict(int, self.in_degree_map)
+        graph.parent_child_map = defaultdict(list, {key: list(value) for key, value in self.parent_child_map.items()})
+        graph.define_vertices_lists()
+        return graph
+
+    def reset_run_state(self) -> None:
+        """Clears the state left behind by a run so the same graph instance can be run again.
+
+        Only run bookkeeping is reset. Vertices and components are rebuilt by `prepare` at the start of
+        the next run, and the processed nodes and edges data, cycle information and sorted layers are kept.
+        """
+        self._prepared = False
+        self._run_id = ""
+        self._session_id = ""
+        self._start_time = datetime.now(timezone.utc)
+        self._is_input_vertices = []
+        self._is_output_vertices = []
+        self._is_state_vertices = None
+        self.has_session_id_vertices = []
+        self.inactivated_vertices = set()
+        self.activated_vertices = []
+        self.vertices_layers = []
+        self.vertices_to_run = set()
+        self.stop_vertex = None
+        self.inactive_vertices = set()
+        self.conditionally_excluded_vertices = set()
+        self.conditional_exclusion_sources = {}
+        self.run_manager = RunnableVerticesManager()
+        self._run_queue = deque()
+        self._first_layer = []
+        self._call_order = []
+        if self._snapshots is not None:
+            self._snapshots.clear()
+        self.vertex_queue_wait_times = {}
+        self._variable_resolver = None
+
     def __eq__(self, /, other: object) -> bool:
         if not isinstance(other, Graph):
             return False
@@ -1444,7 +1545,7 @@ class Graph:
 
         if chat_service is not None:
             await chat_service.set_cache(str(self.flow_id or self._run_id), self)
-        self._record_snapshot(vertex_id)
+        self._record_snapshot(vertex_id, changed=[vertex_id, *next_runnable_vertices])
         return vertex_build_result
 
     def get_snapshot(self):
@@ -1459,10 +1560,38 @@ class Graph:
             }
         )
 
-    def _record_snapshot(self, vertex_id: str | None = None) -> None:
-        self._snapshots.append(self.get_snapshot())
+    def enable_snapshots(self, mode: SnapshotMode = "delta", max_size: int = DEFAULT_SNAPSHOT_MAX_SIZE) -> None:
+        """Records the run state after each step, overriding the `graph_snapshot_mode` setting.
+
+        Args:
+            mode: 'delta' records only what changed at each step, 'full' records a complete copy and
+                'off' disables recording.
+            max_size: Maximum number of steps kept. Older steps are dropped first.
+        """
+        self._snapshots = None if mode == "off" else SnapshotHistory(mode, max_size)
+        self._snapshots_configured = True
+
+    def get_snapshots(self) -> list[dict[str, Any]]:
+        """Returns the snapshots recorded at each step, oldest first, in the layout of `get_snapshot`."""
+        if self._snapshots is None:
+            return []
+        return self._snapshots.snapshots()
+
+    def _record_snapshot(self, vertex_id: str | None = None, changed: list[str] | None = None) -> None:
+        """Records the run state after a step that ran `vertex_id` and changed the vertices `changed`.
+
+        Without `changed` the whole run state is captured, as after `prepare`.
+        """
         if vertex_id:
             self._call_order.append(vertex_id)
+        if not self._snapshots_configured:
+            settings_service = get_settings_service()
+            if settings_service is not None:
+                settings = settings_service.settings
+                self.enable_snapshots(settings.graph_snapshot_mode, settings.graph_snapshot_max_size)
+            self._snapshots_configured = True
+        if self._snapshots is not None:
+            self._snapshots.record_step(self, changed)
 
     def step(
         self,
@@ -1622,8 +1751,27 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        scheduler: GraphScheduler | None = None,
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph with vertices in each layer run in parallel.
+
+        Args:
+            fallback_to_env_vars (bool): Whether to fallback to environment variables.
+            start_component_id (str | None): The component to start the run from.
+            event_manager (EventManager | None): The event manager for the graph.
+            scheduler (GraphScheduler | None): "layered" waits for every vertex of a layer before starting
+                the next one, "dependency" starts each vertex as soon as its own predecessors are built.
+                Defaults to the `graph_scheduler` setting.
+            max_concurrency (int | None): Maximum number of vertices built at the same time by the
+                "dependency" scheduler. Defaults to the `graph_max_concurrency` setting.
+        """
+        if scheduler is None or max_concurrency is None:
+            settings_service = get_settings_service()
+            if settings_service is not None:
+                scheduler = scheduler or settings_service.settings.graph_scheduler
+                if max_concurrency is None:
+                    max_concurrency = settings_service.settings.graph_max_concurrency
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
         vertex_task_run_count: dict[str, int] = {}
@@ -1644,6 +1792,30 @@ class Graph:
                 pass
 
         await self.initialize_run()
+        if scheduler == "dependency":
+            dependency_scheduler = DependencyScheduler(
+                self,
+                partial(
+                    self.build_vertex,
+                    user_id=self.user_id,
+                    inputs_dict={},
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    get_cache=get_cache_func,
+                    set_cache=set_cache_func,
+                    event_manager=event_manager,
+                ),
+                max_concurrency=max_concurrency,
+                has_webhook_component=has_webhook_component,
+            )
+            self.vertex_queue_wait_times = dependency_scheduler.queue_wait_times
+            try:
+                await dependency_scheduler.run(first_layer)
+            except Exception:
+                await logger.aexception("Error executing tasks with the dependency scheduler")
+                raise
+            await logger.adebug("Graph processing complete")
+            return self
+
         lock = asyncio.Lock()
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
@@ -2137,20 +2309,31 @@ class Graph:
         """Sorts the vertices in the graph."""
         self.mark_all_vertices("ACTIVE")
 
-        first_layer, remaining_layers = get_sorted_vertices(
-            vertices_ids=self.get_vertex_ids(),
-            cycle_vertices=self.cycle_vertices,
-            stop_component_id=stop_component_id,
-            start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
-            in_degree_map=self.in_degree_map,
-            successor_map=self.successor_map,
-            predecessor_map=self.predecessor_map,
-            is_input_vertex=self.get_vertex_input_status,
-            get_vertex_predecessors=self.get_vertex_predecessors_ids,
-            get_vertex_successors=self.get_vertex_successors_ids,
-            is_cyclic=self.is_cyclic,
-        )
+        cache_key = (stop_component_id, start_component_id)
+        if self._sorted_vertices_cache is not None and cache_key in self._sorted_vertices_cache:
+            cached_first_layer, cached_remaining_layers = self._sorted_vertices_cache[cache_key]
+            first_layer = list(cached_first_layer)
+            remaining_layers = [list(layer) for layer in cached_remaining_layers]
+        else:
+            first_layer, remaining_layers = get_sorted_vertices(
+                vertices_ids=self.get_vertex_ids(),
+                cycle_vertices=self.cycle_vertices,
+                stop_component_id=stop_component_id,
+                start_component_id=start_component_id,
+                graph_dict=self.__to_dict(),
+                in_degree_map=self.in_degree_map,
+                successor_map=self.successor_map,
+                predecessor_map=self.predecessor_map,
+                is_input_vertex=self.get_vertex_input_status,
+                get_vertex_predecessors=self.get_vertex_predecessors_ids,
+                get_vertex_successors=self.get_vertex_successors_ids,
+                is_cyclic=self.is_cyclic,
+            )
+            if self._sorted_vertices_cache is not None:
+                self._sorted_vertices_cache[cache_key] = (
+                    list(first_layer),
+                    [list(layer) for layer in remaining_layers],
+                )
 
         self.increment_run_count()
         self._sorted_vertices_layers = [first_layer, *remaining_layers]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Literal
+
+from lfx.graph.graph.schema import VertexBuildResult
+from lfx.graph.utils import log_vertex_build
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from lfx.graph.graph.base import Graph
+
+GraphScheduler = Literal["layered", "dependency"]
+
+
+class DependencyScheduler:
+    """Runs the vertices of a graph as soon as their own predecessors are done.
+
+    The layered engine in `Graph.process` waits for a whole layer to finish before computing the next
+    runnable set. This scheduler instead reacts to every completed vertex individually, using the same
+    `RunnableVerticesManager` bookkeeping, so a slow vertex only delays its own successors.
+
+    Args:
+        graph: The graph whose vertices are run.
+        build_vertex: A coroutine function that builds a single vertex given its id.
+        max_concurrency: Maximum number of vertices built at the same time. None means unbounded.
+        has_webhook_component: Whether failed builds should be logged as vertex builds.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        build_vertex: Callable[[str], Awaitable[VertexBuildResult]],
+        *,
+        max_concurrency: int | None = None,
+        has_webhook_component: bool = False,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            msg = f"max_concurrency must be a positive integer, got {max_concurrency}"
+            raise ValueError(msg)
+        self.graph = graph
+        self.build_vertex = build_vertex
+        self.max_concurrency = max_concurrency
+        self.has_webhook_component = has_webhook_component
+        self.queue_wait_times: dict[str, float] = {}
+        """Seconds each vertex spent waiting for a concurrency slot, summed over all of its runs."""
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._lock = asyncio.Lock()
+        self._tasks: dict[asyncio.Task, str] = {}
+        self._running: set[str] = set()
+        # Vertices reported as runnable again while running, such as cycle vertices, run again once they finish
+        self._reruns: set[str] = set()
+        self._run_count: dict[str, int] = {}
+
+    async def run(self, first_layer: list[str]) -> None:
+        """Builds `first_layer` and every vertex that becomes runnable after it."""
+        for vertex_id in first_layer:
+            self._schedule(vertex_id)
+
+        try:
+            while self._tasks:
+                done, _ = await asyncio.wait(self._tasks.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    vertex_id = self._tasks.pop(task)
+                    self._running.discard(vertex_id)
+                    await self._handle_completed(task, vertex_id)
+                    if vertex_id in self._reruns:
+                        self._reruns.discard(vertex_id)
+                        self._schedule(vertex_id)
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks.clear()
+            self._running.clear()
+            self._reruns.clear()
+
+    def _schedule(self, vertex_id: str) -> None:
+        if vertex_id in self._running:
+            self._reruns.add(vertex_id)
+            return
+        self._running.add(vertex_id)
+        run_count = self._run_count.get(vertex_id, 0)
+        self._run_count[vertex_id] = run_count + 1
+        task = asyncio.create_task(self._build(vertex_id, time.perf_counter()), name=f"{vertex_id} Run {run_count}")
+        self._tasks[task] = vertex_id
+
+    async def _build(self, vertex_id: str, enqueued_at: float) -> VertexBuildResult:
+        if self._semaphore is None:
+            self._record_queue_wait(vertex_id, enqueued_at)
+            return await self.build_vertex(vertex_id)
+        async with self._semaphore:
+            self._record_queue_wait(vertex_id, enqueued_at)
+            return await self.build_vertex(vertex_id)
+
+    def _record_queue_wait(self, vertex_id: str, enqueued_at: float) -> None:
+        waited = time.perf_counter() - enqueued_at
+        self.queue_wait_times[vertex_id] = self.queue_wait_times.get(vertex_id, 0.0) + waited
+
+    async def _handle_completed(self, task: asyncio.Task, vertex_id: str) -> None:
+        task_name = task.get_name()
+        exc = task.exception()
+        if exc is not None:
+            await logger.aerror(f"Task {task_name} failed with exception: {exc}")
+            if self.has_webhook_component:
+                await self.graph._log_vertex_build_from_exception(vertex_id, exc)  # noqa: SLF001
+            raise exc
+
+        result = task.result()
+        if not isinstance(result, VertexBuildResult):
+            msg = f"Invalid result from task {task_name}: {result}"
+            raise TypeError(msg)
+
+        if self.graph.flow_id is not None:
+            await log_vertex_build(
+                flow_id=self.graph.flow_id,
+                vertex_id=result.vertex.id,
+                valid=result.valid,
+                params=result.params,
+                data=result.result_dict,
+                artifacts=result.artifacts,
+            )
+        vertex = result.vertex
+        self.graph.run_manager.remove_vertex_from_runnables(vertex.id)
+        await logger.adebug(f"Vertex {vertex.id}, result: {vertex.built_result}, object: {vertex.built_object}")
+
+        next_runnable_vertices = await self.graph.get_next_runnable_vertices(self._lock, vertex=vertex, cache=False)
+        for next_vertex_id in dict.fromkeys(next_runnable_vertices):
+            self._schedule(next_vertex_id)
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from lfx.graph.graph.base import Graph
+
+SnapshotMode = Literal["off", "delta", "full"]
+
+DEFAULT_MAX_SIZE = 100
+
+# State entries that map a vertex id to a list of vertex ids. Deltas of these only hold the changed entries.
+_MAPPING_KEYS = ("run_map", "run_predecessors")
+# State entries that are sets of vertex ids. Deltas of these only hold the added and removed ids.
+_SET_KEYS = ("vertices_to_run", "vertices_being_run", "ran_at_least_once")
+# Per-vertex entries tracked from the vertices a step changed, see `SnapshotHistory.record_step`
+_TRACKED_KEYS = _MAPPING_KEYS + _SET_KEYS
+# Entries the graph replaces rather than mutates, only compared when a new object is assigned
+_REPLACED_KEYS = ("vertices_layers", "first_layer")
+_RUN_MANAGER_KEYS = ("run_map", "run_predecessors", "vertices_to_run", "vertices_being_run", "ran_at_least_once")
+_MISSING = object()
+
+
+def capture_state(graph: Graph) -> dict[str, Any]:
+    """Returns a copy of the run state of `graph` that later steps can't mutate.
+
+    The state only holds ids, so copying each container one level deep is enough; no deepcopy is needed.
+    """
+    run_manager = graph.run_manager
+    return {
+        "run_map": {key: list(value) for key, value in run_manager.run_map.items()},
+        "run_predecessors": {key: list(value) for key, value in run_manager.run_predecessors.items()},
+        "vertices_to_run": set(run_manager.vertices_to_run),
+        "vertices_being_run": set(run_manager.vertices_being_run),
+        "ran_at_least_once": set(run_manager.ran_at_least_once),
+        **_capture_small_state(graph),
+        "vertices_layers": [list(layer) for layer in graph.vertices_layers],
+        "first_layer": list(graph.first_layer),
+    }
+
+
+def _capture_small_state(graph: Graph) -> dict[str, Any]:
+    """Copies the entries of the state that are only a few vertices long, whatever the size of the graph."""
+    return {
+        "run_queue": list(graph._run_queue),  # noqa: SLF001
+        "inactive_vertices": set(graph.inactive_vertices),
+        "activated_vertices": list(graph.activated_vertices),
+    }
+
+
+def _state_sources(graph: Graph) -> dict[str, Any]:
+    """Returns the containers of `graph` the entries of its state are read from."""
+    run_manager = graph.run_manager
+    sources = {key: getattr(run_manager, key) for key in _TRACKED_KEYS}
+    sources["vertices_layers"] = graph.vertices_layers
+    sources["first_layer"] = graph.first_layer
+    return sources
+
+
+def _diff_mapping(mirror: dict[str, list[str]], current: dict[str, list[str]], vertex_ids) -> dict[str, Any] | None:
+    """Updates the entries of `mirror` for `vertex_ids` from `current`, returning the mapping delta if any changed."""
+    changed: dict[str, list[str]] = {}
+    removed: list[str] = []
+    for vertex_id in vertex_ids:
+        ids = current.get(vertex_id, _MISSING)
+        if ids is _MISSING:
+            if vertex_id in mirror:
+                del mirror[vertex_id]
+                removed.append(vertex_id)
+        elif mirror.get(vertex_id, _MISSING) != ids:
+            changed[vertex_id] = mirror[vertex_id] = list(ids)
+    if changed or removed:
+        return {"set": changed, "del": removed}
+    return None
+
+
+def _diff_set(mirror: set[str], current: set[str], vertex_ids) -> dict[str, Any] | None:
+    """Updates the membership of `vertex_ids` in `mirror` from `current`, returning the set delta if any changed."""
+    added: list[str] = []
+    removed: list[str] = []
+    for vertex_id in vertex_ids:
+        if vertex_id in current:
+            if vertex_id not in mirror:
+                mirror.add(vertex_id)
+                added.append(vertex_id)
+        elif vertex_id in mirror:
+            mirror.discard(vertex_id)
+            removed.append(vertex_id)
+    if added or removed:
+        return {"add": added, "del": removed}
+    return None
+
+
+def _merge_entries(first: dict[str, Any] | None, second: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Merges two deltas of the same mapping or set entry that change different vertices."""
+    if first is None or second is None:
+        return first or second
+    if "set" in first:
+        return {"set": {**first["set"], **second["set"]}, "del": first["del"] + second["del"]}
+    return {"add": first["add"] + second["add"], "del": first["del"] + second["del"]}
+
+
+def diff_state(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Returns the entries of `current` that differ from `previous`."""
+    delta: dict[str, Any] = {}
+    for key, value in current.items():
+        if key in _MAPPING_KEYS:
+            previous_mapping = previous.get(key, {})
+            changed = {
+                vertex_id: ids for vertex_id, ids in value.items() if previous_mapping.get(vertex_id, _MISSING) != ids
+            }
+            removed = [vertex_id for vertex_id in previous_mapping if vertex_id not in value]
+            if changed or removed or key not in previous:
+                delta[key] = {"set": changed, "del": removed}
+        elif key in _SET_KEYS:
+            previous_set = previous.get(key, set())
+            if value != previous_set or key not in previous:
+                delta[key] = {"add": list(value - previous_set), "del": list(previous_set - value)}
+        elif previous.get(key, _MISSING) != value:
+            delta[key] = value
+    return delta
+
+
+def _copy_entry(key: str, value: Any) -> Any:
+    if key in _MAPPING_KEYS:
+        return dict(value)
+    if key in _SET_KEYS:
+        return set(value)
+    return value
+
+
+def apply_delta(state: dict[str, Any], delta: dict[str, Any], *, in_place: bool = False) -> dict[str, Any]:
+    """Returns the state with `delta` applied to `state`.
+
+    `state` is not modified unless `in_place` is set: only the entries the delta changes are copied.
+    """
+    new_state = state if in_place else dict(state)
+    for key, value in delta.items():
+        if key in _MAPPING_KEYS:
+            mapping = new_state.setdefault(key, {}) if in_place else dict(new_state.get(key, {}))
+            mapping.update(value["set"])
+            for vertex_id in value["del"]:
+                mapping.pop(vertex_id, None)
+            new_state[key] = mapping
+        elif key in _SET_KEYS:
+            ids = new_state.setdefault(key, set()) if in_place else set(new_state.get(key, set()))
+            ids.difference_update(value["del"])
+            ids.update(value["add"])
+            new_state[key] = ids
+        else:
+            new_state[key] = value
+    return new_state
+
+
+def to_snapshot(state: dict[str, Any]) -> dict[str, Any]:
+    """Converts a captured state to the layout returned by `Graph.get_snapshot`."""
+    return {
+        "run_manager": {key: state[key] for key in _RUN_MANAGER_KEYS},
+        "run_queue": deque(state["run_queue"]),
+        "vertices_layers": state["vertices_layers"],
+        "first_layer": state["first_layer"],
+        "inactive_vertices": state["inactive_vertices"],
+        "activated_vertices": state["activated_vertices"],
+    }
+
+
+class SnapshotHistory:
+    """A bounded history of the run state of a graph, recorded after each step.
+
+    In 'full' mode every entry is a complete copy of the state. In 'delta' mode an entry only holds
+    what changed since the previous step. `record_step` builds it from the vertices the step changed,
+    so a step that runs one vertex costs a handful of entries instead of a copy of the whole graph
+    state; complete snapshots are only built when they are read with `snapshots`. Once `max_size`
+    entries are kept, the oldest one is dropped; in 'delta' mode it is first folded into a base state
+    so the remaining entries can still be replayed.
+
+    Args:
+        mode: Either 'delta' or 'full'.
+        max_size: Maximum number of entries kept.
+    """
+
+    def __init__(self, mode: SnapshotMode = "delta", max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if mode == "off":
+            msg = "Snapshot history can't be created with mode 'off'"
+            raise ValueError(msg)
+        if max_size < 1:
+            msg = f"max_size must be a positive integer, got {max_size}"
+            raise ValueError(msg)
+        self.mode = mode
+        self.max_size = max_size
+        self._entries: deque[dict[str, Any]] = deque()
+        self._base: dict[str, Any] = {}
+        # The state after the last recorded step, kept up to date with each delta
+        self._last: dict[str, Any] = {}
+        # The graph containers `_last` was read from, to notice the ones the graph replaced
+        self._sources: dict[str, Any] = {}
+
+    def record(self, state: dict[str, Any]) -> None:
+        """Adds a state captured with `capture_state` to the history."""
+        if self.mode == "full":
+            self._append(state)
+            return
+        self._sources = {}
+        self._append(diff_state(self._last, state))
+        self._last = state
+
+    def record_step(self, graph: Graph, changed: Iterable[str] | None = None) -> None:
+        """Adds the state of `graph` after a step that changed the vertices `changed` to the history.
+
+        With `changed` None, e.g. after the graph was prepared, the whole state is captured and compared.
+
+        In 'delta' mode, only the entries of the changed vertices, of their successors and predecessors
+        and of the queued and inactive vertices are compared with the previous step. An entry the graph
+        replaced with a new container, or whose size shows changes to other vertices, is compared in full.
+        """
+        if self.mode == "full" or changed is None or not self._sources:
+            self.record(capture_state(graph))
+            self._sources = _state_sources(graph) if self.mode == "delta" else {}
+            return
+        run_manager = graph.run_manager
+        small_state = _capture_small_state(graph)
+        changed = list(changed)
+        vertex_ids = set(changed)
+        for vertex_id in changed:
+            vertex_ids.update(run_manager.run_map.get(vertex_id, ()))
+            vertex_ids.update(run_manager.run_predecessors.get(vertex_id, ()))
+        vertex_ids.update(small_state["run_queue"])
+        vertex_ids.update(small_state["inactive_vertices"])
+        vertex_ids.update(self._last["inactive_vertices"])
+
+        sources = _state_sources(graph)
+        last = self._last
+        delta: dict[str, Any] = {}
+        for key in _TRACKED_KEYS:
+            current = sources[key]
+            mirror = last[key]
+            diff = _diff_mapping if key in _MAPPING_KEYS else _diff_set
+            replaced = current is not self._sources[key]
+            entry = None if replaced else diff(mirror, current, vertex_ids)
+            if replaced or len(mirror) != len(current):
+                # The graph replaced the container or changed vertices outside of the step: compare every vertex
+                entry = _merge_entries(entry, diff(mirror, current, set(mirror) | set(current)))
+            if entry is not None:
+                delta[key] = entry
+        for key in _REPLACED_KEYS:
+            value = sources[key]
+            if value is self._sources[key] and len(value) == len(last[key]):
+                continue
+            copied = [list(layer) for layer in value] if key == "vertices_layers" else list(value)
+            if copied != last[key]:
+                delta[key] = last[key] = copied
+        for key, value in small_state.items():
+            if value != last[key]:
+                delta[key] = last[key] = value
+        self._sources = sources
+        self._append(delta)
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        if len(self._entries) >= self.max_size:
+            evicted = self._entries.popleft()
+            if self.mode == "delta":
+                # The base is never shared with the snapshots returned by `snapshots`, so it is updated in place
+                apply_delta(self._base, evicted, in_place=True)
+        self._entries.append(entry)
+
+    def snapshots(self) -> list[dict[str, Any]]:
+        """Returns the complete snapshots of the recorded steps, oldest first.
+
+        The snapshots share their containers with the history and with each other, so they must not be modified.
+        """
+        if self.mode == "full":
+            return [to_snapshot(state) for state in self._entries]
+        snapshots = []
+        state = {key: _copy_entry(key, value) for key, value in self._base.items()}
+        for delta in self._entries:
+            state = apply_delta(state, delta)
+            snapshots.append(to_snapshot(state))
+        return snapshots
+
+    def clear(self) -> None:
+        """Removes every recorded entry."""
+        self._entries.clear()
+        self._base = {}
+        self._last = {}
+        self._sources = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
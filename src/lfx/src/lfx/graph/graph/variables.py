@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+from lfx.services.deps import get_variable_service
+
+if TYPE_CHECKING:
+    from lfx.graph.graph.base import Graph
+
+# Credentials can't be used in session id fields, so these are always looked up on their own to get that check
+_UNBATCHED_FIELDS = frozenset({"session_id"})
+
+
+class RunVariableResolver:
+    """Resolves the `load_from_db` variables of a graph run.
+
+    Without it every `load_from_db` field of every vertex is looked up on its own, which costs a query
+    and a decryption per field. The first lookup for a user instead fetches the variables referenced by
+    all the vertices of the graph with a single `get_variables` call on the variable service, and the
+    following lookups of the run are served from memory.
+
+    A name that can't be resolved here (unknown variable, request variable override, variable service
+    without `get_variables`) returns None, and the caller falls back to looking it up on its own.
+
+    Args:
+        graph: The graph whose vertices reference the variables.
+        run_id: The run the resolved values belong to.
+    """
+
+    def __init__(self, graph: Graph, run_id: str) -> None:
+        self.graph = graph
+        self.run_id = run_id
+        self._values: dict[str, dict[str, str]] = {}
+        self._lock = asyncio.Lock()
+
+    def collect_names(self) -> set[str]:
+        """Returns the names of the variables referenced by the `load_from_db` fields of the graph."""
+        request_variables = (self.graph.context or {}).get("request_variables") or {}
+        names: set[str] = set()
+        for vertex in self.graph.vertices:
+            for field in vertex.load_from_db_fields:
+                if field.startswith("table:") or field in _UNBATCHED_FIELDS:
+                    continue
+                name = vertex.params.get(field)
+                if name and isinstance(name, str) and name not in request_variables:
+                    names.add(name)
+        return names
+
+    async def get(self, user_id: str | uuid.UUID, name: str, session: Any) -> str | None:
+        """Returns the value of the variable `name` for `user_id`, or None if it wasn't resolved."""
+        key = str(user_id)
+        values = self._values.get(key)
+        if values is None:
+            async with self._lock:
+                values = self._values.get(key)
+                if values is None:
+                    values = await self._fetch(user_id, session)
+                    self._values[key] = values
+        return values.get(name)
+
+    async def _fetch(self, user_id: str | uuid.UUID, session: Any) -> dict[str, str]:
+        variable_service = get_variable_service()
+        if variable_service is None or not hasattr(variable_service, "get_variables"):
+            return {}
+        names = self.collect_names()
+        if not names:
+            return {}
+        try:
+            if isinstance(user_id, str):
+                user_id = uuid.UUID(user_id)
+            return await variable_service.get_variables(user_id=user_id, names=names, session=session)
+        except Exception as exc:  # noqa: BLE001
+            # Every name is then looked up on its own, which reports errors per field
+            await logger.adebug(f"Error resolving the variables of the run: {exc}")
+            return {}
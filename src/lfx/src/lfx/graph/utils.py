@@ -11,7 +11,7 @@ from lfx.schema.data import Data
 from lfx.schema.message import Message
 
 # Database imports removed - lfx should be lightweight
-from lfx.services.deps import get_db_service, get_settings_service
+from lfx.services.deps import get_db_service, get_log_buffer_service, get_settings_service
 
 if TYPE_CHECKING:
     from lfx.graph.vertex.base import Vertex
@@ -109,12 +109,13 @@ async def log_transaction(
     flow_id: str | UUID,
     source: Vertex,
     status,
-    target: Vertex | None = None,  # noqa: ARG001
-    error=None,  # noqa: ARG001
+    target: Vertex | None = None,
+    error=None,
 ) -> None:
     """Asynchronously logs a transaction record for a vertex in a flow if transaction storage is enabled.
 
-    This is a lightweight implementation that only logs if database service is available.
+    The record is handed to the log buffer service when one is registered, which writes it to the database
+    in bulk. Otherwise it is only logged.
     """
     try:
         settings_service = get_settings_service()
@@ -132,7 +133,17 @@ async def log_transaction(
             else:
                 return
 
-        # Log basic transaction info - concrete implementation should be in langflow
+        log_buffer = get_log_buffer_service()
+        if log_buffer is not None:
+            await log_buffer.add_transaction(
+                flow_id=flow_id,
+                vertex_id=source.id,
+                target_id=target.id if target else None,
+                inputs=_vertex_to_primitive_dict(source),
+                outputs=_vertex_to_primitive_dict(target) if target else None,
+                status=status,
+                error=str(error) if error is not None else None,
+            )
         logger.debug(f"Transaction logged: vertex={source.id}, flow={flow_id}, status={status}")
     except Exception as exc:  # noqa: BLE001
         logger.debug(f"Error logging transaction: {exc!s}")
@@ -143,13 +154,14 @@ async def log_vertex_build(
     flow_id: str | UUID,
     vertex_id: str,
     valid: bool,
-    params: Any,  # noqa: ARG001
-    data: dict | Any,  # noqa: ARG001
-    artifacts: dict | None = None,  # noqa: ARG001
+    params: Any,
+    data: dict | Any,
+    artifacts: dict | None = None,
 ) -> None:
     """Asynchronously logs a vertex build record if vertex build storage is enabled.
 
-    This is a lightweight implementation that only logs if database service is available.
+    The record is handed to the log buffer service when one is registered, which writes it to the database
+    in bulk. Otherwise it is only logged.
     """
     try:
         settings_service = get_settings_service()
@@ -168,7 +180,11 @@ async def log_vertex_build(
             logger.debug(f"Invalid flow_id passed to log_vertex_build: {flow_id!r}")
             return
 
-        # Log basic vertex build info - concrete implementation should be in langflow
+        log_buffer = get_log_buffer_service()
+        if log_buffer is not None:
+            await log_buffer.add_vertex_build(
+                flow_id=flow_id, vertex_id=vertex_id, valid=valid, params=params, data=data, artifacts=artifacts
+            )
         logger.debug(f"Vertex build logged: vertex={vertex_id}, flow={flow_id}, valid={valid}")
     except Exception:  # noqa: BLE001
         logger.debug("Error logging vertex build")
@@ -20,6 +20,7 @@ from lfx.schema.schema import INPUT_FIELD_NAME
 from lfx.serialization.serialization import serialize
 from lfx.template.field.base import UNDEFINED, Output
 from lfx.utils.schemas import ChatOutputResponse, DataOutputResponse
+from lfx.utils.stream_accumulator import StreamAccumulator
 from lfx.utils.util import unescape_string
 
 if TYPE_CHECKING:
@@ -375,20 +376,21 @@ class InterfaceVertex(ComponentVertex):
             msg = "The message must be an iterator or an async iterator."
             raise TypeError(msg)
         is_async = isinstance(iterator, AsyncIterator)
-        complete_message = ""
+        streamed_text = StreamAccumulator()
         if is_async:
             async for message in iterator:
                 message_ = message.content if hasattr(message, "content") else message
                 message_ = message_.text if hasattr(message_, "text") else message_
                 yield message_
-                complete_message += message_
+                streamed_text.append(message_)
         else:
             for message in iterator:
                 message_ = message.content if hasattr(message, "content") else message
                 message_ = message_.text if hasattr(message_, "text") else message_
                 yield message_
-                complete_message += message_
+                streamed_text.append(message_)
 
+        complete_message = streamed_text.text
         files = self.params.get("files", [])
 
         treat_file_path = files is not None and not isinstance(files, list) and isinstance(files, str)
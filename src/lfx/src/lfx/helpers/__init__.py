@@ -37,6 +37,7 @@ if has_langflow_memory():
             build_schema_from_inputs,
             get_arg_names,
             get_flow_inputs,
+            list_flow_catalog,
             list_flows,
             load_flow,
             run_flow,
@@ -70,6 +71,7 @@ if has_langflow_memory():
             build_schema_from_inputs,
             get_arg_names,
             get_flow_inputs,
+            list_flow_catalog,
             list_flows,
             load_flow,
             run_flow,
@@ -103,6 +105,7 @@ else:
         build_schema_from_inputs,
         get_arg_names,
         get_flow_inputs,
+        list_flow_catalog,
         list_flows,
         load_flow,
         run_flow,
@@ -122,6 +125,7 @@ __all__ = [
     "format_type",
     "get_arg_names",
     "get_flow_inputs",
+    "list_flow_catalog",
     "list_flows",
     "load_flow",
     "run_flow",
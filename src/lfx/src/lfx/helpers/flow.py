@@ -85,6 +85,29 @@ async def list_flows(*, user_id: str | None = None) -> list[Data]:
     return []
 
 
+async def list_flow_catalog(*, user_id: str | None = None, flow_name: str | None = None) -> list[Data]:  # noqa: ARG001
+    """List the flows of a user without their data.
+
+    In lfx, this is a stub that returns an empty list since we don't have
+    a database backend by default.
+
+    Args:
+        user_id: The user ID to list flows for.
+        flow_name: Only list the flow with this name.
+
+    Returns:
+        List of data objects with the id, name, description and updated_at of each flow.
+    """
+    if not user_id:
+        msg = "Session is invalid"
+        raise ValueError(msg)
+
+    # In lfx, we don't have a database backend by default
+    # This is a stub implementation
+    logger.warning("list_flow_catalog called but lfx doesn't have database backend by default")
+    return []
+
+
 async def load_flow(
     user_id: str,  # noqa: ARG001
     flow_id: str | None = None,
@@ -208,6 +208,23 @@ async def update_table_params_with_load_from_db_fields(
         return params
 
 
+async def get_run_variable(custom_component: CustomComponent, name: str, field: str, session) -> str | None:
+    """Returns the value of the variable `name` resolved for the whole graph run of `custom_component`.
+
+    Returns None when the variable has to be looked up on its own with `custom_component.get_variable`.
+    """
+    from lfx.graph.graph.base import Graph
+
+    if not getattr(custom_component, "_vertex", None):
+        return None
+    graph = custom_component.graph
+    if not isinstance(graph, Graph) or not custom_component.user_id:
+        return None
+    if field == "session_id":
+        return None
+    return await graph.variable_resolver.get(custom_component.user_id, name, session)
+
+
 async def update_params_with_load_from_db_fields(
     custom_component: CustomComponent,
     params,
@@ -238,13 +255,15 @@ async def update_params_with_load_from_db_fields(
                 if field not in params or not params[field]:
                     continue
 
-                try:
-                    key = await custom_component.get_variable(name=params[field], field=field, session=session)
-                except ValueError as e:
-                    if any(reason in str(e) for reason in ["User id is not set", "variable not found."]):
-                        raise
-                    logger.debug(str(e))
-                    key = None
+                key = await get_run_variable(custom_component, params[field], field, session)
+                if key is None:
+                    try:
+                        key = await custom_component.get_variable(name=params[field], field=field, session=session)
+                    except ValueError as e:
+                        if any(reason in str(e) for reason in ["User id is not set", "variable not found."]):
+                            raise
+                        logger.debug(str(e))
+                        key = None
 
                 if fallback_to_env_vars and key is None:
                     key = os.getenv(params[field])
@@ -5,7 +5,7 @@ import logging
 import logging.handlers
 import os
 import sys
-from collections import deque
+from bisect import bisect_left
 from datetime import datetime
 from pathlib import Path
 from threading import Lock, Semaphore
@@ -31,7 +31,16 @@ LOG_LEVEL_MAP = {
 
 
 class SizedLogBuffer:
-    """A buffer for storing log messages for the log retrieval API."""
+    """A ring buffer storing log messages for the log retrieval API.
+
+    Entries are kept in two preallocated arrays, one of epoch milliseconds and one of messages, indexed by
+    the sequence number of the entry modulo the array size. Log records are written in time order, so
+    lookups by timestamp are binary searches.
+
+    Only writers take the write lock. The arrays have one slot more than the buffer size, which is the slot
+    being written; readers copy the entries they need without the lock and drop the ones a concurrent write
+    overwrote in the meantime.
+    """
 
     def __init__(
         self,
@@ -42,20 +51,27 @@ class SizedLogBuffer:
         The buffer can be overwritten by an env variable LANGFLOW_LOG_RETRIEVER_BUFFER_SIZE
         because the logger is initialized before the settings_service are loaded.
         """
-        self.buffer: deque = deque()
-
         self._max_readers = max_readers
         self._wlock = Lock()
         self._rsemaphore = Semaphore(max_readers)
         self._max = 0
+        self._timestamps: list[int] = []
+        self._messages: list[Any] = []
+        # Sequence number of the next entry written
+        self._next = 0
+        # Sequence number of the oldest entry kept by the last resize
+        self._first = 0
 
     def get_write_lock(self) -> Lock:
         """Get the write lock."""
         return self._wlock
 
     def write(self, message: str) -> None:
-        """Write a message to the buffer."""
-        record = json.loads(message)
+        """Write a JSON serialized log record to the buffer."""
+        self.write_record(json.loads(message))
+
+    def write_record(self, record: dict[str, Any]) -> None:
+        """Write a log record, such as a structlog event dict, to the buffer."""
         log_entry = record.get("event", record.get("msg", record.get("text", "")))
 
         # Extract timestamp - support both direct timestamp and nested record.time.timestamp
@@ -72,53 +88,102 @@ class SizedLogBuffer:
         else:
             epoch = int(timestamp * 1000)
 
+        self.append(epoch, log_entry)
+
+    def append(self, epoch_ms: int, message: Any) -> None:
+        """Append an entry to the buffer, overwriting the oldest one when the buffer is full."""
         with self._wlock:
-            if len(self.buffer) >= self.max:
-                for _ in range(len(self.buffer) - self.max + 1):
-                    self.buffer.popleft()
-            self.buffer.append((epoch, log_entry))
+            if self._ensure_capacity() == 0:
+                return
+            index = self._next % len(self._timestamps)
+            self._timestamps[index] = epoch_ms
+            self._messages[index] = message
+            self._next += 1
+
+    def _ensure_capacity(self) -> int:
+        """Resize the arrays if the maximum size changed, keeping the most recent entries. Needs the write lock."""
+        capacity = self.max
+        if capacity == self._capacity():
+            return capacity
+        start, end = self._valid_range()
+        entries = self._copy(max(start, end - capacity), end)
+        slots = capacity + 1 if capacity > 0 else 0
+        timestamps: list[int] = [0] * slots
+        messages: list[Any] = [None] * slots
+        for sequence, (ts, msg) in enumerate(entries, end - len(entries)):
+            timestamps[sequence % slots] = ts
+            messages[sequence % slots] = msg
+        self._timestamps, self._messages = timestamps, messages
+        self._first = end - len(entries)
+        return capacity
+
+    def _capacity(self) -> int:
+        return max(len(self._timestamps) - 1, 0)
+
+    def _valid_range(self) -> tuple[int, int]:
+        """Return the range of sequence numbers of the entries in the buffer."""
+        end = self._next
+        return max(end - self._capacity(), self._first), end
+
+    def _copy(self, start: int, end: int) -> list[tuple[int, Any]]:
+        """Copy the entries with a sequence number in [start, end), dropping the ones overwritten meanwhile."""
+        timestamps, messages = self._timestamps, self._messages
+        slots = len(timestamps)
+        if slots == 0 or start >= end:
+            return []
+        entries = [(timestamps[seq % slots], messages[seq % slots]) for seq in range(start, end)]
+        overwritten = self._next - (slots - 1) - start
+        return entries[overwritten:] if overwritten > 0 else entries
+
+    def _bisect(self, timestamp: int, start: int, end: int) -> int:
+        """Return the sequence number of the first entry in [start, end) logged at or after `timestamp`."""
+        timestamps = self._timestamps
+        slots = len(timestamps)
+        if slots == 0:
+            return end
+        return start + bisect_left(range(start, end), timestamp, key=lambda seq: timestamps[seq % slots])
+
+    @property
+    def buffer(self) -> list[tuple[int, Any]]:
+        """Get a snapshot of the (timestamp, message) entries in the buffer, oldest first."""
+        return self._copy(*self._valid_range())
+
+    @property
+    def sequence(self) -> int:
+        """Get the sequence number the next entry will be written with."""
+        return self._next
+
+    def read_since(self, sequence: int) -> tuple[list[tuple[int, Any]], int]:
+        """Get the entries written since `sequence` that are still in the buffer, and the sequence to read next."""
+        start, end = self._valid_range()
+        return self._copy(max(start, sequence), end), end
 
     def __len__(self) -> int:
         """Get the length of the buffer."""
-        return len(self.buffer)
+        start, end = self._valid_range()
+        return end - start
 
     def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries after a timestamp."""
-        rc = {}
-
+        if lines <= 0:
+            return {}
         self._rsemaphore.acquire()
         try:
-            with self._wlock:
-                for ts, msg in self.buffer:
-                    if lines == 0:
-                        break
-                    if ts >= timestamp and lines > 0:
-                        rc[ts] = msg
-                        lines -= 1
+            start, end = self._valid_range()
+            first = self._bisect(timestamp, start, end)
+            return dict(self._copy(first, min(first + lines, end)))
         finally:
             self._rsemaphore.release()
 
-        return rc
-
     def get_before_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries before a timestamp."""
         self._rsemaphore.acquire()
         try:
-            with self._wlock:
-                as_list = list(self.buffer)
-            max_index = -1
-            for i, (ts, _) in enumerate(as_list):
-                if ts >= timestamp:
-                    max_index = i
-                    break
-            if max_index == -1:
-                return self.get_last_n(lines)
-            rc = {}
-            start_from = max(max_index - lines, 0)
-            for i, (ts, msg) in enumerate(as_list):
-                if start_from <= i < max_index:
-                    rc[ts] = msg
-            return rc
+            start, end = self._valid_range()
+            first = self._bisect(timestamp, start, end)
+            if first == end:
+                return dict(self._copy(max(start, end - lines) if lines > 0 else start, end))
+            return dict(self._copy(max(first - lines, start), first))
         finally:
             self._rsemaphore.release()
 
@@ -126,9 +191,10 @@ class SizedLogBuffer:
         """Get the last n log entries."""
         self._rsemaphore.acquire()
         try:
-            with self._wlock:
-                as_list = list(self.buffer)
-            return dict(as_list[-last_idx:])
+            start, end = self._valid_range()
+            if last_idx > 0:
+                start = max(start, end - last_idx)
+            return dict(self._copy(start, end))
         finally:
             self._rsemaphore.release()
 
@@ -185,8 +251,7 @@ def remove_exception_in_production(_logger: Any, _method_name: str, event_dict:
 def buffer_writer(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Write to log buffer if enabled."""
     if log_buffer.enabled():
-        # Create a JSON representation for the buffer
-        log_buffer.write(json.dumps(event_dict))
+        log_buffer.write_record(event_dict)
     return event_dict
 
 
@@ -10,10 +10,12 @@ from lfx.log.logger import logger
 from lfx.services.schema import ServiceType
 
 if TYPE_CHECKING:
+    from lfx.services.http_client.service import HTTPClientService
     from lfx.services.interfaces import (
         CacheServiceProtocol,
         ChatServiceProtocol,
         DatabaseServiceProtocol,
+        LogBufferServiceProtocol,
         SettingsServiceProtocol,
         StorageServiceProtocol,
         TracingServiceProtocol,
@@ -101,6 +103,20 @@ def get_tracing_service() -> TracingServiceProtocol | None:
     return get_service(ServiceType.TRACING_SERVICE)
 
 
+def get_log_buffer_service() -> LogBufferServiceProtocol | None:
+    """Retrieves the vertex build and transaction log buffer service instance."""
+    from lfx.services.schema import ServiceType
+
+    return get_service(ServiceType.LOG_BUFFER_SERVICE)
+
+
+def get_http_client_service() -> HTTPClientService | None:
+    """Retrieves the pooled HTTP client service instance."""
+    from lfx.services.http_client.factory import HTTPClientServiceFactory
+
+    return get_service(ServiceType.HTTP_CLIENT_SERVICE, HTTPClientServiceFactory())
+
+
 @asynccontextmanager
 async def session_scope():
     """Session scope context manager.
@@ -0,0 +1 @@
+"""Pooled HTTP client service module."""
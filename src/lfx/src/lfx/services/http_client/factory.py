@@ -0,0 +1,38 @@
+"""Factory for creating the pooled HTTP client service."""
+
+from typing import TYPE_CHECKING
+
+from lfx.services.factory import ServiceFactory
+from lfx.services.http_client.service import HTTPClientService
+
+if TYPE_CHECKING:
+    from lfx.services.base import Service
+
+
+class HTTPClientServiceFactory(ServiceFactory):
+    """Factory for creating HTTPClientService instances."""
+
+    def __init__(self) -> None:
+        """Initialize the factory."""
+        super().__init__()
+        self.service_class = HTTPClientService
+
+    def create(self, **kwargs) -> "Service":  # noqa: ARG002
+        """Create an HTTPClientService instance configured from the settings.
+
+        Returns:
+            HTTPClientService instance
+        """
+        from lfx.services.deps import get_settings_service
+
+        settings_service = get_settings_service()
+        if settings_service is None:
+            return HTTPClientService()
+        settings = settings_service.settings
+        return HTTPClientService(
+            max_connections=settings.http_client_max_connections,
+            max_connections_per_host=settings.http_client_max_connections_per_host,
+            keepalive_expiry=settings.http_client_keepalive_expiry,
+            http2=settings.http_client_http2,
+            conditional_cache_size=settings.http_client_conditional_cache_size,
+        )
@@ -0,0 +1,339 @@
+"""Pooled HTTP client service implementation."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import urllib.request
+import weakref
+from collections import OrderedDict
+from http.cookiejar import CookieJar
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import httpx
+
+from lfx.log.logger import logger
+from lfx.services.base import Service
+
+if TYPE_CHECKING:
+    import ssl
+    from collections.abc import AsyncIterator, Callable
+
+# Request headers that change the response of a GET, and so are part of its conditional cache key
+_VARYING_HEADERS = ("accept", "accept-encoding", "accept-language", "authorization", "cookie")
+# Larger responses are never kept by the conditional cache
+MAX_CONDITIONAL_CACHE_ENTRY_SIZE = 1024 * 1024
+
+
+class _ValidatedResponse(NamedTuple):
+    headers: list[tuple[bytes, bytes]]
+    content: bytes
+
+
+class _DiscardingCookieJar(CookieJar):
+    """Cookie jar of the pooled clients, which never stores cookies since a client is shared by every user."""
+
+    def set_cookie(self, cookie) -> None:  # noqa: ARG002
+        return
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that gives back its slot of the total connection limit when it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _PooledTransport(httpx.AsyncBaseTransport):
+    """Transport of a pooled client.
+
+    It bounds the requests in flight of all the clients of an event loop, counts them, and revalidates the GET
+    responses kept by the conditional cache of the service.
+    """
+
+    def __init__(self, service: HTTPClientService, transport: httpx.AsyncHTTPTransport, limit: asyncio.Semaphore):
+        self._service = service
+        self._transport = transport
+        self._limit = limit
+
+    @property
+    def open_connections(self) -> int:
+        pool = getattr(self._transport, "_pool", None)
+        return len(getattr(pool, "connections", ()))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cache_key = self._service.conditional_cache_key(request)
+        cached = self._service.get_validated_response(cache_key) if cache_key else None
+        if cached is not None:
+            headers = httpx.Headers(cached.headers)
+            if "etag" in headers:
+                request.headers["If-None-Match"] = headers["etag"]
+            if "last-modified" in headers:
+                request.headers["If-Modified-Since"] = headers["last-modified"]
+
+        await self._limit.acquire()
+        self._service.requests += 1
+        self._service.in_flight += 1
+
+        def release() -> None:
+            self._service.in_flight -= 1
+            self._limit.release()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            self._service.errors += 1
+            release()
+            raise
+        except BaseException:
+            # Cancelled requests give back their slot too, or they would block the pool for good
+            release()
+            raise
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            try:
+                await response.aclose()
+            finally:
+                release()
+            self._service.revalidated += 1
+            return httpx.Response(
+                httpx.codes.OK,
+                headers=cached.headers,
+                stream=httpx.ByteStream(cached.content),
+                extensions=response.extensions,
+            )
+        if cache_key and self._service.is_cacheable(response):
+            try:
+                content = b"".join([chunk async for chunk in response.stream])
+            finally:
+                await response.aclose()
+                release()
+            self._service.set_validated_response(cache_key, _ValidatedResponse(response.headers.raw, content))
+            return httpx.Response(
+                response.status_code,
+                headers=response.headers,
+                stream=httpx.ByteStream(content),
+                extensions=response.extensions,
+            )
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HTTPClientService(Service):
+    """Pool of HTTP clients shared by components, so connections and TLS sessions are kept alive across runs.
+
+    There is one client per origin and TLS/proxy settings, on each event loop. Clients are borrowed with
+    `get_client` and must not be closed by the callers; they are closed when the service is torn down. Since a
+    client is shared by every user, it never stores the cookies set by responses; cookies must be sent with each
+    request.
+
+    Args:
+        max_connections: Maximum number of requests in flight, over all the clients of an event loop.
+        max_connections_per_host: Maximum number of connections of each client.
+        keepalive_expiry: Time in seconds an idle connection is kept alive.
+        http2: Whether clients use HTTP/2 when the server supports it.
+        conditional_cache_size: Number of GET responses with an ETag or Last-Modified header kept to be revalidated
+            with conditional requests. 0 disables the conditional cache.
+    """
+
+    name = "http_client_service"
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 20,
+        keepalive_expiry: float = 30.0,
+        *,
+        http2: bool = False,
+        conditional_cache_size: int = 0,
+    ) -> None:
+        super().__init__()
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.conditional_cache_size = conditional_cache_size
+        self._lock = threading.Lock()
+        # Clients can only be used on the event loop they were created on
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, httpx.AsyncClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._limits: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._validated: OrderedDict[str, _ValidatedResponse] = OrderedDict()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.revalidated = 0
+
+    def get_client(
+        self,
+        url: str | httpx.URL | None = None,
+        *,
+        verify: ssl.SSLContext | str | bool = True,
+        proxy: str | None = None,
+        http2: bool | None = None,
+    ) -> httpx.AsyncClient:
+        """Return the pooled client for the origin of `url` with the given TLS and proxy settings.
+
+        The client must be used on the running event loop and must not be closed.
+
+        Args:
+            url: URL, or base URL, of the requests. None returns a client shared by every origin.
+            verify: TLS verification, as accepted by httpx.
+            proxy: Proxy URL. None uses the proxy configured in the environment, if any.
+            http2: Whether to use HTTP/2. None uses the setting of the service.
+        """
+        origin = self._origin(url)
+        if proxy is None and origin:
+            proxy = _environment_proxy(origin)
+        http2 = self.http2 if http2 is None else http2
+        key = (origin, verify, proxy, http2)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                if client is not None:
+                    logger.debug(f"Pooled HTTP client for {origin or 'any origin'} was closed by its user")
+                client = self._create_client(loop, verify=verify, proxy=proxy, http2=http2)
+                clients[key] = client
+        return client
+
+    def _create_client(
+        self, loop: asyncio.AbstractEventLoop, *, verify: ssl.SSLContext | str | bool, proxy: str | None, http2: bool
+    ) -> httpx.AsyncClient:
+        limit = self._limits.get(loop)
+        if limit is None:
+            limit = self._limits[loop] = asyncio.Semaphore(self.max_connections)
+        transport = httpx.AsyncHTTPTransport(
+            verify=verify,
+            proxy=proxy,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections_per_host,
+                max_keepalive_connections=self.max_connections_per_host,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+        return httpx.AsyncClient(transport=_PooledTransport(self, transport, limit), cookies=_DiscardingCookieJar())
+
+    @staticmethod
+    def _origin(url: str | httpx.URL | None) -> str:
+        if not url:
+            return ""
+        url = httpx.URL(url)
+        return f"{url.scheme}://{url.netloc.decode('ascii')}"
+
+    def conditional_cache_key(self, request: httpx.Request) -> str | None:
+        """Return the key of a GET request in the conditional cache, or None if it can't be cached."""
+        if (
+            not self.conditional_cache_size
+            or request.method != "GET"
+            or "if-none-match" in request.headers
+            or "if-modified-since" in request.headers
+        ):
+            return None
+        parts = [str(request.url), *(request.headers.get(name, "") for name in _VARYING_HEADERS)]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    @staticmethod
+    def is_cacheable(response: httpx.Response) -> bool:
+        """Whether a GET response can be kept to be revalidated later."""
+        if response.status_code != httpx.codes.OK:
+            return False
+        if "etag" not in response.headers and "last-modified" not in response.headers:
+            return False
+        if "no-store" in response.headers.get("cache-control", "").lower() or "vary" in response.headers:
+            return False
+        content_length = response.headers.get("content-length")
+        return (
+            content_length is not None
+            and content_length.isdigit()
+            and (int(content_length) <= MAX_CONDITIONAL_CACHE_ENTRY_SIZE)
+        )
+
+    def get_validated_response(self, key: str) -> _ValidatedResponse | None:
+        with self._lock:
+            cached = self._validated.get(key)
+            if cached is not None:
+                self._validated.move_to_end(key)
+            return cached
+
+    def set_validated_response(self, key: str, response: _ValidatedResponse) -> None:
+        with self._lock:
+            self._validated[key] = response
+            self._validated.move_to_end(key)
+            while len(self._validated) > self.conditional_cache_size:
+                self._validated.popitem(last=False)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Return the usage metrics of the pool."""
+        with self._lock:
+            transports = [
+                client._transport  # noqa: SLF001
+                for clients in self._clients.values()
+                for client in clients.values()
+                if not client.is_closed
+            ]
+            conditional_cache_entries = len(self._validated)
+        return {
+            "clients": len(transports),
+            "open_connections": sum(
+                transport.open_connections for transport in transports if isinstance(transport, _PooledTransport)
+            ),
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "errors": self.errors,
+            "revalidated": self.revalidated,
+            "conditional_cache_entries": conditional_cache_entries,
+        }
+
+    async def teardown(self) -> None:
+        """Close the clients of the running event loop and forget the others."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with self._lock:
+            clients = self._clients.pop(loop, {}) if loop is not None else {}
+            self._clients.clear()
+            self._limits.clear()
+            self._validated.clear()
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug(f"Error closing pooled HTTP client: {exc}")
+
+
+def _environment_proxy(origin: str) -> str | None:
+    """Return the proxy configured in the environment for `origin`, which clients with their own transport ignore."""
+    url = httpx.URL(origin)
+    if urllib.request.proxy_bypass(url.host):
+        return None
+    proxies = urllib.request.getproxies()
+    return proxies.get(url.scheme) or proxies.get("all")
@@ -101,3 +101,36 @@ class TracingServiceProtocol(Protocol):
     def log(self, message: str, **kwargs) -> None:
         """Log tracing information."""
         ...
+
+
+class LogBufferServiceProtocol(Protocol):
+    """Protocol for the service buffering vertex build and transaction logs."""
+
+    @abstractmethod
+    async def add_vertex_build(
+        self,
+        *,
+        flow_id: Any,
+        vertex_id: str,
+        valid: bool,
+        params: Any,
+        data: Any,
+        artifacts: dict | None = None,
+    ) -> None:
+        """Buffer a vertex build to be written to the database."""
+        ...
+
+    @abstractmethod
+    async def add_transaction(
+        self,
+        *,
+        flow_id: Any,
+        vertex_id: str,
+        status: str,
+        target_id: str | None = None,
+        inputs: dict | None = None,
+        outputs: dict | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Buffer a transaction to be written to the database."""
+        ...
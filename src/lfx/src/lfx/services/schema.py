@@ -19,3 +19,5 @@ class ServiceType(str, Enum):
     JOB_QUEUE_SERVICE = "job_queue_service"
     SHARED_COMPONENT_CACHE_SERVICE = "shared_component_cache_service"
     MCP_COMPOSER_SERVICE = "mcp_composer_service"
+    LOG_BUFFER_SERVICE = "log_buffer_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
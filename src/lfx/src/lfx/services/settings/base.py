@@ -20,6 +20,9 @@ from lfx.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
 from lfx.services.settings.constants import VARIABLES_TO_GET_FROM_ENVIRONMENT
 from lfx.utils.util_strings import is_valid_database_url
 
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+"""Smallest part size S3 accepts for every part of a multipart upload but the last one."""
+
 
 def is_list_of_any(field: FieldInfo) -> bool:
     """Check if the given field is a list or an optional list of any type.
@@ -156,6 +159,15 @@ class Settings(BaseSettings):
     """The port on which Langflow will expose Prometheus metrics. 9090 is the default port."""
 
     disable_track_apikey_usage: bool = False
+    api_key_cache_ttl: float = Field(default=30.0, ge=0)
+    """Seconds a verified API key and its user are kept in memory, so authenticated requests don't query the
+    database for the key. Deleting the key or updating its user drops it right away. Set to 0 to check the key
+    in the database on every request."""
+    api_key_cache_size: int = Field(default=1024, ge=0)
+    """Maximum number of verified API keys kept in memory."""
+    api_key_usage_flush_interval: float = Field(default=5.0, gt=0)
+    """Seconds between writes of the aggregated API key usage counters (`total_uses` and `last_used_at`) to the
+    database. Pending counters are also written on shutdown."""
     remove_api_keys: bool = False
     components_path: list[str] = []
     components_index_path: str | None = None
@@ -187,6 +199,13 @@ class Settings(BaseSettings):
     like_webhook_url: str | None = "https://api.langflow.store/flows/trigger/64275852-ec00-45c1-984e-3bff814732da"
 
     storage_type: str = "local"
+    storage_chunk_size: int = Field(default=1024 * 1024, gt=0)
+    """Size in bytes of the chunks files are read in when they are streamed from the storage."""
+    storage_s3_part_size: int = 8 * 1024 * 1024
+    """Size in bytes of the parts of S3 multipart uploads. S3 requires at least 5 MiB."""
+    storage_dedup_enabled: bool = False
+    """If set to True, local storage keeps one copy of files with the same content, found by the SHA-256
+    computed while they are saved, and hard links the file names to it."""
 
     celery_enabled: bool = False
 
@@ -198,6 +217,9 @@ class Settings(BaseSettings):
     """Whether to store environment variables as Global Variables in the database."""
     variables_to_get_from_environment: list[str] = VARIABLES_TO_GET_FROM_ENVIRONMENT
     """List of environment variables to get from the environment and store in the database."""
+    variable_cache_ttl: float = Field(default=30.0, ge=0)
+    """Time in seconds the decrypted values of Global Variables are kept in memory by the variable service.
+    The cache is per process and per user, and is cleared when a variable of the user is changed. 0 disables it."""
     worker_timeout: int = 300
     """Timeout for the API calls in seconds."""
     frontend_timeout: int = 0
@@ -265,6 +287,15 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    log_buffer_batch_size: int = Field(default=100, gt=0)
+    """Number of buffered vertex builds and transactions that triggers a bulk insert into the database."""
+    log_buffer_flush_interval: float = Field(default=2.0, gt=0)
+    """Maximum number of seconds vertex builds and transactions stay buffered before they are written."""
+    log_buffer_max_size: int = Field(default=10000, gt=0)
+    """Maximum number of buffered records. When it is reached, logging a record waits for the buffer to be written."""
+    log_retention_interval: int = Field(default=60, gt=0)
+    """Interval in seconds at which old vertex builds and transactions are deleted to enforce the
+    max_vertex_builds_to_keep, max_vertex_builds_per_vertex and max_transactions_to_keep limits."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -305,6 +336,99 @@ class Settings(BaseSettings):
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    token_stream_interval: float = Field(default=0.0, ge=0)
+    """Seconds during which the tokens streamed by a component are coalesced into a single token event.
+    0 sends every token in its own event."""
+    token_stream_max_size: int = Field(default=1024, gt=0)
+    """Number of characters after which coalesced tokens are sent without waiting for `token_stream_interval`."""
+    token_stream_max_pending: int = Field(default=0, ge=0)
+    """Number of events waiting in the event queue of a run above which streamed tokens wait for the client to
+    catch up. 0 never waits, which is needed when events are only read by polling."""
+    message_checkpoint_interval: float = Field(default=0.0, ge=0)
+    """Seconds between writes of the text streamed so far to the stored message, so clients reconnecting during
+    a stream get the partial text. 0 only writes the text once the stream is complete."""
+    message_buffer_size: int = Field(default=0, ge=0)
+    """Number of messages stored during a flow run that are kept in memory and written together. Buffered messages
+    are also written before messages are read and at the end of the run. 0 writes every message when it is stored."""
+    llm_response_cache_ttl: float = Field(default=0.0, ge=0)
+    """Seconds language model responses are cached for, keyed by provider, model, parameters and messages. Identical
+    requests are answered from the cache, replayed as a token stream when streaming, and identical requests in flight
+    share one call to the model. 0 disables the cache."""
+    llm_response_cache_max_size: int = Field(default=1024, gt=0)
+    """Maximum number of language model responses kept in memory by the response cache."""
+    llm_response_cache_dir: str | None = None
+    """Directory where the language model response cache also stores responses, so they are kept across restarts
+    and shared between processes. Expired responses are removed from it every 10 minutes. None keeps them in memory
+    only."""
+    http_client_max_connections: int = Field(default=100, gt=0)
+    """Maximum number of HTTP requests in flight through the pooled clients components borrow from the HTTP client
+    service."""
+    http_client_max_connections_per_host: int = Field(default=20, gt=0)
+    """Maximum number of connections each pooled HTTP client keeps to its host."""
+    http_client_keepalive_expiry: float = Field(default=30.0, ge=0)
+    """Seconds an idle connection of the pooled HTTP clients is kept alive, so later runs skip the TCP and TLS
+    handshakes."""
+    http_client_http2: bool = False
+    """If True, the pooled HTTP clients use HTTP/2 with servers that support it."""
+    http_client_conditional_cache_size: int = Field(default=0, ge=0)
+    """Number of GET responses with an ETag or Last-Modified header the pooled HTTP clients keep, to revalidate them
+    with conditional requests and reuse them when the server answers 304 Not Modified. 0 disables it."""
+    docling_worker_pool_size: int = Field(default=2, gt=0)
+    """Number of warm Docling worker processes the File component converts documents with. Workers keep their
+    converters and models loaded between files and runs."""
+    docling_worker_max_jobs: int = Field(default=100, ge=0)
+    """Number of documents after which a Docling worker is replaced by a fresh process, to bound the memory held by
+    native libraries. 0 never recycles workers."""
+    docling_job_timeout: float = Field(default=600.0, ge=0)
+    """Seconds a Docling conversion can run before its worker is killed. 0 waits indefinitely."""
+    docling_parse_cache: bool = False
+    """If True, Docling results are cached on disk, keyed by the SHA-256 of the file content, the conversion
+    options and the Docling version, so unchanged files are not converted again. The cache keeps the text of the
+    converted files until it expires, even if the files are deleted."""
+    docling_parse_cache_dir: str | None = None
+    """Directory of the Docling parse cache. None uses the docling_cache directory in config_dir."""
+    docling_parse_cache_ttl: float = Field(default=7 * 24 * 3600, ge=0)
+    """Seconds a Docling result is kept in the parse cache. 0 keeps results until they are evicted by size."""
+    docling_parse_cache_max_size: int = Field(default=512 * 1024 * 1024, ge=0)
+    """Maximum total size in bytes of the Docling parse cache. The oldest results are removed first. 0 disables the
+    limit."""
+    graph_scheduler: Literal["layered", "dependency"] = "layered"
+    """How Graph.process schedules vertices. 'layered' runs the graph layer by layer, waiting for every vertex
+    of a layer before starting the next one. 'dependency' starts each vertex as soon as its own predecessors are
+    built, so slow branches do not hold back unrelated ones."""
+    graph_max_concurrency: int | None = Field(default=None, gt=0)
+    """Maximum number of vertices built at the same time by the 'dependency' scheduler. None means unbounded."""
+    graph_snapshot_mode: Literal["off", "delta", "full"] = "off"
+    """Whether Graph.astep records the run state after each step for replay and debugging. 'delta' records only
+    what changed at each step, 'full' records a complete copy and 'off' records nothing."""
+    graph_snapshot_max_size: int = Field(default=100, gt=0)
+    """Maximum number of step snapshots kept per graph run. Older snapshots are dropped first."""
+    job_queue_max_size: int = Field(default=0, ge=0)
+    """Maximum number of events kept in memory for each flow build job. 0 keeps every event until it is consumed."""
+    job_queue_full_policy: Literal["block", "drop_tokens", "spill"] = "block"
+    """What a full build job queue does with new events: 'block' makes the build wait for the client, 'drop_tokens'
+    drops streamed token events but keeps the others, and 'spill' writes events to disk until they are consumed."""
+    job_queue_spill_dir: str | None = None
+    """Directory of the files build events are spilled to with the 'spill' policy. None uses the temporary
+    directory."""
+    job_queue_max_jobs: int = Field(default=0, ge=0)
+    """Maximum number of flow build jobs running at the same time. Further builds are rejected with a 429 status.
+    0 means no limit."""
+    state_service_run_ttl: float = Field(default=3600.0, gt=0)
+    """Seconds the state of a graph run is kept after it was last used, when the run never released it."""
+    state_service_max_runs: int = Field(default=10000, gt=0)
+    """Maximum number of graph runs whose state is kept in memory. The oldest runs are dropped first."""
+    prepared_graph_cache_size: int = Field(default=128, ge=0)
+    """Maximum number of prepared graphs kept in memory to serve repeated /run requests of the same flow,
+    keyed by flow id, last update and tweaks. Set to 0 to build the graph from the flow data on every run."""
+    component_class_cache_size: int = Field(default=512, ge=0)
+    """Maximum number of component classes built from code that are kept in memory, keyed by a hash of the code.
+    Set to 0 to rebuild the class every time a component is instantiated."""
+    serve_graph_pool_size: int = Field(default=8, gt=0)
+    """Number of pre-built graph instances kept per flow by `lfx serve`. This is also the maximum number of
+    concurrent runs of a flow; further requests wait for an instance to be returned to the pool."""
+    serve_graph_pool_timeout: float = Field(default=30.0, ge=0)
+    """Seconds a `lfx serve` request waits for a free graph instance before it is rejected with a 503."""
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
@@ -403,6 +527,15 @@ class Settings(BaseSettings):
         # If we can't determine, return as-is and let uvx handle it
         return value
 
+    @field_validator("storage_s3_part_size", mode="after")
+    @classmethod
+    def validate_storage_s3_part_size(cls, value):
+        """Reject part sizes S3 would refuse with `EntityTooSmall` when the upload is completed."""
+        if value < S3_MIN_PART_SIZE:
+            msg = f"storage_s3_part_size must be at least {S3_MIN_PART_SIZE} bytes (5 MiB), got {value}"
+            raise ValueError(msg)
+        return value
+
     @field_validator("variables_to_get_from_environment", mode="before")
     @classmethod
     def set_variables_to_get_from_environment(cls, value):
@@ -0,0 +1,31 @@
+class StreamAccumulator:
+    """Accumulates the chunks of a streamed text in linear time.
+
+    Concatenating every chunk to a string copies the text received so far each time, which is quadratic in
+    the length of the text and slows down long generations. The chunks are kept in a list instead and only
+    joined when the text is read.
+    """
+
+    __slots__ = ("_chunks", "_length")
+
+    def __init__(self, text: str = "") -> None:
+        self._chunks: list[str] = [text] if text else []
+        self._length = len(text)
+
+    def append(self, chunk: str) -> None:
+        if chunk:
+            self._chunks.append(chunk)
+            self._length += len(chunk)
+
+    @property
+    def text(self) -> str:
+        if len(self._chunks) > 1:
+            # Keep the joined text, so reading it again only joins the chunks received since
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self.text
@@ -0,0 +1,161 @@
+import os
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from lfx.base.data.docling_pool import DoclingParseCache, DoclingWorkerPool
+
+# Stands in for the Docling worker: answers with its pid, hangs on "slow" and exits on "crash"
+FAKE_WORKER_SCRIPT = textwrap.dedent(
+    """
+    import json, os, sys, time
+
+    for line in sys.stdin:
+        job = json.loads(line)
+        if job["file_path"] == "slow":
+            time.sleep(30)
+        if job["file_path"] == "crash":
+            print("worker crashed", file=sys.stderr, flush=True)
+            sys.exit(1)
+        print("noise", file=sys.stderr, flush=True)
+        result = {"ok": True, "mode": "markdown", "text": str(os.getpid()), "meta": {"file_path": job["file_path"]}}
+        sys.stdout.write(json.dumps(result) + "\\n")
+        sys.stdout.flush()
+    """
+)
+
+
+def job(file_path, pipeline="standard", ocr_engine=None):
+    return {"file_path": file_path, "pipeline": pipeline, "ocr_engine": ocr_engine}
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**kwargs):
+        pool = DoclingWorkerPool(**kwargs)
+        pools.append(pool)
+        return pool
+
+    with patch("lfx.base.data.docling_pool.WORKER_SCRIPT", FAKE_WORKER_SCRIPT):
+        yield make
+    for pool in pools:
+        pool.shutdown()
+
+
+def test_workers_stay_warm_between_jobs(make_pool):
+    pool = make_pool(size=1)
+
+    pids = {pool.convert(job(f"file{i}.pdf"))["text"] for i in range(3)}
+
+    assert len(pids) == 1
+
+
+def test_workers_are_recycled_after_max_jobs(make_pool):
+    pool = make_pool(size=1, max_jobs_per_worker=2)
+
+    pids = [pool.convert(job(f"file{i}.pdf"))["text"] for i in range(4)]
+
+    assert pids[0] == pids[1]
+    assert pids[1] != pids[2]
+    assert pids[2] == pids[3]
+
+
+def test_concurrent_jobs_are_bounded_by_pool_size(make_pool):
+    pool = make_pool(size=2)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(pool.convert, [job(f"file{i}.pdf") for i in range(12)]))
+
+    assert [result["meta"]["file_path"] for result in results] == [f"file{i}.pdf" for i in range(12)]
+    assert len({result["text"] for result in results}) <= 2
+
+
+def test_timed_out_job_kills_its_worker(make_pool):
+    pool = make_pool(size=1, job_timeout=0.5)
+
+    result = pool.convert(job("slow"))
+
+    assert result == {
+        "ok": False,
+        "error": "Docling conversion timed out after 0.5 seconds",
+        "meta": {"file_path": "slow"},
+    }
+    assert pool.convert(job("file.pdf"))["ok"]
+
+
+def test_crashed_worker_is_reported_and_replaced(make_pool):
+    pool = make_pool(size=1)
+
+    result = pool.convert(job("crash"))
+
+    assert not result["ok"]
+    assert "worker crashed" in result["error"]
+    assert pool.convert(job("file.pdf"))["ok"]
+
+
+def test_native_output_of_docling_does_not_corrupt_results(tmp_path, monkeypatch):
+    # A Docling stand-in writing to fd 1 when it is imported, as native OCR libraries do
+    (tmp_path / "docling").mkdir()
+    (tmp_path / "docling" / "__init__.py").write_text(
+        'import os\nos.write(1, b"native noise\\n")\nraise ImportError("fake docling")\n'
+    )
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    pool = DoclingWorkerPool(size=1)
+    try:
+        result = pool.convert(
+            {
+                **job("file.pdf"),
+                "markdown": True,
+                "image_mode": "placeholder",
+                "md_image_placeholder": "<!-- image -->",
+                "md_page_break_placeholder": "",
+            }
+        )
+    finally:
+        pool.shutdown()
+
+    assert not result["ok"]
+    assert "fake docling" in result["error"]
+
+
+def test_parse_cache_is_keyed_by_content_and_options(tmp_path):
+    cache = DoclingParseCache(tmp_path / "cache")
+    first = tmp_path / "first.pdf"
+    copy = tmp_path / "copy.pdf"
+    first.write_bytes(b"%PDF-1.4 content")
+    copy.write_bytes(b"%PDF-1.4 content")
+    options = {"markdown": True, "pipeline": "standard"}
+
+    key = cache.key(str(first), options)
+    cache.set(key, {"ok": True, "text": "parsed"})
+
+    assert cache.key(str(copy), options) == key
+    assert cache.key(str(first), {**options, "markdown": False}) != key
+    assert cache.get(key) == {"ok": True, "text": "parsed"}
+    first.write_bytes(b"%PDF-1.4 changed")
+    assert cache.get(cache.key(str(first), options)) is None
+    with patch("lfx.base.data.docling_pool._docling_version", return_value="999.0"):
+        assert cache.key(str(copy), options) != key
+
+
+def test_parse_cache_removes_expired_and_oldest_results(tmp_path):
+    # Each result takes 54 bytes, so three of them fit in the cache
+    cache = DoclingParseCache(tmp_path / "cache", ttl=60, max_size=200)
+    for index, key in enumerate(["aa1", "bb2", "cc3"]):
+        with patch("lfx.base.data.docling_pool.time.time", return_value=1000 + index):
+            cache.set(key, {"ok": True, "text": "x" * 30})
+        os.utime(cache._path(key), (1000 + index, 1000 + index))
+
+    with patch("lfx.base.data.docling_pool.time.time", return_value=1000 + 30):
+        assert cache.get("aa1") is not None
+        cache.set("dd4", {"ok": True, "text": "x" * 30})
+        assert cache.get("aa1") is None
+        assert cache.get("bb2") is not None
+
+    with patch("lfx.base.data.docling_pool.time.time", return_value=1000 + 62):
+        assert cache.get("bb2") is None
+        assert cache.prune() == 1
+    assert [path.stem for path in (tmp_path / "cache").glob("*/*.json")] == ["dd4"]
@@ -0,0 +1,129 @@
+import asyncio
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+from lfx.base.models.model import LCModelComponent
+from lfx.base.models.response_cache import (
+    LLMResponseCache,
+    model_cache_params,
+    response_cache_key,
+    split_into_tokens,
+)
+
+
+class FakeModelComponent(LCModelComponent):
+    display_name = "Fake Model"
+
+    def build_model(self):
+        return FakeListChatModel(responses=["first", "second"])
+
+
+def test_cache_key_depends_on_model_and_messages():
+    params = model_cache_params(FakeListChatModel(responses=["a"]))
+    messages = [SystemMessage(content="Be brief"), HumanMessage(content="Hello")]
+
+    key = response_cache_key("Fake", params, messages)
+
+    assert key == response_cache_key("Fake", params, list(messages))
+    assert key != response_cache_key("Fake", params, messages[1:])
+    assert key != response_cache_key("Fake", model_cache_params(FakeListChatModel(responses=["b"])), messages)
+    assert model_cache_params(object()) is None
+
+
+def test_split_into_tokens_keeps_the_text():
+    text = "  Hello,  world!\nBye "
+    assert "".join(split_into_tokens(text)) == text
+
+
+async def test_memory_tier_evicts_least_recently_used_and_expired():
+    cache = LLMResponseCache(ttl=60, max_size=2)
+    await cache.set("a", {"text": "a"})
+    await cache.set("b", {"text": "b"})
+    assert await cache.get("a") == {"text": "a"}
+    await cache.set("c", {"text": "c"})
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == {"text": "a"}
+
+    with patch("lfx.base.models.response_cache.time.time", return_value=10**12):
+        assert await cache.get("a") is None
+
+
+async def test_disk_tier_is_shared_between_caches(tmp_path):
+    await LLMResponseCache(ttl=60, max_size=1, directory=tmp_path).set("key", {"text": "cached"})
+
+    assert await LLMResponseCache(ttl=60, max_size=1, directory=tmp_path).get("key") == {"text": "cached"}
+
+
+async def test_expired_responses_are_swept_from_disk(tmp_path):
+    cache = LLMResponseCache(ttl=60, max_size=8, directory=tmp_path, sweep_interval=3600)
+    await cache.set("old", {"text": "old"})
+    await cache.set("other", {"text": "other"})
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+
+    with patch("lfx.base.models.response_cache.time.time", return_value=10**12):
+        await cache.set("new", {"text": "new"})
+
+    assert [path.stem for path in tmp_path.glob("*/*.json")] == ["new"]
+
+
+async def test_identical_requests_in_flight_share_one_call():
+    cache = LLMResponseCache(ttl=60, max_size=8)
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"text": "response"}
+
+    results = await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(5)))
+
+    assert calls == 1
+    assert [payload for payload, _ in results] == [{"text": "response"}] * 5
+    assert sorted(cached for _, cached in results) == [False, True, True, True, True]
+
+
+async def test_uncacheable_response_is_computed_by_each_request():
+    cache = LLMResponseCache(ttl=60, max_size=8)
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(3)))
+
+    assert calls == 3
+
+
+async def test_model_component_answers_repeated_prompts_from_the_cache():
+    cache = LLMResponseCache(ttl=60, max_size=8)
+    component = FakeModelComponent()
+    model = component.build_model()
+
+    with (
+        patch("lfx.base.models.model.get_llm_response_cache", return_value=cache),
+        patch.object(FakeModelComponent, "is_connected_to_chat_output", return_value=False),
+    ):
+        first = await component._get_chat_result(runnable=model, stream=False, input_value="Hello")
+        second = await component._get_chat_result(runnable=model, stream=True, input_value="Hello")
+        other = await component._get_chat_result(runnable=model, stream=False, input_value="Bye")
+
+    assert first.text == "first"
+    assert second.text == "first"
+    assert other.text == "second"
+    assert cache.hits == 1
+
+
+async def test_model_component_without_cache_calls_the_model():
+    component = FakeModelComponent()
+    model = component.build_model()
+
+    with patch("lfx.base.models.model.get_llm_response_cache", return_value=None):
+        first = await component._get_chat_result(runnable=model, stream=False, input_value="Hello")
+        second = await component._get_chat_result(runnable=model, stream=False, input_value="Hello")
+
+    assert (first.text, second.text) == ("first", "second")
@@ -0,0 +1,142 @@
+"""Unit tests for the graph pool used by the LFX serve app."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from lfx.cli import serve_app
+from lfx.cli.common import execute_graph_with_capture, extract_result_data
+from lfx.cli.graph_pool import GraphPool, GraphPoolExhaustedError
+from lfx.cli.serve_app import StreamRequest, run_flow_generator_for_serve
+from lfx.events.event_manager import create_stream_tokens_event_manager
+from lfx.graph import Graph
+
+
+@pytest.fixture
+def simple_chat_graph():
+    json_path = Path(__file__).parent.parent.parent / "data" / "simple_chat_no_llm.json"
+    with json_path.open() as f:
+        return Graph.from_payload(json.load(f), flow_id="test-flow-id")
+
+
+async def test_instances_are_prebuilt_and_reused(simple_chat_graph):
+    pool = GraphPool(simple_chat_graph, size=2)
+
+    first = await pool.acquire()
+    pool.release(first)
+    second = await pool.acquire()
+    third = await pool.acquire()
+    pool.release(second)
+    pool.release(third)
+
+    assert first is not simple_chat_graph
+    assert third is first
+    stats = pool.stats()
+    assert stats["checkouts"] == 3
+    assert stats["idle"] == 2
+    assert stats["in_use"] == 0
+    assert stats["peak_in_use"] == 2
+    assert stats["replaced"] == 0
+
+
+async def test_reused_instance_runs_again(simple_chat_graph):
+    pool = GraphPool(simple_chat_graph, size=1)
+
+    instances = []
+    for input_value in ["first", "second"]:
+        async with pool.checkout() as graph:
+            results, logs = await execute_graph_with_capture(graph, input_value)
+        instances.append(graph)
+        result_data = extract_result_data(results, logs)
+        assert result_data["success"]
+        assert result_data["result"] == input_value
+        assert pool.stats()["replaced"] == 0
+        # Releasing the instance resets its run bookkeeping
+        assert graph.run_manager.run_map == {}
+        assert graph.vertices_to_run == set()
+        assert graph.inactivated_vertices == set()
+
+    assert instances[0] is instances[1]
+
+    assert pool.stats()["checkouts"] == 2
+
+
+async def test_exhausted_pool_rejects_after_timeout(simple_chat_graph):
+    pool = GraphPool(simple_chat_graph, size=1, acquire_timeout=0.01)
+    graph = await pool.acquire()
+
+    with pytest.raises(GraphPoolExhaustedError):
+        await pool.acquire()
+
+    pool.release(graph)
+    stats = pool.stats()
+    assert stats["waits"] == 1
+    assert stats["rejected"] == 1
+
+
+async def test_waiting_checkout_gets_released_instance(simple_chat_graph):
+    pool = GraphPool(simple_chat_graph, size=1, acquire_timeout=1)
+    graph = await pool.acquire()
+
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    pool.release(graph)
+
+    assert await waiter is graph
+    assert pool.stats()["waits"] == 1
+
+
+async def test_failed_run_replaces_instance(simple_chat_graph):
+    pool = GraphPool(simple_chat_graph, size=1)
+
+    async def failing_run():
+        async with pool.checkout() as graph:
+            msg = "run failed"
+            raise RuntimeError(msg, graph)
+
+    with pytest.raises(RuntimeError) as exc_info:
+        await failing_run()
+    graph = exc_info.value.args[1]
+
+    async with pool.checkout() as replacement:
+        assert replacement is not graph
+    assert pool.stats()["replaced"] == 1
+
+
+async def test_failed_streamed_run_replaces_instance(simple_chat_graph, monkeypatch):
+    pool = GraphPool(simple_chat_graph, size=1)
+
+    async def failing_execute(graph, input_value):
+        # Run the graph to completion so it carries run state, then fail the request
+        await execute_graph_with_capture(graph, input_value)
+        msg = "run failed"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(serve_app, "execute_graph_with_capture", failing_execute)
+    graph = await pool.acquire()
+    queue: asyncio.Queue = asyncio.Queue()
+    failed = await run_flow_generator_for_serve(
+        graph=graph,
+        input_request=StreamRequest(input_value="first"),
+        flow_id="test-flow-id",
+        event_manager=create_stream_tokens_event_manager(queue=queue),
+        client_consumed_queue=asyncio.Queue(),
+    )
+    pool.release(graph, discard=failed)
+
+    assert failed
+    assert pool.stats()["replaced"] == 1
+    async with pool.checkout() as replacement:
+        assert replacement is not graph
+        assert replacement.run_manager.run_map == {}
+        assert not any(vertex.built for vertex in replacement.vertices)
+        results, logs = await execute_graph_with_capture(replacement, "second")
+    assert extract_result_data(results, logs)["result"] == "second"
+    assert pool.stats()["replaced"] == 1
+
+
+def test_invalid_size(simple_chat_graph):
+    with pytest.raises(ValueError, match="positive integer"):
+        GraphPool(simple_chat_graph, size=0)
@@ -386,6 +386,51 @@ class TestServeAppEndpoints:
         assert data["success"] is False
         assert data["type"] == "error"
 
+    def test_run_endpoint_reuses_pooled_graph(self, app_client):
+        """Test that runs check graph instances out of the flow's pool instead of copying the graph."""
+        headers = {"x-api-key": "test-api-key"}
+        run_graphs = []
+
+        async def mock_execute(graph, input_value):  # noqa: ARG001
+            run_graphs.append(graph)
+            return [], ""
+
+        with (
+            patch.dict(os.environ, {"LANGFLOW_API_KEY": "test-api-key"}),  # pragma: allowlist secret
+            patch("lfx.cli.serve_app.execute_graph_with_capture", mock_execute),
+        ):
+            for _ in range(3):
+                app_client.post("/flows/test-flow-id/run", json={"input_value": "Test input"}, headers=headers)
+            response = app_client.get("/flows/test-flow-id/pool", headers=headers)
+
+        pool = app_client.app.state.graph_pools["test-flow-id"]
+        assert len({id(graph) for graph in run_graphs}) <= pool.size
+        assert response.status_code == 200
+        data = response.json()
+        assert data["checkouts"] == 3
+        assert data["in_use"] == 0
+        assert data["rejected"] == 0
+
+    def test_run_endpoint_exhausted_pool(self, app_client):
+        """Test that requests are rejected with a 503 when no graph instance is available."""
+        from lfx.cli.graph_pool import GraphPoolExhaustedError
+
+        headers = {"x-api-key": "test-api-key"}
+        pool = app_client.app.state.graph_pools["test-flow-id"]
+
+        async def mock_acquire():
+            msg = "All instances of flow test-flow-id are in use"
+            raise GraphPoolExhaustedError(msg)
+
+        with (
+            patch.dict(os.environ, {"LANGFLOW_API_KEY": "test-api-key"}),  # pragma: allowlist secret
+            patch.object(pool, "acquire", mock_acquire),
+        ):
+            response = app_client.post("/flows/test-flow-id/run", json={"input_value": "Test input"}, headers=headers)
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
     def test_list_flows_endpoint(self, multi_flow_client):
         """Test listing flows in multi-flow mode."""
         response = multi_flow_client.get("/flows")
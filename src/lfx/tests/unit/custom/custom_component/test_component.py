@@ -1,7 +1,8 @@
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from lfx.base.tools.constants import TOOL_OUTPUT_NAME
 from lfx.components.input_output import ChatInput, ChatOutput
 from lfx.custom.custom_component.component import Component
 from lfx.custom.custom_component.custom_component import CustomComponent
@@ -26,6 +27,23 @@ def test_set_invalid_output():
         chatoutput.set(input_value=chatinput.build_config)
 
 
+def test_append_tool_output_does_not_change_other_instances():
+    class TestComponent(Component):
+        outputs = [Output(name="text", display_name="Text", method="build_text")]
+
+        def build_text(self) -> str:
+            return "text"
+
+    component = TestComponent()
+    other = TestComponent()
+
+    component._append_tool_output()
+
+    assert [output.name for output in component.outputs] == ["text", TOOL_OUTPUT_NAME]
+    assert [output.name for output in other.outputs] == ["text"]
+    assert [output.name for output in TestComponent.outputs] == ["text"]
+
+
 @pytest.mark.xfail(reason="CrewAI is not outdated")
 def test_set_component():
     from lfx.components.crewai import CrewAIAgentComponent, SequentialTaskComponent
@@ -116,7 +134,7 @@ async def test_update_component_build_config_async():
 @pytest.mark.asyncio
 async def test_send_message_without_database(monkeypatch):  # noqa: ARG001
     component = Component()
-    event_manager = MagicMock()
+    event_manager = MagicMock(wait_for_queue=AsyncMock())
     component._event_manager = event_manager
     message = Message(text="Hello", session_id="session", flow_id=None, sender="User", sender_name="Test")
 
@@ -139,7 +157,7 @@ async def test_agent_component_send_message_events(monkeypatch):  # noqa: ARG001
 
     from lfx.components.models_and_agents.agent import AgentComponent
 
-    event_manager = MagicMock()
+    event_manager = MagicMock(wait_for_queue=AsyncMock())
     agent = AgentComponent(
         agent_llm="OpenAI",
         input_value="Hello",
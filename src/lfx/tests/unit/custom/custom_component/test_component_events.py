@@ -1,12 +1,13 @@
 import asyncio
+import json
 import time
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
 from lfx.custom.custom_component.component import Component
-from lfx.events.event_manager import EventManager
+from lfx.events.event_manager import EventManager, create_stream_tokens_event_manager
 from lfx.schema.content_block import ContentBlock
 from lfx.schema.content_types import TextContent, ToolContent
 from lfx.schema.message import Message
@@ -261,3 +262,109 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("interval", "expected_chunks"),
+    [(0.0, ["Hello", " ", "World", "!"]), (60.0, ["Hello World!"])],
+)
+async def test_component_streaming_message_coalesces_tokens(interval, expected_chunks):
+    """Test that tokens are sent from the event loop, coalesced by token_stream_interval."""
+    queue = asyncio.Queue()
+    event_manager = create_stream_tokens_event_manager(queue)
+
+    vertex = MagicMock()
+    vertex.graph.flow_id = str(uuid4())
+    component = ComponentForTesting(_vertex=vertex)
+    component.set_event_manager(event_manager)
+
+    class StreamChunk:
+        def __init__(self, content: str):
+            self.content = content
+
+    async def text_generator():
+        for chunk in ["Hello", " ", "World", "!"]:
+            yield StreamChunk(chunk)
+
+    message = Message(
+        sender="test_sender",
+        session_id="test_session",
+        sender_name="test_sender_name",
+        text=text_generator(),
+        properties=Properties(),
+    )
+    settings_service = MagicMock()
+    settings_service.settings.token_stream_interval = interval
+    settings_service.settings.token_stream_max_size = 1024
+    settings_service.settings.token_stream_max_pending = 0
+    settings_service.settings.message_checkpoint_interval = 0
+
+    with (
+        patch("lfx.custom.custom_component.component.get_settings_service", return_value=settings_service),
+        patch("lfx.custom.custom_component.component.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread,
+    ):
+        sent_message = await component.send_message(message)
+
+    assert sent_message.text == "Hello World!"
+    chunks = []
+    while not queue.empty():
+        _, event_data, _ = queue.get_nowait()
+        event = json.loads(event_data)
+        if event["event"] == "token":
+            assert event["data"]["id"] == str(sent_message.id)
+            chunks.append(event["data"]["chunk"])
+    assert chunks == expected_chunks
+    assert all(call.args[0] != event_manager.on_token for call in to_thread.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_component_streaming_message_checkpoints_partial_text():
+    """Test that the text streamed so far is written to the stored message every message_checkpoint_interval."""
+    event_manager = create_stream_tokens_event_manager(asyncio.Queue())
+    vertex = MagicMock()
+    vertex.graph.flow_id = str(uuid4())
+    component = ComponentForTesting(_vertex=vertex)
+    component.set_event_manager(event_manager)
+
+    class StreamChunk:
+        def __init__(self, content: str):
+            self.content = content
+
+    async def text_generator():
+        for chunk in ["Hello", " ", "World"]:
+            yield StreamChunk(chunk)
+            await asyncio.sleep(0.05)
+
+    checkpoints = []
+
+    async def update_stored_message(message):
+        checkpoints.append((message.text, message.properties.state))
+        return message
+
+    message = Message(
+        sender="test_sender",
+        session_id="test_session",
+        sender_name="test_sender_name",
+        text=text_generator(),
+        properties=Properties(),
+    )
+    settings_service = MagicMock()
+    settings_service.settings.token_stream_interval = 0
+    settings_service.settings.token_stream_max_size = 1024
+    settings_service.settings.token_stream_max_pending = 0
+    settings_service.settings.message_checkpoint_interval = 0.02
+
+    with (
+        patch("lfx.custom.custom_component.component.get_settings_service", return_value=settings_service),
+        patch.object(component, "_update_stored_message", side_effect=update_stored_message),
+    ):
+        sent_message = await component.send_message(message)
+
+    assert sent_message.text == "Hello World"
+    partial_checkpoints = [text for text, state in checkpoints if state == "partial"]
+    assert partial_checkpoints
+    assert all("Hello World".startswith(text) for text in partial_checkpoints)
+    # Unchanged text is not written again
+    assert len(set(partial_checkpoints)) == len(partial_checkpoints)
+    assert checkpoints[-1] == ("Hello World", "complete")
@@ -0,0 +1,110 @@
+from textwrap import dedent
+
+import pytest
+from lfx.custom.class_cache import ComponentClassCache, get_component_class_cache
+from lfx.custom.eval import eval_custom_component_code
+
+CODE = dedent("""
+from lfx.custom import Component
+
+class CachedComponent(Component):
+    display_name = "Cached"
+""")
+
+
+@pytest.fixture
+def build_counter():
+    calls = []
+
+    def build(code):
+        calls.append(code)
+        return type(f"Built{len(calls)}", (), {})
+
+    return build, calls
+
+
+def test_get_or_build_reuses_class_for_same_code(build_counter):
+    build, calls = build_counter
+    cache = ComponentClassCache(max_size=4)
+
+    first = cache.get_or_build("code", build)
+    second = cache.get_or_build("code", build)
+
+    assert first is second
+    assert calls == ["code"]
+    assert cache.stats() == {"size": 1, "max_size": 4, "hits": 1, "misses": 1}
+
+
+def test_edited_code_builds_a_new_class(build_counter):
+    build, calls = build_counter
+    cache = ComponentClassCache(max_size=4)
+
+    original = cache.get_or_build("code", build)
+    edited = cache.get_or_build("code  # edited", build)
+
+    assert original is not edited
+    assert len(calls) == 2
+
+
+def test_least_recently_used_entry_is_evicted(build_counter):
+    build, _ = build_counter
+    cache = ComponentClassCache(max_size=2)
+
+    cache.get_or_build("a", build)
+    cache.get_or_build("b", build)
+    cache.get_or_build("a", build)
+    cache.get_or_build("c", build)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_invalidate_and_clear(build_counter):
+    build, calls = build_counter
+    cache = ComponentClassCache(max_size=4)
+    cache.get_or_build("a", build)
+
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+    cache.get_or_build("a", build)
+    assert len(calls) == 2
+
+    cache.clear()
+    assert cache.stats() == {"size": 0, "max_size": 4, "hits": 0, "misses": 0}
+
+
+def test_zero_max_size_disables_caching(build_counter):
+    build, calls = build_counter
+    cache = ComponentClassCache(max_size=0)
+
+    cache.get_or_build("a", build)
+    cache.get_or_build("a", build)
+
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_build_errors_are_not_cached():
+    cache = ComponentClassCache(max_size=4)
+
+    def failing_build(code):
+        msg = f"bad code: {code}"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="bad code"):
+        cache.get_or_build("a", failing_build)
+    assert "a" not in cache
+
+
+def test_eval_custom_component_code_uses_process_cache():
+    cache = get_component_class_cache()
+    cache.invalidate(CODE)
+
+    first = eval_custom_component_code(CODE)
+    second = eval_custom_component_code(CODE)
+
+    assert first is second
+    assert first.__name__ == "CachedComponent"
+    assert CODE in cache
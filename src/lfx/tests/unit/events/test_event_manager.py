@@ -2,11 +2,13 @@
 
 import asyncio
 import json
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
 from lfx.events.event_manager import (
     EventManager,
+    TokenStream,
     create_default_event_manager,
     create_stream_tokens_event_manager,
 )
@@ -212,6 +214,152 @@ class TestEventManager:
         assert parsed_data["data"] == complex_data
 
 
+class TestEncodeEvent:
+    """Test cases for the event encoding."""
+
+    def test_event_ids_are_unique(self):
+        """Test that every event gets its own id."""
+        queue = MagicMock()
+        manager = EventManager(queue)
+
+        for _ in range(3):
+            manager.send_event(event_type="token", data={"chunk": "a"})
+
+        event_ids = [call.args[0][0] for call in queue.put_nowait.call_args_list]
+        assert len(set(event_ids)) == 3
+        assert all(event_id.startswith("token-") for event_id in event_ids)
+
+    def test_plain_data_matches_json_dumps(self):
+        """Test that plain payloads are encoded as json.dumps does."""
+        queue = MagicMock()
+        manager = EventManager(queue)
+        data = {"chunk": 'h\u00e9llo "world"', "id": "1", "nested": [{"a": 1.5, "b": None}]}
+
+        manager.send_event(event_type="token", data=data)
+
+        _, data_bytes, _ = queue.put_nowait.call_args[0][0]
+        assert data_bytes == (json.dumps({"event": "token", "data": data}) + "\n\n").encode("utf-8")
+
+    def test_other_data_goes_through_jsonable_encoder(self):
+        """Test that payloads with non JSON types are still serialized."""
+        queue = MagicMock()
+        manager = EventManager(queue)
+        timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        manager.send_event(event_type="info", data={"timestamp": timestamp, "tags": ("a", "b")})
+
+        _, data_bytes, _ = queue.put_nowait.call_args[0][0]
+        parsed_data = json.loads(data_bytes.decode("utf-8"))
+        assert parsed_data["data"] == {"timestamp": timestamp.isoformat(), "tags": ["a", "b"]}
+
+    def test_sends_directly(self):
+        """Test that only events without a custom callback are sent directly."""
+
+        def callback(manager, event_type, data):
+            pass
+
+        manager = create_default_event_manager(MagicMock())
+        manager.register_event("on_error", "error", callback)
+
+        assert manager.sends_directly("on_token")
+        assert not manager.sends_directly("on_error")
+        assert not manager.sends_directly("on_unknown")
+
+
+def received_chunks(queue: asyncio.Queue) -> list[str]:
+    chunks = []
+    while not queue.empty():
+        _, data_bytes, _ = queue.get_nowait()
+        chunks.append(json.loads(data_bytes)["data"]["chunk"])
+    return chunks
+
+
+@pytest.mark.asyncio
+class TestTokenStream:
+    """Test cases for the TokenStream class."""
+
+    async def test_tokens_are_sent_one_by_one_without_interval(self):
+        """Test that every token is its own event when coalescing is disabled."""
+        queue = asyncio.Queue()
+        stream = TokenStream(create_stream_tokens_event_manager(queue), "message-id")
+
+        for chunk in ["Hello", " ", "World"]:
+            await stream.send(chunk)
+        stream.close()
+
+        assert received_chunks(queue) == ["Hello", " ", "World"]
+
+    async def test_tokens_are_coalesced_within_interval(self):
+        """Test that tokens sent within the interval are sent as one event."""
+        queue = asyncio.Queue()
+        stream = TokenStream(create_stream_tokens_event_manager(queue), "message-id", interval=60)
+
+        for chunk in ["Hello", " ", "World"]:
+            await stream.send(chunk)
+        assert queue.empty()
+
+        stream.close()
+
+        assert received_chunks(queue) == ["Hello World"]
+        assert stream.frames == 1
+
+    async def test_tokens_are_sent_when_interval_elapses(self):
+        """Test that buffered tokens are sent without waiting for the next token."""
+        queue = asyncio.Queue()
+        stream = TokenStream(create_stream_tokens_event_manager(queue), "message-id", interval=0.01)
+
+        await stream.send("Hello")
+        await asyncio.sleep(0.05)
+
+        assert received_chunks(queue) == ["Hello"]
+
+    async def test_full_frame_is_sent_immediately(self):
+        """Test that a frame reaching max_size is sent without waiting for the interval."""
+        queue = asyncio.Queue()
+        stream = TokenStream(create_stream_tokens_event_manager(queue), "message-id", interval=60, max_size=5)
+
+        for chunk in ["abc", "de", "f"]:
+            await stream.send(chunk)
+
+        assert received_chunks(queue) == ["abcde"]
+        stream.close()
+        assert received_chunks(queue) == ["f"]
+
+    async def test_send_waits_for_pending_events(self):
+        """Test that tokens wait while the queue holds max_pending events."""
+        queue = asyncio.Queue()
+        stream = TokenStream(create_stream_tokens_event_manager(queue), "message-id", interval=0, max_pending=1)
+        await stream.send("a")
+
+        send = asyncio.create_task(stream.send("b"))
+        await asyncio.sleep(0.05)
+        assert not send.done()
+
+        queue.get_nowait()
+        await asyncio.wait_for(send, timeout=1)
+        assert received_chunks(queue) == ["b"]
+
+    async def test_waiting_streams_are_woken_by_the_consumer(self):
+        """Test that each event got from the queue lets one waiting stream send, without the others waking up."""
+        queue = asyncio.Queue()
+        event_manager = create_stream_tokens_event_manager(queue)
+        streams = [TokenStream(event_manager, f"message-{i}", interval=0, max_pending=1) for i in range(3)]
+        await streams[0].send("a")
+
+        sends = [asyncio.create_task(stream.send("b")) for stream in streams]
+        await asyncio.sleep(0.05)
+        assert not any(send.done() for send in sends)
+
+        queue.get_nowait()
+        await asyncio.sleep(0.01)
+        assert [send.done() for send in sends] == [True, False, False]
+
+        for send in sends[1:]:
+            send.cancel()
+        await asyncio.gather(*sends[1:], return_exceptions=True)
+        assert received_chunks(queue) == ["b"]
+
+
 class TestEventManagerFactories:
     """Test cases for EventManager factory functions."""
 
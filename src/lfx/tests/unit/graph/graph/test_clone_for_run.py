@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.graph import Graph
+
+
+@pytest.fixture
+def simple_chat_json():
+    json_path = Path(__file__).parent.parent.parent.parent / "data" / "simple_chat_no_llm.json"
+    with json_path.open() as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def template(simple_chat_json):
+    return Graph.from_payload(simple_chat_json, flow_id="test-flow-id", flow_name="Simple Chat")
+
+
+def test_clone_shares_structure_but_not_vertices(template):
+    clone = template.clone_for_run(user_id="user-1", context={"request": "a"})
+
+    assert clone is not template
+    assert clone.flow_id == template.flow_id
+    assert clone.flow_name == template.flow_name
+    assert clone.user_id == "user-1"
+    assert clone.context == {"request": "a"}
+    assert clone._vertices is template._vertices
+    assert clone.get_vertex_ids() == template.get_vertex_ids()
+    for vertex in clone.vertices:
+        assert vertex is not template.get_vertex(vertex.id)
+        assert vertex.graph is clone
+    assert clone.predecessor_map == template.predecessor_map
+    assert clone.predecessor_map is not template.predecessor_map
+    assert clone._is_input_vertices == template._is_input_vertices
+    assert clone._is_output_vertices == template._is_output_vertices
+
+
+def test_clones_share_sorted_layers(template):
+    first_clone = template.clone_for_run()
+    first_layer = first_clone.sort_vertices()
+    second_clone = template.clone_for_run()
+
+    assert second_clone._sorted_vertices_cache is first_clone._sorted_vertices_cache
+    assert second_clone.sort_vertices() == first_layer
+    assert second_clone.vertices_layers == first_clone.vertices_layers
+
+
+async def test_clones_run_independently(template):
+    first_clone = template.clone_for_run()
+    await first_clone.process(fallback_to_env_vars=False)
+    second_clone = template.clone_for_run()
+
+    assert all(vertex.built for vertex in first_clone.vertices)
+    assert not any(vertex.built for vertex in second_clone.vertices)
+    assert not any(vertex.built for vertex in template.vertices)
+
+    await second_clone.process(fallback_to_env_vars=False)
+    assert all(vertex.built for vertex in second_clone.vertices)
+
+
+def test_clone_requires_payload_graph():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+
+    with pytest.raises(ValueError, match="Only graphs created from a payload"):
+        graph.clone_for_run()
@@ -0,0 +1,127 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from lfx.components.input_output import ChatInput, TextOutputComponent
+from lfx.graph import Graph
+from lfx.graph.graph.scheduler import DependencyScheduler
+from lfx.graph.graph.schema import VertexBuildResult
+
+
+def _uneven_graph() -> Graph:
+    """chat_input feeds a slow branch and a two-step fast branch."""
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    slow = TextOutputComponent(_id="slow")
+    slow.set(input_value=chat_input.message_response)
+    fast = TextOutputComponent(_id="fast")
+    fast.set(input_value=chat_input.message_response)
+    fast_end = TextOutputComponent(_id="fast_end")
+    fast_end.set(input_value=fast.text_response)
+
+    graph = Graph()
+    for component in (chat_input, slow, fast, fast_end):
+        graph.add_component(component)
+    graph.add_component_edge("chat_input", ("message", "input_value"), "slow")
+    graph.add_component_edge("chat_input", ("message", "input_value"), "fast")
+    graph.add_component_edge("fast", ("text", "input_value"), "fast_end")
+    graph.prepare()
+    return graph
+
+
+def _record_completion_order(graph: Graph, slow_vertex_id: str, delay: float) -> list[str]:
+    completed: list[str] = []
+    build_vertex = graph.build_vertex
+
+    async def delayed_build_vertex(vertex_id, **kwargs):
+        if vertex_id == slow_vertex_id:
+            await asyncio.sleep(delay)
+        result = await build_vertex(vertex_id, **kwargs)
+        completed.append(vertex_id)
+        return result
+
+    graph.build_vertex = delayed_build_vertex
+    return completed
+
+
+@pytest.mark.asyncio
+async def test_dependency_scheduler_does_not_wait_for_slow_branch():
+    graph = _uneven_graph()
+    completed = _record_completion_order(graph, "slow", delay=0.2)
+
+    await graph.process(fallback_to_env_vars=False, scheduler="dependency")
+
+    assert set(completed) == {"chat_input", "slow", "fast", "fast_end"}
+    assert completed.index("fast_end") < completed.index("slow")
+    assert all(vertex.built for vertex in graph.vertices)
+
+
+@pytest.mark.asyncio
+async def test_layered_scheduler_waits_for_whole_layer():
+    graph = _uneven_graph()
+    completed = _record_completion_order(graph, "slow", delay=0.2)
+
+    await graph.process(fallback_to_env_vars=False, scheduler="layered")
+
+    assert completed.index("slow") < completed.index("fast_end")
+
+
+@pytest.mark.asyncio
+async def test_dependency_scheduler_reports_queue_wait_times():
+    graph = _uneven_graph()
+    _record_completion_order(graph, "slow", delay=0.1)
+
+    await graph.process(fallback_to_env_vars=False, scheduler="dependency", max_concurrency=1)
+
+    assert set(graph.vertex_queue_wait_times) == {"chat_input", "slow", "fast", "fast_end"}
+    # With a single slot, one of the two branches had to wait for the slow vertex
+    assert max(graph.vertex_queue_wait_times.values()) >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_dependency_scheduler_propagates_build_errors():
+    graph = _uneven_graph()
+
+    async def failing_build_vertex(vertex_id, **kwargs):  # noqa: ARG001
+        msg = f"boom in {vertex_id}"
+        raise RuntimeError(msg)
+
+    graph.build_vertex = failing_build_vertex
+    with pytest.raises(RuntimeError, match="boom in chat_input"):
+        await graph.process(fallback_to_env_vars=False, scheduler="dependency")
+
+
+def test_dependency_scheduler_rejects_invalid_max_concurrency():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        DependencyScheduler(Graph(), lambda _: None, max_concurrency=0)
+
+
+class _ScriptedGraph:
+    """Reports the vertices listed in `next_vertices` as runnable when a vertex completes."""
+
+    def __init__(self, next_vertices: dict[str, list[list[str]]]):
+        self.flow_id = None
+        self.run_manager = MagicMock()
+        self.next_vertices = next_vertices
+
+    async def get_next_runnable_vertices(self, lock, vertex, *, cache):  # noqa: ARG002
+        runs = self.next_vertices.get(vertex.id)
+        return runs.pop(0) if runs else []
+
+
+@pytest.mark.asyncio
+async def test_dependency_scheduler_reruns_a_vertex_reported_while_running():
+    graph = _ScriptedGraph({"start": [["loop"]], "feedback": [["loop"]]})
+    delays = {"feedback": 0.01, "loop": 0.05}
+    completed: list[str] = []
+
+    async def build_vertex(vertex_id):
+        await asyncio.sleep(delays.get(vertex_id, 0))
+        completed.append(vertex_id)
+        vertex = SimpleNamespace(id=vertex_id, built_result=None, built_object=None)
+        return VertexBuildResult(result_dict={}, params="", valid=True, artifacts={}, vertex=vertex)
+
+    await DependencyScheduler(graph, build_vertex).run(["start", "feedback"])
+
+    assert completed == ["start", "feedback", "loop", "loop"]
@@ -0,0 +1,159 @@
+import copy
+import json
+from collections import defaultdict, deque
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from lfx.graph import Graph
+from lfx.graph.graph.snapshots import SnapshotHistory, capture_state, to_snapshot
+
+
+@pytest.fixture
+def simple_chat_json():
+    json_path = Path(__file__).parent.parent.parent.parent / "data" / "simple_chat_no_llm.json"
+    with json_path.open() as f:
+        return json.load(f)
+
+
+def make_state(step: int) -> dict:
+    return {
+        "run_map": {"a": ["b"], "b": ["c"] if step < 2 else []},
+        "run_predecessors": {f"v{i}": ["a"] for i in range(step)},
+        "vertices_to_run": {"a", "b"},
+        "vertices_being_run": {f"v{step}"},
+        "ran_at_least_once": {f"v{i}" for i in range(step)},
+        "run_queue": [f"v{step + 1}"],
+        "vertices_layers": [["a"], ["b"]],
+        "first_layer": ["a"],
+        "inactive_vertices": set(),
+        "activated_vertices": [],
+    }
+
+
+def test_delta_history_replays_full_snapshots():
+    full = SnapshotHistory("full", max_size=10)
+    delta = SnapshotHistory("delta", max_size=10)
+    for step in range(5):
+        full.record(make_state(step))
+        delta.record(make_state(step))
+
+    assert delta.snapshots() == full.snapshots()
+    # Unchanged entries are not stored again
+    assert "vertices_layers" not in delta._entries[-1]
+    assert delta._entries[-1]["run_predecessors"] == {"set": {"v3": ["a"]}, "del": []}
+
+
+def test_history_is_bounded_and_keeps_latest_steps():
+    full = SnapshotHistory("full", max_size=3)
+    delta = SnapshotHistory("delta", max_size=3)
+    for step in range(6):
+        full.record(make_state(step))
+        delta.record(make_state(step))
+
+    assert len(delta) == 3
+    assert len(full) == 3
+    assert delta.snapshots() == full.snapshots()
+    assert delta.snapshots()[0]["run_manager"]["vertices_being_run"] == {"v3"}
+
+
+def make_chain_graph(size: int) -> SimpleNamespace:
+    ids = [f"v{i}" for i in range(size)]
+    run_manager = SimpleNamespace(
+        run_map=defaultdict(list, {ids[i]: [ids[i + 1]] for i in range(size - 1)}),
+        run_predecessors=defaultdict(list, {ids[i + 1]: [ids[i]] for i in range(size - 1)}),
+        vertices_to_run=set(ids),
+        vertices_being_run={"v0"},
+        ran_at_least_once=set(),
+    )
+    return SimpleNamespace(
+        run_manager=run_manager,
+        _run_queue=deque(["v0"]),
+        vertices_layers=[[vertex_id] for vertex_id in ids[1:]],
+        first_layer=["v0"],
+        inactive_vertices=set(),
+        activated_vertices=[],
+    )
+
+
+def run_chain_step(graph: SimpleNamespace, vertex_id: str) -> list[str]:
+    run_manager = graph.run_manager
+    graph._run_queue.popleft()
+    run_manager.ran_at_least_once.add(vertex_id)
+    run_manager.vertices_being_run.discard(vertex_id)
+    next_ids = list(run_manager.run_map.get(vertex_id, []))
+    for next_id in next_ids:
+        run_manager.run_predecessors[next_id].remove(vertex_id)
+        run_manager.vertices_being_run.add(next_id)
+    graph._run_queue.extend(next_ids)
+    return [vertex_id, *next_ids]
+
+
+def test_step_deltas_only_hold_the_changed_vertices():
+    graph = make_chain_graph(50)
+    history = SnapshotHistory("delta")
+    history.record_step(graph)
+    expected = [to_snapshot(copy.deepcopy(capture_state(graph)))]
+
+    for i in range(10):
+        history.record_step(graph, run_chain_step(graph, f"v{i}"))
+        expected.append(to_snapshot(copy.deepcopy(capture_state(graph))))
+
+    assert history.snapshots() == expected
+    delta = history._entries[-1]
+    assert delta["run_predecessors"] == {"set": {"v10": []}, "del": []}
+    assert delta["vertices_being_run"] == {"add": ["v10"], "del": ["v9"]}
+    assert delta["ran_at_least_once"] == {"add": ["v9"], "del": []}
+    assert "run_map" not in delta
+    assert "vertices_layers" not in delta
+
+
+def test_step_deltas_catch_changes_outside_of_the_step():
+    graph = make_chain_graph(5)
+    history = SnapshotHistory("delta", max_size=2)
+    history.record_step(graph)
+
+    changed = run_chain_step(graph, "v0")
+    graph.run_manager.vertices_to_run.discard("v4")
+    graph.run_manager.run_map = defaultdict(list, {"v0": ["v1", "v3"]})
+    graph.vertices_layers = [["v1", "v3"]]
+    history.record_step(graph, changed)
+
+    snapshot = history.snapshots()[-1]
+    assert snapshot == to_snapshot(copy.deepcopy(capture_state(graph)))
+    assert "v4" not in snapshot["run_manager"]["vertices_to_run"]
+    assert snapshot["run_manager"]["run_map"] == {"v0": ["v1", "v3"]}
+
+
+def test_off_mode_is_rejected():
+    with pytest.raises(ValueError, match="off"):
+        SnapshotHistory("off")
+
+
+async def test_graph_records_no_snapshots_by_default(simple_chat_json):
+    graph = Graph.from_payload(simple_chat_json, flow_id="test-flow-id")
+
+    results = [result async for result in graph.async_start()]
+
+    assert results
+    assert graph.get_snapshots() == []
+    assert graph._call_order
+
+
+@pytest.mark.parametrize("mode", ["delta", "full"])
+async def test_graph_snapshots_match_get_snapshot(simple_chat_json, mode):
+    graph = Graph.from_payload(simple_chat_json, flow_id="test-flow-id")
+    graph.enable_snapshots(mode)
+
+    expected = []
+    graph.prepare()
+    expected.append(graph.get_snapshot())
+    while True:
+        result = await graph.astep()
+        if not hasattr(result, "vertex"):
+            break
+        expected.append(graph.get_snapshot())
+
+    snapshots = graph.get_snapshots()
+    assert len(snapshots) == len(graph._call_order) + 1
+    assert snapshots == expected
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from lfx.graph import Graph
+from lfx.graph.graph.variables import RunVariableResolver
+from lfx.interface.initialize.loading import update_params_with_load_from_db_fields
+
+RESOLVER_MODULE = "lfx.graph.graph.variables"
+
+
+def make_graph(context=None):
+    vertices = [
+        SimpleNamespace(load_from_db_fields=["api_key"], params={"api_key": "OPENAI_API_KEY"}),
+        SimpleNamespace(
+            load_from_db_fields=["api_key", "session_id", "table:headers"],
+            params={"api_key": "ANTHROPIC_API_KEY", "session_id": "SESSION", "table:headers": "HEADER"},
+        ),
+        SimpleNamespace(load_from_db_fields=["token"], params={"token": "OVERRIDDEN"}),
+    ]
+    return SimpleNamespace(vertices=vertices, context=context or {})
+
+
+def make_variable_service(values):
+    variable_service = MagicMock()
+    variable_service.get_variables = AsyncMock(return_value=values)
+    return variable_service
+
+
+def test_collect_names_skips_unbatched_fields_and_overrides():
+    resolver = RunVariableResolver(make_graph({"request_variables": {"OVERRIDDEN": "value"}}), run_id="run")
+
+    assert resolver.collect_names() == {"OPENAI_API_KEY", "ANTHROPIC_API_KEY"}
+
+
+async def test_variables_are_fetched_once_per_user():
+    variable_service = make_variable_service({"OPENAI_API_KEY": "sk-1", "ANTHROPIC_API_KEY": "sk-2"})
+    resolver = RunVariableResolver(make_graph(), run_id="run")
+    user_id = uuid4()
+
+    with patch(f"{RESOLVER_MODULE}.get_variable_service", return_value=variable_service):
+        assert await resolver.get(user_id, "OPENAI_API_KEY", session=None) == "sk-1"
+        assert await resolver.get(str(user_id), "ANTHROPIC_API_KEY", session=None) == "sk-2"
+        assert await resolver.get(user_id, "UNKNOWN", session=None) is None
+
+    variable_service.get_variables.assert_awaited_once()
+    _, kwargs = variable_service.get_variables.call_args
+    assert kwargs["user_id"] == user_id
+    assert kwargs["names"] == {"OPENAI_API_KEY", "ANTHROPIC_API_KEY", "OVERRIDDEN"}
+
+
+async def test_unresolved_when_service_has_no_batch_lookup():
+    resolver = RunVariableResolver(make_graph(), run_id="run")
+
+    with patch(f"{RESOLVER_MODULE}.get_variable_service", return_value=SimpleNamespace()):
+        assert await resolver.get(uuid4(), "OPENAI_API_KEY", session=None) is None
+
+
+async def test_unresolved_when_batch_lookup_fails():
+    variable_service = make_variable_service({})
+    variable_service.get_variables.side_effect = RuntimeError("database is locked")
+    resolver = RunVariableResolver(make_graph(), run_id="run")
+
+    with patch(f"{RESOLVER_MODULE}.get_variable_service", return_value=variable_service):
+        assert await resolver.get(uuid4(), "OPENAI_API_KEY", session=None) is None
+
+
+def test_graph_resolver_is_scoped_to_the_run():
+    graph = Graph()
+    graph.set_run_id("00000000-0000-0000-0000-000000000001")
+    resolver = graph.variable_resolver
+
+    assert graph.variable_resolver is resolver
+
+    graph.set_run_id("00000000-0000-0000-0000-000000000002")
+    assert graph.variable_resolver is not resolver
+    resolver = graph.variable_resolver
+
+    graph.reset_run_state()
+    assert graph.variable_resolver is not resolver
+
+
+async def test_load_from_db_fields_use_run_resolver():
+    graph = Graph(user_id=str(uuid4()))
+    graph.vertices = [SimpleNamespace(load_from_db_fields=["api_key"], params={"api_key": "OPENAI_API_KEY"})]
+    custom_component = MagicMock(_vertex=MagicMock(), graph=graph, user_id=graph.user_id)
+    custom_component.get_variable = AsyncMock(return_value="from-get-variable")
+    variable_service = make_variable_service({"OPENAI_API_KEY": "sk-1"})
+    session_scope = MagicMock()
+    session_scope.return_value.__aenter__.return_value = MagicMock()
+
+    with (
+        patch(f"{RESOLVER_MODULE}.get_variable_service", return_value=variable_service),
+        patch("lfx.interface.initialize.loading.session_scope", session_scope),
+    ):
+        params = await update_params_with_load_from_db_fields(
+            custom_component, {"api_key": "OPENAI_API_KEY", "other": "OTHER"}, ["api_key", "other"]
+        )
+
+    assert params == {"api_key": "sk-1", "other": "from-get-variable"}
+    custom_component.get_variable.assert_awaited_once()
+    assert custom_component.get_variable.call_args.kwargs["name"] == "OTHER"
@@ -0,0 +1,26 @@
+"""Tests for the validation of the cache size settings."""
+
+import pytest
+from lfx.services.settings.base import Settings
+from pydantic import ValidationError
+
+
+def test_prepared_graph_cache_can_be_disabled(monkeypatch):
+    """Test that 0 is accepted to build the graph on every run."""
+    monkeypatch.setenv("LANGFLOW_PREPARED_GRAPH_CACHE_SIZE", "0")
+    settings = Settings()
+    assert settings.prepared_graph_cache_size == 0
+
+
+def test_negative_prepared_graph_cache_size_is_rejected(monkeypatch):
+    """Test that a negative cache size fails when the settings are loaded."""
+    monkeypatch.setenv("LANGFLOW_PREPARED_GRAPH_CACHE_SIZE", "-1")
+    with pytest.raises(ValidationError, match="prepared_graph_cache_size"):
+        Settings()
+
+
+def test_negative_component_class_cache_size_is_rejected(monkeypatch):
+    """Test that a negative cache size fails when the settings are loaded."""
+    monkeypatch.setenv("LANGFLOW_COMPONENT_CLASS_CACHE_SIZE", "-1")
+    with pytest.raises(ValidationError, match="component_class_cache_size"):
+        Settings()
@@ -0,0 +1,33 @@
+"""Tests for the validation of the storage settings."""
+
+import pytest
+from lfx.services.settings.base import S3_MIN_PART_SIZE, Settings
+from pydantic import ValidationError
+
+
+def test_default_part_size_is_accepted(monkeypatch):
+    """Test that the default part size passes validation."""
+    monkeypatch.delenv("LANGFLOW_STORAGE_S3_PART_SIZE", raising=False)
+    settings = Settings()
+    assert settings.storage_s3_part_size >= S3_MIN_PART_SIZE
+
+
+def test_minimum_part_size_is_accepted(monkeypatch):
+    """Test that exactly 5 MiB is accepted."""
+    monkeypatch.setenv("LANGFLOW_STORAGE_S3_PART_SIZE", str(S3_MIN_PART_SIZE))
+    settings = Settings()
+    assert settings.storage_s3_part_size == S3_MIN_PART_SIZE
+
+
+def test_part_size_below_minimum_is_rejected(monkeypatch):
+    """Test that a part size S3 would refuse fails when the settings are loaded."""
+    monkeypatch.setenv("LANGFLOW_STORAGE_S3_PART_SIZE", str(S3_MIN_PART_SIZE - 1))
+    with pytest.raises(ValidationError, match="storage_s3_part_size"):
+        Settings()
+
+
+def test_empty_chunk_size_is_rejected(monkeypatch):
+    """Test that a chunk size of 0, which would stream empty downloads, fails when the settings are loaded."""
+    monkeypatch.setenv("LANGFLOW_STORAGE_CHUNK_SIZE", "0")
+    with pytest.raises(ValidationError, match="storage_chunk_size"):
+        Settings()
@@ -0,0 +1,136 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from lfx.services.http_client.service import HTTPClientService
+
+SERVICE_MODULE = "lfx.services.http_client.service"
+
+
+class FakeServer:
+    """Mock transport answering GETs with an ETag, and 304 when the ETag is sent back."""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.concurrent -= 1
+        if request.url.path == "/login":
+            return httpx.Response(200, headers={"Set-Cookie": "session=secret; Path=/"})
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"value": 1}, headers={"ETag": '"v1"'})
+
+    def transport(self, **_kwargs) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+
+@pytest.fixture
+def server():
+    server = FakeServer()
+    with patch(f"{SERVICE_MODULE}.httpx.AsyncHTTPTransport", side_effect=server.transport):
+        yield server
+
+
+async def test_clients_are_shared_per_origin_and_settings(server):  # noqa: ARG001
+    service = HTTPClientService()
+
+    client = service.get_client("https://api.example.com/v1/items")
+
+    assert service.get_client("https://api.example.com/v2") is client
+    assert service.get_client("https://other.example.com") is not client
+    assert service.get_client("https://api.example.com", verify=False) is not client
+    assert service.get_client("https://api.example.com", http2=True) is not client
+    assert service.get_metrics()["clients"] == 4
+    await service.teardown()
+    assert client.is_closed
+
+
+async def test_closed_client_is_replaced(server):  # noqa: ARG001
+    service = HTTPClientService()
+    client = service.get_client("https://api.example.com")
+    await client.aclose()
+
+    assert service.get_client("https://api.example.com") is not client
+
+
+async def test_requests_in_flight_are_bounded(server):
+    server.delay = 0.01
+    service = HTTPClientService(max_connections=2)
+
+    responses = await asyncio.gather(
+        *(service.get_client(url).get(url) for url in [f"https://host{i % 3}.example.com/" for i in range(6)])
+    )
+
+    assert [response.json() for response in responses] == [{"value": 1}] * 6
+    assert server.max_concurrent == 2
+    metrics = service.get_metrics()
+    assert metrics["requests"] == 6
+    assert metrics["in_flight"] == 0
+
+
+async def test_cancelled_requests_release_their_slot(server):
+    server.delay = 10
+    service = HTTPClientService(max_connections=2)
+    client = service.get_client("https://api.example.com")
+    tasks = [asyncio.create_task(client.get("https://api.example.com/items")) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert service.get_metrics()["in_flight"] == 0
+    server.delay = 0
+    response = await asyncio.wait_for(client.get("https://api.example.com/items"), timeout=1)
+    assert response.json() == {"value": 1}
+
+
+async def test_conditional_cache_revalidates_get_responses(server):
+    service = HTTPClientService(conditional_cache_size=8)
+    client = service.get_client("https://api.example.com")
+
+    first = await client.get("https://api.example.com/items")
+    second = await client.get("https://api.example.com/items")
+    other_user = await client.get("https://api.example.com/items", headers={"Authorization": "Bearer other"})
+
+    assert (first.status_code, second.status_code) == (200, 200)
+    assert second.json() == first.json() == {"value": 1}
+    assert "if-none-match" not in server.requests[0].headers
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+    assert "if-none-match" not in server.requests[2].headers
+    assert other_user.json() == {"value": 1}
+    assert service.get_metrics()["revalidated"] == 1
+
+
+async def test_conditional_cache_is_disabled_by_default(server):
+    service = HTTPClientService()
+    client = service.get_client("https://api.example.com")
+
+    await client.get("https://api.example.com/items")
+    await client.get("https://api.example.com/items")
+
+    assert all("if-none-match" not in request.headers for request in server.requests)
+
+
+async def test_cookies_set_by_responses_are_not_replayed(server):
+    service = HTTPClientService()
+    client = service.get_client("https://api.example.com")
+
+    login = await client.get("https://api.example.com/login")
+    await service.get_client("https://api.example.com").get("https://api.example.com/items")
+    await client.get("https://api.example.com/items", headers={"Cookie": "session=mine"})
+
+    assert login.cookies["session"] == "secret"
+    assert not client.cookies
+    assert "cookie" not in server.requests[1].headers
+    assert server.requests[2].headers["cookie"] == "session=mine"
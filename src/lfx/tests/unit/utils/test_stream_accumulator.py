@@ -0,0 +1,18 @@
+from lfx.utils.stream_accumulator import StreamAccumulator
+
+
+def test_chunks_are_joined_when_read():
+    streamed_text = StreamAccumulator()
+    for chunk in ["Hello", "", " ", "World"]:
+        streamed_text.append(chunk)
+
+    assert streamed_text.text == "Hello World"
+    assert len(streamed_text) == len("Hello World")
+
+    streamed_text.append("!")
+    assert str(streamed_text) == "Hello World!"
+
+
+def test_initial_text():
+    assert StreamAccumulator().text == ""
+    assert StreamAccumulator("Hello").text == "Hello"
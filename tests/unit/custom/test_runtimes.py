@@ -22,6 +22,7 @@ from langflow.custom.runtimes.manager import (
     DeviceType,
     ModelRuntime,
     TransformersRuntime,
+    InferenceWorker,
     LlamaCppRuntime,
     get_default_models,
 )
@@ -52,6 +53,100 @@ class MockModelRuntime(ModelRuntime):
         return {"status": "mock_healthy"}
 
 
+class FakeEncoding(dict):
+    """Tokenizer output supporting `.to(device)`."""
+
+    def to(self, _device):
+        return self
+
+
+class FakeTokenizer:
+    """Character level tokenizer: every character is a token, 0 is the pad and eos token."""
+
+    eos_token = "<eos>"  # noqa: S105
+    eos_token_id = 0
+
+    def __init__(self):
+        self.pad_token = None
+        self.pad_token_id = 0
+        self.padding_side = "right"
+
+    def __call__(self, prompts, **_kwargs):
+        assert self.padding_side == "left"
+        width = max(len(prompt) for prompt in prompts)
+        input_ids = [[0] * (width - len(prompt)) + [ord(c) for c in prompt] for prompt in prompts]
+        return FakeEncoding(input_ids=input_ids)
+
+    def decode(self, ids, **_kwargs):
+        return "".join(chr(i) for i in ids if i != 0)
+
+
+class FakeModel:
+    """Generates "x" tokens, recording the size and sampling parameters of every batch."""
+
+    device = "cpu"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batch_sizes = []
+        self.sampling = []
+
+    def generate(
+        self,
+        input_ids,
+        max_new_tokens,
+        *,
+        temperature,
+        top_p,
+        top_k,
+        do_sample,
+        pad_token_id,  # noqa: ARG002
+        streamer=None,
+    ):
+        import time
+
+        # Without do_sample, transformers decodes greedily and ignores the sampling parameters
+        assert do_sample is True
+        time.sleep(self.delay)
+        self.batch_sizes.append(len(input_ids))
+        self.sampling.append((temperature, top_p, top_k))
+        if streamer:
+            streamer.put(input_ids)
+        rows = [list(row) for row in input_ids]
+        for _ in range(max_new_tokens):
+            for row in rows:
+                row.append(ord("x"))
+            if streamer:
+                streamer.put([[ord("x")] for _ in rows])
+        if streamer:
+            streamer.end()
+        return rows
+
+
+class FakeTransformersRuntime(TransformersRuntime):
+    """Transformers runtime loading a `FakeTokenizer` and a `FakeModel`."""
+
+    def __init__(self, config: ModelConfig, delay: float = 0.0):
+        super().__init__(config)
+        self.delay = delay
+
+    def _load_model(self) -> None:
+        self.tokenizer = FakeTokenizer()
+        self.model = FakeModel(self.delay)
+
+
+def make_loaded_transformers_runtime(batch_size=4, batch_wait_ms=50.0, delay=0.0):
+    config = ModelConfig(
+        model_id="test/model",
+        model_name="Test",
+        model_type="llm",
+        runtime_type=RuntimeType.TRANSFORMERS,
+        batch_size=batch_size,
+        batch_wait_ms=batch_wait_ms,
+    )
+    return FakeTransformersRuntime(config, delay)
+
+
 # ============ MANAGER TESTS ============
 
 class TestRuntimeManager:
@@ -322,6 +417,190 @@ class TestTransformersRuntime:
         assert runtime.model is None
         assert runtime.tokenizer is None
         assert runtime.is_loaded is False
+        assert runtime.worker is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_generations_are_batched(self):
+        """Test that concurrent prompts are generated in one padded batch."""
+        runtime = make_loaded_transformers_runtime()
+        assert await runtime.load()
+        try:
+            results = await asyncio.gather(
+                runtime.generate(GenerationConfig(prompt="hi", max_tokens=2)),
+                runtime.generate(GenerationConfig(prompt="hello", max_tokens=3)),
+                runtime.generate(GenerationConfig(prompt="hey", max_tokens=1)),
+            )
+        finally:
+            await runtime.unload()
+
+        assert runtime.model is None
+        assert [result.text for result in results] == ["hixx", "helloxxx", "heyx"]
+        assert [result.tokens_generated for result in results] == [2, 3, 1]
+        assert all(result.metadata["batch_size"] == len(results) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_batches_are_split_by_sampling_parameters(self):
+        """Test that prompts sampling differently are not generated together."""
+        runtime = make_loaded_transformers_runtime()
+        await runtime.load()
+        model = runtime.model
+        try:
+            await asyncio.gather(
+                runtime.generate(GenerationConfig(prompt="a", temperature=0.1, top_p=0.5, top_k=10)),
+                runtime.generate(GenerationConfig(prompt="b", temperature=0.9, top_p=0.5, top_k=10)),
+            )
+        finally:
+            await runtime.unload()
+
+        assert model.batch_sizes == [1, 1]
+        assert sorted(model.sampling) == [(0.1, 0.5, 10), (0.9, 0.5, 10)]
+
+    @pytest.mark.asyncio
+    async def test_generation_does_not_block_event_loop(self):
+        """Test that the event loop keeps running while the model generates."""
+        runtime = make_loaded_transformers_runtime(batch_size=1, delay=0.2)
+        await runtime.load()
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        try:
+            await runtime.generate(GenerationConfig(prompt="hi", max_tokens=1))
+        finally:
+            ticker.cancel()
+            await runtime.unload()
+
+        assert ticks > 5
+
+    @pytest.mark.asyncio
+    async def test_generate_stream(self):
+        """Test streaming the prompt, then the generated text."""
+        runtime = make_loaded_transformers_runtime()
+        await runtime.load()
+        try:
+            chunks = [chunk async for chunk in runtime.generate_stream(GenerationConfig(prompt="hi", max_tokens=3))]
+        finally:
+            await runtime.unload()
+
+        assert chunks == ["hi", "x", "x", "x"]
+
+    @pytest.mark.asyncio
+    async def test_streamed_text_matches_generated_text(self):
+        """Test that a batch streams the same text as it returns, padded prompts included."""
+        runtime = make_loaded_transformers_runtime()
+        await runtime.load()
+
+        async def stream(gen_config):
+            return "".join([chunk async for chunk in runtime.generate_stream(gen_config)])
+
+        try:
+            streamed = await asyncio.gather(
+                stream(GenerationConfig(prompt="hi", max_tokens=2)),
+                stream(GenerationConfig(prompt="hello", max_tokens=3)),
+            )
+            generated = await asyncio.gather(
+                runtime.generate(GenerationConfig(prompt="hi", max_tokens=2)),
+                runtime.generate(GenerationConfig(prompt="hello", max_tokens=3)),
+            )
+        finally:
+            await runtime.unload()
+
+        assert streamed == [result.text for result in generated] == ["hixx", "helloxxx"]
+
+    @pytest.mark.asyncio
+    async def test_generation_errors_are_raised(self):
+        """Test that an error of the model is raised to every request of the batch."""
+        runtime = make_loaded_transformers_runtime()
+        await runtime.load()
+        runtime.model.generate = Mock(side_effect=RuntimeError("out of memory"))
+        try:
+            with pytest.raises(RuntimeError, match="out of memory"):
+                await runtime.generate(GenerationConfig(prompt="hi"))
+            assert isinstance(runtime.worker, InferenceWorker)
+            assert runtime.worker.is_running
+        finally:
+            await runtime.unload()
+
+
+# ============ TRANSFORMERS RUNTIME WITH A REAL MODEL ============
+
+TINY_MODEL_ID = "hf-internal-testing/tiny-random-gpt2"
+
+
+@pytest.fixture
+async def tiny_transformers_runtime():
+    """A transformers runtime serving a tiny random GPT-2 on CPU, skipped when it can't be loaded."""
+    pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    pytest.importorskip("accelerate")
+    config = ModelConfig(
+        model_id=TINY_MODEL_ID,
+        model_name="TinyGPT2",
+        model_type="llm",
+        runtime_type=RuntimeType.TRANSFORMERS,
+        device_type=DeviceType.CPU,
+        batch_size=4,
+        batch_wait_ms=50.0,
+    )
+    runtime = TransformersRuntime(config)
+    if not await runtime.load():
+        pytest.skip(f"{TINY_MODEL_ID} is not available")
+    try:
+        yield runtime
+    finally:
+        await runtime.unload()
+
+
+@pytest.mark.slow
+class TestTransformersRuntimeWithRealModel:
+    """Test TransformersRuntime against a real tokenizer and model."""
+
+    @pytest.mark.asyncio
+    async def test_batched_generation(self, tiny_transformers_runtime):
+        """Test that concurrent prompts are padded, generated in one batch and cut at their own limits."""
+        runtime = tiny_transformers_runtime
+        generate = runtime.model.generate
+        calls = []
+
+        def recording_generate(*args, **kwargs):
+            calls.append(kwargs)
+            return generate(*args, **kwargs)
+
+        runtime.model.generate = recording_generate
+        prompts = ["Hello", "The quick brown fox"]
+        results = await asyncio.gather(
+            runtime.generate(GenerationConfig(prompt=prompts[0], max_tokens=3)),
+            runtime.generate(GenerationConfig(prompt=prompts[1], max_tokens=5)),
+        )
+
+        assert len(calls) == 1
+        kwargs = calls[0]
+        assert kwargs["do_sample"] is True
+        assert kwargs["max_new_tokens"] == 5
+        assert kwargs["pad_token_id"] == runtime.tokenizer.pad_token_id
+        # Left padding keeps the shorter prompt right before its completion
+        assert kwargs["attention_mask"][0][0] == 0
+        for prompt, result, max_tokens in zip(prompts, results, [3, 5], strict=True):
+            assert result.text.startswith(prompt)
+            assert 0 < result.tokens_generated <= max_tokens
+            assert result.metadata["batch_size"] == len(prompts)
+
+    @pytest.mark.asyncio
+    async def test_generate_stream(self, tiny_transformers_runtime):
+        """Test that the streamer fed by generate on the worker thread delivers the prompt, then new text."""
+        runtime = tiny_transformers_runtime
+        chunks = [
+            chunk async for chunk in runtime.generate_stream(GenerationConfig(prompt="Hello world", max_tokens=4))
+        ]
+
+        assert chunks[0] == "Hello world"
+        assert len(chunks) > 1
+        assert runtime.worker.is_running
 
 
 # ============ LLAMA.CPP RUNTIME TESTS ============